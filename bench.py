@@ -0,0 +1,276 @@
+#%%
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+from timeit import default_timer as timer
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA = os.path.join(ROOT, "consulta_cand_2018")
+SCHEMA = os.path.join(ROOT, "HeapHEAD.txt")
+
+# the 1-state, 5-state and all-state datasets
+DATASETS = {
+    "1": ["DF"],
+    "5": ["DF", "GO", "MG", "RJ", "SP"],
+    "all": None,
+}
+
+# the testbed workloads, in the order the testbed runs them
+SELECTS = [
+    "select * from candidates where SQ_CANDIDATO=280000622172",
+    "select * from candidates where SQ_CANDIDATO in (280000624082,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)",
+    "select * from candidates where SQ_CANDIDATO between 280000600000 and 280000700000",
+    "select * from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)",
+]
+DELETES = [
+    "delete from candidates where SQ_CANDIDATO=280000622172",
+    "delete from candidates where SQ_CANDIDATO in (280000624082,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)",
+    "delete from candidates where SQ_CANDIDATO between 280000600000 and 280000700000",
+    "delete from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)",
+]
+WORKLOADS = [
+    ("select", SELECTS),
+    ("insert1", ["insert1.txt"]),
+    ("insert10", ["insert10.txt"] * 3),
+    ("insertall", ["insertall.txt"]),
+    ("delete", DELETES),
+]
+
+
+def dataset_files(name):
+    states = DATASETS[name]
+    if states is None:
+        return sorted(glob.glob(os.path.join(DATA, "consulta_cand_2018_*.csv")))
+    return [os.path.join(DATA, "consulta_cand_2018_{}.csv".format(state))
+            for state in states]
+
+
+def main_module():
+    import main
+    return main
+
+
+def engines():
+    # every concrete DBFile engine in main, so new engines are picked up
+    main = main_module()
+    found = {}
+    pending = list(main.DBFile.__subclasses__())
+    while pending:
+        engine = pending.pop(0)
+        pending.extend(engine.__subclasses__())
+        if engine.struct:
+            found[engine.struct.lower()] = engine
+    return found
+
+
+def statements(workload):
+    for source in workload:
+        if source.endswith(".txt"):
+            with open(os.path.join(ROOT, source), encoding="utf-8") as f:
+                for statement in f:
+                    yield statement
+        else:
+            yield source
+
+
+def percentile(samples, p):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(int(round(p / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(latencies, errors, rows):
+    seconds = sum(latencies)
+    return {
+        "count": len(latencies),
+        "errors": errors,
+        "rows": rows,
+        "seconds": seconds,
+        "throughput": len(latencies) / seconds if seconds else None,
+        "p50": percentile(latencies, 50),
+        "p90": percentile(latencies, 90),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies) if latencies else None,
+    }
+
+
+def run_phase(db, workload):
+    latencies = []
+    errors = 0
+    rows = 0
+    db.reset_stats()
+    for statement in statements(workload):
+        start = timer()
+        try:
+            result = db.parse(statement)
+            if result is not None and not isinstance(result, bool):
+                rows += sum(1 for _ in result)
+        except Exception:
+            errors += 1
+        latencies.append(timer() - start)
+    summary = summarize(latencies, errors, rows)
+    # block accesses of the whole phase, as counted by the engine's pool
+    io = db.stats()["buffer_pool"]
+    summary["io"] = {x: io[x] for x in main_module().BufferPool.counters}
+    return summary
+
+
+def file_sizes(directory):
+    return {name: os.path.getsize(os.path.join(directory, name))
+            for name in sorted(os.listdir(directory))
+            if os.path.isfile(os.path.join(directory, name))}
+
+
+def run_one(engine_name, dataset):
+    # runs in a fresh process: the tables live in a scratch directory and
+    # the peak RSS belongs to this engine and dataset only
+    engine = engines()[engine_name]
+    files = dataset_files(dataset)
+    workdir = tempfile.mkdtemp(prefix="bench-")
+    cwd = os.getcwd()
+    try:
+        os.chdir(workdir)
+        shutil.copy(SCHEMA, "HeapHEAD.txt")
+        source = files[0] if len(files) == 1 else files
+        start = timer()
+        db = engine(source, "HeapHEAD.txt")
+        load = timer() - start
+        loaded = file_sizes(workdir)
+        phases = {}
+        for name, workload in WORKLOADS:
+            phases[name] = run_phase(db, workload)
+        db.flush()
+        return {
+            "engine": engine_name,
+            "dataset": dataset,
+            "files": len(files),
+            "load_seconds": load,
+            "phases": phases,
+            "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            "loaded_bytes": loaded,
+            "final_bytes": file_sizes(workdir),
+        }
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def run_isolated(engine_name, dataset):
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(run_one, (engine_name, dataset))
+
+
+def run_benchmarks(engine_names, datasets):
+    runs = []
+    for dataset in datasets:
+        for engine_name in engine_names:
+            run = run_isolated(engine_name, dataset)
+            report(run)
+            runs.append(run)
+    return {
+        "version": 1,
+        "created": datetime.now().strftime("%Y%m%d%H%M%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "runs": runs,
+    }
+
+
+def milliseconds(seconds):
+    return "-" if seconds is None else "{:.3f}".format(seconds * 1000)
+
+
+def report(run):
+    print("{} / {} state(s): load {:.2f}s, peak RSS {} KiB, {} bytes on disk"
+          .format(run["engine"], run["dataset"], run["load_seconds"],
+                  run["peak_rss_kb"], sum(run["final_bytes"].values())))
+    print("  {:<10}{:>7}{:>7}{:>11}{:>11}{:>11}{:>11}{:>12}{:>10}{:>10}".format(
+        "phase", "stmts", "errs", "p50 ms", "p90 ms", "p99 ms", "max ms",
+        "stmts/s", "reads", "writes"))
+    for name, phase in run["phases"].items():
+        print("  {:<10}{:>7}{:>7}{:>11}{:>11}{:>11}{:>11}{:>12}{:>10}{:>10}".format(
+            name, phase["count"], phase["errors"],
+            milliseconds(phase["p50"]), milliseconds(phase["p90"]),
+            milliseconds(phase["p99"]), milliseconds(phase["max"]),
+            "-" if phase["throughput"] is None
+            else "{:.1f}".format(phase["throughput"]),
+            phase["io"]["reads"], phase["io"]["writes"]))
+
+
+def compare(baseline, current, tolerance):
+    # a phase regresses when its median latency grows past the tolerance
+    previous = {(run["engine"], run["dataset"]): run for run in baseline["runs"]}
+    regressions = 0
+    for run in current["runs"]:
+        old = previous.get((run["engine"], run["dataset"]))
+        if old is None:
+            continue
+        print("{} / {} state(s)".format(run["engine"], run["dataset"]))
+        rows = [("load", old["load_seconds"], run["load_seconds"])]
+        rows += [(name, old["phases"][name]["p50"], phase["p50"])
+                 for name, phase in run["phases"].items()
+                 if name in old["phases"]]
+        for name, before, after in rows:
+            if not before or after is None:
+                continue
+            ratio = after / before
+            flag = ""
+            if ratio > 1 + tolerance:
+                flag = "  REGRESSION"
+                regressions += 1
+            print("  {:<10}{:>11}{:>11}{:>8.2f}x{}".format(
+                name, milliseconds(before), milliseconds(after), ratio, flag))
+        rss = run["peak_rss_kb"] / old["peak_rss_kb"]
+        size = sum(run["final_bytes"].values()) / max(sum(old["final_bytes"].values()), 1)
+        print("  peak RSS {:.2f}x, disk {:.2f}x".format(rss, size))
+    return regressions
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Run the testbed workloads against every engine.")
+    parser.add_argument("--engines", default=None,
+                        help="comma separated engines (default: all)")
+    parser.add_argument("--datasets", default="1,5,all",
+                        help="comma separated datasets out of 1, 5 and all")
+    parser.add_argument("--output", default=None,
+                        help="write the results as json to this file")
+    parser.add_argument("--compare", default=None,
+                        help="json results of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed median latency growth before flagging")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    available = engines()
+    names = list(available) if args.engines is None else args.engines.split(",")
+    for name in names:
+        if name not in available:
+            sys.exit("unknown engine {} (have {})".format(name, ", ".join(available)))
+    datasets = args.datasets.split(",")
+    for dataset in datasets:
+        if dataset not in DATASETS:
+            sys.exit("unknown dataset {}".format(dataset))
+
+    results = run_benchmarks(names, datasets)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(baseline, results, args.tolerance):
+            sys.exit(1)
@@ -0,0 +1,60 @@
+#%%
+import json
+import socket
+
+
+class ServerError(Exception):
+    pass
+
+
+class Client(object):
+    # one connection to a server.py process; statements are sent one at a
+    # time and their answers read back in order
+    def __init__(self, host: str = "localhost", port: int = 7410,
+                 path: str = None, timeout: float = None):
+        if path is not None:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.settimeout(timeout)
+            self.socket.connect(path)
+        else:
+            self.socket = socket.create_connection((host, port), timeout)
+        self.file = self.socket.makefile("rwb")
+        self.requests = 0
+
+    def execute(self, statement: str, params: tuple = (),
+                table: str = None) -> dict:
+        self.requests += 1
+        request = {"id": self.requests, "statement": statement,
+                   "params": list(params)}
+        if table is not None:
+            request["table"] = table
+        self.file.write(json.dumps(request).encode("latin-1") + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("the server closed the connection")
+        response = json.loads(line.decode("latin-1"))
+        if "error" in response:
+            raise ServerError(response["error"])
+        return response
+
+    def query(self, statement: str, params: tuple = (),
+              table: str = None) -> list:
+        # the rows of a select
+        return self.execute(statement, params, table).get("rows", [])
+
+    def parse(self, statement: str, params: tuple = (), table: str = None):
+        # the same answer DBFile.parse gives: rows for a select, the result
+        # of the statement otherwise
+        response = self.execute(statement, params, table)
+        return response["rows"] if "rows" in response else response["result"]
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
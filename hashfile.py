@@ -1 +0,0 @@
-data=SortedDict({'70000600723': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600723', '70032', 'PAULA FRANCINETE ALVES', 'PAULA ALVES PSICOPEDAGOGA', '#NULO#', '65843339149', 'PAULAFRANCINETEALVES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'RN', '-3', 'MOSSOR ', '30/08/1972', '46', '011085892046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '292', 'AGENTE ADMINISTRATIVO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003458320186070000'], '70000600724': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600724', '70022', 'T CIO ROG RIO ALLAN PONTES', 'T CIO ROG RIO DOS RODOVI RIOS', '#NULO#', '56146434191', 'TACIOSUZUKI@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '30/10/1973', '45', '011516682020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '531', 'MOTORISTA DE VE CULOS DE TRANSPORTE COLETIVO DE PASSAGEIROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003544520186070000'], '70000600725': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600725', '70500', 'AKILLA MARIA DE MELO MARINHO', 'AKILLA MARINHO', '#NULO#', '90384067115', 'AKILLAMARINHO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '20/04/1981', '37', '016872322003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '292', 'AGENTE ADMINISTRATIVO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003137820186070000'], '70000600726': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600726', '70156', 'SIMONE PEREIRA MAGALH ES', 'SIMONE MAGALH ES', '#NULO#', '80407242104', 'CONTATO@SIMONEMAGALHAES.NET', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '26/12/1974', '44', '010421842003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '581', 'DONA DE CASA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003536020186070000'], '70000600727': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600727', '70456', 'PAULO WANDERSON MOREIRA MARTINS', 'AUDITOR PAULO MARTINS', '#NULO#', '02988971137', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'S O LUIS DOS MONTES BELOS', '17/07/1990', '28', '055031651007', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003466820186070000'], '70000600728': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600728', '70123', 'NERY MOREIRA DA SILVA', 'NERY DO BRASIL', '#NULO#', '43468756100', 'NERYBRAZIL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'HIDROLINA', '05/08/1972', '46', '019287662062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '403', 'CORRETO DE IM  IS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003449820186070000'], '70000600729': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600729', '70555', 'MAURO CEZAR LIMA', 'DELEGADO MAURO CEZAR', '#NULO#', '25976427120', 'MAUROCEZARLIMA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'EDEIA', '25/05/1963', '55', '014311932038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003414620186070000'], '70000600730': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600730', '70170', 'ALFREDO CARNEIRO DOS SANTOS JUNIOR', 'ALFREDO JUNIOR', '#NULO#', '69889023172', 'ALFREDOJUNIORMAISBRASILIA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '28/01/1979', '39', '014358982003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003146320186070000'], '70000600731': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600731', '70600', 'JOSE CORREIA DE BRITO', 'CORREA LE O DE JUD ', '#NULO#', '47352230106', 'LEAODEJUDA.CORREA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'CORUMB ', '20/09/1970', '48', '007943922003', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '152', 'T CNICO DE BIOLOGIA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003336920186070000'], '70000600732': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600732', '70369', 'VALERIA MARIA DE SANTANA', 'MC BANDIDA', '#NULO#', '00932781101', 'EMPRESARIOMCBANDIDA@OUTLOOK.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '06/08/1986', '32', '018715272038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '163', 'CANTOR E COMPOSITOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003596720186070000'], '70000600733': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600733', '70222', 'JANE KLEBIA DO NASCIMENTO SILVA REIS', 'DRA. JANE', '#NULO#', '25808907187', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '01/03/1963', '55', '004019392038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '02', 'PRETA', '232', 'POLICIAL CIVIL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003301720186070000'], '70000600734': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600734', '70789', 'JOSE BOLIVAR DA ROCHA CRUZ LEITE', 'BOLIVAR ROCHA', '#NULO#', '62081144115', 'BOLIVAR.ROCHAR13@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'PI', '-3', 'CORRENTE', '06/11/1973', '45', '013226832054', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003328420186070000'], '70000600735': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600735', '70000', 'SEVERINO DE SOUSA OLIVEIRA', 'PROF. SEVERINO CAJAZEIRAS', '#NULO#', '14543079191', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'PB', '-3', 'CAJAZEIRAS', '10/04/1959', '59', '000187322011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003527520186070000'], '70000600736': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600736', '70700', 'GEORGIA SILVINA DE SA QUARTIN DE MATOS', 'GEORGIA QUARTIN', '#NULO#', '57322465172', 'GEORGIAQUARTIN@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '23/11/1971', '47', '009601292054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003267720186070000'], '70000600737': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600737', '70133', 'ISAURINETE BARBOSA DE MIRANDA', 'ISAURA BARBOSA', '#NULO#', '69255970100', 'AVANTE.TRE.DF@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'MA', '-3', 'BALSAS', '21/12/1951', '67', '006558082097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '5', 'VI VO(A)', '03', 'PARDA', '999', 'OUTROS', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06003293220186070000'], '70000600738': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600738', '70444', 'SERGIO COSTA DAMACENO', 'SERGINHO DAMACENO', '#NULO#', '53891740115', 'DAMACENO2007@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '16/06/1974', '44', '010703172097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003519020186070000'], '70000600739': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600739', '70101', 'ANGELA MARIA TEIXEIRA', 'ANGELA TEIXEIRA', '#NULO#', '48410942100', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PATOS DE MINAS', '01/01/1959', '60', '002428702097', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003613720186070000'], '70000600740': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600740', '70800', 'CRISTIA CORREA DE LIMA', 'CRISTIA LIMA', '#NULO#', '80953360172', 'CRISTIAC23@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '23/10/1970', '48', '008256582062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003207020186070000'], '70000600741': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600741', '70400', 'LULO DE SOUSA SENA', 'LULO SENA', '#NULO#', '46793879391', 'LULOSENA@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'PI', '-3', 'LUZIL NDIA', '14/01/1973', '45', '034484781171', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '292', 'AGENTE ADMINISTRATIVO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003397620186070000'], '70000600742': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600742', '70987', 'KYARA ZARUTY DA SILVA', 'KYARA ZARUTY LGBTI', '#NULO#', '03973173109', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'SP', '-3', 'BAURU', '09/11/1987', '31', '054529081058', '4', 'FEMININO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '398', 'TELEFONISTA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003370920186070000'], '70000600743': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600743', '70270', 'ROBERTO BATISTA DE LUCENA', 'DR. ROBERTO LUCENA', '#NULO#', '29535433172', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'PB', '-3', 'CAMPINA GRANDE', '22/02/1953', '65', '014433401007', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003500820186070000'], '70000600744': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600744', '70777', 'GEISON RAFAEL VENOZINA DOS SANTOS MOREIRA', 'RAFAEL MOREIRA', '#NULO#', '00651250102', 'GEISONRAFAELM@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'BOM JESUS DA LAPA', '17/11/1984', '34', '017926802070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003259220186070000'], '70000600745': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600745', '70401', 'ARTHUR KLEBER CARDOSO', 'ARTHUR CARDOSO', '#NULO#', '98330039153', 'ARTHURCARDOSODF@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '24/06/1982', '36', '017590702011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06003605220186070000'], '70000600746': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600746', '70333', 'CARLOS ALBERTO ARAUJO DE SOUZA', 'DR. CARLOS', '#NULO#', '85315494772', 'MEDEIROSESOUZAADVOCACIA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '09/04/1965', '53', '083176280345', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003171820186070000'], '70000600747': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600747', '70888', 'JO O ALVES CARDOSO', 'JOAO CARDOSO PROFESSOR-AUDITOR', '#NULO#', '37157728168', 'JOAOALVESEREGINA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '05/08/1966', '52', '004112442003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '2', 'ELEITO POR QP', 'N', 'S', '-1', '06003310220186070000'], '70000600748': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600748', '70100', 'NAIR QUEIROZ PESSOA', 'TIA NAIR', '#NULO#', '54002273172', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'ALTO PARAISO', '27/01/1971', '47', '008433492062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '02', 'PRETA', '230', 'PEDAGOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003431620186070000'], '70000600749': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600749', '70192', 'EDILSON DE JESUS', 'BILL SA DE', '#NULO#', '24915513149', 'AVANTE.TRE.DF@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '13/12/1962', '56', '004009632003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '109', 'AGENTE DE SA DE E SANITARISTA', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06003224020186070000'], '70000600750': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600750', '70200', 'REGINALDO ROCHA SARDINHA', 'REGINALDO SARDINHA', '#NULO#', '76839354172', 'REGINALDOSARDINHA@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'AN POLIS', '30/08/1975', '43', '039397601023', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06003475320186070000'], '70000600751': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600751', '70335', 'BERNARDO ROGERIO MATA DE ARAUJO JUNIOR', 'ROG RIO MORRO DA CRUZ', '#NULO#', '64848914353', 'ROGERIOMORRODACRUZ@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PORTO', '04/01/1981', '37', '014464412011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '40 ', 'SUPERVISOR  INSPETOR E AGENTE DE COMPRAS E VENDAS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003154820186070000'], '70000600752': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600752', '70193', 'RENILSON SANTOS DE ROMA', 'RENILSON ROMA', '#NULO#', '78466393668', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '04/04/1970', '48', '010141832097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003483820186070000'], '70000600753': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600753', '70147', 'KLEBSON FRANCISCO DOS SANTOS', 'GORDINHO DA FARM CIA', '#NULO#', '80643655115', 'KLEBSON34@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SENHOR DO BONFIM', '13/03/1973', '45', '027136081066', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003353920186070000'], '70000600754': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600754', '70999', 'HUELITON SIM ES', 'SGT. SIM ES - TOTO LEGAL', '#NULO#', '71557040672', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BONFIN POLIS', '14/04/1971', '47', '099009170205', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '295', 'MEMBRO DAS FOR AS ARMADAS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003276220186070000'], '70000600755': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600755', '70707', 'MARCOS MAURICIO RODRIGUES PEREIRA', 'MARCOS MAUR CIO', '#NULO#', '44327919187', 'MARCOSMAUR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '11/04/1968', '50', '002245442020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003406120186070000'], '70000600756': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600756', '70007', 'KLEYSON DOS SANTOS SILVA', 'KLEYSON MORENO', '#NULO#', '49445723104', 'PRESIDENCIAFORCAAFROBRASIL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '09/09/1975', '43', '012674802003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003362420186070000'], '70000600757': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600757', '70678', 'DIEGO RODRIGUES MATOS', 'PROF. DIEGO MATOS DA FERCAL', '#NULO#', '01732164126', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '25/09/1989', '29', '020832062003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003215520186070000'], '70000600758': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600758', '70389', 'CL UDIO FLORENCIO DE CAMARGO', 'CAMARGO', '#NULO#', '77576055120', 'AVANTEDF70@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '30/10/1977', '41', '011592852003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003198520186070000'], '70000600759': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600759', '70488', 'JOS  FL VIO TEOFILO CARDOSO', 'FL VIO CARDOSO', '#NULO#', '53908805104', 'AVANTEDF70@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'CE', '-3', 'INDEPENDENCIA', '15/12/1972', '46', '053759510760', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003345420186070000'], '70000600760': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600760', '70277', 'MICHAEL BARBOSA MIRANDA', 'MAICON MIRANDA', '#NULO#', '72098350163', 'PRMICHAELMIRANDA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/06/1983', '35', '018073342046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003423120186070000'], '70000600761': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600761', '70111', 'IRAN LIMA ARAG O FILHO', 'PROF. IRAN LIMA', '#NULO#', '39284743168', 'IRANARAGO@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '28/08/1967', '51', '007454432003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '142', 'PROFESSOR DE ENSINO SUPERIOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003284720186070000'], '70000600762': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600762', '70066', 'GABRIELA SOARES DE FREITAS', 'GABI DA JUVENTUDE', '#NULO#', '04929075106', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '25/01/1994', '24', '022775912097', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '9 ', 'ESTUD TE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003241020186070000'], '70000600763': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600763', '70321', 'LOURIVAL ROSA CORREIA', 'MAJOR LOURIVAL', '#NULO#', '42824834153', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '02/09/1967', '51', '003075582038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003389120186070000'], '70000600764': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600764', '70234', 'RICARDO MOREIRA DA COSTA', 'RICARDO TOB ', '#NULO#', '93416024168', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '19/08/1981', '37', '015963582062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003492320186070000'], '70000600765': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600765', '70070', 'CAROLINA MOUR O ALBUQUERQUE', 'CAROL DOS ANIMAIS', '#NULO#', '77958667191', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '16/11/1975', '43', '010896912003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '171', 'JORNALISTA E REDATOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003180320186070000'], '70000600766': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600766', '70371', 'WUNILBERTO ROCHA MELO', 'WUNILBERTO MELO', '#NULO#', '00629866198', 'WUNILBERTO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRA SILIA', '22/12/1985', '33', '018286102003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '126', 'ANALISTA DE SISTEMAS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003553020186070000'], '70000600767': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600767', '70033', 'EMILINE NASCIMENTO DE OLIVEIRA MUNIZ', 'MILENE DA CEIL DIA', '#NULO#', '82633550100', 'EMILINEMUNIZ@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '09/02/1976', '42', '012222232020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '03', 'PARDA', '134', 'ASSISTENTE SOCIAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003232520186070000'], '70000600768': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600768', '70140', 'ADRIANA DOS ANJOS GLORIA', 'ADRIANA GLORIA', '#NULO#', '53851234120', 'ADRIANAGLORIA2@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRA SILIA', '19/12/1972', '46', '007839582089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003129320186070000'], '70000600769': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000600769', '70099', 'BISMARCK KONRAD HEGERMANN', 'BIS RCK UBER  CABIFY E 99', '#NULO#', '26661586168', 'BISMARCKKONRAD@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '21/03/1967', '51', '007458742062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '537', 'MOTORISTA PARTICULAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003163320186070000'], '70000601681': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601681', '11222', 'JOSIVANIA JORGE DA SILVA GURGEL', 'V NIA GURGEL', '#NULO#', '63837447472', 'VANIAGURGELOFICIAL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'RN', '-3', 'CARA BAS', '25/09/1968', '50', '014730722038', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004047120186070000'], '70000601682': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601682', '11555', 'PEDRO BARROS COSTA', 'PEDRO BARROS', '#NULO#', '26203987387', 'PEDRO.B.COSTA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'PI', '-3', 'SIMPLICIO MENDES', '11/07/1967', '51', '011480312097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004141820186070000'], '70000601683': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601683', '11204', 'ELUIDES AGAPITO MOREIRA', 'PROFESSOR ELU DES AGAPITO', '#NULO#', '30838096115', 'ELUIDESAGAPITO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'CE', '-3', 'IPUEIRAS', '18/11/1964', '54', '007718052054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003908720186070000'], '70000601684': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601684', '11011', 'CARINA SALES DOS SANTOS', 'CARINA SALES', '#NULO#', '32655041828', 'CARINA_SALES@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '16/09/1984', '34', '320990790167', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003787320186070000'], '70000601685': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601685', '11191', 'DANIEL PAULO MORENO DOS REIS', 'DANIEL REIS', '#NULO#', '82057699153', 'REISD2012@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '07/01/1978', '40', '012251812003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003856520186070000'], '70000601686': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601686', '11100', 'KARINE DE SANTES BASTOS MOREIRA', 'KARINE MOREIRA', '#NULO#', '64791416104', 'KARINEBASTOS@IG.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '17/04/1974', '44', '011798272003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '101', 'ENGENHEIRO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004064120186070000'], '70000601687': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601687', '11022', 'ANA MARIA DA SILVA', 'ANA MARIA', '#NULO#', '47796480172', 'ANAMARAMUSICA@BOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'CE', '-3', 'SOBRAL', '06/12/1967', '51', '010924062003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003735120186070000'], '70000601688': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601688', '11190', 'JEAN RODRIGUES OLIVEIRA', 'CORONEL JEAN', '#NULO#', '49811444153', 'JPOLICE17@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '17/10/1971', '47', '010322512054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004003420186070000'], '70000601689': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601689', '11113', 'NEIDE ARAUJO NEIVA', 'NEIDE NEIVA', '#NULO#', '69995699591', 'ALEX@DUARTEEGONTIJO.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'BA', '-3', 'MUTUIPE', '14/09/1975', '43', '075809690590', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004116320186070000'], '70000601690': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601690', '11114', 'CLAUDIA SOUSA COSTA', 'PROFESSORA CL UDIA COSTA', '#NULO#', '10693471832', 'KLLAUDHIA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'MA', '-3', 'COLINAS', '02/04/1968', '50', '177241311147', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003812820186070000'], '70000601691': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601691', '11101', 'ATAILDES JOS  DE OLIVEIRA', 'ATAILDES OLIVEIRA', '#NULO#', '30546117104', 'ATAILDESOJ@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'BA', '-3', 'TABOCAS DO BREJO VELHO', '09/10/1963', '55', '002863412038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003752120186070000'], '70000601692': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601692', '11123', 'ANDERSON MEDINA BORGES', 'ANDERSON MEDINA', '#NULO#', '96709863115', 'ANDERSON_VISA@TERRA.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '08/11/1982', '36', '015074062046', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003743620186070000'], '70000601693': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601693', '11109', 'FABIO LETICIO OLIVEIRA DE SOUZA', 'PROFESSOR FABIO LETICIO', '#NULO#', '83596747104', 'PROFESSORFABIOLETICIO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SANTA MARIA DA VIT RIA', '27/04/1975', '43', '076134060574', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '02', 'PRETA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003925720186070000'], '70000601694': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601694', '11333', 'GERALDO FRANCISCO DO NASCIMENTO', 'GERALDO NASCIMENTO', '#NULO#', '12112275100', 'GERALDONASCIMENTOPP11@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'MG', '-3', 'AIMOR S', '19/01/1955', '63', '002411402070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '403', 'CORRETO DE IM  IS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003951220186070000'], '70000601695': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601695', '11000', 'RENATA MESQUITA D AGUIAR', 'RENATA D AGUIAR', '#NULO#', '12461082758', 'RENATA_M_DAGUIAR@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '07/11/1988', '30', '131786630361', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004150320186070000'], '70000601696': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601696', '11389', 'EDLEUZA DE SOUSA MACHADO PAIVA', 'EDLEUZA PAIVA', '#NULO#', '53918363104', 'EDLEUZAPAIVA71@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'GO', '-3', 'PLANALTINA', '29/03/1971', '47', '008397582097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '5', 'VI VO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003873520186070000'], '70000601697': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601697', '11110', 'BERNARDETH DE FATIMA SILVA MARTINS', 'BERNARDETH MARTINS', '#NULO#', '23861525100', 'DETH.FATIMA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BELO HORIZONTE', '05/06/1960', '58', '000193792089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003760620186070000'], '70000601698': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601698', '11611', 'DANIEL GINO MARTINS', 'DANIEL GINO', '#NULO#', '52342905149', 'DANIELGINNO7@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '07/06/1970', '48', '007533152020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003839520186070000'], '70000601699': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601699', '11133', 'DANIEL MATOS', 'DANIEL MATOS', '#NULO#', '50542990172', 'PR.DANIELMATOS@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'TAGUATINGA', '10/08/1972', '46', '032827961023', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003848020186070000'], '70000601700': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601700', '11117', 'DANIEL SILVA DE ARAUJO', 'PROFESSOR DANIEL ARA JO', '#NULO#', '62007394120', 'DSA.ARAUJO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '07/10/1976', '42', '012484922003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003865020186070000'], '70000601701': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601701', '11004', 'FABIANA LACERDA DE BARROS MARQUES', 'FABIANA LACERDA', '#NULO#', '72363428153', 'INOVERENOVEFABIANALACERDA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '20/11/1982', '36', '016968122038', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003917220186070000'], '70000601702': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601702', '11444', 'JOSE ARAUJO DE CARVALHO LIMA', 'JOSE ARAUJO', '#NULO#', '69675627387', 'ASTDF.PRESIDENTE@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'PI', '-3', 'COCAL', '01/12/1975', '43', '018577352003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '536', 'TAXISTA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004020420186070000'], '70000601703': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601703', '11456', 'PABLO DE SOUSA VALENTE LIMA', 'PABLO VALENTE', '#NULO#', '01486766188', 'PABLOVALENTE@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '03/01/1986', '32', '016718692003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '394', 'AUXILIAR DE ESCRIT RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004133320186070000'], '70000601704': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601704', '11212', 'ULYSSES JOSE GUEDES GOMES', 'DR ULYSSES', '#NULO#', '28205561672', 'DRULYSSESGOMES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BELO HORIZONTE', '21/04/1962', '56', '011136472020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '111', 'M DICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004185520186070000'], '70000601705': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601705', '11061', 'BRUNO LOPES DORNELAS', 'DORNELLAS', '#NULO#', '99500035120', 'BRUNODORNELLAS@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PATROC NIO', '30/11/1982', '36', '015735152003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003778820186070000'], '70000601706': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601706', '11777', 'CLAUDETE SILVA DO NASCIMENTO', 'CLAUDETE', '#NULO#', '54659094120', 'JORNALISTA.CLAUDETENASCIMENTO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '23/05/1973', '45', '009853012046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003804320186070000'], '70000601707': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601707', '11500', 'CL UDIO DE SOUZA BENTO', 'CLAUDIO BENTO', '#NULO#', '47972327149', 'CLAUDIOBENTO03@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'BA', '-3', 'CARINHANHA', '13/10/1968', '50', '059941580582', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003821320186070000'], '70000601708': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601708', '11711', 'ELIANE PEREIRA ARCENIO', 'ELIANE ARCENIO', '#NULO#', '55267777153', 'ELIANEARCENIO2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'GO', '-3', 'AN POLIS', '26/01/1972', '46', '009906892046', '4', 'FEMININO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003890520186070000'], '70000601709': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601709', '11122', 'FRANCISCO JOAO MARQUES FREITAS', 'JO O BAR O', '#NULO#', '36442364100', 'JOAOBARAO786@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'MA', '-3', 'ARAIOSES', '09/03/1964', '54', '001599492062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '537', 'MOTORISTA PARTICULAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003942720186070000'], '70000601710': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601710', '11121', 'JAILTON FERREIRA SOUSA', 'JAILTON VIGILANTE', '#NULO#', '41707893187', 'JAILTON.VIGILANTE2017@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'MA', '-3', 'MON  O', '22/03/1968', '50', '014610872062', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003994920186070000'], '70000601711': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601711', '11321', 'JOAO PAULO BARBOSA DE FARIAS', 'PASTOR JO O PAULO', '#NULO#', '60226510182', 'PRJOAOPAULO.BARBOSA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '24/06/1975', '43', '011107242038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '910', 'SACERDOTE OU MEMBRO DE ORDEM OU SEITA RELIGIOSA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004011920186070000'], '70000601712': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601712', '11001', 'MAGDA LEITE DE ALBUQUERQUE', 'MAGDA LEITE', '#NULO#', '79422926149', '123MAGALBUQ@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '28/06/1976', '42', '013669102097', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004099320186070000'], '70000601713': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601713', '11911', 'ORLANDO SALES DE OLIVEIRA JUNIOR', 'PROFESSOR ORLANDO J NIOR', '#NULO#', '02807779140', 'ORLANDO.PROFESSOR13@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'BA', '-3', 'CAN POLIS', '13/10/1988', '30', '020258492062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004124820186070000'], '70000601714': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601714', '11511', 'RENATO CARNEIRO PEDROZA', 'RENATINHO', '#NULO#', '82077150149', 'RENATINHORCP@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'PLANALTINA', '17/01/1976', '42', '011867372003', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004168520186070000'], '70000601715': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601715', '11234', 'VALDELINO RODRIGUES BARCELOS', 'VALDELINO BARCELOS', '#NULO#', '08425655153', 'VRBBARCELOS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ITUIUTABA', '30/05/1950', '68', '005535242070', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '2', 'ELEITO POR QP', 'N', 'S', '-1', '06004194020186070000'], '70000601716': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601716', '11999', 'IRANY DOMINGOS GOMES', 'IRANY GOMES', '#NULO#', '63570289168', 'IRANY.GOMES@IG.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '15/03/1971', '47', '127891640213', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003986420186070000'], '70000601717': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601717', '11311', 'CARLOS DALVAN SOARES DE OLIVEIRA', 'CARLOS DALVAN', '#NULO#', '60091376327', 'CARLOSCDSO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '03/12/1987', '31', '064676740795', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003795820186070000'], '70000601718': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601718', '11033', 'JULIO CEZAR DE JESUS', 'JULIO CEZAR', '#NULO#', '61909203149', 'CONTATO@JULIOCEZARDF.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '18/10/1973', '45', '009600432046', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '124', 'CONTADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004055620186070000'], '70000601719': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601719', '11211', 'ALEXANDRE DE JESUS SILVA YANEZ', 'ALEXANDRE YANEZ', '#NULO#', '48454141120', 'ALEXANDRE.YANEZ@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '17/10/1970', '48', '009775992046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003726620186070000'], '70000601720': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601720', '11112', 'FRANCISCO EVANDO XIMENES MENESES', 'EVANDO MENESES', '#NULO#', '24850446191', 'MENESES.EVANDO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'CE', '-3', 'SOBRAL', '06/08/1961', '57', '009998452046', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003934220186070000'], '70000601721': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601721', '11013', 'GLAUCIA SIMOES DA SILVA', 'GLAUCIA SIM ES ', '#NULO#', '60658843168', 'GLAUCIAEDUCACAO11@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '28/07/1973', '45', '008734092070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003969420186070000'], '70000601722': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601722', '11111', 'HERCULES GOMES RIBEIRO', 'PROFESSOR H RCULES', '#NULO#', '25928570104', 'HERCULLLESSS@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'SOBRADINHO DF', '09/09/1965', '53', '010386972011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '142', 'PROFESSOR DE ENSINO SUPERIOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06003977920186070000'], '70000601723': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601723', '11543', 'JOSE HEITOR DA SILVA CASTRO', 'HEITOR DO HOSPITAL', '#NULO#', '24811254104', 'JOSEHEITORDASILVACASTRO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'PI', '-3', 'S O RAIMUNDO NONATO', '29/10/1962', '56', '002301462062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004038620186070000'], '70000601724': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601724', '11411', 'SANDRO BERGAMIM', 'SANDRO BERGAMIM', '#NULO#', '59093544934', 'SANDROBERGAMIM2012@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'SC', '-3', 'CONC RDIA', '10/03/1969', '49', '005073802348', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004177020186070000'], '70000601725': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601725', '11789', 'EDUARDO REZENDE DE CARVALHO', 'PROFESSOR EDUARDO REZENDE', '#NULO#', '86447750149', 'PROFESSOREDUARDOCEILANDIA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '17/09/1978', '40', '014018902003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06003882020186070000'], '70000601726': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601726', '11341', 'LINDOBEX RODRIGUES ALVES', 'LINDOBEX', '#NULO#', '30841453187', 'LINDOBEX248@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '30/06/1963', '55', '005690052062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004072620186070000'], '70000601727': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601727', '11042', 'MARIA DO SOCORRO ABREU CASSIANO', 'MARIA CASSIANO', '#NULO#', '50589610163', 'MARIACASSIANO710@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'MA', '-3', 'S O LU S', '18/11/1969', '49', '007621532011', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004107820186070000'], '70000601728': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000601728', '11300', 'LUIZ AFONSO LUSTOSA DO AMARAL', 'LUIZ AFONSO', '#NULO#', '11636351115', 'LUSTOSAAMARAL@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'PI', '-3', 'CURIMAT ', '27/09/1955', '63', '004296851503', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '395', 'BANC RIO E ECONOMI RIO', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06004081120186070000'], '70000602342': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '3', 'GOVERNADOR', '70000602342', '30', 'ALEXANDRE FREIRE GUERRA', 'ALEXANDRE GUERRA', '#NULO#', '89668766172', 'GUERRAPELODF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '06/09/1980', '38', '013795672089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004237720186070000'], '70000602343': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '4', 'VICE-GOVERNADOR', '70000602343', '30', 'ERICKSON JOS  BLUN LIMA', 'ERICKSON BLUN', '#NULO#', '56701357920', 'ERIBLUN@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'PR', '-3', 'PONTA GROSSA', '05/01/1966', '52', '004763430620', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '111', 'M DICO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06004359120186070000'], '70000602344': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602344', '3000', 'ANNEBELLE FERREIRA BORGES', 'BELLE BORGES', '#NULO#', '01185593543', 'BELLEBORGESDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'PR', '-3', 'CURITIBA', '21/08/1982', '36', '094972490540', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004263220186070000'], '70000602345': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602345', '3033', 'ASSIS MARINHO CARVALHO', 'ASSIS MARINHO', '#NULO#', '36041068187', 'ASSISMARINHONOVO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'BA', '-3', 'XIQUE-XIQUE', '04/10/1965', '53', '015394562054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004271720186070000'], '70000602346': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602346', '3034', 'DIEGO BARROS MAIA', 'DIEGO MAIA', '#NULO#', '99898497149', 'DBMAIA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '16/12/1982', '36', '015473192089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004315420186070000'], '70000602347': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602347', '3023', 'GISELIA FERREIRA', 'GISELIA', '#NULO#', '84124857934', 'GF.UNIVERSIDADE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'PR', '-3', 'SANTA F ', '10/05/1972', '46', '050873130604', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004419820186070000'], '70000602348': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602348', '3030', 'RODRIGO FREIRE DE ARAG O', 'RODRIGO FREIRE', '#NULO#', '89639677191', 'RODRIGOFREIRENOVO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '25/10/1980', '38', '013792962020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004618920186070000'], '70000602349': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602349', '3010', 'THIAGO DE ARAUJO MACIEIRA MANZONI', 'THIAGO MANZONI', '#NULO#', '00540316130', 'THIAGOMANZONI@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'MS', '-3', 'CAMPO GRANDE', '25/01/1984', '35', '016039412062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004627420186070000'], '70000602350': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602350', '30777', 'ALLAN FREIRE BARBOSA DA SILVA', 'ALLAN FREIRE', '#NULO#', '73323020120', 'FREIRE.ALLAN@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '02/05/1988', '30', '020612292003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004246220186070000'], '70000602351': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602351', '30400', 'ANDREA PONTES QUADROS C RTES', 'ANDREA QUADROS', '#NULO#', '78568560920', 'ANDREAQUADROSADV@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SALVADOR', '28/07/1974', '44', '076086990523', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004254720186070000'], '70000602352': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602352', '30100', 'CARLOS EDUARDO CURADO GOMES', 'KADU GOMES', '#NULO#', '36880795153', 'KADUGOMESNOVO@ICLOUD.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'SP', '-3', 'SANTO ANDR ', '17/04/1968', '50', '001275262070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004280220186070000'], '70000602353': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602353', '30000', 'CL UDIO CAVALCANTI BARRA', 'CL UDIO BARRA', '#NULO#', '78204976100', 'FALECOMIGO@CLAUDIOBARRA.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'PA', '-3', 'BEL M', '08/02/1976', '42', '227883460124', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004306920186070000'], '70000602354': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602354', '30600', 'DIEGO SILVA WANDERLEY', 'DR. DIEGO WANDERLEY', '#NULO#', '00962992151', 'DRDIEGOWANDERLEY@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '25/04/1985', '33', '016041602070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '111', 'M DICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004323920186070000'], '70000602355': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602355', '30555', 'EDUARDO MITSUO YODA', 'EDUARDO MITSUO YODA', '#NULO#', '71840222115', 'MITSUOYODA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '01/12/1981', '37', '017061912011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '04', 'AMARELA', '395', 'BANC RIO E ECONOMI RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004332420186070000'], '70000602356': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602356', '30999', 'ELISABETH LEITE RIBEIRO', 'BETH RIBEIRO', '#NULO#', '72897660759', 'LRIBEIROADV@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '26/12/1962', '56', '014671242070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004340920186070000'], '70000602357': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602357', '30300', 'ELVIS SEITI IWANO', 'ELVIS SEITI', '#NULO#', '62025805187', 'ELVIS30DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '16/10/1975', '43', '010946872003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '04', 'AMARELA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004652920186070000'], '70000602358': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602358', '30456', 'ERIKA FURTADO VIEIRA BERBERT', 'ERIKA BERBERT', '#NULO#', '83133291149', 'ERIKA_VIEIRA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'MA', '-3', 'S O LU S', '06/12/1978', '40', '013640842046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '222', 'NUTRICIONISTA E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004367620186070000'], '70000602359': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602359', '30500', 'FERNANDO MOREIRA OLIVIERE CAIXETA', 'CAIXETA', '#NULO#', '71033408115', 'FOLIVIERE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PATOS DE MINAS', '05/06/1981', '37', '017217202020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004376120186070000'], '70000602360': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602360', '30123', 'GERALDO ANT NIO DE CASTRO', 'GERA DE CASTRO', '#NULO#', '14487128153', 'GERADECASTRO@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BELO HORIZONTE', '04/10/1959', '59', '006652182020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004393120186070000'], '70000602361': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602361', '30010', 'GEUSA SANTANA DA SILVA', 'GEUSA', '#NULO#', '18327648187', 'GEUSACUCA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '10/03/1960', '58', '000970192003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004401620186070000'], '70000602362': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602362', '30700', 'HUMBERTO BARRETO ALENCAR', 'HUMBERTO ALENCAR ', '#NULO#', '82876150115', 'HUMBERTO.ALENCAR@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '19/11/1977', '41', '011924742089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004428320186070000'], '70000602363': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602363', '30030', 'JAILTON ALMEIDA DO NASCIMENTO', 'JAJA JAILTON', '#NULO#', '30175718822', 'JAILTONN@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '03/07/1978', '40', '279077340132', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004436820186070000'], '70000602364': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602364', '30130', 'JEFFERSON BORGES DA SILVA MOREIRA', 'JEFFERSON MOREIRA', '#NULO#', '92443141187', 'JEFFERSON.JBSM@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/01/1982', '36', '014471352038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004445320186070000'], '70000602365': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602365', '30444', 'JULIA LUCY MARQUES ARAUJO', 'J LIA LUCY', '#NULO#', '00482309105', 'JULIALUCY21@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PATOS DE MINAS', '21/11/1985', '33', '019171252003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06004453820186070000'], '70000602366': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602366', '30333', 'LUIZ GUILHERME PINHEIRO DE MEDEIROS', 'LGM', '#NULO#', '01339129140', 'LUIZGUILHERMEPM@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '07/04/1993', '25', '022524012003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '931', ' STUDANTE BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004462320186070000'], '70000602367': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602367', '30888', 'LUIZ HENRIQUE FADEL FRAZ O', 'FRAZ O', '#NULO#', '94800600197', 'DEPUTADOFRAZAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '27/04/1983', '35', '017437412054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004470820186070000'], '70000602368': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602368', '30008', 'MARCOS SOUTO DE LIMA', 'CORONEL SOUTO', '#NULO#', '80884334791', 'MARCOSSOUTO1965@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'CABO FRIO', '25/02/1965', '53', '027376661244', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '295', 'MEMBRO DAS FOR AS ARMADAS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004497520186070000'], '70000602369': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602369', '30330', 'MARIA CL UDIA DE VILHENA MORAES', 'CL UDIA VILHENA', '#NULO#', '06326594839', 'CLAUDIAVILHENAMORAES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '09/11/1961', '57', '010286912089', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004506020186070000'], '70000602370': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602370', '30321', 'MARIA RITA ALVES DE SOUZA', 'DR. MARIA RITA', '#NULO#', '29593786104', 'MARIARITA.ADV@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ARINOS', '30/01/1963', '55', '000415462046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004514520186070000'], '70000602371': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602371', '30003', 'MAURO PORTO', 'MAURO PORTO', '#NULO#', '51285444191', 'MAUROPORTODF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/09/1971', '47', '009492522062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004523020186070000'], '70000602372': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602372', '30303', 'M RCIA HELENA CORR A RIBEIRO', 'M RCIA RIBEIRO', '#NULO#', '60323310168', 'MARCIAHCRIBEIRO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '14/12/1972', '46', '009666422070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004489020186070000'], '70000602373': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602373', '30111', 'NEIVALDO SANCHES DE OLIVEIRA', 'SANCHES', '#NULO#', '18308490182', 'GERENTEESTADUAL.SANCHES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '06/11/1961', '57', '012809102011', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004531520186070000'], '70000602374': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602374', '30061', 'N LIO DOMINGUES', 'N LIO DOMINGUES', '#NULO#', '22119825149', 'NELIODOM@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '18/01/1961', '57', '000985632054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004549720186070000'], '70000602375': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602375', '30800', 'PATRICIA CARLOS DOS SANTOS', 'PATRICIA AMADA ', '#NULO#', '06204079646', 'PATRICIAAMADABRASIL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'MG', '-3', 'SALINAS', '17/03/1983', '35', '139558290221', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004558220186070000'], '70000602376': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602376', '30789', 'PAULO CESAR DA ROCHA ANTONY', 'COMANDANTE  ANTONY', '#NULO#', '41224426053', 'PCRANTONY61@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'PA', '-3', 'BEL M', '08/01/1961', '57', '017584140302', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '181', 'PILOTO DE AVIA   COMERC L  NAVEGADOR  MEC NICO DE V O E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004566720186070000'], '70000602377': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602377', '30222', 'PEDRO PAULO ARAUJO MOREIRA', 'PEDRO PAULO DO NOVO', '#NULO#', '41755758120', 'PEDROPAULODONOVO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '29/06/1965', '53', '000623992070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004583720186070000'], '70000602378': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602378', '30007', 'RENATA DINIZ DE ALMEIDA', 'RENATA DINIZ', '#NULO#', '82794430106', 'RENATADINIZ30DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '14/01/1977', '41', '013638362003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004592220186070000'], '70000602379': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602379', '30033', 'ROBERTO DA SILVA RIBEIRO', 'ROBERTO RIBEIRO', '#NULO#', '11927719747', 'RIBEIRO.NK@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '11/01/1989', '29', '137829520337', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004600720186070000'], '70000602380': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602380', '30230', 'V TOR BITTENCOURT DE AQUINO FERNANDES', 'V TOR AQUINO', '#NULO#', '01621508145', 'NOVOVITORAQUINO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '22/02/1987', '31', '019512332038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '111', 'M DICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004635920186070000'], '70000602381': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000602381', '300', 'PAULO ROBERTO ROQUE ANTONIO KHOURI', 'PAULO ROQUE ', '#NULO#', '43726461604', 'PAULOKHOURI@KHOURIADVOCACIA.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'MG', '-3', 'CAJURI', '14/05/1967', '51', '010677012011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004575220186070000'], '70000602382': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000602382', '300', 'FIDELIS ANTONIO FANTIN JUNIOR', 'FIDELIS FANTIN', '#NULO#', '51138190934', 'FIDELISFANTIN@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'SC', '-3', 'VIDEIRA', '03/09/1966', '52', '015930510930', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06004384620186070000'], '70000602383': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000602383', '300', 'CESAR FERNANDO OLESKOVICZ', 'CESAR OLESK', '#NULO#', '64594840159', 'CESAR@BIOPARTS.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '30', 'NOVO', 'PARTIDO NOVO', '70000050065', 'PARTIDO ISOLADO', 'NOVO', '1', 'BRASILEIRA NATA', 'PR', '-3', 'UNI O DA VIT RIA', '02/04/1974', '44', '010948352003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '115', 'ODONT LOGO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06004298420186070000'], '70000602704': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '3', 'GOVERNADOR', '70000602704', '50', 'MARIA FATIMA DE SOUSA', 'F TIMA SOUSA', '#NULO#', '23818735468', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'PB', '-3', 'S O JOS  LAGOA TAPADA', '29/11/1960', '58', '013064842038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '142', 'PROFESSOR DE ENSINO SUPERIOR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06005017120186070000'], '70000602705': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '4', 'VICE-GOVERNADOR', '70000602705', '50', 'CLEMENTINA ARAUJO BAGNO DA SILVA', 'KEKA BAGNO', '#NULO#', '02328198155', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '13/04/1988', '30', '020025672003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '134', 'ASSISTENTE SOCIAL', '-1', '4', 'N O ELEITO', 'N', 'N', '-1', '06004774320186070000'], '70000602706': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000602706', '501', 'FRANCISCO CLAUDIO CORREA MEYER SANT ANNA', 'CHICO SANT ANNA', '#NULO#', '11636114172', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '04/10/1957', '61', '000816492038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '171', 'JORNALISTA E REDATOR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004852020186070000'], '70000602707': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000602707', '500', 'MARIVALDO DE CASTRO PEREIRA', 'MARIVALDO PEREIRA', '#NULO#', '28337410817', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '06/07/1979', '39', '193841020191', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06005034120186070000'], '70000602708': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602708', '5016', 'ANGELO BALBINO SOARES PEREIRA', 'ANGELO BALBINO', '#NULO#', '49183575120', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '23/11/1968', '50', '007892572089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004688120186070000'], '70000602709': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602709', '5005', 'ANJULI TOSTES FARIA', 'ANJULI', '#NULO#', '01710181176', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '23/08/1985', '33', '015737762046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004696620186070000'], '70000602710': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602710', '5001', 'ANTONIO JORGE CARDOSO DE OLIVEIRA', 'ANTONIO CARDOSO', '#NULO#', '89290259787', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '28/07/1966', '52', '072998240353', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '910', 'SACERDOTE OU MEMBRO DE ORDEM OU SEITA RELIGIOSA', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004713620186070000'], '70000602711': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602711', '5013', 'EDISON PINTO DE OLIVEIRA', 'EDISON CEILANDIA', '#NULO#', '50430599153', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PARACATU', '13/10/1969', '49', '007400522070', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '541', 'MEC NICO DE MANUTEN  O', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004782820186070000'], '70000602712': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602712', '5055', 'ERICK VINICIUS ANDRADE DA ROCHA', 'ERICK ANDRADE', '#NULO#', '03898853128', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '08/04/1995', '23', '023360942011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004818020186070000'], '70000602713': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602713', '5088', 'EVELIN MACIEL BRISOLLA', 'EVELIN MACIEL', '#NULO#', '49065386149', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'PEN POLIS', '07/03/1969', '49', '008189052062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004826520186070000'], '70000602714': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602714', '5060', 'HELO SA PIRES ZAMPROGNO GOZZI', 'HEL  PIRES', '#NULO#', '26138948149', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ARAGUARI', '17/09/1955', '63', '000477802003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004878720186070000'], '70000602715': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602715', '5077', 'INOC NCIO CALTAGIRONI DANTAS', 'INOC NCIO CALTAGIRONI', '#NULO#', '02400723168', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'LADAINHA', '07/10/1943', '75', '004296322003', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004895720186070000'], '70000602716': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602716', '5033', 'ITAMAR ALVES DE OLIVEIRA', 'ITAMAR', '#NULO#', '32873808187', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'GRAJA ', '15/11/1965', '53', '012952332089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004904220186070000'], '70000602717': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602717', '2121', 'JAMIL MAGARI', 'JAMIL MAGARI PCB', '#NULO#', '77867556834', 'PCB.BRASILIA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '21', 'PCB', 'PARTIDO COMUNISTA BRASILEIRO', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'RINOPOLIS', '30/10/1956', '62', '001848172089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06004921220186070000'], '70000602718': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602718', '5051', 'JOS  GON ALVES DE ALMEIDA', 'JAC ', '#NULO#', '07442485820', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ITACARAMBI', '18/12/1965', '53', '090470100191', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06005138520186070000'], '70000602719': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602719', '5050', 'MARIA JOS  DA CONCEI  O MANINHA', 'MANINHA', '#NULO#', '18592163153', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'JANU RIA', '13/09/1948', '70', '001110832070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06005025620186070000'], '70000602720': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602720', '5011', 'NATHAN BELCAVELLO DE OLIVEIRA', 'NATHAN BELCAVELLO', '#NULO#', '05014663630', 'SECRETARIAGERAL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'JUIZ DE FORA', '10/02/1982', '36', '125379000256', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06005051120186070000'], '70000602721': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602721', '5000', 'OSVALDO ROSA DA SILVA JUNIOR', 'JUNIOR XUKURU', '#NULO#', '22241603805', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'PE', '-3', 'PESQUEIRA', '10/02/1983', '35', '283293910183', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '05', 'IND GENA', '129', 'ARTES O', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06005147020186070000'], '70000602722': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602722', '5061', 'ROG RIO DA VEIGA', 'ROG RIO DA VEIGA', '#NULO#', '29034964809', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'ORLANDIA', '03/11/1981', '37', '254667790116', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06005086320186070000'], '70000602723': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000602723', '5044', 'TALITA VICTOR SILVA', 'TALITA VICTOR', '#NULO#', '00584786123', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '29/04/1984', '34', '018038472062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06005103320186070000'], '70000602724': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602724', '50050', 'ANTONIO CARLOS DE ANDRADE', 'TONINHO DO PSOL', '#NULO#', '41489772715', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BAR O DE MONTE ALTO', '04/08/1953', '65', '007543752011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004705120186070000'], '70000602725': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602725', '50321', 'CARLOS HENRIQUE MOTA DE MORAES', 'EDUCADOR CARLOS', '#NULO#', '12697916806', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'CE', '-3', 'RERIUTABA', '21/03/1971', '47', '008422132038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004722120186070000'], '70000602726': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602726', '50234', 'CARLOS ROBERTO DE SOUZA', 'CARL O', '#NULO#', '28155157172', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'PR', '-3', 'RIO NEGRO', '24/08/1958', '60', '001826872054', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004730620186070000'], '70000602727': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602727', '50111', 'CARMEM DE OLIVEIRA FURTADO', 'CARMEM DE OLIVEIRA', '#NULO#', '24846961168', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '17/08/1965', '53', '004154262062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004748820186070000'], '70000602728': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602728', '50161', 'CELSO RIBEIRO PAZ', 'CELSO RIBEIRO', '#NULO#', '83843493391', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'MAT ES', '16/01/1978', '40', '018664472046', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '537', 'MOTORISTA PARTICULAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004765820186070000'], '70000602729': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602729', '50445', 'C SSIO EDUARDO SILVEIRA XAVIER', 'C SSIO EDUARDO', '#NULO#', '04256742158', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'RS', '-3', 'SANTA MARIA', '11/06/1996', '22', '023566932003', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '164', 'M SICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004757320186070000'], '70000602730': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602730', '50702', 'ELEM SIMONE ANDRADE DOS SANTOS', 'ELEM SIMONE', '#NULO#', '96875763168', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIANIA', '22/05/1979', '39', '031545972712', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '243', 'T CNICO DE ENFERMAGEM E ASSEMELHADOS (EXCETO ENFERMEIRO)', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004809520186070000'], '70000602731': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602731', '50133', 'FRANCISCO WILAS DE SOUSA SANTOS', 'COD Z O', '#NULO#', '81230451153', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'ARAME', '07/12/1975', '43', '016790352097', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PA A', '413', 'FEIRANTE  AMBULANTE E MASCATE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004860520186070000'], '70000602732': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602732', '50123', 'F BIO FELIX SILVEIRA', 'F BIO FELIX', '#NULO#', '01080639179', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '20/12/1985', '33', '019458762020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '134', 'ASSISTENTE SOCIAL', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06004835020186070000'], '70000602733': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602733', '50442', 'ILKA TEODORO', 'ILKA TEODORO', '#NULO#', '80692389172', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '09/05/1978', '40', '013564952011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004887220186070000'], '70000602734': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602734', '50700', 'JAIR ARA JO', 'JARO BRINY', '#NULO#', '60598751149', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'URU U ', '22/11/1971', '47', '013958532046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004912720186070000'], '70000602735': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602735', '50000', 'JANA NA GOMES PENTEADO', 'JANAINA PENTEADO', '#NULO#', '91819865134', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '15/11/1975', '43', '010880322011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004939420186070000'], '70000602736': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602736', '50420', 'JUAN RICTHELLY VIEIRA DA SILVA', 'JUAN RICTHELLY', '#NULO#', '03260701176', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '22/01/1991', '27', '021530822038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06004947920186070000'], '70000602737': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602737', '50017', 'JULIANA DE FREITAS NASCIMENTO', 'JULIANA DE FREITAS', '#NULO#', '00944519156', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '09/07/1984', '34', '018187972089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004956420186070000'], '70000602738': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602738', '50678', 'JURACY MARQUES DOS SANTOS', 'JURACY MARQUES', '#NULO#', '57205302587', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'BA', '-3', 'RIO DAS CONTAS', '08/06/1970', '48', '012901532097', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', ' 31', 'EST ANTE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004964920186070000'], '70000602739': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602739', '50180', 'LUDMILA WEIZMANN SUAID LEVYSKI', 'LUDMILA SUAID', '#NULO#', '92862950149', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '19/06/1979', '39', '013938152003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '134', 'ASSISTENTE SOCIAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004981920186070000'], '70000602740': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602740', '50222', 'MARCELO PIRES MACHADO', 'MARCELO VIGILANTE', '#NULO#', '91258987520', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'GUARULHOS', '28/09/1976', '42', '081385000558', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06004990420186070000'], '70000602741': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602741', '50100', 'MAX MACIEL CAVALCANTI', 'MAX MACIEL', '#NULO#', '72417935104', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '01/12/1982', '36', '016110462038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '230', 'PEDAGOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005042620186070000'], '70000602742': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602742', '50061', 'RAPHAEL SEBBA DAHER FLEURY CURADO', 'RAPHAEL SEBBA', '#NULO#', '01285313127', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOI NIA', '29/09/1990', '28', '020797752038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '133', 'SOCI LOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005069320186070000'], '70000602743': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602743', '50005', 'RITA DE CASSIA FERNANDES DE ANDRADE', 'RITA ANDRADE', '#NULO#', '33917817187', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'RN', '-3', 'EDUARDO GOMES', '17/05/1963', '55', '007475162003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005077820186070000'], '70000602744': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602744', '50500', 'RUBENS BIAS PINTO', 'RUBENS BIAS', '#NULO#', '30836047850', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '13/03/1983', '35', '283252290141', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '132', 'PSIC LOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005094820186070000'], '70000602745': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602745', '50555', 'THIAGO DE  VILA E SILVA OLIVEIRA', 'MANDATO COLETIVO', '#NULO#', '01521947112', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '26/08/1986', '32', '019199212003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '136', 'COMUNIC LOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005111820186070000'], '70000602746': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000602746', '50300', 'ZAQUEU DE OLIVEIRA BRAGA', 'ZAQUEU BRAGA', '#NULO#', '72043407104', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '20/03/1985', '33', '017605482020', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '9', 'DIVORCIADO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005120320186070000'], '70000602747': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000602747', '501', 'LINCON MAC RIO MAIA', 'LINCOLN MAC RIO', '#NULO#', '84173777191', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '21/04/1978', '40', '012699012020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '171', 'JORNALISTA E REDATOR', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06004973420186070000'], '70000602748': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000602748', '500', 'MARCOS TOSCANO SIEBRA BRITO', 'MARCOS TOSCANO', '#NULO#', '05063139485', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'PE', '-3', 'RECIFE', '10/07/1983', '35', '060175970841', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06005008620186070000'], '70000602749': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000602749', '501', 'EDUARDO D ALBERGARIA FREITAS', 'EDUARDO D ALBERGARIA', '#NULO#', '05516616743', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '18/03/1981', '37', '108356080361', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06004791320186070000'], '70000602750': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000602750', '500', 'FERNANDA BARBOSA GRANJA ARAUJO', 'FERNANDA GRANJA', '#NULO#', '70034982191', 'SECRETARIAGERALPSOLDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '50', 'PSOL', 'PARTIDO SOCIALISMO E LIBERDADE', '70000050081', 'ELAS POR N S: SEM MEDO DE MUDAR O DF', 'PSOL / PCB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '17/06/1979', '39', '014089792038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '134', 'ASSISTENTE SOCIAL', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06004843520186070000'], '70000604843': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604843', '31000', 'JOS  JOECI DA SILVA', 'JOECI', '#NULO#', '91237769787', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'PE', '-3', 'IPUBI', '05/06/1965', '53', '022946290329', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '292', 'AGENTE ADMINISTRATIVO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005363120186070000'], '70000604844': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604844', '31347', 'MARCIA DE ALMEIDA FERRAZ', 'MARCINHA TAXISTA', '#NULO#', '53896394134', 'MARCIATAXISTADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '20/11/1971', '47', '008229202011', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '536', 'TAXISTA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005398320186070000'], '70000604845': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604845', '31501', 'MARIA DASDORIA DE FREITAS', 'DORINHA DO MAS', '#NULO#', '49290940115', 'DORINHAF13@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'CE', '-3', 'ACOPIARA', '09/04/1969', '49', '012577732011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005406820186070000'], '70000604846': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604846', '31222', 'MARIA SONIA DA LUZ LIMA', 'S NIA LIMA', '#NULO#', '00125375786', 'SONIAIMOVEIS12@OUTLOOK.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'MA', '-3', 'TIMBIRAS', '01/03/1969', '49', '022410131597', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '403', 'CORRE R DE IM EIS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005415320186070000'], '70000604847': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604847', '31044', 'MARIO GOMES DA NOBREGA', 'DELEGADO MARIO GOMES', '#NULO#', '18565913104', 'ADV.MARIOGOMES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'PB', '-3', 'SAO MAMEDE', '14/12/1957', '61', '003443112062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005423820186070000'], '70000604848': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604848', '31719', 'MESSIAS FROES DA SILVA', 'DR. MESSIAS FROES', '#NULO#', '02207753204', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'PA', '-3', 'AVEIRO', '09/11/1947', '71', '013143882038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '111', 'M DICO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005432320186070000'], '70000604849': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604849', '31031', 'OSEIAS RIBEIRO DE SOUZA', 'OS IAS RIBEIRO', '#NULO#', '00131497170', 'CONTATO.OSEIAS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'SP', '-3', 'SANTO ANTONIO DE POSSE', '07/07/1977', '41', '017622002003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005440820186070000'], '70000604850': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604850', '31999', 'SERGIO GOMES DE ANDRADE', 'SERGIO ANDRADE', '#NULO#', '00038939100', 'SERGIOFISIOTERAPPEUTA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '13/01/1983', '35', '016280092011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '114', 'FISIOTERAPEUTA E TERAPEUTA OCUPACIONAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005501520186070000'], '70000604851': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604851', '31777', 'ROSIMAR DE JESUS DUTRA', 'PASTORA ROSE', '#NULO#', '65793480110', 'ROSEDEJESUSDUTRA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '22/12/1966', '52', '003449862062', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '910', 'SACERDOTE OU MEMBRO DE ORDEM OU SEITA RELIGIOSA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005493020186070000'], '70000604852': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604852', '31131', 'SEVERINO MARCELINO DE MORAES', 'DR. MORAES', '#NULO#', '23817607415', 'DR.MORAES@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'PB', '-3', 'CATINGUEIRA', '24/12/1960', '58', '003325122011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005519720186070000'], '70000604853': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604853', '31137', 'WASHINGTON SILVA ARAUJO', 'WASHINGTON SILVA', '#NULO#', '54000394134', 'WASHINGTONPIMBA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '13/02/1973', '45', '008104602038', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '531', 'MOTORISTA DE VE CULOS DE TRANSPORTE COLETIVO DE PASSAGEIROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005562220186070000'], '70000604854': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604854', '31321', 'GLEIDE MARA DE SOUSA', 'PROFESSORA GLEIDE', '#NULO#', '57292957153', 'GLEIDEMARABSB@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/06/1972', '46', '008978962046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005310920186070000'], '70000604855': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604855', '31479', 'SABINO ARCANJO DOS SANTOS NETO', 'BINO ARCANJO', '#NULO#', '33367531120', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'TAGUATINGA', '04/08/1967', '51', '008035292062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005570720186070000'], '70000604856': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604856', '31011', 'THAIS GON ALVES MACHADO', 'THAIS MACHADO', '#NULO#', '04746165173', 'TAISALLER@MAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '11/04/1994', '24', '022427092003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005528220186070000'], '70000604857': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604857', '31020', 'C LIA REGINA CUNHA DA COSTA', 'CELIA REGINA', '#NULO#', '26647079149', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'SP', '-3', 'SAO PAULO', '17/11/1964', '54', '000603302097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '403', 'CORRETO DE IM  IS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005216220186070000'], '70000604858': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604858', '31193', 'ANA PAULA DE ALMEIDA GUALBERTO', 'SUBTENENTE ANA PAULA', '#NULO#', '59914041191', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'SOBRADINHO', '12/06/1973', '45', '008403582097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005181020186070000'], '70000604859': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604859', '31900', 'SAIONARA C RTES NUNES', 'SAIONARA CORTES', '#NULO#', '57873712168', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '23/10/1972', '46', '009279792020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005553720186070000'], '70000604860': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604860', '31331', 'ABEL ENRIQUE DUARTE', 'ABEL DUARTE', '#NULO#', '31729096115', 'DEPUTADODISTRITALABEL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '2', 'BRASILEIRA (NATURALIZADA)', 'ZZ', '-3', 'ARGENTINA', '18/03/1957', '61', '001031542062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005172520186070000'], '70000604861': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604861', '31007', 'CRISTIANO TORRES DANTAS', 'CRISTIANO TORRES', '#NULO#', '85768758100', 'CRISTIANOTORRESOFICIAL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '03/12/1978', '40', '013527732089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005224720186070000'], '70000604862': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604862', '31100', 'DAVI TAVARES COSTA', 'DAVI TAVARES', '#NULO#', '71630384100', 'DAVITAVARESCOSTA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SALVADOR', '08/07/1981', '37', '016478132046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005233220186070000'], '70000604863': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604863', '31624', 'EDUARDO BATISTA COSTA DE OLIVEIRA', 'EDUARDO LYON', '#NULO#', '35145862172', 'LYONDELIBRA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '23/09/1965', '53', '006499302097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005241720186070000'], '70000604864': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604864', '31333', 'ERNATAN BENEVIDES OLIVEIRA JUNIOR', 'NATAN', '#NULO#', '98868250578', 'NATANCANCAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'BA', '-3', 'NOVA REDEN  O', '08/05/1980', '38', '063379420523', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '02', 'PRETA', '126', 'ANALISTA DE SISTEMAS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005250220186070000'], '70000604865': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604865', '31300', 'FILIPE BALBINO DA COSTA LOHMANN', 'FILIPE BALBINO', '#NULO#', '03561236189', 'FILIPEBALBINO31@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '22/11/1996', '22', '024641202003', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '931', ' STUDANTE BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005268420186070000'], '70000604866': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604866', '31010', 'FLAUZINA MARTINS DE JESUS', 'FLORINDA SAMONTES', '#NULO#', '07497237187', 'FLAU36@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BAMBU ', '23/05/1942', '76', '000475642054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005276920186070000'], '70000604867': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604867', '31001', 'FORLAND OLIVEIRA SILVA', 'PROF. FORLAND', '#NULO#', '02038589488', 'PROFFORLAND@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'PB', '-3', 'CAMPINA GRANDE', '20/04/1975', '43', '021132011210', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '117', 'FARMAC UTICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005285420186070000'], '70000604868': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604868', '31311', 'FRANCISCO FERREIRA DE CARVALHO', 'CHIQUINHO', '#NULO#', '30848741153', 'GRAFICAKAFKA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PARNAIBA', '23/10/1963', '55', '010613282054', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '711', 'TRABALHADOR DE ARTES GR FICAS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005293920186070000'], '70000604869': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604869', '31323', 'GABRIEL OLIVEIRA ROCHA', 'GABRIEL ROCHA', '#NULO#', '31763529134', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'FILADELFIA', '05/11/1963', '55', '006300042097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '134', 'ASSISTENTE SOCIAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005302420186070000'], '70000604870': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604870', '31066', 'ILTON CORREA DOS SANTOS', 'JAMAIKA AMBIENTALISTA', '#NULO#', '41765320178', 'PHSDF31.NOTIFICACOESELEICOES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'SOBRADINHO', '19/05/1966', '52', '004017672062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005329120186070000'], '70000604871': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604871', '31456', 'IVONILDO ANTONIO LIRA DE MEDEIROS DA SILVA', 'LIRA', '#NULO#', '26063344420', 'AGENDADEPUTADOLIRA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'RN', '-3', 'S O RAFAEL', '12/04/1962', '56', '000272782070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '5', 'SUPLENTE', 'S', 'S', '-1', '06005337620186070000'], '70000604872': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604872', '31555', 'JOANA D ARC DE SOUSA MACHADO', 'JOANA MACHADO', '#NULO#', '94649235120', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '24/06/1977', '41', '015500142046', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '514', 'ESTETICISTA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005346120186070000'], '70000604873': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604873', '31190', 'JOAO HERMETO DE OLIVEIRA NETO', 'HERMETO', '#NULO#', '35924780104', 'JHERMETOADM@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'IPU', '03/11/1965', '53', '006913202020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06005354620186070000'], '70000604874': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604874', '31113', 'JOS  LUCIO DE C SSIO MADEIRA', 'JOSE LUCIO', '#NULO#', '39304540178', 'JOSELUCIOMADEIRA22@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIANIA', '16/04/1959', '59', '015413932046', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '303', 'GERENTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005371620186070000'], '70000604875': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604875', '31123', 'LUIZ ANDR  RORIZ SOLANO', 'DED  RORIZ', '#NULO#', '80130038172', 'DEDERORIZ2010@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '05/04/1977', '41', '015018932089', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '167', 'OPERADOR DE EQUIPA NTO DE R  O  TELEVIS O  SOM E CINEMA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005389820186070000'], '70000604876': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604876', '31110', 'PAULO ANDRADE DA SILVA', 'PAULO ALEGRIA', '#NULO#', '81966318634', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'MG', '-3', 'UNAI', '30/07/1967', '51', '016591112097', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005459020186070000'], '70000604877': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604877', '31159', 'RAIMUNDO RIBEIRO CAMPOS', 'MARRETA', '#NULO#', '05470161153', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '29/02/1940', '78', '010230492011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005467520186070000'], '70000604878': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604878', '31003', 'ROBERT LUIS MARQUES RODRIGUES', 'PROF. ROBERT MARQUES', '#NULO#', '77012186100', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '29/12/1976', '42', '011555942070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005476020186070000'], '70000604879': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604879', '31444', 'RONON PINHEIRO DA CRUZ', 'PR RONON PINHEIRO', '#NULO#', '58601287115', 'PASTORRONO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'PA', '-3', 'CONCEI  O DO ARAGUAIA', '16/05/1975', '43', '024862272046', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '910', 'SACERDOTE OU MEMBRO DE ORDEM OU SEITA RELIGIOSA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005484520186070000'], '70000604880': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604880', '31133', 'WELLINGTON CAPISTRANO FERREIRA NOBRE', 'CAPISTRANO', '#NULO#', '18631592153', 'WELLCAPISTRANO@IG.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '18/04/1960', '58', '001510762623', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '598', 'EMPREGADO DOM STICO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005536720186070000'], '70000604881': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604881', '31111', ' NGELO ZANOLLY BATISTA RABELO', 'PROF.  NGELO ZANOLLY', '#NULO#', '48443999187', 'ANGELOZANOLLY2012@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PARACATU', '27/04/1968', '50', '007272652003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005199220186070000'], '70000604882': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000604882', '31313', 'CAROLINE DIAS RIBEIRO', 'CAROLINE RIBEIRO', '#NULO#', '03126011152', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '10/04/1988', '30', '020424092046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005207720186070000'], '70000605127': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605127', '70093', 'WILKERSON FERREIRA DA SILVA', 'WILKERSON FERREIRA', '#NULO#', '77632648100', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '27/04/1975', '43', '011178862089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005545220186070000'], '70000605591': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605591', '90045', 'ADRIANA LOUREN O DAS CANDEIAS', 'ADRIANA LOUREN O', '#NULO#', '38558084149', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '29/10/1969', '49', '014148052062', '4', 'FEMININO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005597420186070000'], '70000605592': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605592', '90121', 'ALESSANDRO MARTINS ALVES', 'PR. ALESSANDRO MARTINS', '#NULO#', '01634692101', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '07/09/1985', '33', '051149841023', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005605920186070000'], '70000605593': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605593', '90009', 'AMAZONICA BRASIL MAGALLANS LUJAN', 'AMAZONICA BRASIL', '#NULO#', '26570238191', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'AM', '-3', 'ITAPIRANGA', '20/04/1964', '54', '002667082089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005614420186070000'], '70000605594': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605594', '90906', 'ANTONIO DA CONCEICAO FERREIRA', 'ANTONIO DO LIVRO', '#NULO#', '78105927187', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'MA', '-3', 'SANTA LUZIA', '21/10/1971', '47', '021162261139', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005622920186070000'], '70000605595': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605595', '90011', 'ANTONIO FELIX DE OLIVEIRA', 'ANTONIO DA FEIRA', '#NULO#', '71764879520', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SALVADOR', '14/06/1974', '44', '084865690558', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005631420186070000'], '70000605596': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605596', '90555', 'ANTONIO SENA MAGALHAES SILVA', 'SENA', '#NULO#', '08702616149', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIANIA', '17/11/1954', '64', '040848831031', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005649620186070000'], '70000605597': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605597', '90147', 'CARLOS ALBERTO RODRIGUES TABANEZ', 'TABANEZ ', '#NULO#', '49320475172', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/06/1970', '48', '007643862011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '232', 'POLICIAL CIVIL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005658120186070000'], '70000605598': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605598', '90156', 'DAVI MOREIRA DOS SANTOS', 'PROFESSOR DAVI MOREIRA', '#NULO#', '22226524134', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'GO', '-3', 'DAMINANOPOLIS', '13/11/1960', '58', '019367191082', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005666620186070000'], '70000605599': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605599', '90222', 'DEUSINELIA ANICIO ALCANTARA NASCIMENTO', 'DETE', '#NULO#', '14569825249', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'MG', '-3', 'VIRGOLANDIA', '11/05/1965', '53', '008614361392', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005675120186070000'], '70000605600': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605600', '90193', 'ELIEL DE SOUSA MENDES', 'ELIEL MENDES', '#NULO#', '18141854372', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '01/01/1960', '59', '004141002089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005683620186070000'], '70000605601': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605601', '90999', 'ERIVELTO FORLAN DUARTE CAMPOS', 'FORLANGOV', '#NULO#', '69823871191', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '12/08/1978', '40', '012965722038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005692120186070000'], '70000605602': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605602', '90456', 'FABIO LINDENBERG SERRA COSTA', 'FABIO KB A', '#NULO#', '94501521104', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '01/07/1981', '37', '016600312020', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005700620186070000'], '70000605603': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605603', '90901', 'FELIPE ALVES LEITAO', 'PROF. FELIPE LEITAO', '#NULO#', '01389078116', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA ', '07/02/1987', '31', '019472762054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005718820186070000'], '70000605604': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605604', '90190', 'FERNANDO BATISTA FERNANDES', 'DELEGADO FERNANDO FERNANDES', '#NULO#', '39934977168', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '04/09/1969', '49', '007946872020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '2', 'ELEITO POR QP', 'N', 'S', '-1', '06005727320186070000'], '70000605605': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605605', '90090', 'FREDERICO CRISTIANO GONCALVES MOURAO', 'FRED', '#NULO#', '51672693187', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'SP', '-3', 'RIO CLARO', '20/12/1972', '46', '008185842003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005735820186070000'], '70000605606': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605606', '90111', 'GILBERTO ELIAZARIO DE CAMARGOS', 'GILBERTO CAMARGOS', '#NULO#', '47864176615', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BOM DESPACHO', '06/02/1964', '54', '004088100272', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005744320186070000'], '70000605607': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605607', '90800', 'GLENO ROSSI', 'GLENO ROSSI', '#NULO#', '30867401168', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '07/03/1964', '54', '000651192020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005752820186070000'], '70000605608': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605608', '90077', 'HELDER CAMPANATE MARTINS', 'HELDER CAMPANATE', '#NULO#', '90529383187', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/07/1980', '38', '013283842070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005761320186070000'], '70000605609': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605609', '90444', 'IVONE LOPES DE CARVALHO', 'IVONE LOPES', '#NULO#', '70934967172', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '06/01/1977', '41', '015851572054', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006601420186070000'], '70000605610': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605610', '90007', 'JANDERLENE NOGUEIRA DE SOUZA', 'JANDERLENE NOGUEIRA', '#NULO#', '72153636191', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '25/06/1982', '36', '015942522003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005779520186070000'], '70000605611': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605611', '90197', 'JANILTON SOUTO DE ALMEIDA', 'ARGENTINO SOUTO', '#NULO#', '47388820159', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'MG', '-3', 'TEOFILO OTONI', '02/01/1969', '49', '029916211066', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005788020186070000'], '70000605612': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605612', '90000', 'JANIO FARIAS MARQUES', 'GUARDA JANIO', '#NULO#', '31359353100', 'DARLYPONTES@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '15/11/1965', '53', '006123372062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005796520186070000'], '70000605613': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605613', '90044', 'JERFFESON RODRIGUES DE CASTRO', 'JERFFESON CASTRO', '#NULO#', '26706539104', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'CE', '-3', 'ITAPIPOCA', '18/03/1962', '56', '005779452062', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005805020186070000'], '70000605614': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605614', '90333', 'JOANA D ARC TAVARES DE SOUZA SANTOS', 'JOANA D ARC (PORTO RICO)', '#NULO#', '87450976153', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '14/12/1980', '38', '014439262038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005813520186070000'], '70000605615': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605615', '90390', 'JOAO LUCIO PEREIRA COSTA', 'JOAO LUCIO', '#NULO#', '83108416120', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BURITIS', '02/03/1977', '41', '013648072011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006619620186070000'], '70000605616': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605616', '90777', 'JULIO CESAR D ELIA RIEDER', 'JULIO CESAR JAPA', '#NULO#', '93044135168', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'MT', '-3', 'CACERES', '20/04/1981', '37', '021479921856', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005822020186070000'], '70000605617': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605617', '90900', 'LEONARDO PEREIRA GON ALVES', 'LEO GUERREIRO', '#NULO#', '70890226172', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '01/03/1980', '38', '015356462097', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005830520186070000'], '70000605618': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605618', '90003', 'LEUCIMONIA TRINDADE DA ROCHA RODRIGUES', 'SIMONE ROCHA', '#NULO#', '00900386657', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'GO', '-3', 'DAMIANOPOLIS', '03/08/1974', '44', '029786371015', '4', 'FEMININO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005848720186070000'], '70000605619': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605619', '90061', 'LUCIANO NUNES VIDAL', 'LUCIANO DO JOAOZAO', '#NULO#', '50569228115', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '16/01/1969', '49', '007516412003', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005857220186070000'], '70000605620': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605620', '90907', 'MARCELO DE CARVALHO MARQUES', 'MARCELO MARQUES', '#NULO#', '50458698172', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'MA', '-3', 'SAO LUIS', '01/06/1971', '47', '008275612003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005865720186070000'], '70000605621': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605621', '90127', 'MARCOS MORENO DE OLIVEIRA', 'MARCOS MORENO', '#NULO#', '18611800125', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'ES', '-3', 'SANTA TERESA', '27/12/1958', '60', '003435702097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005874220186070000'], '70000605622': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605622', '90180', 'MARIA DE FATIMA PEREIRA DA SILVA GODOI', 'PROFESSORA GODOI', '#NULO#', '22240187115', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '25/01/1961', '57', '003612362089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005882720186070000'], '70000605623': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605623', '90014', 'MARIZETE PEREIRA DE OLIVEIRA', 'MARIZETE DA SAUDE', '#NULO#', '52860728953', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '14/04/1963', '55', '007091362020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005891220186070000'], '70000605624': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605624', '90069', 'MARIZIA OLIVEIRA BONIFACIO', 'MARIZIA BONIFACIO', '#NULO#', '06630855191', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'GO', '-3', 'LEOPOLDO DE BULHOES', '22/09/1954', '64', '000722242038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005909420186070000'], '70000605625': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605625', '90099', 'NILSON DA SILVA FARIAS', 'NILSON DA FEMEI', '#NULO#', '11452536104', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '07/06/1956', '62', '007408932054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005917920186070000'], '70000605626': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605626', '90033', 'PAULO ULISSIS BATISTA LIMA', 'ULISSIS LIMA', '#NULO#', '99527707153', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'PA', '-3', 'MARABA', '19/01/1983', '35', '017581982020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005926420186070000'], '70000605627': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605627', '90500', 'RAIMUNDO FERNANDES FELIX', 'RAIMUNDO ACQUACERRADO', '#NULO#', '49038168187', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'CE', '-3', 'ASSARE', '08/01/1971', '47', '025710932011', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005934920186070000'], '70000605628': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605628', '90101', 'RAIMUNDO VITORINO DA SILVA FILHO', 'NETO TO CONTIGO', '#NULO#', '49451278168', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '19/05/1968', '50', '007364602011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005943420186070000'], '70000605629': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605629', '90666', 'RICARDO ELVIDIO DE NEGREIROS', 'RICARDO NEGREIROS', '#NULO#', '78138256168', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '24/06/1977', '41', '010862742097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005951920186070000'], '70000605630': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605630', '90888', 'ROSA HELENA REGO MARTINS', 'ROSA MARTINS', '#NULO#', '29290511320', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'MA', '-3', 'PASTOS BONS', '24/04/1965', '53', '040987921023', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005960420186070000'], '70000605631': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605631', '90100', 'SAMARA DOS SANTOS BRITO NEVES', 'SAMARA BRITO', '#NULO#', '72514850100', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/04/1984', '34', '016643902097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06005978620186070000'], '70000605632': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605632', '90600', 'SEBASTIAO CEZAR PINTO', 'CEZAR ', '#NULO#', '23385227100', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '04/11/1960', '58', '000549101007', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06005987120186070000'], '70000605633': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605633', '90123', 'TELMA RUFINO ALVES', 'TELMA RUFINO', '#NULO#', '45528489172', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '12/08/1968', '50', '009240012020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '277', 'DEPUTADO', '0', '3', 'ELEITO POR M DIA', 'S', 'S', '-1', '06005995620186070000'], '70000605634': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605634', '90904', 'VANIA APARECIDA COELHO', 'VANIA COELHO', '#NULO#', '91399610600', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '17/09/1971', '47', '009490862089', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006004120186070000'], '70000605635': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605635', '90017', 'VANUZA ROSA DOS ANJOS', 'BARBARA ANJOS', '#NULO#', '63527510168', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '29/04/1973', '45', '013176372046', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006012620186070000'], '70000605636': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605636', '90010', 'VENCESLAU GUIMARAES DA CRUZ FILHO', 'VENCESLAU GUIMARAES', '#NULO#', '79037259120', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '05/11/1975', '43', '011421702038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006021120186070000'], '70000605637': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605637', '90909', 'WALLACE DE OLIVEIRA MACIEL', 'BILL', '#NULO#', '93653182115', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '08/08/1980', '38', '015683222020', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006039320186070000'], '70000605638': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605638', '90789', 'WALTER MARQUES SIQUEIRA DE LIMA', 'WALTER MARQUES', '#NULO#', '71872540163', 'ELEICOESGERAISDF2018@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '06/07/1981', '37', '015439482089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06006047820186070000'], '70000605780': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '3', 'GOVERNADOR', '70000605780', '16', 'ANTONIO RICARDO MARTINS GUILLEN', 'GUILLEN', '#NULO#', '38013908100', '7GUILLEM@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '16', 'PSTU', 'PARTIDO SOCIALISTA DOS TRABALHADORES UNIFICADO', '70000050166', 'PARTIDO ISOLADO', 'PSTU', '1', 'BRASILEIRA NATA', 'SP', '-3', 'SANTO ANAST CIO', '08/01/1961', '57', '001604912003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06006064820186070000'], '70000605781': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '4', 'VICE-GOVERNADOR', '70000605781', '16', 'EDUARDO RENN  ZANATA', 'ZANATA', '#NULO#', '00920930190', 'ERZANATA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '16', 'PSTU', 'PARTIDO SOCIALISTA DOS TRABALHADORES UNIFICADO', '70000050166', 'PARTIDO ISOLADO', 'PSTU', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '22/09/1985', '33', '015593802003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '394', 'AUXILIAR DE ESCRIT RIO E ASSEMELHADOS', '-1', '4', 'N O ELEITO', 'N', 'N', '-1', '06006592920186070000'], '70000605782': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000605782', '160', 'ROBSON RAYMUNDO DA SILVA', 'ROBSON', '#NULO#', '32332491287', 'RORAYSIL70@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '16', 'PSTU', 'PARTIDO SOCIALISTA DOS TRABALHADORES UNIFICADO', '70000050166', 'PARTIDO ISOLADO', 'PSTU', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '12/04/1970', '48', '082030640329', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06006108520186070000'], '70000605783': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000605783', '1616', 'ELCIMARA AUGUSTO DE SOUZA', 'ELCIMARA', '#NULO#', '93718950120', 'ELCIMARABAIANA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '16', 'PSTU', 'PARTIDO SOCIALISTA DOS TRABALHADORES UNIFICADO', '70000050166', 'PARTIDO ISOLADO', 'PSTU', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SANTA RITA DE C SSIA', '29/12/1981', '37', '090903460531', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06006081820186070000'], '70000605784': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000605784', '16161', 'EDSON DA SILVA', 'EDSON', '#NULO#', '47154578149', 'EDSONDASILVA70@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '16', 'PSTU', 'PARTIDO SOCIALISTA DOS TRABALHADORES UNIFICADO', '70000050166', 'PARTIDO ISOLADO', 'PSTU', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '19/10/1970', '48', '007649852011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06006073320186070000'], '70000605785': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000605785', '160', 'SILVIO SOARES FILHO', 'SILVIO', '#NULO#', '58162097872', 'SILVIOSFILHO@IG.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '16', 'PSTU', 'PARTIDO SOCIALISTA DOS TRABALHADORES UNIFICADO', '70000050166', 'PARTIDO ISOLADO', 'PSTU', '1', 'BRASILEIRA NATA', 'SP', '-3', 'SANTOS', '06/02/1951', '67', '015077942020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06006117020186070000'], '70000605786': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000605786', '160', 'RENATO FERREIRA DOS SANTOS', 'RENATO', '#NULO#', '37509152704', 'RE.MENDO12@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '16', 'PSTU', 'PARTIDO SOCIALISTA DOS TRABALHADORES UNIFICADO', '70000050166', 'PARTIDO ISOLADO', 'PSTU', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'DUQUE DE CAXIAS', '12/11/1953', '65', '049062160361', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06006090320186070000'], '70000607594': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607594', '12512', 'ANARCISE PEREIRA DA SILVEIRA', 'ANINHA DA AUTOESCOLA', '#NULO#', '53958713149', 'ANINHADAAUTOESCOLA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'PI', '-3', 'S O FRANCISCO DO PIAU ', '03/01/1970', '48', '008471202070', '4', 'FEMININO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006169220186070000'], '70000607595': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607595', '12013', 'DAIANE DA ROCHA BIAM', 'DAIANE CIGANA', '#NULO#', '07447813451', 'DAIANECIGANA1@GMAIL.OM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BELO HORIZONTE', '30/08/1988', '30', '079597980809', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '394', 'AUXILIAR DE ESCRIT RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006255420186070000'], '70000607596': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607596', '12222', 'ELINE TEIXEIRA LEMOS', 'ELINE LEMOS', '#NULO#', '41787951120', 'ELINELEMOSDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '10/01/1968', '50', '003863772089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006299120186070000'], '70000607597': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607597', '12036', 'JOSEFINA SERRA DOS SANTOS', 'DRA. J ', '#NULO#', '29675448172', 'JOSEFINASERRADOSSANTOSS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'MA', '-3', 'CAJAPI ', '25/10/1962', '56', '001616722020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006393820186070000'], '70000607598': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607598', '12111', 'MARIA FRANCISCA SOARES DA CORTE', 'FRANCISCA C RTE', '#NULO#', '82891249100', 'MARIAPPP@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'MA', '-3', 'PARNARAMA', '01/03/1973', '45', '014579012046', '4', 'FEMININO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '5', 'VI VO(A)', '03', 'PARDA', '581', 'DONA DE CASA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006471520186070000'], '70000607599': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607599', '12180', 'NAYRA RAMOS DA SILVA', 'NAYRA RAMOS', '#NULO#', '00770074928', 'NAYRA.RAMOS12180@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '19/04/1983', '35', '039671170981', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '303', 'GERENTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006515220186070000'], '70000607600': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607600', '12333', 'PATR CIA GUIMAR ES GARC S', 'PATR CIA GUIMAR ES', '#NULO#', '85320978120', 'PATRICIAGARCESDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '11/01/1979', '39', '013894532062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006523720186070000'], '70000607601': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607601', '12018', 'ANGELINA APARECIDA DOURADO SANTOS', 'CIDINHA SANTOS', '#NULO#', '35857382149', 'CIDNHA12@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '27/10/1966', '52', '005745172097', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '224', 'OPERADOR DE COMPUTADOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006194720186070000'], '70000607602': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607602', '12555', 'CARLOS FARIAS PONTES', 'CARLOS PONTES', '#NULO#', '00317462172', 'CARLOSPO.FARIAS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'CE', '-3', 'NOVA RUSSAS', '04/11/1946', '72', '002130602020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '171', 'JORNALISTA E REDATOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006211720186070000'], '70000607603': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607603', '12001', 'CARLOS PENNA BRESCIANINI', 'CARLOS PENNA', '#NULO#', '23912995168', 'CANDIDATOCARLOSPENNA@YAHOO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '17/09/1961', '57', '001502082054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006220220186070000'], '70000607604': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607604', '12021', 'CESAR AUGUSTO RESENDE DA COSTA SANTOS', 'CESINHA DA ACESSIBILIDADE', '#NULO#', '51676141553', 'CARCS01@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'SE', '-3', 'ARACAJU', '25/01/1967', '51', '010375082127', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006238420186070000'], '70000607605': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607605', '12003', 'DANIEL ASSIS MARTINEZ', 'DANIEL MARTINEZ', '#NULO#', '07521564626', 'DANIEL.ASSIS.MARTINEZ@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'PA', '-3', 'MARAB ', '04/10/1990', '28', '021433292011', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006263920186070000'], '70000607606': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607606', '12777', 'DILMANOEL DE ARAUJO SOARES', 'DIL(DILMANOEL)', '#NULO#', '10656073349', 'DILMANOSOARES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'MA', '-3', 'PINHEIRO', '02/09/1958', '60', '010351332070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006280920186070000'], '70000607607': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607607', '12124', 'EMERSON PEREIRA DE OLIVEIRA', 'EMERSON OLIVEIRA', '#NULO#', '53049535504', 'EMERSONOLIVEIRA72@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SERRA DOURADA', '29/10/1972', '46', '014084812038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '403', 'C RETOR D IM VEIS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006307620186070000'], '70000607608': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607608', '12156', 'FABIO PEREIRA DE SOUSA', 'PROFESSOR F BIO SOUSA', '#NULO#', '78542588134', 'PROFESSORFABIOSOUSA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'PI', '-3', 'S O MIGUEL DO TAPUIO', '08/05/1976', '42', '012241772062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006324620186070000'], '70000607609': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607609', '12123', 'FRANCISCO CLAUDIO DE ABRANTES', 'CL UDIO ABRANTES', '#NULO#', '44436777120', 'PATRICIAPARAGUASSU@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'PB', '-3', 'CATOL  DO ROCHA', '28/12/1968', '50', '008080482089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '3', 'ELEITO POR M DIA', 'S', 'S', '-1', '06006628120186070000'], '70000607610': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607610', '12012', 'JO O BATISTA ARRAIS', 'JO O ARRAIS', '#NULO#', '52953920820', 'JOAOARRAIS94859@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'CE', '-3', 'CAMPOS SALES', '04/12/1946', '72', '015041092038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006359820186070000'], '70000607611': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607611', '12444', 'JO O EDUARDO DE SOUZA', 'VIGILANTE SURICATA', '#NULO#', '46178910134', 'SURICATA2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'BA', '-3', 'RIACH O DAS NEVES', '31/08/1961', '57', '026687350566', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006368320186070000'], '70000607612': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607612', '12000', 'JOAQUIM VITOR LOPES ALVES', 'JOAQUIM VITOR', '#NULO#', '09887903191', 'JOAQUIMVITOR.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'PE', '-3', 'RECIFE', '30/11/1953', '65', '001095512003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006376820186070000'], '70000607613': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607613', '12321', 'LEONARDO BATISTA DA MOTA BRITTO', 'LEO BRITTO', '#NULO#', '98412507134', 'LEOJAH2.2@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '27/02/1984', '34', '015060872003', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006410820186070000'], '70000607614': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607614', '12120', 'MANUEL BENEVAL ADELINO', 'BEN  ADELINO', '#NULO#', '22117040187', 'BALSAMO20@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'PB', '-3', 'SOL NEA', '28/05/1961', '57', '006620002003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006429020186070000'], '70000607615': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607615', '12192', 'MARCO AURELIO RANGEL', 'RANGEL JACAR ', '#NULO#', '41049551168', 'MARCO.AURELIO.RANGEL@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '27/04/1967', '51', '010092272070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '243', 'T CNICO DE ENFERMAGEM E ASSEMELHADOS (EXCETO ENFERMEIRO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006446020186070000'], '70000607616': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607616', '12456', 'MOISES JOSE MARQUES', 'MOISES MARQUES', '#NULO#', '15147819134', 'MJOSEMADV@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '25/11/1959', '59', '003946362038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006506720186070000'], '70000607617': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607617', '12345', 'REGINALDO VERAS COELHO', 'PROFESSOR REGINALDO VERAS', '#NULO#', '63501015100', 'RVERASCO@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'CE', '-3', 'CRATE S', '02/01/1973', '45', '007974202054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '277', 'DEPUTADO', '0', '2', 'ELEITO POR QP', 'S', 'S', '-1', '06006532220186070000'], '70000607618': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607618', '12061', 'RONEI ALVES DA SILVA', 'R NEI CATADOR', '#NULO#', '62005812153', 'RAS.BRASIL@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '16/05/1974', '44', '011046002070', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '147', 'CATADOR DE RECICL VEIS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006558920186070000'], '70000607619': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607619', '12190', 'SIDNEY DA SILVA PATR CIO', 'PATR CIO', '#NULO#', '37208810168', 'CABOPATRICIO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '07/09/1966', '52', '008324222003', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006567420186070000'], '70000607620': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607620', '12121', 'WAGNER PEREIRA DE LIMA', 'NEGUIN', '#NULO#', '27092720168', 'WPLNEGRIMM@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '18/06/1969', '49', '007946762070', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006584420186070000'], '70000607621': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607621', '12458', 'MAURO EVANGELISTA ESTEVES DUARTE', 'MAURO EVANGELISTA', '#NULO#', '15063585191', 'EVANGELISTAPDT@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'MG', '-3', 'MALACACHETA', '28/04/1958', '60', '004564382038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '200', 'HISTORIADOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006498220186070000'], '70000607622': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607622', '12007', 'ANDR  RICARDO SANTOS BURMANN', 'ANDR  CORUJA', '#NULO#', '91419433172', 'BURMANN16@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '02/09/1977', '41', '012925732003', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '537', 'MOTORISTA PARTICULAR', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06006177720186070000'], '70000607623': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607623', '43003', 'ADHARA CAMPOS VIEIRA', 'ADHARA CAMPOS', '#NULO#', '82852855100', 'ADHARACVIEIRA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '20/08/1979', '39', '013644182011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006151020186070000'], '70000607624': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607624', '43060', 'ANDREA MARIA MENDES', 'ANDREA MENDES', '#NULO#', '38995638915', 'ANDREAMENDES27@YAHOO.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BELO HORIZONTE', '27/08/1960', '58', '007291472070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06006186220186070000'], '70000607625': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607625', '43007', 'ANTONIO FERREIRA ALVES', 'TONINHO MARATONISTA HOPE HOPE', '#NULO#', '24869066149', 'TONINHOMARATONISTA2017@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '17/12/1961', '57', '016017571090', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006203220186070000'], '70000607626': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607626', '43190', 'CHRISTIANE RIBEIRO PEREIRA GIACOMETTI', 'MAJOR CHRISTIANE', '#NULO#', '58523618104', 'MJCHRISTIANE43190@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '26/11/1971', '47', '095917190353', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006246920186070000'], '70000607627': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607627', '43188', 'DANIELLE DE SOUSA MAGALHAES', 'DANY DO PV', '#NULO#', '03234392170', 'NAILTONPLANT@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '27/04/1987', '31', '019871632054', '4', 'FEMININO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '581', 'DONA DE CASA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006272420186070000'], '70000607628': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607628', '43061', 'ERIDAN STEFANELLI DE OLIVEIRA', 'DRA. ERIDAN STEFANELLI', '#NULO#', '79194591504', 'ERIDANSTEFANELLI@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SALVADOR', '10/02/1980', '38', '094408010574', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '111', 'M DICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006316120186070000'], '70000607629': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607629', '43113', 'FRANCISCO RODRIGUES DE BRITO JUNIOR', 'JUNIOR GARI', '#NULO#', '68858922115', 'JUNIORGARI@OUTLOOK.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'SOBRADINHO', '14/11/1976', '42', '010854652070', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '537', 'MOTORISTA PARTICULAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006333120186070000'], '70000607630': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607630', '43433', 'HUDSON QUINTANA LUCAS', 'HUDSON QUINTANA', '#NULO#', '48044890106', 'HUDSONQUINTANA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'MS', '-3', 'AQUIDAUANA', '15/04/1969', '49', '007465342038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006341620186070000'], '70000607631': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607631', '43277', 'JORGE JOSE DA SILVA', 'JORGE SILVA', '#NULO#', '05728819168', 'JORGEJS1@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'INHAUMA', '26/10/1945', '73', '001408772011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '921', 'MILITAR REFORMADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006385320186070000'], '70000607632': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607632', '43000', 'KEVES DIOGO FERNANDES FREITAS DA CONCEICAO', 'KEVES DIOGO', '#NULO#', '03101643112', 'KEVESDIOGO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '24/07/1991', '27', '021081612011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006402320186070000'], '70000607633': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607633', '43210', 'MARCELO OTTONI NEPOMUCENO', 'MARCELO OTTONI', '#NULO#', '69698708120', 'MARCELO.OTTONI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '28/05/1979', '39', '013984602089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '395', 'BANC RIO E ECONOMI RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006437520186070000'], '70000607634': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607634', '43062', 'MARIA DE JESUS SOEIRO MOTA', 'NADIR BALEIRA', '#NULO#', '46158197149', 'PVDF@PVDF.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'MA', '-3', 'TIMBIRAS', '15/06/1962', '56', '000413592038', '4', 'FEMININO', '2', 'L  E ESCREVE', '1', 'SOLTEIRO(A)', '02', 'PRETA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006454520186070000'], '70000607635': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607635', '43111', 'MARIA EMILIA BASTOS STENZEL', 'EM LIA STENZEL', '#NULO#', '39562298000', 'E.STENZEL@ME.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'RS', '-3', 'OSORIO', '11/11/1955', '63', '000308972887', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '142', 'PROFESSOR DE ENSINO SUPERIOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006463020186070000'], '70000607636': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607636', '43017', 'MARLENE DAMAZIO PAULINO', 'MARLENE DAMAZIO', '#NULO#', '15374351168', 'MARLENEDPAULINO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'GO', '-3', 'SANTA HELENA DE GOIAS', '17/07/1955', '63', '002374412020', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006489720186070000'], '70000607637': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607637', '43900', 'RAFAEL SILVA', 'RAFAEL SILVA', '#NULO#', '11530774187', 'PVDF@PVDF.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'PI', '-3', 'CAMPO MAIOR', '24/10/1941', '77', '005868342038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006636620186070000'], '70000607638': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607638', '43123', 'RODRIGO FRANCELINO ALVES', 'PROFESSOR FRANCELINO', '#NULO#', '99707004134', 'RODRIGOFRANCELINOALVES@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '18/07/1983', '35', '017469972003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006540720186070000'], '70000607639': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000607639', '43001', 'ULISSES HIGINO DA SILVA FILHO', 'ULISSES HIGINO', '#NULO#', '07536432860', 'ULISSESHIGINO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'SP', '-3', 'SAO PAULO', '07/12/1965', '53', '152286140141', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '9', 'DIVORCIADO(A)', '02', 'PRETA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006575920186070000'], '70000608906': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608906', '10335', 'ROBERTO MEDEIROS SANTOS', 'ROBERTO AMIGO DE TODOS', '#NULO#', '33962995153', 'ROBERTOMEDEIROSSSDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'RN', '-3', 'S O JO O DO SABUGI', '08/06/1963', '55', '005137112003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007034820186070000'], '70000608907': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608907', '10222', 'NAJH YUSUF SALEH AHMAD', 'NAJH', '#NULO#', '33362475191', 'DR.NAJH@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '05/03/1965', '53', '006765412062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007017820186070000'], '70000608908': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608908', '10678', 'ANA PAULA GUEDES FRANCO', 'ANA PAULA GUEDES', '#NULO#', '52419509153', 'ANAMGUEDES32@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '05/07/1972', '46', '010379372011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006722820186070000'], '70000608909': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608909', '10123', 'MARCOS MARTINS MACHADO', 'MARTINS MACHADO', '#NULO#', '63684527149', 'FALECOMPRMARTINS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '08/08/1966', '52', '113278210175', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '2', 'ELEITO POR QP', 'N', 'N', '-1', '06006982620186070000'], '70000608910': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608910', '10190', 'JOS  NILTON DA SILVA', 'Z  NILTON', '#NULO#', '26312972100', 'JNILTONLIDERSAMAMBAIA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'PA', '-3', 'SANTAR M', '07/06/1962', '56', '002078262003', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006887920186070000'], '70000608911': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608911', '10011', 'ADIM RIO TEODORO DA SILVA LEITE DE FARIA', 'PROFESSOR ADIM RIO TEODORO', '#NULO#', '26009641691', 'THELLSILVA@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'S O ROQUE DE MINAS', '18/07/1962', '56', '000932142003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06006653620186070000'], '70000608912': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608912', '10456', 'RODRIGO GERMANO DELMASSO MARTINS', 'DELMASSO', '#NULO#', '70024987115', 'DEP.RODRIGODELMASSO@CL.DF.GOV.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'PR', '-3', 'MARING ', '09/06/1980', '38', '014536812011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '3', 'ELEITO POR M DIA', 'S', 'S', '-1', '06007043320186070000'], '70000608913': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608913', '10189', 'RUBENS DE ARA JO LIMA', 'RUB O', '#NULO#', '11682507149', 'RUBENSLIM@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'QUEIMADOS', '12/07/1955', '63', '006008212062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007051820186070000'], '70000608914': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608914', '10777', 'PAULO ROBERTO BORGES', 'PAULO ROBERTO', '#NULO#', '29142741149', 'PRBKARATE@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'JO O PINHEIRO', '29/02/1964', '54', '008147462097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '921', 'MILITAR REFORMADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007026320186070000'], '70000608915': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608915', '10001', 'L CIO ROG RIO GOMES DOS SANTOS', 'PROF. L CIO ROG RIO', '#NULO#', '84191660730', 'LUCIOROGERIO@LUCIOROGERIO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '07/03/1966', '52', '006294330329', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006965620186070000'], '70000608916': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608916', '10333', 'ADRIANA PEDERNEIRAS REBELO DA SILVA', 'DRA. ADRIANA PEDERNEIRAS', '#NULO#', '89327098749', 'ADRIANA.PEDERNEIRAS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '13/07/1965', '53', '018974550345', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '222', 'NUTRICIONISTA E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006670620186070000'], '70000608917': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608917', '10600', 'LUANA FERREIRA LIMA', 'LUANA LIMA', '#NULO#', '00557751101', 'LUANACANTE@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'CEIL NDIA', '14/04/1984', '34', '035056812798', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006957120186070000'], '70000608918': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608918', '10023', 'LENISE MENEGHETTI', 'LENISE MENEGHETTI', '#NULO#', '31760147168', 'LMSML2010@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'RS', '-3', 'PORTO ALEGRE', '22/04/1963', '55', '013843132038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006921920186070000'], '70000608919': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608919', '10101', 'LANA CRISTINA DINIZ MIRANDA', 'LANA MIRANDA', '#NULO#', '72086980159', 'LANAFUT@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '04/01/1982', '36', '015505702070', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '168', 'ATLETA PROFISSIONAL E T CNICO EM DESPORTOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006913420186070000'], '70000608920': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608920', '10007', 'ANA ELIZABETH DE ANDRADE FARIAS SANTOS SALES', 'ANA SALES', '#NULO#', '63265168468', 'ANASALESSAC@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'PE', '-3', 'RECIFE', '09/11/1968', '50', '010234412011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006705820186070000'], '70000608921': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608921', '10111', 'ANA LUIZA DE OLIVEIRA DIAS', 'ANA LUIZA', '#NULO#', '85906980172', 'LUIZANUTRI79@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '19/03/1979', '39', '012529922038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '5', 'VI VO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006714320186070000'], '70000608922': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608922', '10567', 'JO O BENEDITO SANTAR M DE BRITO', 'JO O DITO', '#NULO#', '60254068120', 'JDITO@BOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'CEIL NDIA', '26/07/1975', '43', '011880132097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006852720186070000'], '70000608923': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608923', '10000', 'DANIEL DAMASCENO CREPALDI', 'PROFESSOR DANIEL CREPALDI', '#NULO#', '28309151861', 'DANIELDCREPALDI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O JOS  DO RIO PRETO', '23/07/1980', '38', '256079180183', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006766520186070000'], '70000608924': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608924', '10500', 'EVANDRO PEREIRA DA SILVA', 'EVANDRO PEREIRA', '#NULO#', '28954882153', 'EVANDROAMASSCLARAS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '14/04/1969', '49', '007881822070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006783520186070000'], '70000608925': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608925', '10122', 'ALEXANDRE FERREIRA DOS SANTOS', 'ALEXANDRE TOTA', '#NULO#', '82344159134', 'AOSANTOS.TOTA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '21/04/1978', '40', '013981012038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006697320186070000'], '70000608926': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608926', '10033', 'ADIMILSON DA ROSA BRITES', 'PROFESSOR JUQUINHA', '#NULO#', '98059998749', 'JUJILSUJUQUINHA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '28/10/1967', '51', '036605750310', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006662120186070000'], '70000608927': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608927', '10193', 'ANTONIO JOAQUIM DE SOUZA', 'MAJOR SOUZA', '#NULO#', '08895422104', 'MAJCBMDFSOUZA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SANTANA', '29/08/1944', '74', '007218572054', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '921', 'MILITAR REFORMADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006749520186070000'], '70000608928': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608928', '10233', 'RAQUEL BOG A CARVALHO', 'RAQUEL BOG A', '#NULO#', '83909419100', 'RAQUELBOGEA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '20/03/1978', '40', '013132362097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007104020186070000'], '70000608929': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608929', '10300', 'AGENILDO NERI DA SILVA', 'AGENILDO NERI', '#NULO#', '47807539100', 'AGENILDONERI@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SANTA MARIA DA VIT RIA', '23/08/1969', '49', '007769292062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006688820186070000'], '70000608930': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608930', '10125', 'TIAGO LACERDA DE BRITO', 'TIAGO LACERDA', '#NULO#', '05365735145', 'LACERDA_TIAGO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'CAVALCANTE', '28/01/1993', '25', '022671382020', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007078520186070000'], '70000608931': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608931', '10100', 'GARCIMAR BRASILEIRO LANDIM', 'LANDIM', '#NULO#', '69693161149', 'PHBMOVEIS2014@HOTMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SANTA RITA DE CASSIA', '03/11/1980', '38', '015388132011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06006818720186070000'], '70000608932': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608932', '10321', 'JOS  M RIO TRANQUILLINI NERY', 'TRANQUILLINI', '#NULO#', '28009037168', 'TRANQUILLINI3000@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '23/10/1962', '56', '001333912070', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '921', 'MILITAR REFORMADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006879420186070000'], '70000608933': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608933', '10250', 'ANDERSON MARQUES DE SOUZA', 'DERSON RACING', '#NULO#', '66991927104', 'CONTATO.DERSONRACING@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ARAGUARI', '26/01/1975', '43', '012004112011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006731320186070000'], '70000608934': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608934', '10002', 'IRIS MARIA DOS SANTOS', 'IRIS', '#NULO#', '15076482191', 'IRISMARIA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'MA', '-3', 'IMPERATRIZ', '24/01/1958', '60', '003672422054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006844220186070000'], '70000608935': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608935', '10110', 'MARIA DO SOCORRO BARBOSA DA COSTA', 'SOCORRO COSTA', '#NULO#', '58439234104', 'SOCORROCOSTA102014@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'PI', '-3', 'DEMERVAL LOB O', '09/05/1973', '45', '013892772003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007009320186070000'], '70000608936': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608936', '10010', 'GEORGE ARTHUR MOTTA DE SOUZA', 'GEORGE ARTHUR', '#NULO#', '01643230158', 'GEORGEMOTTA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '07/10/1986', '32', '019751332089', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006827220186070000'], '70000608937': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608937', '10700', 'LINDALVA DE FREITAS MARTINS', 'LINDA MARTINS', '#NULO#', '58485147120', 'LINDAMARTINSEVOCE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOI NIA', '05/12/1963', '55', '003844482003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006948620186070000'], '70000608938': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608938', '77192', 'ADRIANO ARA JO DA SILVA', 'ADRIANO ARA JO', '#NULO#', '55284302168', 'ADRIANOARAUJO11ENFERMAGEM@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '11/12/1971', '47', '010585702020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '113', 'ENFERMEIRO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007095520186070000'], '70000608939': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608939', '77771', 'ANTONIO VALDEMAR RODRIGUES DO NASCIMENTO', 'ANT NIO FISCAL', '#NULO#', '33238634291', 'SAMARONNEMUSICO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'PA', '-3', 'CAPIT O PO O', '01/01/1970', '49', '019063411350', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006758020186070000'], '70000608940': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608940', '77000', 'EDUARDO BENTES DE SOUZA LEAL', 'EDUARDO LEAL', '#NULO#', '04909696407', 'EDUARDOBENTESLEAL@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'AL', '-3', 'MACEI ', '28/09/1985', '33', '019160552003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006775020186070000'], '70000608941': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608941', '77001', 'FRANCISCO DAS CHAGAS LIMA RAMOS', 'ENGENHEIRO FRANCISCO', '#NULO#', '86762508120', 'TEC.FRANCISCORAMOS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'CE', '-3', 'TIANGUA', '30/09/1980', '38', '016344182097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '101', 'ENGENHEIRO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006792020186070000'], '70000608942': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608942', '77911', 'FRANCISCO JOSE ANTONIO DA SILVA', 'CHICO BOMBEIRO', '#NULO#', '55969755168', 'SFRANCISCOJOSE@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '30/04/1972', '46', '008342822020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '145', 'BOMBEIRO CIVIL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06006800520186070000'], '70000608943': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608943', '77111', 'GILVAN NERY DE SOUSA', 'GILVAN GAR OM', '#NULO#', '79524605104', 'GILVANGARCOM10@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'BREJOL NDIA ', '14/07/1977', '41', '011678902097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '196', 'GAR OM', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006835720186070000'], '70000608944': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608944', '77070', 'HILARIO JONAS DOS SANTOS', 'PIRIGOSO', '#NULO#', '28170768187', 'SOLIDARIEDADE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '13/01/1958', '60', '007818422046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007121020186070000'], '70000608945': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608945', '77123', 'JORGE LUIZ PEREIRA DE ARA JO MARIANO', 'DR. JORGE ARA JO', '#NULO#', '71357602120', 'FALECONOSCO@DRJORGEARAUJO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '21/01/1981', '37', '015915072070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '117', 'FARMAC UTICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006861220186070000'], '70000608946': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608946', '77077', 'JOS  WILSON GON ALVES', 'WILSON GON ALVES', '#NULO#', '76881318120', 'WILSON.ELEICAO.2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '07/07/1977', '41', '011587382054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006896420186070000'], '70000608947': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608947', '77321', 'KELRIANY NASCIMENTO DA SILVA', 'KELRIANY SILVA', '#NULO#', '82883319120', 'ANYNASCI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '12/07/1977', '41', '012702612070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PAR ', '931', ' STUDANTE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006904920186070000'], '70000608948': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608948', '77543', 'LEONARDO LUIS DE FREITAS PEDRON', 'PROFESSOR PEDRON', '#NULO#', '00754316106', 'LLFPEDRON@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '31/05/1986', '32', '019731882046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006930420186070000'], '70000608949': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608949', '77567', 'MARCO AUR LIO ANGELO ROSA', 'MARCO ROSA', '#NULO#', '78465125104', 'MARCOROSA.ADV@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '29/07/1977', '41', '012110382089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06006974120186070000'], '70000608950': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608950', '77777', 'MARIA ANT NIA RODRIGUES MAGALH ES', 'PROFESSORA MARIA ANT NIA', '#NULO#', '39895246153', 'PROFESSORAMARIAANTONIA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'UNA ', '05/04/1957', '61', '003759192097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06006991120186070000'], '70000608951': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608951', '77167', 'MARIA SONEIDE DOS SANTOS FERREIRA', 'MARIA SONEIDE', '#NULO#', '39905934120', 'FYLLIPE.FERREIRA@OUTLOOK.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'MA', '-3', 'S O LU S', '12/04/1959', '59', '004743392038', '4', 'FEMININO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007112520186070000'], '70000608952': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608952', '77222', 'SOLANGE SOARES CAMPOS', 'SOLANGE CAMPOS', '#NULO#', '61957925191', 'SOLANGE.SC@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOI NIA', '29/03/1974', '44', '013663642003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007060320186070000'], '70000608953': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000608953', '77333', 'WASHINGTON LUIZ DA SILVA', 'WASHINGTON L DER COMUNIT RIO', '#NULO#', '64648559134', 'SOLIDARIEDADE.DS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'PR', '-3', 'CIANORTE', '01/09/1962', '56', '007977712097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007087020186070000'], '70000610796': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610796', '13222', 'ROBERTO POLICARPO FAGUNDES', 'POLICARPO', '#NULO#', '51279983434', 'POLICARPO13PT@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'RN', '-3', 'PASSAGEM', '22/02/1967', '51', '010276842003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '293', 'SERVENTU RIO DE JUSTI A', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007598120186070000'], '70000610797': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610797', '13123', 'GERALDO MAGELA PEREIRA', 'MAGELA', '#NULO#', '21134375620', 'GMAGELAP13@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PATOS DE MINAS', '26/12/1956', '62', '001284552003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009148420186070000'], '70000610798': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610798', '13001', 'RODRIGO LOPES BRITTO', 'RODRIGO BRITTO', '#NULO#', '58486003172', 'PTDF1@PTDF.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '17/02/1979', '39', '013927722089', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '395', 'BANC RIO E ECONOMI RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007606620186070000'], '70000610799': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610799', '13163', 'JUAREZ PAULINO DE MEDEIROS', 'JUAREZ PAULINO', '#NULO#', '67658296449', 'PTDF1@PTDF.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'PB', '-3', 'JUNC  DO SIRID ', '10/03/1969', '49', '007898852011', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007407520186070000'], '70000610800': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610800', '13122', 'SANTIAGO DA SILVA FRAN A', 'DR. SANTIAGO', '#NULO#', '72403195120', 'SANTIAGODOBRASIL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '28/10/1981', '37', '016367212097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '111', 'M DICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007623620186070000'], '70000610801': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610801', '13913', 'ELICEUDA SILVA DE FRAN A', 'PROFESSORA ELICEUDA', '#NULO#', '30847079104', 'ELICEUDA@SIMPRODF.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PARNAIBA', '29/04/1964', '54', '005918062054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007242420186070000'], '70000610802': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610802', '13111', 'MARIA DE DEUS COELHO ROCHA FARIA', 'PROFESSORA DEUSINHA', '#NULO#', '36679950163', 'DCOELHOROCHA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'PI', '-3', 'BARRAS', '20/12/1967', '51', '001629472062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007485220186070000'], '70000610803': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610803', '13113', 'GLAUCO DE SILVA E SILVA', 'PROFESSOR GLAUCO', '#NULO#', '58431284153', 'SSGLAUCO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '08/10/1971', '47', '008183342011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007329820186070000'], '70000610804': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610804', '13180', 'HELLEN CRISTHYAN CORREIA BOAVENTURA', 'HELLEN FRIDA', '#NULO#', '03781632563', 'HELLENFRIDADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'BA', '-3', 'FEIRA DE SANTANA', '17/04/1991', '27', '135912480523', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009130220186070000'], '70000610805': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610805', '13013', 'RICARDO VALE DA SILVA', 'RICARDO VALE', '#NULO#', '34430130159', 'PTDF1@PTDF.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '29/07/1965', '53', '004092442097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '277', 'DEPUTADO', '0', '5', 'SUPLENTE', 'S', 'S', '-1', '06007571420186070000'], '70000610806': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610806', '13313', 'MICHEL PLATINI GOMES FERNANDES', 'MICHEL PLATINI', '#NULO#', '94099464172', 'PTDF1@PTDF.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRSILIA', '19/06/1983', '35', '016264382003', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007502220186070000'], '70000610807': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610807', '13131', 'ARLETE AVELAR SAMPAIO', 'ARLETE SAMPAIO', '#NULO#', '05733014172', 'ARLETESAMPAIO13@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'BA', '-3', 'ITAGIB ', '28/06/1950', '68', '000216022003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '111', 'M DICO', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06007208420186070000'], '70000610808': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610808', '13777', 'WALDICEIA DE MORAES TEIXEIRA DA SILVA', 'PASTORA WALL', '#NULO#', '54973937720', 'PTDF1@PTDF.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'RIO DE JANEIRO', '07/03/1958', '60', '000597852062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007675820186070000'], '70000610809': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610809', '13000', 'ERICO GRASSI CADEMARTORI', 'ERICO GRASSI', '#NULO#', '95953175191', 'PTDF1@PTDF.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '05/12/1979', '39', '014740152003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007250920186070000'], '70000610810': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610810', '13369', 'LEILA REGINA LOPES', 'NEGALAIZE', '#NULO#', '45759448072', 'SAPATADVENUS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'RS', '-3', 'PORTO ALEGRE', '10/12/1967', '51', '039443420469', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007424520186070000'], '70000610811': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610811', '13021', 'VIRIDIANO CUSTODIO DE BRITO', 'VIRIDIANO BRITO', '#NULO#', '15353745191', 'VIRIDIANOBRITO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'GO', '-3', 'FORMOSA', '01/10/1958', '60', '006145202054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007667320186070000'], '70000610812': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610812', '13016', 'ALDEMIO OGLIARI', 'ALDEMIO OGLIARI', '#NULO#', '12089133015', 'ALDEMIOAGLIARI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'RS', '-3', 'BOQUEIR O DO LEAO', '16/04/1953', '65', '011756082003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007164720186070000'], '70000610813': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610813', '13651', 'JOSMAILTON INACIO LOPES', 'JOSMAILTON', '#NULO#', '39258637100', 'JOSMAILTONIL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '16/02/1967', '51', '002484082003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007399020186070000'], '70000610814': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610814', '13872', 'LUIZA GONZAGA GOMES DE S ', 'LUIZA GOMES', '#NULO#', '36894583153', 'LUIZAGOMESPT@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'PI', '-3', 'AROAZES', '01/04/1962', '56', '002118572020', '4', 'FEMININO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '5', 'VI VO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007459720186070000'], '70000610815': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610815', '13636', 'ALISSON LUIZ DE MACEDO VEIRA', 'ALLISSON RENOVA  O', '#NULO#', '87558262100', 'ALISSON.VIEIRA@YAHOO.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '19/02/1982', '36', '016154212054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007173220186070000'], '70000610816': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610816', '13443', 'OSVANILDO LOURENSO DA SILVA', 'OSVANILDO LOURENSO', '#NULO#', '22117024149', 'OSVANILDO@UNB.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'PI', '-3', 'CURIM TA', '11/07/1958', '60', '004071262038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '5', 'VI VO(A)', '02', 'PRETA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007537420186070000'], '70000610817': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610817', '13100', 'FRANCISCO DOMINGOS DOS SANTOS', 'CHICO VIGILANTE', '#NULO#', '29731372172', 'CHICOVIGILANTE@CHICOVIGILANTE.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'MA', '-3', 'VITORINO FREIRE', '08/09/1954', '64', '005221582070', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '277', 'DEPUTADO', '0', '2', 'ELEITO POR QP', 'S', 'S', '-1', '06007294620186070000'], '70000610818': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610818', '13223', 'REGINA LUCIA TOME DOS SANTOS', 'REGINA TOM ', '#NULO#', '00207991790', 'REGINALTOME@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'CE', '-3', 'ITAPIPOCA', '19/12/1968', '50', '085351640345', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007554420186070000'], '70000610819': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610819', '13300', 'VANDERLEI MACIEL LIMA', 'WANDER MACIEL', '#NULO#', '41674600178', 'WANDERMACIEL22@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'PI', '-3', 'CORRENTES', '03/05/1970', '48', '017212422011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '164', 'M SICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007640620186070000'], '70000610820': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610820', '13456', 'RICARDO GUANABARA LEAL', 'GUANABARA', '#NULO#', '70818193700', 'RGBLEAL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '11/05/1961', '57', '057652100248', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007562920186070000'], '70000610821': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610821', '13420', 'RONALDO UBIRAJARA DO CARMO', 'RONALDO CARMO', '#NULO#', '71367373115', 'UBIRAJARAMULTICLIK@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '22/01/1980', '38', '013503762062', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007615120186070000'], '70000610822': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610822', '13133', 'JOSE LUIS DIAS BORGES', 'LUISINHO', '#NULO#', '12457078334', 'JOSELUISGWT@HOTMMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'S O LUIS', '01/10/1957', '61', '003049742046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007363820186070000'], '70000610823': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610823', '13020', 'LUCIMAR ALVES MARTINS', 'LUCIMAR', '#NULO#', '25917480125', 'LUCIMARMARTINS.AXE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '23/05/1962', '56', '000882782003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007433020186070000'], '70000610824': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610824', '13383', 'DARCY LUIZ DE OLIVEIRA', 'DARCY LUIZ', '#NULO#', '04548671153', 'DARCY.LUIZ@YAHOO.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'MS', '-3', 'CAMPO GRANDE', '15/04/1938', '80', '009086452054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007233920186070000'], '70000610825': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610825', '13018', 'JOSE VICENTE RODRIGUES DA SILVA', 'PROFESSOR VICENTE', '#NULO#', '41042549168', 'JOSECONSTRUTOR@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'CE', '-3', 'IBIAPINA', '11/10/1967', '51', '042959711031', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06007380820186070000'], '70000610826': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610826', '13333', 'FRANCISCO DE ASSIS DOS SANTOS', 'FRANCISCO DA M NORTE', '#NULO#', '23043288491', 'FAO519632@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'RN', '-3', 'MONTE ALEGRE', '15/10/1954', '64', '007766932097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007286120186070000'], '70000610827': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610827', '13999', 'MARIANA ROSA MOREIRA DOS SANTOS', 'MARIANA ROSA', '#NULO#', '69819041104', 'MMARINANI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'MG', '-3', 'URBEL NDIA', '19/03/1981', '37', '014629522062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '390', 'SECRET RIO E DATIL GRAFO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007493720186070000'], '70000610828': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610828', '13713', 'JOSE VASCONCELOS CAMPOS DE SOUZA', 'PROFESSOR VASCO', '#NULO#', '16442636615', 'VASCQUONCELOS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ARA UAI', '09/01/1958', '60', '000513552054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007372320186070000'], '70000610829': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000610829', '13070', 'THELMA REGINA VIEIRA DE MELLO', 'THELMA MELLO', '#NULO#', '87052601672', 'THELMA.MELLO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'VOLTA REDONDA', '04/09/1972', '46', '117371480230', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007632120186070000'], '70000610830': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '3', 'GOVERNADOR', '70000610830', '13', 'JULIO FLAVIO GAMEIRO MIRAGAYA', 'J LIO MIRAGAYA', '#NULO#', '41181573734', 'JULIO.MIRAGAYA@DF.SEBRAE.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '10/11/1957', '61', '013222412046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '121', 'ECONOMISTA', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06007416020186070000'], '70000610831': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '4', 'VICE-GOVERNADOR', '70000610831', '13', 'CLAUDIA PEREIRA FARINHA', 'CLAUDIA FARINHA', '#NULO#', '81606400134', 'CLAUDIAFARINHADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'CEIL NDIA', '09/05/1975', '43', '012813612038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '601', 'AGRICULTOR', '-1', '4', 'N O ELEITO', 'N', 'N', '-1', '06009182420186070000'], '70000610832': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000610832', '133', 'MARCELO DA COSTA PINTO NEVES', 'MARCELO NEVES', '#NULO#', '31247679420', 'MARCELONEVESBRZIL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'PE', '-3', 'RECIFE', '16/08/1957', '61', '005594410833', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06007468220186070000'], '70000610833': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000610833', '131', 'WASNY NAKLE DE ROURE', 'WASNY', '#NULO#', '16066189620', 'WASNYSENADOR131@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIAS', '10/05/1951', '67', '001319062003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06007692820186070000'], '70000610834': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610834', '1300', 'ABIAS DE SOUSA SILVA', 'ABIAS DE SOUSA SILVA', '#NULO#', '56150245187', 'ABIAS2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SANTA MARIA DA VITORIA', '10/10/1972', '46', '032899871040', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007156220186070000'], '70000610835': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610835', '1303', 'ANA CRISTINA ROBERTO', 'CRISTINA ROBERTO', '#NULO#', '10238050149', 'CRISTINAEBOMDEMAIS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'ABAET -MG', '19/02/1955', '63', '000726622011', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007181720186070000'], '70000610836': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610836', '1369', 'DANIEL QUEIROZ GALV O', 'DANIEL PXEIRA', '#NULO#', '16579058889', 'DQGALVAOJP@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'PA', '-3', 'BEL M', '16/11/1974', '44', '227922160167', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007225420186070000'], '70000610837': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610837', '1331', 'ERIKA JUCA KOKAY', 'ERIKA KOKAY', '#NULO#', '22441107100', 'DEP.ERIKAKOKAY@CAMARA.LEG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'FORTALEZA', '15/08/1957', '61', '001086432003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '3', 'ELEITO POR M DIA', 'S', 'S', '-1', '06007269120186070000'], '70000610838': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610838', '1312', 'EXPEDITO AFONSO VELOSO', 'EXPEDITO VELOSO', '#NULO#', '42458960600', 'EXPEDITOVELOSO@TERRA.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PORTO FIRME', '02/08/1964', '54', '014336392011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '121', 'ECONOMISTA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007277620186070000'], '70000610839': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610839', '1318', 'GERALDO MAGELLA ALMEIDA SALVADO', 'MAGELLINHA', '#NULO#', '65821262100', 'MAGELINHA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '16/11/1974', '44', '016540952062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007303120186070000'], '70000610840': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610840', '1333', 'JOAQUIM RODRIGUES DOS SANTOS FILHO', 'JOAQUIM RODRIGUES', '#NULO#', '15377555104', 'JOAQUIM13RODRIGUES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '22/09/1957', '61', '035233990701', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007346820186070000'], '70000610841': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610841', '1317', 'LUIZ FERNANDO CASTELO BRANCO REBELLO HORTA', 'FERNANDO HORTA', '#NULO#', '91914825004', 'FERNANDOHORTA@UNB.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'RS', '-3', 'POTO ALEGRE', '07/01/1977', '42', '066246670493', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007441520186070000'], '70000610842': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610842', '1311', 'OSNI DE SOUZA CALIXTO', 'OSNI CALIXTO', '#NULO#', '32346840904', 'OSNICAKIXTO@BOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'PR', '-3', 'SABAUDIA', '02/05/1954', '64', '127440790281', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007528920186070000'], '70000610843': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610843', '1321', 'REBECA GOMES DE FREITAS', 'REBECA GOMES', '#NULO#', '06456312132', 'REBECAGOMESDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA-DF', '03/04/1997', '21', '024151992089', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '931 ESTUDAN   BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007545920186070000'], '70000610844': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610844', '1324', 'VANESSA NEGRINI', 'VANESSA   O BICHO', '#NULO#', '89740009620', 'NEGRINI.VANESSA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'PARANOA', '07/11/1974', '44', '110895690205', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007658820186070000'], '70000610845': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000610845', '133', 'CRISTIANE PEREIRA DOS SANTOS', 'CRIS SANTOS', '#NULO#', '83234020191', 'CRIS.CORSAP@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'ASA NORTE', '28/02/1977', '41', '013052952003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '-1', '4', 'N O ELEITO', 'N', 'N', '-1', '06007216920186070000'], '70000610846': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000610846', '131', 'OLGA CRISTINA ROCHA DE FREITAS', 'OLGA CRISTINA', '#NULO#', '31385532149', 'OLGAFREITAS26@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'MG', '-3', 'TRES MARIAS', '26/06/1967', '51', '001264942003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06007510720186070000'], '70000610847': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000610847', '133', 'IOLANDA RODRIGUES ROCHA', 'IOLANDA RODRIGUES  ROCHA', '#NULO#', '59689366572', 'ROCHAIOLANDA27@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'TO', '-3', 'TOCANTINS', '27/04/1968', '50', '014383352070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '266', 'PROFESSOR DE ENSINO M DIO', '-1', '4', 'N O ELEITO', 'N', 'N', '-1', '06007338320186070000'], '70000610848': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000610848', '131', 'JOSE ALVES DA SILVA', 'ZE ALVES', '#NULO#', '28937260115', 'EMAILDOSEALVES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '10/03/1964', '54', '003363852062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '131', 'ADVOGADO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06007355320186070000'], '70000610849': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610849', '1313', 'ANTONIO SABINO DE VASCONCELOS NETO', 'SABINO', '#NULO#', '14521644104', 'SABINOTAGUATINGA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'CE', '-3', 'TIANGUA', '24/03/1959', '59', '002824992003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007190220186070000'], '70000610850': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610850', '1320', 'G SSYCA ALVES DE SOUZA', 'GESSYCA', '#NULO#', '03333106167', 'GESSYCAALVESS@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '10/05/1991', '27', '021960322011', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '9 ', 'ESTUD TE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007311620186070000'], '70000610851': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610851', '1310', 'MARIA AMERICA MENEZES BONFIM HAMU', 'AMERICA BONFIM', '#NULO#', '22284745172', 'AMERICAPT@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'CE', '-3', 'CRATEUS', '01/03/1960', '58', '010400312011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '03', 'PARDA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007476720186070000'], '70000610852': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610852', '1322', 'ROBERTO CARLOS PINHEIRO SOUSA', 'TIM', '#NULO#', '37308858120', 'ROBERTO.TIM.13@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '25/02/1966', '52', '003223472070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007589620186070000'], '70000610853': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000610853', '1307', 'WALTER CELIO DE ALMEIDA', 'WALTER CELIO', '#NULO#', '11525983172', 'WALTERCELIOPT@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '13', 'PT', 'PARTIDO DOS TRABALHADORES', '70000050289', 'PARTIDO ISOLADO', 'PT', '1', 'BRASILEIRA NATA', 'MG', '-3', 'CAMPO BELO', '25/01/1954', '65', '000635172003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007684320186070000'], '70000611631': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611631', '22775', 'CONCEI  O DE MARIA MEIRELES OLIVEIRA', 'CONCEI  O MARIA', '#NULO#', '84649216168', 'WWW.PARTIDOREPUBLICADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'MA', '-3', 'ARAIOSES', '08/12/1972', '46', '013405102011', '4', 'FEMININO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007822720186070000'], '70000611632': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611632', '22022', 'MARCOS GUTEMBERG FIALHO DA COSTA', 'DR GUTEMBERG', '#NULO#', '39491382420', 'PAULO.GOYAZ@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'PB', '-3', 'ARARUNA', '10/09/1964', '54', '011556602097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '111', 'M DICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008057020186070000'], '70000611633': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611633', '22111', 'ANDRE MATTAR', 'ANDRE MATTAR', '#NULO#', '53852680115', 'ANDRADEMATTAR@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/03/1973', '45', '007841132020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007788720186070000'], '70000611634': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611634', '22789', 'ROBERTA CANDIDA DA SILVA PEREIRA', 'ROBERTA VIANA', '#NULO#', '05431090704', 'PARTIDOREPUBLICADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'ITAGUAI', '01/06/1980', '38', '106541450353', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008117720186070000'], '70000611635': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611635', '22156', 'SILVANIA LEAL DIAS', 'SILVANIA LEAL', '#NULO#', '58363777153', 'IMOVEISDELUXO2013@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'PI', '-3', 'MONTE ALEGRE', '07/09/1972', '46', '012884382038', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '403', 'CORRETO DE IM  IS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008143220186070000'], '70000611636': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611636', '22223', 'ERISVALDO FARIAS SIMOES', 'FALA ERISVALDO', '#NULO#', '11153338874', 'FLAERISVALDO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'PE', '-3', 'CABROBRO', '25/05/1971', '47', '012854102070', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '156', 'T CNICO D ELETRICIDADE  ELETR NICA E TELECOMUNICA  ES', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007900420186070000'], '70000611637': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611637', '22552', 'NICANOR FERREIRA DOS SANTOS', 'NICANOR FERREIRA', '#NULO#', '37989952149', 'PARTIDOREPUBLICADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'GO', '-3', 'POSSE', '02/05/1967', '51', '008469261015', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008082520186070000'], '70000611638': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611638', '22567', 'ANDERSON FABRICIO GOMES', 'ANDERSON FABRICIO', '#NULO#', '82344612149', 'PARTIDOREPUBLICADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '08/10/1977', '41', '012691692003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007762020186070000'], '70000611639': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611639', '22777', 'SANDRA FARAJ CAVALCANTE', 'SANDRA FARAJ', '#NULO#', '60337982104', 'PARTIDOREPUBLICADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '12/02/1975', '43', '009643342062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '5', 'SUPLENTE', 'S', 'S', '-1', '06008134720186070000'], '70000611640': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611640', '22224', 'VALDEMAR FELIX DA COSTA FILHO', 'VALDEMAR FELIX', '#NULO#', '78061300397', 'PARTIDOREPUBLICADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'PI', '-3', 'BARRAS', '09/11/1978', '40', '014630232003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008151720186070000'], '70000611641': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611641', '22123', 'AGACIEL DA SILVA MAIA', 'AGACIEL MAIA', '#NULO#', '16321383104', 'AGACIEL9@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'PB', '-3', 'BREJO DO CRUZ', '21/07/1958', '60', '000018152054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '2', 'ELEITO POR QP', 'S', 'S', '-1', '06007753520186070000'], '70000611642': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611642', '22243', 'BENEDITO GALVAO DE FRAN A', 'BENEDITO GALVAO', '#NULO#', '00535883803', 'MARTELINHODEOUROCONTATO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'SP', '-3', 'CUNHA', '18/01/1956', '62', '050702310191', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007814220186070000'], '70000611643': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611643', '22057', 'LELIO SEBASTIAO NOGUEIRA', 'LELIO NEGAO', '#NULO#', '11960701134', 'LELIONOGUEIRA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIANIA', '11/02/1957', '61', '006342582020', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008004820186070000'], '70000611644': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611644', '22555', 'ELIANA FERREIRA EMERICK', 'ELIANA EMERICK', '#NULO#', '14394600197', 'ELIANAEMERICKDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'MG', '-3', 'MANHUA U', '19/01/1956', '62', '001380992003', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007866420186070000'], '70000611645': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611645', '22193', 'FRANCISCO JOSE NUNES', 'DR PROF CABO J NUNES', '#NULO#', '26706288187', 'JOSENUNESDF@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'CE', '-3', 'UBAJARA', '05/10/1960', '58', '009524952097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007935620186070000'], '70000611646': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611646', '22772', 'FABIANO DE OLIVEIRA LAGO', 'FABIANO LAGO', '#NULO#', '57815577172', 'FABIANOLAGO2006@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '24/10/1972', '46', '009240932046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007918620186070000'], '70000611647': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611647', '22130', 'MARIA DUCLERIO BRAZILINO DA SILVA', 'MARIA DUCLERIO', '#NULO#', '50155660349', 'PARTIDOREPUBLICADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'CE', '-3', 'BATURITE', '18/11/1970', '48', '047037701090', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008065520186070000'], '70000611648': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611648', '22445', 'JOAO BATISTA ALVES SOBRINHO', 'JOAO BATISTA', '#NULO#', '57968500168', 'BJOAO22770@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '16/08/1972', '46', '010801862038', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007961120186070000'], '70000611649': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611649', '22722', 'FRANCISCO FERNANDO ALVES REIS', 'FERNANDO REIS', '#NULO#', '71946560197', 'FERNANDOALVESREIS@OUTLOOK.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '07/11/1981', '37', '017324492011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007927120186070000'], '70000611650': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611650', '22227', 'DEUSNENE LOUREN O DE LIMA', 'DEUNENE PIERRE', '#NULO#', '35777338100', 'PIERREDBSB@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'GO', '-3', 'PORANGATU', '09/11/1967', '51', '007873382070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007849420186070000'], '70000611651': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611651', '22021', 'LUCIANO BUENO FRANCO', 'LUCIANO FRANCO', '#NULO#', '06962519818', 'LUCIANOLBFRNCO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'SP', '-3', 'RIBEIRAO PRETO', '19/04/1970', '48', '200952510108', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008013320186070000'], '70000611652': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611652', '22122', 'RENATO ANDRADE DOS SANTOS', 'BISPO RENATO ANDRADE', '#NULO#', '29630142104', 'PARTIDOREPUBLICADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PATOS DE MINAS', '27/03/1963', '55', '002065982038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '5', 'SUPLENTE', 'S', 'S', '-1', '06008091020186070000'], '70000611653': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611653', '22319', 'ANDERSON SILVA DE OLIVEIRA', 'ANDERSON MANTEIGA', '#NULO#', '70742740110', 'MANTEIGAANDERSON@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'PLANALTINA', '23/07/1983', '35', '018575632038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '176', 'COZINHEIRO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009156920186070000'], '70000611654': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611654', '22333', 'JOAO MARTINS MASCARENHAS', 'JOAO MASCARENHAS', '#NULO#', '05473837115', 'JOAOMASCARENHS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'CE', '-3', 'CRATEUS', '12/09/1941', '77', '009908162011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007987820186070000'], '70000611655': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611655', '22002', 'NEUSA BARBOSA DOS SANTOS', 'NEUSA BARBOSA', '#NULO#', '41791274153', 'NEUSABARBOSA.CONSULTORI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '28/12/1966', '52', '015846372070', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008074020186070000'], '70000611656': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611656', '22721', 'JOVENIL ALVES DA SILVA', 'JUVENIL ALVES', '#NULO#', '85871028187', 'JUVENILALVESALVES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/11/1976', '42', '013391262070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '531', 'MOTORISTA DE VE CULOS DE TRANSPORTE COLETIVO DE PASSAGEIROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007996320186070000'], '70000611657': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611657', '22051', 'MARCIA DE SOUSA GAMA', 'MARCIA GAMA', '#NULO#', '57382441172', 'MARCIAGAMA5@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '14/09/1971', '47', '008142082046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008048520186070000'], '70000611658': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611658', '22125', 'ANTONIO PEREIRA DE SOUSA', 'PASTOR JORGE BOMBEIRO', '#NULO#', '25834550100', 'PRJORGEBOMBEIRO@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'MA', '-3', 'CODO', '14/11/1956', '62', '010049252089', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06007805720186070000'], '70000611659': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611659', '22126', 'LUCIMAR SITONIO DA SILVA', 'LUCIMAR ASSISTENTE SOCIAL', '#NULO#', '56389388187', 'LUCIMARSITONIO@HOTMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'CE', '-3', 'COREAU', '12/01/1967', '51', '008897130710', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06008021820186070000'], '70000611660': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611660', '22180', 'ANTONIO CRISPIM DE OLIVEIRA', 'ANTONIO CRISPIM', '#NULO#', '86746235653', 'ANTONIOCRISPIMPR22@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'BA', '-3', 'COCOS', '09/06/1970', '48', '030799091007', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '531', 'MOTORISTA DE VE CULOS DE TRANSPORTE COLETIVO DE PASSAGEIROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007797220186070000'], '70000611661': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611661', '22444', 'ANDERSON SENTO SE SANTANA DA COSTA', 'ANDERSON SENTO', '#NULO#', '55267165115', 'ANDERSONSENTO75@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '16/03/1975', '43', '011887472089', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '537', 'MOTORISTA PARTICULAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007770520186070000'], '70000611662': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611662', '22000', 'VALDEMIR HELENO DE SOUSA', 'VALDEMIR VIGILANTE', '#NULO#', '61950238172', 'PRVALDEMIR2009@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/06/1972', '46', '014311542020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008160220186070000'], '70000611663': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611663', '22434', 'ROBERTO EUSTAQUIO INACIO VIEIRA', 'ROBERTO EUSTAQUIO', '#NULO#', '09647317115', 'ROBERTOVIEIRAPRODUTOR@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '23/05/1954', '64', '036776931090', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '124', 'CONTADOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008126220186070000'], '70000611664': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611664', '22354', 'LUIZ CARLOS DOS SANTOS', 'MISSIONARIO CARLOS', '#NULO#', '25935496100', 'MISSIONARIOCARLOS.DF2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '05/07/1965', '53', '018792892089', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '403', 'CORRETO DE IM  IS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008030320186070000'], '70000611665': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611665', '22140', 'EDILSON ALVES DOS SANTOS', 'EDILSON', '#NULO#', '31368387187', 'EDILSONBELLO@HOTMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'MA', '-3', 'CAXIAS', '14/01/1965', '53', '016966112020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '295', 'MEMBRO DAS FOR AS ARMADAS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06007857920186070000'], '70000611666': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611666', '22017', 'EMERSON BENEDITO VIDAL', 'EMERSON VIDAL', '#NULO#', '26873796115', 'EMERSONVIDAL2007@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/09/1963', '55', '007079292003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007891920186070000'], '70000611667': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611667', '22888', 'ELIZABETE MARIA CARDOSO DE NOGUEIRA', 'BETH CARDOSO', '#NULO#', '22502904153', 'BETINHA115@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '29/04/1960', '58', '000162742046', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '137', 'RELA  ES-P BLICAS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007883420186070000'], '70000611668': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611668', '22322', 'ELISABETE HERNANDES TROVAO', 'BETH SCOFIELD', '#NULO#', '50581252187', 'PARTIDOREPUBLICADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '23/06/1970', '48', '007794422089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007874920186070000'], '70000611669': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611669', '22221', 'CRISTIANE SANTANA ALVES POVOA MOREIRA', 'CRIS DA SAUDE', '#NULO#', '86442902153', 'KRIKA2211@HOTMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '22/11/1978', '40', '035310431007', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06007831220186070000'], '70000611670': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611670', '22007', 'RICARDO HERNANDES TROVAO', 'RICARDO TROVAO', '#NULO#', '25848550115', 'PARTIDOREPUBLICADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '27/07/1962', '56', '004995602003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008109220186070000'], '70000611671': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611671', '22373', 'INES FERREIRA DOS SANTOS', 'INES DIAS', '#NULO#', '70725454172', 'INESSALUTE@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '28/09/1980', '38', '014583732097', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007944120186070000'], '70000611672': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611672', '22225', 'ADRIANE PEREIRA DE FRAN A', 'INDIA', '#NULO#', '85210188191', 'BABYDRIFASCHION@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'CE', '-3', 'IGUATU', '06/12/1975', '43', '012604522062', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '05', 'IND GENA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06007745020186070000'], '70000611673': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611673', '22222', 'IVAMAR DA SILVA RIBEIRO JUNIOR', 'IVAMAR JUNIOR', '#NULO#', '70058890106', 'IVAMAR.RIBEIRO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIANIA', '28/04/1980', '38', '014801772097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '246', 'T CNICO   OBRAS C IS  ESTRADAS  SANEAMENTO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007952620186070000'], '70000611674': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000611674', '22190', 'JOAO DE DEUS SILVA CARVALHO', 'JO O DE DEUS', '#NULO#', '14598299134', 'VIRGINIA.CASTRO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'AL', '-3', 'PIA ABU U', '14/06/1954', '64', '007896762003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '921', 'MILITAR REFORMADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06007979320186070000'], '70000612382': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612382', '65655', 'MARIO MENDES DO PRADO', 'MAUR O', '#NULO#', '28734718168', 'MARIOURAURA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'JO O PINHEIRO -MG', '12/09/1960', '58', '003149192062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008559620186070000'], '70000612383': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612383', '65339', 'LEONARDO MATHEUS DE SOUZA RIBEIRO', 'LE  MATHEUS', '#NULO#', '04939257169', 'LEO.UJSDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'CEILANDIA', '10/07/1996', '22', '024664222070', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRE ', '931', ' STUDANTE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008480720186070000'], '70000612384': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612384', '65065', 'GUILHERME DA HORA PEREIRA', 'GUILHERME DA HORA', '#NULO#', '01254369040', 'GHPEREIRA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'PORTO ALEGRE', '14/11/1989', '29', '097390460418', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008386020186070000'], '70000612385': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612385', '65000', 'TAMARA NAIZ DA SILVA', 'TAMARA NAIZ', '#NULO#', '98798316168', 'TAMARA.UJS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'PLANALTINA', '16/03/1984', '34', '015375912097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '230', 'PEDAGOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009173920186070000'], '70000612386': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612386', '65333', 'JEFFERSON OLIVEIRA MOTTA LEITE', 'JEFF MOTTA', '#NULO#', '27785106215', 'JEFFERSONMOTTA2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'JEQUI ', '03/03/1970', '48', '009594792054', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '244', 'T CNICO EM EDIFICA  ES', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008429720186070000'], '70000612387': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612387', '65035', 'RICARDO LUCAS VASCONCELOS VIANNA', 'RICARDO LUCAS', '#NULO#', '95965149115', 'RICLUCAS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/01/1986', '32', '019164912020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008662820186070000'], '70000612388': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612388', '65123', 'TATIANA DOS SANTOS GOMES FRANCA', 'TATI GOMES', '#NULO#', '03802258401', 'GOMESFRANCA_JUS@OUTLOOK.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'PE', '-3', 'RECIFE', '08/10/1981', '37', '056250940809', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA 931', 'E UDANTE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008689520186070000'], '70000612389': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612389', '65585', 'JANIO ALVES DA SILVA', 'J NIO ALVES', '#NULO#', '38713411349', 'VIDRACARIA.OESTEDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PARNAIBA', '13/12/1969', '49', '016823142011', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008411520186070000'], '70000612390': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612390', '65100', 'FRANCISCO RODRIGUES DA SILVA NETO', 'CHIQUINHO DE SAMAMBAIA', '#NULO#', '65941900163', 'CHIQUINHOSAMAMBAIA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '06/01/1953', '65', '011390572038', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008377520186070000'], '70000612391': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612391', '65180', 'IVANETE ALVES OLIVEIRA', 'SANTA ALVES', '#NULO#', '35140330130', 'SANTAALVES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'CERES', '23/11/1961', '57', '004340782070', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008403020186070000'], '70000612392': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612392', '65565', 'THAMIRIS OLIVEIRA DA SILVA', 'THAMIRIS FLORA', '#NULO#', '04097430114', 'THAMIRIS.UJS65@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '28/12/1992', '26', '022499392038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '113', 'ENFERMEIRO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008723520186070000'], '70000612393': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612393', '65777', 'EUCLIDES DA SILVA', 'EUCLIDES FILHO DE PIONEIRO', '#NULO#', '40011038187', 'EUCLIDES35@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '01/01/1967', '52', '001764952003', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06008342320186070000'], '70000612394': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612394', '65222', 'ELIAS SILVA ARAUJO', 'PROFESSOR ELIAS', '#NULO#', '46166670125', 'PROFESSORELIAS.DISTRITAL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'JANUARIA', '22/05/1966', '52', '006746342097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '230', 'PEDAGOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008316820186070000'], '70000612395': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612395', '65758', 'MARIA DE JESUS MELO SANTOS', 'JESUS COBRADORA', '#NULO#', '18500129115', 'MARIADEJESUSMELO58@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'MIRACEMA DO NORTE', '07/07/1958', '60', '002341002003', '4', 'FEMININO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '160', 'COBRADOR DE TRANSPORTE COLETIVO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008541420186070000'], '70000612396': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612396', '65888', 'ALDEMIR DOM CIO DA SILVA', 'ALDEMIR DOMICIO', '#NULO#', '34057340106', 'PCDOBDFELEICOES2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/10/1968', '50', '007664992003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '109', 'AGENTE DE SA DE E SANITARISTA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008212420186070000'], '70000612397': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612397', '18200', 'ADILSON NUNES DE LIMA', 'ADILSON NUNES', '#NULO#', '19229054372', 'ADILSONNL79@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'AL', '-3', 'ARAPIRACA', '12/02/1962', '56', '052879160507', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008195420186070000'], '70000612398': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612398', '18420', 'ADOLPHO LUIZ BEZERRA KESSELRING', 'ADOLPHO FUICA', '#NULO#', '22056092115', 'ADOLPHOKESSEL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'SP', '-3', 'GUARATINGUET ', '07/01/1961', '57', '006536102070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008203920186070000'], '70000612399': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612399', '18182', 'ANA ROSA CARVALHO DE ABREU', 'ANA ROSA', '#NULO#', '01023551187', 'ANAROSA200@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'MA', '-3', 'BACABAL', '25/02/1949', '69', '010243252097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008220920186070000'], '70000612400': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612400', '18918', 'ANDR  RODOLFO DE LIMA', 'ANDR  LIMA', '#NULO#', '15219560816', 'SECRETARIAREDEDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'SP', '-3', 'ARARAQUARA', '09/12/1971', '47', '184742860124', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008239120186070000'], '70000612401': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612401', '18012', 'AUGUSTO BELLO DE SOUZA NETO', 'GUTO BELLO', '#NULO#', '80431402191', 'AUGUSTOBELLONETO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'JEQUI ', '07/04/1976', '42', '011786212038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008247620186070000'], '70000612402': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612402', '18123', 'BALTAZAR CRISTINO DA SILVA', 'BALTAZAR', '#NULO#', '35160128115', 'BAL13@BOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '24/01/1969', '49', '008113252046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008256120186070000'], '70000612403': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612403', '18666', 'CARLOS INACIO PRATES', 'CARLOS INACIO', '#NULO#', '51056089687', 'CARLOSPRATES11@YAHOO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BELO HORIZONTE', '26/02/1965', '53', '057620500248', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008264620186070000'], '70000612404': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612404', '18193', 'CESAR DA SILVA SANTANA', 'CESAR SANTANA', '#NULO#', '62512234720', 'SANTANACBM@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '15/06/1959', '59', '009502032038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008273120186070000'], '70000612405': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612405', '18070', 'CRISTIANO ALENCAR SEVERO', 'CRISTIANO SEVERO', '#NULO#', '69948216172', 'SEVEROCRISTIANO2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '21/05/1979', '39', '015879652089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '395', 'BANC RIO E ECONOMI RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008281620186070000'], '70000612406': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612406', '18333', 'DANIELLE LIMA BARRETO RAMOS', 'DANIELLE BARRETO', '#NULO#', '71779760191', 'DANILIMABARRETO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/09/1979', '39', '015670952038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '171', 'JORNALISTA E REDATOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008299820186070000'], '70000612407': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612407', '18111', 'DYENE SILVA', 'DYENE SILVA', '#NULO#', '34059695149', 'SILVADYENESILVE8@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '05/11/1965', '53', '001194292011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008308320186070000'], '70000612408': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612408', '18181', 'ENILDE NERES MARTINS', 'ENILDE NERES ', '#NULO#', '42896886168', 'ENILDENERES18@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'C COS', '01/09/1968', '50', '007867972020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008325320186070000'], '70000612409': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612409', '18223', 'ESTEV O CUBAS ROLIM', 'ESTEV O ROLIM', '#NULO#', '03081955157', 'ESTEVAOCUBASR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'TAGUATINGA', '17/06/1991', '27', '022279782046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008333820186070000'], '70000612410': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612410', '18888', 'FERNANDO MOURA DOS SANTOS', 'FERNANDO MOURA', '#NULO#', '53700031149', 'SECRETARIAREDEDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '20/09/1970', '48', '007948132011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '142', 'PROFESSOR DE ENSINO SUPERIOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008369020186070000'], '70000612411': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612411', '18910', 'F BIO FERREIRA MARTINS SILVA', 'F BIO ABARKA', '#NULO#', '83869646187', 'FABIOABARKA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '13/11/1977', '41', '013618622089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008350820186070000'], '70000612412': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612412', '18777', 'HALINE DO CARMO ARAGAO', 'HALINE ARAG O', '#NULO#', '44463014115', 'HALINEARAGAO2008@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PARACATU', '29/07/1967', '51', '003423242070', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008394520186070000'], '70000612413': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612413', '18118', 'JOSE AUGUSTO DOS REIS GOMES', 'JOS  AUGUSTO CAPIL ', '#NULO#', '39286762100', 'JOSEAUGUSTODOSREISGOMES@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '07/07/1966', '52', '000658662097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008446720186070000'], '70000612414': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612414', '18900', 'JOS  ROBERTO AZAMBUJA BORGES MACIEL', 'AZAMBUJA', '#NULO#', '56378122687', 'JRABORGES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ITUIUTABA', '08/03/1968', '50', '004642160230', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '171', 'JORNALISTA E REDATOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008455220186070000'], '70000612415': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612415', '18018', 'JO O FRANCISCO ARAUJO MARIA', 'JO O FRANCISCO', '#NULO#', '53941373153', 'JOAOXICO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIIA', '04/08/1982', '36', '015988032011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008438220186070000'], '70000612416': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612416', '18190', 'JUSTO MAGALH ES MORAES', 'JUSTO MAGALH ES', '#NULO#', '02399709187', 'SEJAJUSTO2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'NANUQUE', '28/04/1950', '68', '002241872003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008463720186070000'], '70000612417': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612417', '18061', 'LEANDRO ANTONIO GRASS PEIXOTO', 'LEANDRO GRASS', '#NULO#', '00014360152', 'LEANDROGRASS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '15/06/1985', '33', '015450722046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '142', 'PROFESSOR DE ENSINO SUPERIOR', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06008472220186070000'], '70000612418': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612418', '18007', 'LIZIANE BEATRIZ DE ARA JO BRAUNER', 'LIZIANE BRAUNER', '#NULO#', '01333015160', 'LIZIANEBRAUNER@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'RS', '-3', 'PORTO ALEGRE', '01/05/1985', '33', '087699770400', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008498920186070000'], '70000612419': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612419', '18345', 'LUZIA MOREIRA LEITE', 'LUZIA LEITE', '#NULO#', '48323594104', 'SECRETARIAREDEDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'CORA  O DE JESUS', '17/03/1969', '49', '007450942003', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '581', 'DONA DE CASA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008507420186070000'], '70000612420': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612420', '18000', 'MARCOS ANTONIO FARIA', 'PROF. MARCOS FARIA', '#NULO#', '62368192115', 'MARCOSFARIA2105@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'PIRANHAS', '21/05/1975', '43', '017542342003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008515920186070000'], '70000612421': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612421', '18911', 'MARCUS VINICIUS BARCELLOS DE ABREU', 'MARCUS ABREU', '#NULO#', '32976305587', 'SECRETARIAREDEDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '19/03/1965', '53', '002892682453', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008524420186070000'], '70000612422': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612422', '18999', 'MARIA ABADIA DA SILVA SANTAREM AMORIM', 'ABADIA SANTAREM ', '#NULO#', '14416492120', 'ABADIASANTAREM01@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BURITIS', '15/08/1956', '62', '003758042046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008532920186070000'], '70000612423': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612423', '18100', 'MARTA CLERIA LIMA', 'MARTA LIMA ', '#NULO#', '23967056104', 'SECRETARIAREDEDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '17/01/1965', '53', '002015232046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008568120186070000'], '70000612424': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612424', '18222', 'MICHAEL DE MATOS LEAL', 'MICHAEL LEAL', '#NULO#', '03422172165', 'MATOSLEAL25@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '12/03/1992', '26', '021341852003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008576620186070000'], '70000612425': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612425', '18444', 'NATANAEL SAULO DA SILVA PEREIRA', 'NATANAEL SAULO', '#NULO#', '04778137124', 'NATANAELSAULO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '17/02/1994', '24', '024454052020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '162', 'ATOR E DIRETOR DE ESPET CULOS P BLICOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06008593620186070000'], '70000612426': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612426', '18180', 'PAULO GON ALVES COSTA', 'PAULO COSTA - PC', '#NULO#', '57949751134', 'SECRETARIAREDEDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '28/04/1972', '46', '007557962054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008628820186070000'], '70000612427': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612427', '18710', 'RAIMUNDO CANUTO DE OLIVEIRA', 'RAIMUNDO CANUTO', '#NULO#', '22299556168', 'RAIMUNDOCANUTO@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'CE', '-3', 'NOVO ORIENTE', '14/10/1957', '61', '014523882046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008645820186070000'], '70000612428': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612428', '18965', 'TATIANE OLIVEIRA CRUZ CECILIANO', 'TATY CECILIANO', '#NULO#', '82905215100', 'TATIANECECILIANO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '10/09/1977', '41', '013645332011', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06008706520186070000'], '70000612429': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612429', '18192', 'WALDIR SOARES CORDEIRO', 'WALDIR CORDEIRO', '#NULO#', '58514910191', 'WALDIRSC@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050334', 'Bras lia Justa e de m os limpas', 'PC do B / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '23/05/1974', '44', '036515921023', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009165420186070000'], '70000612430': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612430', '35989', 'RANIELE FERREIRA N BREGA', 'RANI N BREGA', '#NULO#', '03937159142', 'BRASILIA@PMB.ORG.BR', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '07/01/1994', '24', '024511332011', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06009018520186070000'], '70000612431': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612431', '35333', 'MARIA DO CARMO PAULINO MESQUITA RAMOS', 'MARIA DO CARMO PAULINO', '#NULO#', '68229160325', 'CARMOPAULINOMESQUITA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'CE', '-3', 'CARIR ', '03/10/1972', '46', '031868670736', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008966320186070000'], '70000612432': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612432', '35007', 'JORGE LUIZ DA CRUZ SILVA', 'SALVE JORGE', '#NULO#', '69303258134', 'VIVAJORGEDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '14/02/1981', '37', '016904452011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '03', 'PARDA', '295', 'MEMBRO DAS FOR AS ARMADAS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008870420186070000'], '70000612433': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612433', '35035', 'RICHARD FERREIRA DOS SANTOS', 'RICHARD DA SA DE', '#NULO#', '61069507172', 'RICHARD.DA.SAUDE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '01/06/1971', '47', '008405312003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009027020186070000'], '70000612434': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612434', '35666', 'FRANCISCO EUDES PINHO FARIAS', 'FARIAS DO BODE', '#NULO#', '99863480304', 'EUDES.FARIAS@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'PI', '-3', 'BURITI DOS LOPES', '11/04/1984', '34', '030732201546', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008801220186070000'], '70000612435': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612435', '35999', 'PAULO AFONSO RODRIGUES', 'PAULO PITOMBEIRA', '#NULO#', '09688790397', 'GERALSERVICE@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '01/04/1956', '62', '015907172011', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008991820186070000'], '70000612436': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612436', '35124', 'JORGE DA SILVA MESSIAS', 'JORGE BAIANO', '#NULO#', '24006637500', 'DEPUTADOJORGEBAHIANO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SERRINHA', '04/08/1962', '56', '016331602054', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '03', 'PARDA', '703', 'ELETRICISTA E ASSEMELHADOS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008861920186070000'], '70000612437': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612437', '35199', 'WANDERLEIA DAS GRACAS DE SOUZA', 'LELECA', '#NULO#', '57346224191', 'LELECADISTRITAL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PIEDADE DA PONTE NEGRA', '22/10/1968', '50', '009085652038', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '514', 'ESTETICISTA', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06009113220186070000'], '70000612438': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612438', '35000', 'RONALDO MARQUES DE CARVALHO', 'RONALDO CAMEL ', '#NULO#', '01534160175', 'BRASILIA@PMB.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '30/09/1985', '33', '019049052062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '298', 'SERVIDOR P BLICO MUNICIPAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009044020186070000'], '70000612439': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612439', '35288', 'SEBASTIAO HELIO DE LIMA', 'H LIO LIMA', '#NULO#', '26008459768', 'HELIOLIMA4510@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'CE', '-3', 'LAVRAS DA MAN ABEIRA', '15/02/1950', '68', '004644340345', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009079220186070000'], '70000612440': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612440', '35135', 'BRUNO RODRIGUES DE CASTRO MUNIZ', 'BRUNO CAPELLI', '#NULO#', '00317164155', 'BRUNOHAIRDESING@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '15/05/1979', '39', '142509110264', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '512', 'CABELEIREIRO E BARBEIRO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008671320186070000'], '70000612441': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612441', '35888', 'EDUARDO ALVES MOREIRA', 'DR. EDUARDO MOREIRA', '#NULO#', '62015192115', 'MEDIADOREDUARDOMOREIRA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'BA', '-3', 'CAN POLIS', '14/10/1974', '44', '012357592062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008740520186070000'], '70000612442': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612442', '35777', 'ELAINE MOUR O FERNANDES', 'MC LANA', '#NULO#', '73599468168', 'LANAALERQUINA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '18/04/1988', '30', '020657052062', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '163', 'CANTOR E COMPOSITOR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008767220186070000'], '70000612443': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612443', '35444', 'PAULO RENATO TEIXEIRA', 'PAULO RENATO', '#NULO#', '59890711753', 'TEIXEIRA.PR@IG.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '20/06/1959', '59', '014151900310', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '102', 'ARQUITETO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009000320186070000'], '70000612444': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612444', '35322', 'ARTEMISA ALVES MARTINS RIBEIRO', 'MISA MORENA', '#NULO#', '41782810110', 'TRABALHOSACADEMICOSMISA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '29/06/1964', '54', '022830811520', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '129', 'ARTES O', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008637320186070000'], '70000612445': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612445', '35351', 'RONEIDE PAIVA DO NASCIMENTO', 'RONEIDE PAIVA', '#NULO#', '69355347120', 'RO.PAIVAXX@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'PB', '-3', 'MONTEIRO', '16/11/1975', '43', '018588662020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '397', 'RECEPCIONISTA', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009052520186070000'], '70000612446': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612446', '35555', 'LUCIO VARLONE PEREIRA DE SA', 'PEREIRA', '#NULO#', '44382502187', 'IMOBILIARIAPEREIRA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '10/06/1966', '52', '009726952003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008949320186070000'], '70000612447': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612447', '35020', 'EDILENE DE OLIVEIRA GUEDES', 'LENE GUEDES', '#NULO#', '50587544104', 'EDILENEGUEDES_@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '12/09/1968', '50', '008017342046', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008732020186070000'], '70000612448': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612448', '35998', 'DANIELLE PEREIRA LEITE', 'DANIELLE LEITE', '#NULO#', '91724090100', 'DANIELLELEITE32@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '13/01/1982', '36', '018563472038', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008715020186070000'], '70000612449': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612449', '35826', 'LAYANNE PRYSCILA SILVA MARTINS', 'LAY SILVA', '#NULO#', '03926598166', 'LAYPEQUENA@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '28/08/1990', '28', '024315952089', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008922620186070000'], '70000612450': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612450', '35979', 'LA S NAT LIA SOARES DE SOUZA', 'LA S SOUZA', '#NULO#', '04916678176', 'BRASILIA@PMB.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'TO', '-3', 'GURUPI', '08/04/1991', '27', '024415592062', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008914120186070000'], '70000612451': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612451', '35123', 'MARIA EDUARDA SILVA SOUSA', 'DUDA MARIA', '#NULO#', '06745029146', 'ME6646794@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '03/09/1999', '19', '025737712062', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06008974820186070000'], '70000612452': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612452', '35389', 'FLAVIA CONCEI  O DOS REIS', 'FLAVIA REIS', '#NULO#', '92118003153', 'BRASILIA@PMB.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '17/02/1980', '38', '015252062003', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '581', 'DONA DE CASA', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008784220186070000'], '70000612453': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612453', '35678', 'FRANCISCO DE ASSIS PESSOA', 'ASSIS DA SA DE', '#NULO#', '37961128468', 'FRANCIASSIS523@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'PB', '-3', 'RIO TINTO', '14/07/1957', '61', '004574132232', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008792720186070000'], '70000612454': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612454', '51717', 'JOSIAS LEITE DE FREITAS JUNIOR', 'ENFERMEIRO JOSIAS JUNIOR', '#NULO#', '60586141120', 'JOSIASJUNIOR1904@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '19/04/1972', '46', '008233042070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '113', 'ENFERMEIRO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008897120186070000'], '70000612455': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612455', '51024', 'SUELEN REZENDE AGUIAR', 'SUELEN AGUIAR', '#NULO#', '04973197564', 'SUELENREZENDE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '27/08/1990', '28', '021356042011', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06009087720186070000'], '70000612456': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612456', '51000', 'RODRIGO BENTO DOS SANTOS', 'PROFESSOR RODRIG O', '#NULO#', '99420899187', 'BENTOBSB@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'GO', '-3', 'MONTE ALEGRE DE GOIAS', '17/06/1985', '33', '019789832011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009035520186070000'], '70000612457': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612457', '51115', 'WELTON JOS  DE OLIVEIRA J NIOR', 'WELTON JOS ', '#NULO#', '52948439191', 'WELTONJUNIOR1970@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIANIA', '21/10/1970', '48', '026058491090', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06009121720186070000'], '70000612458': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612458', '51151', 'WALTER REIS CALHEIROS', 'PROFESSOR WALTER', '#NULO#', '63697343734', 'PROFESSORWALTERREIS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '05/03/1960', '58', '073567570345', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '921', 'MILITAR REFORMADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009104720186070000'], '70000612459': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612459', '51123', 'GABRIEL ASSIS DOS SANTOS', 'GABRIEL ASSIS', '#NULO#', '01696095107', 'ASSISDOSSANTOS.GABRIEL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '05/04/1997', '21', '024339452089', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008819420186070000'], '70000612460': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612460', '51111', 'ALEXANDRE DE OLIVEIRA MORAIS', 'ALEXANDRE MORAIS', '#NULO#', '37288474100', 'ALEXANDRE.MORAIS@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'GO', '-3', 'RIO VERDE', '08/02/1966', '52', '007457162020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '232', 'POLICIAL CIVIL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008602120186070000'], '70000612461': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612461', '51999', 'HELTON LOPES MARQUES', 'HELTON MARQUES O PATRIOTA', '#NULO#', '71327592134', 'HELTON.2208@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'MS', '-3', 'DOURADOS', '22/08/1981', '37', '016876091910', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '295', 'MEMBRO DAS FOR AS ARMADAS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008844920186070000'], '70000612462': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612462', '51106', 'RICARDO LUIS PAZ DE ARAUJO', 'RICARDO PAZ', '#NULO#', '32395566420', 'RICARDOARAUJO@CONSULTORIARH.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'RN', '-3', 'NATAL', '29/03/1961', '57', '002086651643', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009190920186070000'], '70000612463': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612463', '51222', 'WALDETE RODRIGUES DE SOUSA', 'PROFESSORA WALDETE', '#NULO#', '34308997100', 'WALZINHA1962@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '05/08/1962', '56', '006232982011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06009096220186070000'], '70000612464': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612464', '51555', 'EMILSON RIBEIRO NETO', 'EMILSON RIBEIRO', '#NULO#', '87437694115', 'EMILSONRIBEIRO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '15/06/1981', '37', '014119512003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '126', 'ANALISTA DE SISTEMAS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008775720186070000'], '70000612465': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612465', '51026', 'GUALTER VIEIRA DO NASCIMENTO', 'GUALTER VIEIRA', '#NULO#', '71501495372', 'GUALTERNEI@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '18/04/1975', '43', '022828941503', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008836420186070000'], '70000612466': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612466', '51512', 'COUBERT BRAZ DA VEIGA', 'COUBERT BRAZ', '#NULO#', '65928318120', 'COUBERTBRAZ@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '03/05/1976', '42', '011608612070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008698020186070000'], '70000612467': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612467', '51515', 'SAMIO BANDEIRA', 'SAMIO BANDEIRA', '#NULO#', '71307311172', 'KAIO@KAIO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'MA', '-3', 'S O JO O DOS PATOS', '23/12/1980', '38', '024480402011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009061020186070000'], '70000612468': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612468', '51193', 'MAURICIO TOMAZ DA SILVA', 'TOMAZ', '#NULO#', '83152709153', 'MAURICIOTOMAZ@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '05/05/1977', '41', '012912132011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008983320186070000'], '70000612469': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612469', '51251', 'MARCIO ROMEU DA SILVA CARDOSO', 'M RCIO CARDOSO', '#NULO#', '48560308504', 'MARCIO.CARDOSO10@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'BA', '-3', 'ITAPETINGA', '02/12/1969', '49', '051728970540', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008957820186070000'], '70000612470': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612470', '51234', 'LEONARDO MIRANDA DE CASTRO', 'PROFESSOR LEONARDO MIRANDA', '#NULO#', '71244719153', 'KAIO@KAIO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '19/07/1979', '39', '014718382038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008931120186070000'], '70000612471': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612471', '51140', 'ANDERSON DA SILVA LOPES', 'ANDERSON LOPES', '#NULO#', '91419085115', 'ANDERSONSILVA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/06/1982', '36', '014928262046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '403', 'COR TOR DE   VEIS  SEGUROS  T TULOS E VALORES', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008610620186070000'], '70000612472': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612472', '51391', 'HELTON MACIEL NOGUEIRA', 'HELTON MACIEL', '#NULO#', '50418726191', 'HELTONMACIELNOGUEIRA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '04/09/1972', '46', '009564172097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008853420186070000'], '70000612473': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612473', '51777', 'GERALDA APARECIDA DA SILVA BUENO', 'CIDA SILVA', '#NULO#', '96726482604', 'CIDAMG@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PARACATU', '14/04/1975', '43', '105173070205', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '169', 'COMERCIANTE', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008827920186070000'], '70000612474': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612474', '51333', 'KAIO DE OLIVEIRA TEIXEIRA', 'KAIO TEIXEIRA', '#NULO#', '81864256168', 'KAIO@KAIO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '19/04/1977', '41', '011992562054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06008905620186070000'], '70000612475': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612475', '51051', 'EDUARDO COELHO DA COSTA PACHECO', 'EDUARDO COELHO', '#NULO#', '53970497191', 'EDUARDOCOELHODF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '11/04/1974', '44', '011188812020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008758720186070000'], '70000612476': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612476', '51002', 'JOSE COSTA DA SILVA', 'ZEZINHO', '#NULO#', '70799458104', 'KAIO@KAIO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'GO', '-3', 'MINA U', '11/03/1979', '39', '014184892038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008888620186070000'], '70000612477': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000612477', '51888', 'BENEDITO AARAO SALES DE ARAUJO', 'BENEDITO DA VOZINHA', '#NULO#', '02263249311', 'BENEDITODAVOZINHA2019@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '09/01/1987', '31', '020607572011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06008654320186070000'], '70000613822': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000613822', '233', 'CRISTOVAM RICARDO CAVALCANTI BUARQUE', 'CRISTOVAM BUARQUE', '#NULO#', '22364129168', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050368', 'UNIDOS PELO DF', 'PSD / PRB / PPS / SOLIDARIEDADE / PODE / PSC', '1', 'BRASILEIRA NATA', 'PE', '-3', 'RECIFE', '20/02/1944', '74', '001081812003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '276', 'SENADOR', '0', '4', 'N O ELEITO', 'S', 'S', '-1', '06009217620186070000'], '70000613823': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000613823', '233', 'MARCELO AGUIAR DOS SANTOS S ', 'MARCELO AGUIAR', '#NULO#', '30157129187', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050368', 'UNIDOS PELO DF', 'PSD / PRB / PPS / SOLIDARIEDADE / PODE / PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '05/04/1962', '56', '001511572020', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06009278320186070000'], '70000613824': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '4', 'VICE-GOVERNADOR', '70000613824', '55', 'EGMAR TAVARES DA SILVA', 'PASTOR EGMAR', '#NULO#', '46237909168', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050368', 'UNIDOS PELO DF', 'PSD / PRB / PPS / SOLIDARIEDADE / PODE / PSC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PRESIDENTE OLEG RIO', '06/05/1968', '50', '010807172097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06009226120186070000'], '70000613825': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000613825', '233', 'MANOEL FERREIRA', 'BISPO MANOEL FERREIRA', '#NULO#', '13962884815', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050368', 'UNIDOS PELO DF', 'PSD / PRB / PPS / SOLIDARIEDADE / PODE / PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '30/05/1932', '86', '097339360396', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06009269820186070000'], '70000613826': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000613826', '777', 'FERNANDO DE CASTRO MARQUES', 'FERNANDO MARQUES', '#NULO#', '66296676891', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050368', 'UNIDOS PELO DF', 'PSD / PRB / PPS / SOLIDARIEDADE / PODE / PSC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BELO HORIZONTE', '01/07/1954', '64', '108206910221', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009234620186070000'], '70000613827': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '3', 'GOVERNADOR', '70000613827', '55', 'ROG RIO SCHUMANN ROSSO', 'ROG RIO ROSSO', '#NULO#', '50567780104', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050368', 'UNIDOS PELO DF', 'PSD / PRB / PPS / SOLIDARIEDADE / PODE / PSC', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '30/08/1968', '50', '008207582054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009286820186070000'], '70000613828': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000613828', '777', 'JO O LUIZ CLEROT', 'PR. JO O CLEROT', '#NULO#', '50441663168', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050368', 'UNIDOS PELO DF', 'PSD / PRB / PPS / SOLIDARIEDADE / PODE / PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '08/01/1971', '48', '019928141295', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06009251620186070000'], '70000613829': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000613829', '777', 'FRANCISCA CLEIA SOUZA CARVALHO', 'MANA', '#NULO#', '66958148134', 'BRUNO.BELEZA@NWADV.COM.BR', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050368', 'UNIDOS PELO DF', 'PSD / PRB / PPS / SOLIDARIEDADE / PODE / PSC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PARNA BA', '02/10/1976', '42', '018705342003', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '303', 'GERENTE', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06009243120186070000'], '70000614409': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '3', 'GOVERNADOR', '70000614409', '40', 'RODRIGO SOBRAL ROLLEMBERG', 'RODRIGO ROLLEMBERG', '#NULO#', '24529850153', 'JURIDICO@GABRIELAROLLEMBERG.ADV.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '13/07/1959', '59', '007484672046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '6', '2  TURNO', 'S', 'S', '-1', '06009511420186070000'], '70000614410': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000614410', '408', 'LEILA GOMES DE BARROS R GO', 'LEILA DO V LEI', '#NULO#', '85632406687', 'LEILADOVOLEI 2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '30/09/1971', '47', '099971460213', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '168', 'ATLETA PROFISSIONAL E T CNICO EM DESPORTOS', '0', '1', 'ELEITO', 'N', 'S', '-1', '06009416720186070000'], '70000614411': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000614411', '408', 'LEANY BARREIRO DE SOUSA LEMOS', 'LEANY LEMOS', '#NULO#', '49064428115', 'JURIDICO@GABRIELAROLLEMBERG.ADV.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '06/04/1970', '48', '007515232054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '-1', '1', 'ELEITO', 'N', 'S', '-1', '06009408220186070000'], '70000614412': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000614412', '180', 'DJACYR CAVALCANTI DE ARRUDA FILHO', 'DJACYR ARRUDA', '#NULO#', '37228145100', 'DJACYRARRUDAFILHO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '20/01/1970', '49', '007474262011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06009347520186070000'], '70000614413': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000614413', '180', 'FRANCISCO LEITE DE OLIVEIRA', 'CHICO LEITE', '#NULO#', '31764002172', 'RODNEFREITAS@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'CE', '-3', 'MILAGRES', '11/07/1964', '54', '000379762003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009373020186070000'], '70000614414': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000614414', '180', 'ALVARO SILVEIRA J NIOR', ' LVARO SILVEIRA J NIOR', '#NULO#', '31386164100', 'RODNEFREITAS@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'UBERABA', '28/01/1969', '50', '010236862046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06009312320186070000'], '70000614415': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '4', 'VICE-GOVERNADOR', '70000614415', '40', 'EDUARDO DUTRA BRAND O CAVALCANTI', 'EDUARDO BRAND O', '#NULO#', '36199559649', 'JURIDICO@GABRIELAROLLEMBERG.ADV.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '14/02/1960', '58', '252043730116', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '101', 'ENGENHEIRO', '-1', '6', '2  TURNO', 'N', 'N', '-1', '06009356020186070000'], '70000614416': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000614416', '408', 'MARIA IVONETE GOMES DO NASCIMENTO', 'IVONETE NASCIMENTO', '#NULO#', '22105867120', 'JURIDICO@GABRIELAROLLEMBERG.ADV.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PARNA BA', '26/07/1960', '58', '005157162011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '02', 'PRETA', '262', 'ARQUIVISTA E MUSE LOGO', '-1', '1', 'ELEITO', 'N', 'S', '-1', '06009477420186070000'], '70000614417': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614417', '1819', 'ADRIANA BARBOSA ROCHA DE FARIA', 'ADRIANA FARIA', '#NULO#', '50479008191', '001DRI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '09/02/1972', '46', '010051082020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009303820186070000'], '70000614418': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614418', '6565', 'ANA MARIA PRESTES RABELO', 'ANA PRESTES', '#NULO#', '84321679168', 'ANAMPRESTES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'ZZ', '-3', 'MOSCOU', '16/11/1977', '41', '033702081007', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '133', 'SOCI LOGO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009320820186070000'], '70000614419': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614419', '1881', 'ANGELO SARAIVA DONGA', 'ANGELO DONGA', '#NULO#', '42212120044', 'ANGELODONGA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'RS', '-3', 'PORTO ALEGRE', '12/04/1964', '54', '010766312267', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009339020186070000'], '70000614420': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614420', '1221', 'EST FANE CELIS ARAUJO', 'EST FANE CABE A BRANCA', '#NULO#', '15393631120', 'ESTEFANECABECABRANCA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '21/06/1958', '60', '001404302003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009364520186070000'], '70000614421': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614421', '4343', 'ISRAEL MATOS BATISTA', 'PROFESSOR ISRAEL', '#NULO#', '96311380110', 'PROFESSORISRAEL@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/05/1982', '36', '018459442070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '2', 'ELEITO POR QP', 'N', 'S', '-1', '06009381520186070000'], '70000614422': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614422', '1234', 'LEIRSON TRIGUEIRO MATOS', 'L O MATOS', '#NULO#', '95014730159', 'LEOMATOS@ESTUDIOAULAS.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '10/01/1982', '37', '017044732011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009425220186070000'], '70000614423': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614423', '1818', 'LEOCLIDES MILTON ARRUDA', 'LEOCLIDES ARRUDA', '#NULO#', '19161816000', 'LEOCLIDES.ARRUDA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'RS', '-3', 'ROQUE GONZALES', '17/07/1954', '64', '080812060361', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009433720186070000'], '70000614424': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614424', '6544', 'MANOEL ALVES DA SILVA FILHO', 'PROFESSOR MANOEL FILHO', '#NULO#', '28495012120', 'MALVESSFILHO@TERRA.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '02/03/1961', '57', '011398522038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009442220186070000'], '70000614425': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614425', '4040', 'MARCOS DE ALENCAR DANTAS', 'MARCOS DANTAS', '#NULO#', '11551267187', 'MARCOSDEALENCARDANTAS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '12/05/1957', '61', '006570172089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009450720186070000'], '70000614426': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614426', '4012', 'MARIA DE LOURDES ABADIA', 'MARIA ABADIA', '#NULO#', '01227939191', 'ABADIA.ML@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'BELA VISTA DE GOI S', '14/08/1944', '74', '004741142054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '134', 'ASSISTENTE SOCIAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009468920186070000'], '70000614427': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614427', '1800', 'MAUR LIO BRAZ SANTANA JUNIOR', 'MAUR LIO DF', '#NULO#', '02148075926', 'MAURILIOSANTANADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'PR', '-3', 'LONDRINA', '01/04/1979', '39', '063547400663', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009485920186070000'], '70000614428': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614428', '1813', 'OLAVO BATISTA DA SILVA', 'KAMUU DAN', '#NULO#', '22515933220', 'KAMUUDAN@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'RR', '-3', 'BOA VISTA', '12/10/1969', '49', '001189662623', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '05', 'IND GENA', '124', 'CONTADOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009494420186070000'], '70000614429': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614429', '4333', 'RAYSSA LEITE DE CASTRO TOMAZ DA SILVA', 'RAYSSA TOMAZ', '#NULO#', '01169321127', 'RAYSSATOMAZPV@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '29/08/1988', '30', '020369282003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '171', 'JORNALISTA E REDATOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009502920186070000'], '70000614430': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614430', '1808', 'THAYNARA MELO RODRIGUES', 'THAYNARA', '#NULO#', '04132363155', 'THAYNARAMELO.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '18', 'REDE', 'REDE SUSTENTABILIDADE', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SALVADOR', '08/08/1992', '26', '060476671023', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '260', 'BIBLIOTEC RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009529620186070000'], '70000614431': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614431', '1212', 'WANDERSON MAIA NASCIMENTO', 'DERSON MAIA', '#NULO#', '01758803100', 'DERSONMAIA2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '17/02/1989', '29', '021085452054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009538120186070000'], '70000614432': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614432', '1236', 'JOSE GADELHA LOUREIRO', 'PROFESSOR GADELHA', '#NULO#', '22292470187', 'GADELHAKAUAN@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '12', 'PDT', 'PARTIDO DEMOCR TICO TRABALHISTA', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'CE', '-3', 'LIMOEIRO DO NORTE', '22/03/1957', '61', '038157100710', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009399720186070000'], '70000614433': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614433', '15777', 'EUSA JUSTINIANO DE ASSIS', 'EUSA DE ASSIS', '#NULO#', '20983662134', 'RAQUELASSIS94@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '06/10/1958', '60', '006085762089', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009693520186070000'], '70000614434': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614434', '15017', 'DANIELA ALVES DE OLIVEIRA', 'DANI ALVES', '#NULO#', '70160414172', 'DANIALVES1717@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '17/08/1978', '40', '014524232062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '401 SUPERVISOR  INSPETOR E AGENTE DE COMPRAS E VENDAS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009598820186070000'], '70000614435': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614435', '15127', 'MARIA VIN LIA RAMALHO PORTO CARVALHO PORTUGAL', 'VIN LIA PORTUGAL', '#NULO#', '27495825391', 'VINOLIA.RP@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'RIBEIRO GON ALVES', '18/02/1964', '54', '006073392054', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009858620186070000'], '70000614436': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614436', '15999', 'ELIZABETE DO R GO NASCIMENTO DA COSTA', 'ELIZABETE DO R GO', '#NULO#', '24910996168', 'BETE.REGO@GLOBO.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'PB', '-3', 'BOQUEIR O', '12/01/1961', '57', '013681522046', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009668020186070000'], '70000614437': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614437', '15006', 'MARIA QUIT RIA CORDEIRO DOS SANTOS', 'DRA. QUIT RIA', '#NULO#', '16653378420', 'Q.CORDEIRO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'RECIFE', '19/06/1953', '65', '000012662011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '111', 'M DICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009840420186070000'], '70000614438': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614438', '15151', 'ERICKA SIQUEIRA NOGUEIRA FILIPPELLI', 'ERICKA FILIPPELLI', '#NULO#', '70531960110', 'ERICKANFILIPPELLI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '20/02/1979', '39', '013790432097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '172', 'PUBLICIT RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009685020186070000'], '70000614439': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614439', '15220', 'DIVINA SILVA DE OLIVEIRA', 'DIVINA SILVA', '#NULO#', '36496839115', 'DIVINASILVA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '02/02/1967', '51', '016899252038', '4', 'FEMININO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '176', 'COZINHEIRO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009615820186070000'], '70000614440': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614440', '15452', 'MARIA DE F TIMA AZEREDO OLIVEIRA', 'F TIMA AZEREDO', '#NULO#', '38514753568', 'AZEREDOFATIMA56@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'ES', '-3', 'S O GABRIEL DA PALHA', '07/07/1956', '62', '011601362011', '4', 'FEMININO', '5', 'ENSINO M DIO INCOMPLETO', '5', 'VI VO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009823420186070000'], '70000614441': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614441', '15007', 'BRUNA DE SOUZA SILVA', 'BRUNA DE SOUZA', '#NULO#', '05196355154', 'BRUNADESOUZABSB@OUTLOOK.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '26/03/1995', '23', '023444912062', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '9 ', 'ESTUD TE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009563620186070000'], '70000614442': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614442', '15015', 'KADIJA DE ALMEIDA GUIMAR ES', 'KADIJA', '#NULO#', '01364856182', 'KADIJA.CERIMONIAL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '05/11/1986', '32', '020083832011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009814920186070000'], '70000614443': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614443', '15600', 'MARLI LOURDES DA SILVA CAMPOS', 'MARLI CAMPOS', '#NULO#', '30884624900', 'MARLICAMPOSDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'PR', '-3', 'APUCARANA', '10/08/1958', '60', '011973802038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '132', 'PSIC LOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009867120186070000'], '70000614444': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614444', '15200', 'DOLORES MOREIRA DA COSTA FERREIRA', 'PSIC LOGA DOLORES FERREIRA', '#NULO#', '78668824104', 'DOLORESMOREIRA@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'BA', '-3', 'MIGUEL CALMON', '19/08/1973', '45', '042062521074', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '132', 'PSIC LOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009624320186070000'], '70000614445': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614445', '15444', 'RUBENS C SAR BRUNELLI J NIOR', 'BRUNELLI', '#NULO#', '47348089100', 'RUBENS@BRUNELLI.COM.BR', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '20/02/1970', '48', '007788262062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06009944820186070000'], '70000614446': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614446', '15233', 'SEBASTI O GOMES BALAG O', 'BALAG O', '#NULO#', '14476916104', 'TCHUCABALA28@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'AN POLIS', '15/10/1956', '62', '005883872038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009953320186070000'], '70000614447': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614447', '15326', 'GERALDO DANTAS NOBRE', 'DY NOBRE DOS OFICINEIROS', '#NULO#', '03265731863', 'DYNOBRESHOW@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'PB', '-3', 'AGUIAR', '02/12/1960', '58', '006805292097', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009745720186070000'], '70000614448': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614448', '15222', 'RAFAEL CAVALCANTI PRUDENTE', 'RAFAEL PRUDENTE', '#NULO#', '00066296102', 'EPADVOCACIA@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '05/11/1983', '35', '016569212003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '2', 'ELEITO POR QP', 'S', 'S', '-1', '06009884120186070000'], '70000614449': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614449', '15123', 'WELLINGTON LUIZ DE SOUZA SILVA', 'WELLINGTON LUIZ', '#NULO#', '26657554168', 'DEP.WELLINGTONLUIZ@CL.DF.GOV.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '23/11/1966', '52', '006534282070', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'S', 'S', '-1', '06009988520186070000'], '70000614450': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614450', '15678', 'RAIMUNDO DA SILVA RIBEIRO NETO', 'RAIMUNDO RIBEIRO', '#NULO#', '11667087134', 'RAIMUNDORIBEIRO.RR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PIRACURUCA', '02/08/1957', '61', '000593502089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '5', 'SUPLENTE', 'S', 'S', '-1', '06011296020186070000'], '70000614451': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614451', '15061', 'JOS  BERNARDO WERNIK MIZRATTI', 'BERNARDO WERNIK', '#NULO#', '15151220187', 'BERNARDO.WERNIK.MIZRATTI@WERNIK.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '2', 'BRASILEIRA (NATURALIZADA)', 'ZZ', '-3', 'MONTEVIDEO - URUGUAI', '19/03/1958', '60', '000842002011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009789420186070000'], '70000614452': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614452', '15321', 'REGINA DA SILVA COSTA', 'PROF. REGINA', '#NULO#', '37593110168', 'REGINADOMINGAS@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '31/07/1965', '53', '001996572062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009892620186070000'], '70000614453': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614453', '15789', 'ANDRE LUIS SILVA DE OLIVEIRA', 'ANDR  LUIZ', '#NULO#', '46132350144', 'ANDRELUISOLIVEIRA.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '27/12/1970', '48', '007533822097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009555120186070000'], '70000614454': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614454', '15115', 'FRANCISCO SILVA SANTOS', 'BOCAI VA', '#NULO#', '15135950168', 'BOCAIUVASLU@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'COD ', '12/09/1956', '62', '005281482020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009728720186070000'], '70000614455': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614455', '15024', 'IVANILDO PEREIRA DUARTE', 'MAGAL DO POV O', '#NULO#', '11940972191', 'FABIANNODC@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'PB', '-3', 'UMBUZEIRO', '13/03/1955', '63', '004264922046', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009762720186070000'], '70000614456': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614456', '15133', 'DIONES AMORIM DE ALMEIDA', 'DIONES ALMEIDA', '#NULO#', '86627031191', 'DIONES10ALMEIDA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '25/04/1980', '38', '012631102089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009607320186070000'], '70000614457': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614457', '15201', 'JOS  WILSON PAZ BORGES', 'Z  WILSON', '#NULO#', '39786056353', 'PAZBORGES2017@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'PARNARAMA', '24/09/1970', '48', '018085332046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '170', 'COMERCI RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009806420186070000'], '70000614458': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614458', '15555', 'EDSON BATISTA LOPES', 'EDSON SOL NASCENTE', '#NULO#', '87650134172', 'EDSONBATISTALOPES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '30/07/1979', '39', '014355102089', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009641320186070000'], '70000614459': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614459', '15300', 'URUBATAN NICODEMOS SIM ES DE BARROS', 'ENGENHEIRO URUBATAN', '#NULO#', '09829083187', 'URUBATANBARROS8@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'PA', '-3', 'ALMEIRIM', '02/02/1952', '66', '001702612003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '101', 'ENGENHEIRO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009961820186070000'], '70000614460': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614460', '15567', 'ZENON LUZ RIBEIRO', 'ZENON LUZ', '#NULO#', '03294293100', 'ZENONLUZ@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'CAXIAS', '11/07/1951', '67', '002859892003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '124', 'CONTADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010014020186070000'], '70000614461': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614461', '15318', 'VANDEILDO LOPES DE G IS', 'VANDER LOPES', '#NULO#', '01398420123', 'VANDERDVP@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'PB', '-3', 'PRINCESA ISABEL', '18/12/1983', '35', '019155902054', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '167', 'OPERADOR DE EQUI MENTO DE  DIO  TELEVIS O  SOM E CINEMA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009970320186070000'], '70000614462': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614462', '15018', 'FRANCISCO DAS CHAGAS DE MEDEIROS', 'FRANCISCO COKIM', '#NULO#', '62034782100', 'FRANSYSMEDEIROS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '18/04/1974', '44', '011272252020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009710520186070000'], '70000614463': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614463', '15231', 'MARIA DO SOCORRO FERREIRA DA SILVA', 'SOCORRO FERREIRA', '#NULO#', '30813417104', 'SOCORROFERREI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'TO', '-3', 'PARAN ', '04/08/1964', '54', '015008172070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009831920186070000'], '70000614464': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614464', '15000', 'CHRISTIAN TADEU DE SOUZA SANTOS', 'CHRISTIAN TADEU', '#NULO#', '63625946149', 'CS@TECNEW.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BAEPENDE', '28/01/1973', '45', '013842532062', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009572120186070000'], '70000614465': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614465', '15500', 'DANIEL GON ALVES', 'DANIEL GON ALVES', '#NULO#', '69231516191', 'DANIELGONCALVES.ADVOGADO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '31/08/1979', '39', '013602302062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009580620186070000'], '70000614466': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614466', '15826', 'EDIVALDO DOS SANTOS ALBUQUERQUE JUNIOR', 'EDIVALDO ALBUQUERQUE ', '#NULO#', '65888456187', 'EDIVALDOALBUQUERQUEMDB@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '03/07/1977', '41', '012469252046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009632820186070000'], '70000614467': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614467', '15901', 'ENIO MAR AL PASSOS', 'ENIO MAR AL', '#NULO#', '69083738191', 'MARCAL.GO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'TAGUATINGA', '20/06/1976', '42', '012106452038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009676520186070000'], '70000614468': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614468', '15021', 'FERNANDO ANTONIO MIRANDA DE VASCONCELOS', 'FERNANDO VASCONCELOS', '#NULO#', '02908522187', 'FERNANDOVASCONCELOS152018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'PA', '-3', 'VIGIA', '21/10/1946', '72', '013938352054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '172', 'PUBLICIT RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009702020186070000'], '70000614469': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614469', '15111', 'FRANKLIN MARCIO DE ARA JO', 'MARCIO DOS FEIRANTES', '#NULO#', '66958989104', 'MARCIOARAUJOFEIRANTE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '20/08/1975', '43', '018396432070', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009737220186070000'], '70000614470': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614470', '15215', 'GILVANE DE CASTRO', 'GILVANE DE CASTRO', '#NULO#', '51262681120', 'CASTROGEOVANNE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIANESIA', '08/12/1968', '50', '010758942011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009754220186070000'], '70000614471': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614471', '15414', 'JOS  RIBEIRO DA SILVA', 'JOS  RIBEIRO', '#NULO#', '63531658115', 'RIBEIRODASILVAJOSE769@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SANTA RITA DE C SSIA', '12/02/1974', '44', '068228670582', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '532', 'MOTORISTA DE VE CULOS DE TRANSPORTE DE CARGA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009797920186070000'], '70000614472': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614472', '15888', 'PAULO ROBERTO CORREA', 'PAULO CORR A', '#NULO#', '83426825791', 'PAULOCIMOVEIS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '03/10/1965', '53', '020597770302', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '403', 'COR TOR DE   VEIS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009875620186070000'], '70000614473': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614473', '15100', 'RODOLPHO HOTH DOS REIS', 'RODOLPHO HOTH HOTH', '#NULO#', '93644892172', 'AMIGOSDOHOTHHOTH@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '26/08/1974', '44', '011416552062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06009901120186070000'], '70000614474': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614474', '15400', 'RONALD SIQUEIRA BARBOSA FILHO', 'RONALD', '#NULO#', '01024847160', 'RONALDBMDB@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '29/09/1984', '34', '018671272062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009919320186070000'], '70000614475': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614475', '15124', 'RUAN FURTADO DA SILVA SANTOS', 'RUAN', '#NULO#', '01944080198', 'RUANRFSS10@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '31/10/1996', '22', '024142722070', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '9 ', 'ESTUD TE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009936320186070000'], '70000614476': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614476', '15190', 'WILLIAN ALVES DE OLIVEIRA', 'WILLIAN VINIL', '#NULO#', '39919382191', 'TWMATICA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '06/09/1966', '52', '003640292097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06009997020186070000'], '70000614477': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614477', '15022', 'WILTON BORGES DE SOUZA', 'WILTON BICA', '#NULO#', '21009678191', 'WILTON-BORGES@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '15/03/1958', '60', '003237622011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010005520186070000'], '70000614478': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614478', '15214', 'ROSALICE FERREIRA DE ARA JO SILVA', 'ROSALICE', '#NULO#', '22424202168', 'ROSALICEFERREIRA1@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'CAXIAS', '21/04/1948', '70', '002892892089', '4', 'FEMININO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06009927820186070000'], '70000614479': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614479', '15800', 'JAIR AMARAL DA SILVA', 'DR. JAIR', '#NULO#', '18224946134', 'JAIRAMARAL.ADV@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'MT', '-3', 'C CERES', '22/09/1959', '59', '011463492003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06009771220186070000'], '70000614480': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614480', '15001', 'ELISABETE GUILHERME RAIMUNDO', 'BETE GUILHERME', '#NULO#', '49985906691', 'BETEDF@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050383', 'PARTIDO ISOLADO', 'MDB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '12/02/1965', '53', '008130762003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06009659520186070000'], '70000614515': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '2', '298', 'Elei  es Gerais Estaduais 2018', '28/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '3', 'GOVERNADOR', '70000614515', '15', 'IBANEIS ROCHA BARROS JUNIOR', 'IBANEIS', '#NULO#', '53942590115', 'IBANEISROCHA2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050385', 'PRA FAZER A DIFEREN A', 'MDB / PP / AVANTE / PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '10/07/1971', '47', '036847001031', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06010031020186070000'], '70000614516': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '2', '298', 'Elei  es Gerais Estaduais 2018', '28/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '4', 'VICE-GOVERNADOR', '70000614516', '15', 'MARCUS VINICIUS BRITTO DE ALBUQUERQUE DIAS', 'PACO BRITTO', '#NULO#', '28013735168', 'PACOBRITTO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '70', 'AVANTE', 'AVANTE', '70000050385', 'PRA FAZER A DIFEREN A', 'MDB / PP / AVANTE / PSL / PPL', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '04/06/1964', '54', '008435532070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06010049220186070000'], '70000614519': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614519', '1577', 'EDIMAR PIRENEUS CARDOSO', 'EDIMAR PIRENEUS', '#NULO#', '08514151134', 'EDIMARPIRENEUS2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'CORUMB  DE GOI S', '06/02/1949', '69', '004533022003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '5', 'VI VO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010100220186070000'], '70000614520': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614520', '1555', 'MEIRE L CIA GOMES MONTEIRO MOTA COELHO', 'MEIRE MOTA', '#NULO#', '09042890363', 'MEIREMOTACOELHO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'RN', '-3', 'MOSSOR ', '04/06/1957', '61', '014216682003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010152420186070000'], '70000614521': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614521', '1515', 'NELSON TADEU FILIPPELLI', 'FILIPPELLI', '#NULO#', '04251091191', 'TADEUFILIPPELLI@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'SP', '-3', 'CATANDUVA', '11/05/1949', '69', '000862172070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '101', 'ENGENHEIRO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010160920186070000'], '70000614522': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614522', '1777', 'WILL GODOY RODRIGUES', 'WILL GODOY', '#NULO#', '56136919168', 'WILLGODOY@GLOBO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '05/10/1973', '45', '011290522089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011382220186070000'], '70000614523': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614523', '1717', 'NEWTON LINS TEIXEIRA DE CARVALHO', 'NEWTON LINS', '#NULO#', '35094540149', 'PSL17DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SALVADOR', '03/06/1962', '56', '001515922062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011321520186070000'], '70000614524': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614524', '1733', 'SERGIO FERNANDO PEDROSO ABOUD', 'COMANDANTE ABOUD', '#NULO#', '33404534115', 'CELABOUD@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '07/03/1964', '54', '006357672097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '921', 'MILITAR REFORMADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010187620186070000'], '70000614525': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614525', '7044', 'ALEXANDRE LIRA DE SOUZA', 'ALEXANDRE LIRA LGBTI', '#NULO#', '03920815122', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '70', 'AVANTE', 'AVANTE', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'MA', '-3', 'ARAIOSES', '25/04/1992', '26', '021371402070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010066220186070000'], '70000614526': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614526', '7030', 'ANA ELIZA CAMARGO CHACEL', 'ANA ELIZA', '#NULO#', '63624354191', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '70', 'AVANTE', 'AVANTE', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '21/09/1974', '44', '011806752038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010074720186070000'], '70000614527': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614527', '7099', 'ANDREIA DE MEDEIROS GOMES', 'ANDREIA GOMES DOS ANIMAIS', '#NULO#', '51235188191', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '70', 'AVANTE', 'AVANTE', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '07/04/1970', '48', '007618872054', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '113', 'ENFERMEIRO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010083220186070000'], '70000614528': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614528', '7018', 'EVERALDO ANTONIO DA CRUZ', 'SARGENTO EVERALDO', '#NULO#', '66550700159', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '70', 'AVANTE', 'AVANTE', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'BARREIRAS', '15/11/1973', '45', '014126352046', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '295', 'MEMBRO DAS FOR AS ARMADAS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010118420186070000'], '70000614529': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614529', '7007', 'FRANCISCO PEREIRA DE SOUSA', 'AGENTE D SOUSA', '#NULO#', '28714369168', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '70', 'AVANTE', 'AVANTE', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'PB', '-3', 'POMBAL', '10/07/1961', '57', '005123622038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010126920186070000'], '70000614530': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614530', '7077', 'GIULIANE SAMPAIO DIAS DE OLIVEIRA', 'GIULIANE DIAS DA CEIL NDIA', '#NULO#', '01013235142', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '70', 'AVANTE', 'AVANTE', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '18/12/1985', '33', '018763532070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010135420186070000'], '70000614531': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614531', '7000', 'ISANIL FRANCISCO GUALBERTO', 'ISANIL', '#NULO#', '53917472104', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '70', 'AVANTE', 'AVANTE', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '02/04/1970', '48', '008002922046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011313020186070000'], '70000614532': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614532', '7070', 'KLEBER VINICIUS BEZERRA CAMELO DE MELO', 'DEFENSOR KLEBER', '#NULO#', '00271565160', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '70', 'AVANTE', 'AVANTE', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '12/08/1983', '35', '015540902011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010143920186070000'], '70000614533': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614533', '1122', 'CELINA LEAO HIZIM', 'CELINA LE O', '#NULO#', '79981488100', 'CELINALEAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOI NIA', '02/03/1977', '41', '038881211074', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06010091720186070000'], '70000614534': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614534', '1111', 'OLAIR FRANCISCO', 'OLAIR', '#NULO#', '38095610100', 'ESCRITORIOLAIR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050387', 'PRA FAZER A DIFEREN A I', 'MDB / PP / PSL / AVANTE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'PETROLINA DE GOI S', '01/06/1968', '50', '001878482046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010179120186070000'], '70000614535': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614535', '55222', 'ADRIANO DE ANDRADE MARROCOS', 'ADRIANO MARROCOS', '#NULO#', '33535809134', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '10/04/1966', '52', '002220412054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '124', 'CONTADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010204620186070000'], '70000614536': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614536', '55200', 'ALTINO ALMEIDA SILVA', 'ALTINO TORNEIRO', '#NULO#', '63537575149', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'ES', '-3', 'CONCEI  O DA BARRA', '13/03/1970', '48', '008416162089', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '249', 'TORNEIRO MEC NICO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010213120186070000'], '70000614537': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614537', '55007', 'ANDERSON DA SILVA FONSECA', 'ANDERSON FONSECA', '#NULO#', '95857370191', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '03/07/1982', '36', '015668672038', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010221620186070000'], '70000614538': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614538', '55333', 'DIRSOMAR FERREIRA CHAVES', 'DIRSOMAR', '#NULO#', '40197840191', 'BRUNO.BELEZA@NWADV.COM.BR', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'GO', '-3', 'MORRINHOS', '16/01/1961', '57', '007638272020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '303', 'GERENTE', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06010317520186070000'], '70000614539': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614539', '55678', 'EDUARDO CHAVES FAVARO', 'EDUARDO FAVARO', '#NULO#', '04155409925', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'PR', '-3', 'UMUARAMA', '01/03/1982', '36', '071682430604', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010326020186070000'], '70000614540': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614540', '55061', 'JOSIEL ARAG O', 'ARAG O', '#NULO#', '55256813153', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '08/08/1971', '47', '075416800680', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010412220186070000'], '70000614541': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614541', '55100', 'MARIA DE FATIMA AMARAL', 'FATINHA', '#NULO#', '47707437420', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'PE', '-3', 'AFOGADOS DA INGAZEIRA ', '12/04/1966', '52', '009733402003', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '134', 'ASSISTENTE SOCIAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010481420186070000'], '70000614542': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614542', '55444', 'ISAIAS LEAO MACHADO FELIX', 'ISAIAS LE O', '#NULO#', '57906505115', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'PE', '-3', 'NAZARE DA MATA', '26/07/1973', '45', '010817922011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '142', 'PROFESSOR DE ENSINO SUPERIOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010351520186070000'], '70000614543': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614543', '55660', 'JOS  DE SOUSA RODRIGUES', 'Z  BIDOLA', '#NULO#', '51219395749', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'CE', '-3', 'RERUITABA', '15/07/1957', '61', '021888750728', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010395220186070000'], '70000614544': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614544', '55022', 'MARIA DE LOURDES CANDIDO DE SOUZA', 'LURDINHA C NDIDO', '#NULO#', '34398490159', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '22/09/1965', '53', '002059602062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '292', 'AGENTE ADMINISTRATIVO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010499620186070000'], '70000614545': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614545', '55777', 'PAULO AUGUSTO ASSENCO DE OLIVEIRA', 'PAULO BOD O', '#NULO#', '69113777149', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '22/09/1977', '41', '012910322054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010516620186070000'], '70000614546': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614546', '55111', 'RISOMAR DA SILVA CARVALHO', 'RISOMAR CARVALHO', '#NULO#', '44270208104', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '15/03/1971', '47', '007832592011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010550620186070000'], '70000614547': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614547', '55888', 'VALDINAR NASCIMENTO DA SILVA', 'VAVA GAR OM', '#NULO#', '55191690397', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PIRIPIRI', '07/05/1972', '46', '018720282054', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '196', 'GAR OM', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010594320186070000'], '70000614548': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614548', '55555', 'VALERIA RODRIGUES LINHARES', 'VALERIA LINHARES', '#NULO#', '69966745149', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '22/10/1980', '38', '015826762070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010602820186070000'], '70000614549': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614549', '55321', 'JOANA DARC DE JESUS', 'TIA JOANA', '#NULO#', '37330012149', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '12/06/1967', '51', '005708692097', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '134', 'ASSISTENTE SOCIAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010369720186070000'], '70000614550': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614550', '55151', 'KENNEDY VALENTE DA SILVA', 'KENNEDY VALENTE', '#NULO#', '56387008115', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'AM', '-3', 'MANAUS', '31/03/1974', '44', '011453712003', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010447420186070000'], '70000614551': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614551', '55055', 'CHRISTIANNO NOGUEIRA ARAUJO', 'CRISTIANO ARA JO', '#NULO#', '97634158100', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '11/05/1983', '35', '016423192046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '5', 'SUPLENTE', 'S', 'S', '-1', '06010273820186070000'], '70000614552': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614552', '55000', 'ROB RIO BANDEIRA DE NEGREIROS FILHO', 'ROB RIO NEGREIROS', '#NULO#', '69629110172', 'ROBERIONEGREIROS2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '07/09/1978', '40', '014341312003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '2', 'ELEITO POR QP', 'S', 'S', '-1', '06010577320186070000'], '70000614553': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614553', '19333', 'ANDR  BRAND O PERES', 'ANDR  BRAND O', '#NULO#', '92640796100', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '11/11/1981', '37', '016092702089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '101', 'ENGENHEIRO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010239820186070000'], '70000614554': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614554', '19256', 'ANT NIO CARLOS DA SILVA', 'ANT NIO CARLOS', '#NULO#', '30985641134', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '15/04/1967', '51', '002511322003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '230', 'PEDAGOGO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010248320186070000'], '70000614555': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614555', '19061', 'ANT NIO CARLOS PEREIRA DE ARRUDA', 'PROFESSOR CARLOS ARRUDA', '#NULO#', '33384533100', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'PI', '-3', 'LU S CORREIA', '17/01/1964', '54', '002983362020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010256820186070000'], '70000614556': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614556', '19456', 'ANTONIO SANTOS MENDES', 'ANTONIO MENDES', '#NULO#', '05642765531', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'LIC NIO DE ALMEIDA', '06/03/1994', '24', '148026060507', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010265320186070000'], '70000614557': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614557', '19123', 'CLAUDECI XAVIER DE MIRANDA', 'CLAUDECI LUART', '#NULO#', '58379339134', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '18/07/1973', '45', '011891182011', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010282320186070000'], '70000614558': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614558', '19018', 'DEUSA SENE CAPUCHINHO', 'DEUSA CAPUCHINHO', '#NULO#', '58463747191', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '30/09/1971', '47', '009013532097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010290820186070000'], '70000614559': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614559', '55595', 'MARIA DAS GRA AS NUNES DE LIMA', 'GRA A NUNES', '#NULO#', '25868667115', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'PE', '-3', 'S O JOS  DO EGITO', '22/06/1962', '56', '003054192054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '134', 'ASSISTENTE SOCIAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010472920186070000'], '70000614560': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614560', '19400', 'DILSON FRANCISCO ROSA', 'DILSON ROSA', '#NULO#', '38655438120', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '29/11/1968', '50', '008454602046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010309020186070000'], '70000614561': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614561', '19001', 'ELISANGELA DE ALMEIDA CANDEIAS SOARES BARBOSA', 'ELIS', '#NULO#', '81738374149', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '18/07/1973', '45', '009537482011', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010334520186070000'], '70000614562': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614562', '19234', 'GILSON DA GUIA ARAUJO BARBOSA', 'GILSON ARAUJO', '#NULO#', '00836648153', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'PI', '-3', 'FLORIANO PIAU ', '01/06/1947', '71', '001723272089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010343020186070000'], '70000614563': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614563', '19311', 'JONAS RODRIGUES LESSA', 'JONAS LESSA', '#NULO#', '45621764153', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'BA', '-3', 'COCOS', '05/05/1969', '49', '106653910515', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010378220186070000'], '70000614564': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614564', '19200', 'JORGE VIANA DE SOUSA', 'JORGE VIANNA', '#NULO#', '79730450153', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'MA', '-3', 'BACABAL', '27/07/1976', '42', '011694842003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06010386720186070000'], '70000614565': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614565', '19051', 'JOSIVALDO ALVES FERNANDES', 'CHOCOLATE BOTAFOGO', '#NULO#', '85779377120', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'TO', '-3', 'TOCANTINS', '30/03/1976', '42', '020218252070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010420720186070000'], '70000614566': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614566', '19100', 'KENNEDY ANTONIO DE ALMEIDA', 'KENNEDY CAETANO', '#NULO#', '33200025115', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PATO DE MINAS', '21/11/1965', '53', '001212731074', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010438920186070000'], '70000614567': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614567', '19191', 'LUCILENE RODRIGUES MESQUITA', 'CIGANA LUCY ', '#NULO#', '86842277191', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '25/06/1976', '42', '011241002046', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010455920186070000'], '70000614568': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614568', '19999', 'LUIZ ANTONIO MARIANO', 'PROF.MARIANO', '#NULO#', '30808138120', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'S O GON ALO DO ABAET ', '12/12/1961', '57', '007321922097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '142', 'PROFESSOR DE ENSINO SUPERIOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010464420186070000'], '70000614569': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614569', '19007', 'OZIEL LOURENCO DA PAZ', 'OZIEL PAZ', '#NULO#', '93098219149', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '20/05/1981', '37', '015772452046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010508120186070000'], '70000614570': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614570', '19020', 'PEDRO LUIZ DIAS LEITE', 'PEDRO LEITE', '#NULO#', '33940150134', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '26/12/1969', '49', '007682902054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010525120186070000'], '70000614571': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614571', '19000', 'REGINA AYRES LACERDA', 'REGINA LACERDA', '#NULO#', '22337237168', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'VOLTA REDODNDA', '22/11/1961', '57', '001882102046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010533620186070000'], '70000614572': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614572', '19888', 'RENATA PEREIRA DE ALBUQUERQUE BRAND O', 'RENATA', '#NULO#', '00761809139', 'BRUNO.BELEZA@NWADV.COM.BR', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '08/08/1987', '31', '020027932011', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06010542120186070000'], '70000614573': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614573', '19500', 'RIVANE LUCENA MELO PEDRA', 'RIVANE', '#NULO#', '47769190100', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'MA', '-3', 'PEDREIRAS', '03/02/1969', '49', '008237252054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010568820186070000'], '70000614574': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614574', '19121', 'TELES ALVES LUSTOSA', 'TALES ALVES', '#NULO#', '91792339100', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '19/03/1981', '37', '015353162089', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010585820186070000'], '70000614575': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614575', '19555', 'VANILDA NATALIA DO NASCIMENTO', 'NAT LIA MAZZOLI', '#NULO#', '58523987134', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '01/10/1971', '47', '009238562054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010611320186070000'], '70000614576': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614576', '19444', 'VIVIANE SILVA LIMA JUNQUEIRA', 'VIVIANE', '#NULO#', '03002386146', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '30/01/1989', '29', '022572842089', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010629520186070000'], '70000614577': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614577', '19208', 'JOSENI RODRIGUES DAS CHAGAS', 'JOSENI MYLLA', '#NULO#', '34315870110', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050388', 'UNIDOS PELO DF 2', 'PSD / PODE', '1', 'BRASILEIRA NATA', 'RN', '-3', 'PATU', '25/05/1968', '50', '005517152003', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010403720186070000'], '70000614972': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614972', '4417', 'BEATRIZ KICIS TORRENTS DE SORDI', 'BIA KICIS', '#NULO#', '38567792134', 'BEATRIZKICIS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RESENDE', '19/09/1961', '57', '000101242097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06010759420186070000'], '70000614973': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614973', '4455', 'JOSE OSCAR DA SILVA', 'OSCAR SILVA', '#NULO#', '05546869372', 'OSCARSILVAADV@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'IMPERATRIZ', '05/05/1955', '63', '006031902003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011036220186070000'], '70000614974': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614974', '4447', 'CARLOS HENRIQUE AROUCK DE SOUZA', 'CARLOS AROUCK', '#NULO#', '62609211791', 'CARLOSAROUCK@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/08/1959', '59', '001160472089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011390720186070000'], '70000614975': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614975', '44321', 'KLESLEY GARCIA SOARES', 'KLESLEY GARCIA', '#NULO#', '01173504192', 'KLESLEYGARCIA@YAHOO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '13/05/1986', '32', '020657782011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011053220186070000'], '70000614976': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614976', '4420', 'JANETE ALMEIDA DO NASCIMENTO', 'JANETE ALMEIDA', '#NULO#', '28035011049', 'JANETE.VIOLETA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'RS', '-3', 'PORTO ALEGRE', '28/01/1960', '59', '001384222089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010984020186070000'], '70000614977': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614977', '4444', 'ADALBERTO IMBROSIO OLIVEIRA', 'ADALBERTO IMBR SIO', '#NULO#', '93294204787', 'AGENDAADALBERTO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '29/05/1970', '48', '074549720337', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010646520186070000'], '70000614978': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614978', '44131', 'CAIO CESAR DE ANDRADE SANTOS', 'CAIO C SAR', '#NULO#', '33466335191', 'CAIOXCESAR@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'LUZI NIA', '03/11/1968', '50', '007359042070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '402 VENDEDOR PRA STA  REPRESENTANTE  CAIXEIRO-VIAJANTE E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010767920186070000'], '70000614979': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614979', '44050', 'FATIMA AYAKO TANAKA', 'F TIMA TANAKA', '#NULO#', '24507156149', 'F.A.TANAKA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '23/10/1962', '56', '003174832020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010923320186070000'], '70000614980': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614980', '4499', 'EMILIO KERBER FILHO', 'MAJOR EMILIO', '#NULO#', '92759130053', 'EMILIOKERBER@TERRA.COM.BR', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'PR', '-3', 'PALMAS', '31/08/1976', '42', '263044410167', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '101', 'ENGENHEIRO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06010889320186070000'], '70000614981': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614981', '44441', 'CARLOS JOSE ESTEVES JUNIOR', 'JUNIOR ESTEVES', '#NULO#', '78740126153', 'CARLOSESTEVESJR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '19/01/1976', '42', '012009012062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010801920186070000'], '70000614982': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614982', '44747', 'CLAUDIO AUGUSTO SAMPAIO PINTO', 'CL UDIO SAMPAIO', '#NULO#', '78204950144', 'CLAUDIOSAMPAIODF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SALVADOR', '10/05/1975', '43', '011792182038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010810420186070000'], '70000614983': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '3', 'GOVERNADOR', '70000614983', '44', 'PAULO CHAGAS', 'GENERAL PAULO CHAGAS', '#NULO#', '15435520053', 'PRP44PAULOCHAGAS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '16/05/1949', '69', '059378530400', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '921', 'MILITAR REFORMADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011122420186070000'], '70000614984': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614984', '44077', 'PAULO HENRIQUE DO REGO BANDEIRA', 'PAULINHO MADRUGADA', '#NULO#', '63507803100', 'PAULINHOMADRUGADA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '22/07/1974', '44', '008733772054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011130920186070000'], '70000614985': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614985', '44555', 'CHARLES BARBOSA CHAGAS', 'CHARLES DO G SMYT', '#NULO#', '76729400587', 'CHARLESPOPWAYT@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PICOS', '11/01/1975', '43', '016907692089', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011348220186070000'], '70000614986': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '4', 'VICE-GOVERNADOR', '70000614986', '44', 'ADALBERTO MONTEIRO', 'ADALBERTO MONTEIRO', '#NULO#', '00392545187', 'ADALBERTOMONTEIRO.PRP@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'ES', '-3', 'Mimoso do Sul', '18/01/1948', '70', '006292552003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06010655020186070000'], '70000614987': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000614987', '444', 'FADI FAYEZ FARAJ', 'FADI FARAJ', '#NULO#', '38112167168', 'PRFADI@TERRA.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '2', 'BRASILEIRA (NATURALIZADA)', 'ZZ', '-3', 'AIN-ATA-L BANO', '16/09/1965', '53', '016958442062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '910', 'SACERDOTE OU MEMBRO DE ORDEM OU SEITA RELIGIOSA', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06010914820186070000'], '70000614988': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614988', '4493', 'ADRIANO CANDIDO DE OLIVEIRA', 'SGT ADRIANO OLIVEIRA', '#NULO#', '54010586168', 'ADRIANOOLIVEIRA35@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'TAGUATINGA', '16/04/1971', '47', '007975342011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010672020186070000'], '70000614989': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000614989', '4477', 'ELIS NGELA MACHADO DOS SANTOS DE FREITAS', 'ELISA ROBSON', '#NULO#', '02454640937', 'ELISAROBSONBR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'RS', '-3', 'PORTO ALEGRE', '21/03/1976', '42', '064717780604', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '171', 'JORNALISTA E REDATOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010871120186070000'], '70000614990': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614990', '44180', 'AURESTINA ASSIS DE MATOS LOPES', 'TINA LOPES', '#NULO#', '13347442890', 'TINAMLOPES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'JALES', '15/09/1957', '61', '053211590167', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '910', 'SACERDOTE OU MEMBRO DE ORDEM OU SEITA RELIGIOSA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010741220186070000'], '70000614991': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614991', '44222', 'DANIEL XAVIER DONIZET', 'DANIEL DONIZET', '#NULO#', '87568519104', 'BSBDANIELXD@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'LUZI NIA', '24/12/1981', '37', '014512942070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06010845620186070000'], '70000614992': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614992', '44111', 'EVANILSON LIMA DE OLIVEIRA', 'VAN OLIVEIRA', '#NULO#', '52463923172', 'VANOLIVEIRA2019@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'SALINAS', '31/10/1970', '48', '007952932070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010906320186070000'], '70000614993': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614993', '44038', 'JOS  FERNANDO HONORATO DE AZEVEDO', 'POLICIAL FEDERAL HONORATO', '#NULO#', '31005144168', 'HONORATO.JFHA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'TRINDADE', '21/09/1956', '62', '007186512070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011027720186070000'], '70000614994': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614994', '44054', 'JO O BATISTA DE OLIVEIRA', 'J BATISTA', '#NULO#', '01217393846', 'JOAO_JBO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'ANICUNS', '18/10/1958', '60', '008979422011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010992520186070000'], '70000614995': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614995', '44007', 'LUIS CARLOS SANCHA DA CUNHA', 'CARLOS SANCHA', '#NULO#', '55396240172', 'CARLOS.SANCHA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'SANTA LUZIA', '11/09/1973', '45', '011332622003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011070220186070000'], '70000614996': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614996', '44033', 'NILDO NAVES DE OLIVEIRA', 'NILDO NAVES', '#NULO#', '47925108134', 'NILDONAVES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'CERES', '05/05/1969', '49', '010413902313', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '921', 'MILITAR REFORMADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011105420186070000'], '70000614997': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614997', '44593', 'NUBIA LIMA DE SOUZA', 'N BIA LIMA', '#NULO#', '49337661187', 'NUBIALIMABM@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '28/09/1969', '49', '007691312097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011113920186070000'], '70000614998': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614998', '44123', 'RAUL RODRIGUES DOS SANTOS', 'PROFESSOR RAUL', '#NULO#', '02389107176', 'PROFRAULRODRIGUES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'CEIL NDIA', '21/01/1990', '28', '020265782062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011166120186070000'], '70000614999': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000614999', '44193', 'WASHINGTON LUIZ PATROCINIO', 'SGT. WASHINGTON PATROC NIO', '#NULO#', '58465871191', 'WLPATROCIONIO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '02/02/1970', '48', '010454362054', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011252320186070000'], '70000615000': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000615000', '4488', 'FRANCISCO WELLINGTON SANTOS RAMOS', 'FRANCISCO WELLINGTON', '#NULO#', '05108347448', 'FWR.ADV@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'RN', '-3', 'S O RAFAEL', '03/10/1985', '33', '021620631660', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010931820186070000'], '70000615001': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615001', '44200', 'ADELMO JOS  LIMA', 'ADELMO PAPAI SMURF', '#NULO#', '50409468134', 'ADELMOESA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '26/02/1970', '48', '007774772003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '295', 'MEMBRO DAS FOR AS ARMADAS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010663520186070000'], '70000615002': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615002', '44221', 'CRISTIANE DIAS CUNHA', 'CRISTIANE DIAS', '#NULO#', '04865611193', 'CRISTIANEDIASCUNHA28.11.2012@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PATOS DE MINAS', '30/12/1992', '26', '021616372003', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010828620186070000'], '70000615003': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615003', '44176', 'DAIANNE COUTO DE PAULO', 'DAIANNE COUTO', '#NULO#', '02724119142', 'DAIANNE.COUTO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'VALPARAIZO DE GOI S', '03/07/1991', '27', '021949782062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010837120186070000'], '70000615004': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615004', '44322', 'FRANCISCO ALVES DE OLIVEIRA NETO', 'FRANCISCO MOLINA', '#NULO#', '11627603115', 'FRAOLIVEIR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'PI', '-3', ' GUA BRANCA', '29/06/1957', '61', '006610212089', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011356720186070000'], '70000615005': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615005', '44335', 'GILSON ARRUDA DE SOUZA', 'SOUZA', '#NULO#', '37572741134', 'SOUSA.GILSONELETRICA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'BARRO ALTO', '24/12/1965', '53', '012159522020', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010940320186070000'], '70000615006': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615006', '44888', 'INALDO DO NASCIMENTO', 'PROFESSOR INALDO CONCURSEIRO', '#NULO#', '37608487100', 'INALDOBIRTH@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '12/01/1970', '48', '007953212062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010967020186070000'], '70000615007': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615007', '44055', 'JOAO VICTOR OLIVEIRA ARAPONGA SALAS', 'JO O SALAS', '#NULO#', '03654859186', 'CONTATOJOAOSALAS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'SAMABAIA SUL', '02/08/1996', '22', '024697732070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PAR ', '931', ' STUDANTE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011019220186070000'], '70000615008': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615008', '44678', 'KELLY CRISTINA PEREIRA DOS SANTOS', 'KELLY BOLSONARO', '#NULO#', '03487470128', 'KELLYBOLSONARO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '10/06/1986', '32', '018115812003', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '581', 'DONA DE CASA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011044720186070000'], '70000615009': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615009', '44777', 'LINDOLFO CAVALCANTI DE MAGALHAES', 'LINDOLFO MAGALH ES', '#NULO#', '09394800778', 'LINDOLFO@ILN.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '17/07/1943', '75', '001619832070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011061720186070000'], '70000615010': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615010', '44117', 'MARCELA AMAZONAS DUARTE DE AVELAR FIORESI', 'MARCELA AMAZONAS', '#NULO#', '27943598865', 'MARCELAAMAZONAS44@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'PRESIDENTE PRUDENTE', '07/02/1978', '40', '256982310175', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011096920186070000'], '70000615011': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615011', '44417', 'RAIMUNDA ALVES DOS REIS', 'RAY RUA BRASIL', '#NULO#', '28694171104', 'RAIMUNDAALVESDOSREIS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'S TIO NOVO', '14/09/1962', '56', '006585092046', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011157620186070000'], '70000615012': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615012', '44017', 'VICTOR OKUBO AGUIAR', 'VICTOR OKUBO', '#NULO#', '03173312139', 'VICTOROKUBO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '15/12/1990', '28', '021949952062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011243820186070000'], '70000615013': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000615013', '444', 'ROBERTA MACEDO FRAYSSAT', 'ROBERTA MACEDO', '#NULO#', '70664161120', 'ROBERTA.F.ADVOGADA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '25/02/1982', '36', '016125672038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '5', 'VI VO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06011191620186070000'], '70000615014': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000615014', '281', 'ATILA MAIA DA ROCHA', 'BRIGADEIRO ATILA MAIA', '#NULO#', '77460421804', 'ATILAMAIA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'RN', '-3', 'NATAL', '19/11/1956', '62', '084525020590', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '295', 'MEMBRO DAS FOR AS ARMADAS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06010732720186070000'], '70000615015': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615015', '28009', 'ANDREA APARECIDA BORGES SILVA', 'ANDREA BORGES', '#NULO#', '50518224104', 'ANDREA.BORGES38@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '06/03/1972', '46', '009693422046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010715720186070000'], '70000615016': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615016', '28008', 'DULCE HELEN LIM', 'DULCE LIM', '#NULO#', '85852180106', 'DULCESUZI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/08/1980', '38', '014133302003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '04', 'AMARELA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010854120186070000'], '70000615017': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000615017', '2828', 'IRACEMA CHRISTIANE GALV O TABOSA', 'CHRISTIANE TABOSA', '#NULO#', '52411745168', 'CHRIS.TABOSA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'S O LUIZ', '23/09/1954', '64', '006505852062', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010975520186070000'], '70000615018': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000615018', '2810', 'LUIZ GONZAGA DE LIRA', 'LUGON', '#NULO#', '15316866134', 'LUIZ.LIRA@BOL.COM.BR', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'TO', '-3', 'PARAISO', '23/08/1955', '63', '002416322089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06011088420186070000'], '70000615019': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000615019', '2882', 'MIRIAM CRISTINA DIENSTMANN STEIN', 'MIRIAM STEIN', '#NULO#', '84724595191', 'MIRIAMDIEST@HOTMAIL.CM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'RS', '-3', 'CRUZ ALTA', '26/09/1976', '42', '034225542747', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011373720186070000'], '70000615020': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000615020', '2811', 'PAULO THIAGO LIMA COSTA BARRETO', 'MAJOR PAULO THIAGO', '#NULO#', '80375456520', 'MAJORPAULOBARRETO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'BA', '-3', 'IRECE', '12/12/1983', '35', '104826510574', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011149120186070000'], '70000615021': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000615021', '2800', 'ROBERTO CARLOS RODRIGUES AGUIAR', 'CAPIT O ROBERTO BOMBEIRO', '#NULO#', '39296709172', 'ROBERTO.AGUIAR22@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '02/09/1966', '52', '003321032070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011209820186070000'], '70000615022': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000615022', '2818', 'WILSON PEREIRA DA SILVA', 'WILSON GREY', '#NULO#', '25850083120', 'WILSONGREY24@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '18/03/1965', '53', '002043472054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011260820186070000'], '70000615023': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615023', '28066', 'ANTONIO LUIZ DIONIZIO DOS SANTOS', 'ANTONIO DO TAXI', '#NULO#', '39778711100', 'ANTONIODIONIZIOD32@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '13/01/1966', '52', '017528952003', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '536', 'TAXISTA', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06010724220186070000'], '70000615024': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615024', '28012', 'CARLOS BIANCHINI PONTES', 'BIANCHINI', '#NULO#', '51094460834', 'BIANCHINISOF@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'BIRIGUI', '25/03/1952', '66', '007266712054', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '295', 'MEMBRO DAS FOR AS ARMADAS', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06010784920186070000'], '70000615025': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615025', '28014', 'ELISAF  TERTO DE AMORIM', 'ELISAF  AMORIM', '#NULO#', '35857480310', 'ELISAAMORIM2016@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'CE', '-3', 'QUIXAD ', '14/08/1967', '51', '037079980809', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '295', 'MEMBRO DAS FOR AS ARMADAS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010862620186070000'], '70000615026': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615026', '28820', 'RITA DE CASSIA SIQUEIRA DIENSTMANN', 'RITA SIQUEIRA', '#NULO#', '32357648287', 'MIRIAMDIEST@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '21/12/1948', '70', '034225602798', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '114', 'FISIOTERAPEUTA E TERAPEUTA OCUPACIONAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011304520186070000'], '70000615027': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615027', '28117', 'ROMILDO LIBARINO DE OLIVEIRA', 'INDIO CARROCEIRO', '#NULO#', '91790590582', 'JRTAPETESESPECIAIS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'BA', '-3', 'PLANALTO', '13/08/1964', '54', '074653510523', '2', 'MASCULINO', '2', 'L  E ESCREVE', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '147', 'CATADOR DE RECICL VEIS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011218320186070000'], '70000615028': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615028', '28000', 'TANCY REZENDE SILVA DE MORAIS', 'TANCY REZENDE', '#NULO#', '79384285153', 'TANCYREZENDE@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'AM', '-3', 'HUMAITA', '08/03/1977', '41', '011698712038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '258', 'BOMBEIRO MILITAR', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06011235320186070000'], '70000615029': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615029', '28123', 'WILSON MENDES GOMES', 'WILSON MENDES', '#NULO#', '39272427134', 'MENDESWILSONMENDES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '13/06/1968', '50', '007303782054', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011279020186070000'], '70000615030': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000615030', '281', 'SULAMITA MUNIZ FLORES SANTOS', 'SULAMITA MUNIZ', '#NULO#', '45634807115', 'SULAMITAFLORES@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '04/01/1963', '56', '015515692097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06011226820186070000'], '70000615031': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000615031', '281', 'RODNEY FERNANDES DA FONSECA', 'RODNEY FERNANDES', '#NULO#', '61908347104', 'FONSECARODNEY@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '28', 'PRTB', 'PARTIDO RENOVADOR TRABALHISTA BRASILEIRO', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'PR', '-3', 'CURITIBA', '28/11/1971', '47', '009595492003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06011339720186070000'], '70000615032': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000615032', '444', 'ALMIR LOPES DE OLIVEIRA', 'ALMIR LOPES', '#NULO#', '29711681153', 'LOPESALMIR@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'TAGUATINGA', '15/08/1964', '54', '002404842020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '-1', '4', 'N O ELEITO', 'N', 'N', '-1', '06010680520186070000'], '70000615033': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615033', '44567', 'GUSTAVO BARBOSA SAMPAIO', 'GUSTAVO LABAREDA', '#NULO#', '76774180159', 'GUSTAVOBSAMPAIO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '19/07/1976', '42', '011374032097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010958520186070000'], '70000615034': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615034', '44444', 'REGIS SOARES MACHADO', 'REGIS MACHADO', '#NULO#', '89635612168', 'REGISWORK@HOTMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'UBERL NDIA', '01/02/1981', '37', '015044932097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011183120186070000'], '70000615035': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615035', '44044', 'WINSTON RODRIGUES LIMA', 'WINSTON', '#NULO#', '75969602787', 'WINSTONRL142@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '19/08/1961', '57', '000167930329', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '921', 'MILITAR REFORMADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011287520186070000'], '70000615036': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615036', '44179', 'ANA PAULA AGUIAR DE SOUSA', 'PAULA AIK', '#NULO#', '00233555145', 'PAULAAIKSOUSA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'ESPERANTINA', '09/05/1982', '36', '017899742054', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '402', ' ENDEDOR PRACI A  REPRESENTANTE  CAIXEIRO-VIAJANTE E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010698720186070000'], '70000615037': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615037', '44047', 'REGINA BENINI MOEZIA DE LIMA', 'CORONEL REGINA', '#NULO#', '27080536120', 'REGINABENINI@TERRA.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'LINS', '02/05/1964', '54', '000152122097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '921', 'MILITAR REFORMADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011174620186070000'], '70000615038': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615038', '44144', 'ANDERSON CAMPOS DOS SANTOS', 'ANDERSON SANTOS', '#NULO#', '61983675172', 'SANTOS03DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'TAGUATINGA', '03/03/1974', '44', '010804692020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010707220186070000'], '70000615039': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615039', '44455', 'PAULO LEONARDO MOREIRA MARTINS', 'PAULO MARTINS', '#NULO#', '66854628334', 'DF.PAULO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '09/08/1982', '36', '055473980795', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011365220186070000'], '70000615040': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000615040', '4422', 'JOAO DE DEUS CARVALHO MARTINS', 'JO O DE MARTINS', '#NULO#', '09652485349', 'JDCMARTINS@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TEREZINA', '23/02/1956', '62', '023862241163', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011001020186070000'], '70000615041': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615041', '44015', 'EVALDO ARAUJO AMORIM', 'EVALDO AMORIM', '#NULO#', '55449743300', 'EVALDOASOLNASCENTE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'ESPERANTINA', '16/04/1973', '45', '019624661520', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '411', 'VENDEDOR DE COM RCIO VAREJISTA E ATACADISTA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06010897820186070000'], '70000615042': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615042', '44000', 'CARLOS EDUARDO ANTUNES TORRES', 'EDUARDO TORRES', '#NULO#', '00083039163', 'TORREVIDEO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '07/03/1985', '33', '019953682020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010793420186070000'], '70000615043': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615043', '44999', 'CARLOS ALBERTO NEVES DA SILVA', 'CAC  SILVA', '#NULO#', '46237135120', 'CACASILVA.MEUDEPUTADO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '29/06/1971', '47', '018395932070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '164', 'M SICO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06010776420186070000'], '70000615684': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615684', '14444', 'RENNE LEITE CARMO DE SOUZA', 'RENNEZ O', '#NULO#', '98580531187', 'RENNELEITE@HOTMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA DF', '13/12/1982', '36', '015224872020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011763420186070000'], '70000615685': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615685', '14555', 'JACIRA SIQUEIRA SILVA', 'PROFESSORA JACIRA', '#NULO#', '78346231172', 'PTBDF14@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'SP', '-3', 'SAO PAULO', '22/09/1975', '43', '012137772046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011625020186070000'], '70000615686': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615686', '14269', 'ELIZABETE MOREIRA DE QUEIROZ', 'ELIZABETE QUEIROZ', '#NULO#', '00425447189', 'ELIZAMOREIRAQUEIROZ@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '26/09/1974', '44', '118785910256', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '134', 'ASSISTENTE SOCIAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011520620186070000'], '70000615687': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615687', '14900', 'JAQUELINE ANGELA DA SILVA', 'JAQUELINE SILVA', '#NULO#', '88987280187', 'SANDIEGOUTILIDADES@HOTMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '21/04/1980', '38', '016513882062', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '128', 'ASTR NOMO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011633520186070000'], '70000615688': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615688', '14021', 'ANA CRISTINA SIQUEIRA CAMPOS DA SILVEIRA', 'ANA CRISTINA DO POR DO SOL', '#NULO#', '60998032115', 'ANNATTEN@YAHOO.COM.BR', '3', 'INAPTO', '14', 'INDEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '27/04/1976', '42', '016139172089', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '41 ', 'FEIRANTE  AMBULANTE E MASCATE', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06012404420186070000'], '70000615689': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615689', '14012', 'GIZELE RIBEIRO DOS SANTOS', 'GIZELE RIBEIRO', '#NULO#', '72701650178', 'GIZELERIBEIRO_1@HOTMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/01/1984', '34', '018080262003', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '390', 'SECRET RIO E DATIL GRAFO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011581320186070000'], '70000615690': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615690', '14001', 'SIHAMI JABER MUDARRA', 'PROFESSORA SIHAMI', '#NULO#', '53919793153', 'SIHAMIMUDARRA@YAHOO.COM.BR', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '25/08/1971', '47', '008013612062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011780420186070000'], '70000615691': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615691', '14015', 'DEBORA QUECIA DOS SANTOS', 'DEBORA SANTOS', '#NULO#', '71176110144', 'DEBORAQ2@HOTMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SALVADOR', '24/02/1980', '38', '090592170540', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011503620186070000'], '70000615692': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615692', '14524', 'VERA LUCIA DO NASCIMENTO SEVERINO', 'VERA SEVERINO', '#NULO#', '14349884149', 'VERASEVERINO.ELEICAO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'CAMPO GRANDE', '21/05/1957', '61', '030775731066', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011815620186070000'], '70000615693': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615693', '14266', 'SEBASTIANA DA SILVA FREIRE', 'TIANA FREIRE', '#NULO#', '13005073220', 'TIANA.DFREIRE@YAHOO.COM.BR', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'AC', '-3', 'RIO BRANCO', '02/06/1961', '57', '012792632224', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011771920186070000'], '70000615694': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615694', '14321', 'KELY CRISTINA REGO DOS SANTOS', 'GALEGA DO PASTEL', '#NULO#', '89090519149', 'PTBDF14@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '26/06/1977', '41', '014490892070', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '41 ', 'FEIRANTE  AMBULANTE E MASCATE', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011694220186070000'], '70000615695': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615695', '14222', 'ADRIANDESSON SOUSA CASTELO', 'CASTELO', '#NULO#', '69756490144', 'CASTELOPTBDF14@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '29/10/1979', '39', '014263632070', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '145', 'BOMBEIRO CIVIL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011417420186070000'], '70000615696': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615696', '14556', 'CHARLES JATOBA QUEIROZ SANTANA', 'CHARLES JATOBA', '#NULO#', '06851278774', 'CHARLES.JATOBAQS@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '10/09/1971', '47', '080791560353', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011486620186070000'], '70000615697': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615697', '14154', 'WILYE GOMES DE CAMPOS', 'WILYE CAMPOS', '#NULO#', '08927855272', 'WILYESS@HOTMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'UBERLANDIA', '13/08/1955', '63', '001934582690', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011832620186070000'], '70000615698': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615698', '14003', 'LOURIVAL MOREIRA DA SILVA', 'MOREIRA', '#NULO#', '11468548115', 'LSMOREIRA003@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'JOAO PINHEIRO', '28/11/1953', '65', '005579892097', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011702720186070000'], '70000615699': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615699', '14007', 'TEODOMIRO CAMINHA LUSTOSA', 'THEODOMIRO LUSTOSA', '#NULO#', '09753427115', 'THEODOMIROLUSTOSA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'BOM JESUS', '21/01/1954', '64', '001493702011', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '403', 'CORRETOR   IM V S  SEGUROS  T TULOS E VALORES', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011807120186070000'], '70000615700': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615700', '14100', 'ANTONIO CESAR DOS SANTOS RAMOS', 'CESAR RAMOS', '#NULO#', '47378786187', 'PTBDF14@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'SOBRADINHO', '14/06/1968', '50', '007427312003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011469620186070000'], '70000615701': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615701', '14800', 'JOSE FRANCISCO DA SILVA', 'GALEGO DA LIMPEZA', '#NULO#', '41674103115', 'GALEGODALIMPEZA@HOTMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'RN', '-3', 'FLORANCIA', '27/09/1970', '48', '007965942003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '109', 'AGENTE DE SA DE E SANITARISTA', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011668720186070000'], '70000615702': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615702', '14122', 'ALDENIR ALVES DE SOUSA', 'DENILSON DO GAS', '#NULO#', '58502955187', 'DENILSON.DISTRIBUIDOR@YAHOO.COM.BR', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'PADRE BERNARDO', '08/05/1972', '46', '010316612020', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011434420186070000'], '70000615703': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615703', '14123', 'FRANCISCO COSTA DE SANTANA', 'FRANCISCO COSTA', '#NULO#', '08126488204', 'FRANCISCOCOSTACORRETOR@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'ITAUEIRA', '23/07/1952', '66', '004924432062', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06012395920186070000'], '70000615704': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615704', '14190', 'PABLO AGUIAR TAVARES DE PAULA GOMES', 'DELEGADO PABLO AGUIAR', '#NULO#', '91127661604', 'PABLOATPG@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '28/06/1975', '43', '102381050248', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011746420186070000'], '70000615705': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615705', '14031', 'ARIONILDO BARROS LIMA', 'ARI SUSHI', '#NULO#', '41103807153', 'ARILIMA8@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'CODO', '14/12/1971', '47', '009699892097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011478120186070000'], '70000615706': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615706', '14145', 'STANLEY BARRETO SALGADO', 'STANLEY SALGADO', '#NULO#', '01312865105', 'SAVEIRODF@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/02/1987', '31', '019253672020', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011798620186070000'], '70000615707': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615707', '14456', 'JORDENES FERREIRA DA SILVA', 'PROFESSOR JORDENES', '#NULO#', '55385176168', 'JORDENNES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'UNAI', '15/04/1971', '47', '008014522038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011650520186070000'], '70000615708': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615708', '14710', 'JOSE RICARDO DE SOUZA BRANDAO', 'RICARDO BRANDAO', '#NULO#', '94480320725', 'BRANDAO5@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '06/08/1970', '48', '075536720329', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '185', 'ESCRITOR E CR TICO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011685720186070000'], '70000615709': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615709', '14777', 'PAULO HENRIQUE MAGALHAES POLI', 'PAULO POLI', '#NULO#', '15267024104', 'PAULO@PHDAUTOMOVEIS.COM.BR', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIANIA', '18/06/1960', '58', '006584432089', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06012412920186070000'], '70000615710': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615710', '14191', 'ALZIRO BARBOSA DE SOUSA', 'SARGENTO ALZIRO NETO', '#NULO#', '44308779120', 'ALZIRONETO1@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'CE', '-3', 'NOVA RUSSA', '17/07/1966', '52', '005497132020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '273', 'MINISTRO DE ESTADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011451420186070000'], '70000615711': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615711', '14110', 'EDSON DAGOBERTO RABELLO DA SILVA', 'EDSON RABELLO', '#NULO#', '56147724800', 'EDSONRABELLO2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '03/09/1953', '65', '097174650132', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011512120186070000'], '70000615712': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615712', '14014', 'ERNESTO FERREIRA SOARES', 'ERNESTO GOLD', '#NULO#', '69497400187', 'ERNESTOSOARESS@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'BA', '-3', 'BARRA', '25/08/1977', '41', '012986762038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011538820186070000'], '70000615713': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615713', '14074', 'LUCIOMAR VENTURA DA SILVA', 'MAZINHO VENTURA', '#NULO#', '01454423730', 'MAZINHOVENTURA40@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'BONSUCESSO', '29/12/1967', '51', '007765300345', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011729420186070000'], '70000615714': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615714', '14025', 'GIOVANI GONCALVES CORRADI', 'GIOVANI CORRADI', '#NULO#', '29871719604', 'GIOVANI.CORRADI@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ITAUNA', '01/12/1957', '61', '000476410221', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011572820186070000'], '70000615715': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615715', '14020', 'VIRGILIO CESAR GALVAO PIMENTEL', 'PROFESSOR VIRGILIO GALVAO', '#NULO#', '55396402172', 'VIRGILIOPHD@OUTLOOK.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'PB', '-3', 'CAMPINA GRANDE', '09/05/1971', '47', '009596132054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06012421420186070000'], '70000615716': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615716', '14000', 'WASHINGTON GIL MESQUITA', 'WASHINGTON MESQUITA', '#NULO#', '31744125104', 'DEPUTADOWM@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '20/06/1965', '53', '012024732020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011824120186070000'], '70000615717': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615717', '14235', 'FILIPE DA SILVA COSTA', 'FILIPE COSTA', '#NULO#', '02212310137', 'FILIPEFXM@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '23/05/1986', '32', '020028462062', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011555820186070000'], '70000615718': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615718', '14432', 'ZUILA SOEIRO FONSECA', 'ZUILA', '#NULO#', '28803140115', 'ZUILA2018ALIRIO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'PA', '-3', 'VISEU', '15/06/1962', '56', '002001932046', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '254', 'VIGILANTE', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011841120186070000'], '70000615719': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615719', '14789', 'IVONE ARMANDO LUZARDO DE SOUSA', 'IVONE LUZARDO', '#NULO#', '20216637104', 'IVLUUZ@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/03/1959', '59', '018701481651', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '5', 'VI VO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011616520186070000'], '70000615720': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615720', '14144', 'AIRAM OLIVEIRA ALVES CORREIA', 'AIRAM', '#NULO#', '63482053120', 'ARAM.BAYPARK@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '24/04/1974', '44', '011802052070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011425920186070000'], '70000615721': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615721', '14228', 'EVANILDO CORREIA GARCIA', 'GARCIA', '#NULO#', '92090460563', 'CANTOREVANILDOCGARCIA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '26/04/1978', '40', '020041101414', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011547320186070000'], '70000615722': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615722', '14333', 'PAULO FERNANDO CARNEIRO MONTEIRO', 'PAULO MONTEIRO', '#NULO#', '17977975491', 'PTBDF14@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'PE', '-3', 'RECIFE', '13/12/1950', '68', '003446692070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '111', 'M DICO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011754920186070000'], '70000615723': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615723', '14111', 'JOSE BATISTA NETO', 'BATISTA NETO', '#NULO#', '04235797115', 'JBNETO19529@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '28/05/1950', '68', '000790562070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '243', 'T CNICO DE ENFERMAGEM E ASSEMELHADOS (EXCETO ENFERMEIRO)', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011677220186070000'], '70000615724': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615724', '14500', 'MARINALDA DOS SANTOS BARROS', 'MARINALDA SANTOS', '#NULO#', '29765242115', 'MARINALDACONTATO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '17/11/1964', '54', '001873202020', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '161', 'PRODUTOR DE ESPET CULOS P BLICOS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011737920186070000'], '70000615725': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615725', '14141', 'IRENALDO PEREIRA LIMA', 'INDIO SOBERANA', '#NULO#', '26633299168', 'PTBDF14@GAMIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '01/12/1962', '56', '001201792046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011608020186070000'], '70000615726': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615726', '14567', 'H RCULES CEZ RIO DA SILVA DO NASCIMENTO', 'PROFESSOR HERCULES  CEZAR', '#NULO#', '02397177161', 'HERCULESCSN@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '22/04/1988', '30', '019900392020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011599520186070000'], '70000615727': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615727', '14051', 'JOAO DE DEUS SANTANA', 'JOAO PESCOCINHO', '#NULO#', '74623362353', 'PTBDF14@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'CE', '-3', 'IRACEMA', '01/06/1976', '42', '038919280710', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011642020186070000'], '70000615728': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615728', '14400', 'ALEX ALVES NEVES', 'ALEX NEVES', '#NULO#', '68908091149', 'PTBDF14@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '14/03/1976', '42', '011798652038', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '126', 'ANALISTA DE SISTEMAS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011442920186070000'], '70000615729': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615729', '14510', 'LUCIANO GONZAGA DA SILVA', 'LUCIANO GONZAGA', '#NULO#', '33419116187', 'PRLUCIANOGONZAGA@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '14/03/1967', '51', '004179872003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '124', 'CONTADOR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011711220186070000'], '70000615730': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615730', '14180', 'CRISTINE VASCONCELOS CARVALHO', 'CRISTINI VASCONCELOS', '#NULO#', '71359427104', 'CRISTINIVASCONCELOS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '24/02/1982', '36', '016172532011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '171', 'JORNALISTA E REDATOR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06011495120186070000'], '70000615731': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000615731', '14133', 'FRANCISCA ELICLEUDA PEREIRA DA SILVA DO COUTO', 'ELICLEUDA', '#NULO#', '60691107149', 'ELICLEUDA@HOTMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050420', 'PARTIDO ISOLADO', 'PTB', '1', 'BRASILEIRA NATA', 'CE', '-3', 'ERERE', '04/07/1974', '44', '011292682070', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '581', 'DONA DE CASA', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06011564320186070000'], '70000616349': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616349', '33391', 'ANDR  LUIS QUEIROZ ROSA', 'ANDR  QUEIROZ', '#NULO#', '85418285149', 'ANDRE_QUEIROZ@GLOBOMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '08/12/1978', '40', '015564522054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011937020186070000'], '70000616350': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616350', '33777', 'JO O HELIO CARDOSO', 'DI CARDOSO', '#NULO#', '77595254191', 'JOHELIO40@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '15/08/1974', '44', '030059671040', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '163', 'CANTOR E COMPOSITOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012119120186070000'], '70000616351': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616351', '33133', 'ADEMILSON PEIXOTO SOARES', 'PROF ADEMILSOM', '#NULO#', '34218491704', 'ADEMILSON.PROF.53@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'RIO DE JANEIRO', '27/08/1953', '65', '002313972097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011901820186070000'], '70000616352': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616352', '33167', 'BRUNA AUGUSTO DE SOUSA', 'BRUNA AUGUSTO', '#NULO#', '71990623115', 'BRUNA.AUGUSTO.67@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'BOM JESUS', '31/05/1983', '35', '015783072038', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '581', 'DONA DE CASA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011971020186070000'], '70000616353': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616353', '33333', 'EVA ALESSANDRA ROSA GOMES', 'ALESSANDRA GOMES', '#NULO#', '62025813104', 'ALESSANDRAGOMES.2@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'VAZANTE', '05/08/1971', '47', '008464742003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '04', 'AMARELA', '411', 'VENDEDOR DE COM RCIO VAREJISTA E ATACADISTA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012040220186070000'], '70000616354': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616354', '33030', 'MARYLIA TAVARES DA SILVA', 'MARYLIA TAVARES', '#NULO#', '02046823125', 'MARYLIATAVARES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '26/10/1988', '30', '020414102020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012196820186070000'], '70000616355': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616355', '33244', 'MOACIR ROSA DA SILVA', 'SARGENTO MOACIR', '#NULO#', '33382654172', 'MOACIR_R.SILVA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '10/03/1963', '55', '004715862011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '921', 'MILITAR REFORMADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012222320186070000'], '70000616356': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616356', '33023', 'ROSIRENE SANTOS DE SOUZA DA SILVA', 'ROSE SOUZA', '#NULO#', '02330538162', 'ROSESOUZA13311604@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SIM ES FILHO', '18/01/1984', '34', '018767962062', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '411', 'VENDEDOR DE COM RCIO VAREJISTA E ATACADISTA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012274520186070000'], '70000616357': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616357', '33444', 'NILZA SOARES GOMES', 'NILZA GOMES', '#NULO#', '14983672168', 'NILZASOARESGOMEZ@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'GO', '-3', 'CATAL O', '29/05/1956', '62', '034933401090', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012230820186070000'], '70000616358': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616358', '33000', 'RUMALDO RIBEIRO DE SOUZA FILHO', 'PALHA O LAMBY SAL', '#NULO#', '84659467368', 'COLUNISTAPOPULAR@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '14/06/1981', '37', '044614050752', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012283020186070000'], '70000616359': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616359', '33012', 'JOS  CLAUDIO BONINA', 'SGT BONINA - V I DA 12', '#NULO#', '36880337104', 'LREZENDE84@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'CEIL NDIA]', '22/07/1963', '55', '005514952097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012144620186070000'], '70000616360': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616360', '33633', 'SILVANA ARA JO SANTOS', 'SILVANA SANTOS', '#NULO#', '02310148563', 'SILVERLAINY13@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SALVADOR', '29/11/1980', '38', '098282230590', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '581', 'DONA DE CASA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012318220186070000'], '70000616361': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616361', '33033', 'ANDRE LUIS RAIMUNDO DA SILVA', 'ANDRE KALLAGRI', '#NULO#', '44347910100', 'KALLAGRI@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '06/01/1971', '47', '009830312062', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '705', 'TRABALHADOR DE FABRICA  O DE ROUPAS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012448120186070000'], '70000616362': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616362', '33193', 'CLESIMAR GURGEL DE AMORIM J NIOR', 'GURGEL', '#NULO#', '91397294434', 'GURGELJUNIOR@HOTMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'PB', '-3', 'JO O PESSOA', '07/09/1974', '44', '016281951600', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06011997720186070000'], '70000616363': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616363', '33233', 'RACIB ELIAS TICLY', 'RACIB ELIAS TICLY', '#NULO#', '03149722187', 'RETICLY@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'SP', '-3', 'PEDREGULHO', '23/11/1947', '71', '000774032003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012266020186070000'], '70000616364': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616364', '33999', 'FLORENCIO GON ALVES DOS SANTOS', 'FLOR NCIO DO QUEIJO', '#NULO#', '33246327149', 'FLORENCIOROLDINEI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'COCOS', '01/04/1962', '56', '132225510248', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012439620186070000'], '70000616365': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616365', '33111', 'LIDIA GRIGAITIS RIBEIRO DINIZ', 'LIDIA RIBEIRO', '#NULO#', '83251944134', 'LGRIGAITIS@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '29/12/1979', '39', '013873312089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06012161620186070000'], '70000616366': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616366', '36026', 'ADRIANO AZEVEDO', 'ADRIANO AZEVEDO', '#NULO#', '06170385898', 'ADRIANOAZEVEDO14@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'SP', '-3', 'ANDRADINA', '14/01/1974', '44', '017537182054', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011910320186070000'], '70000616367': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616367', '36111', 'AILTON MIRANDA LUSTOSA', 'AILTON MIRANDA', '#NULO#', '48821756149', 'AILTONMIRANDAPSL@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PARNAGU ', '09/08/1969', '49', '007687232003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011928520186070000'], '70000616368': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616368', '36255', 'ANTONIA FLAVIA LOPES DO NASCIMENTO', 'FLAVINHA DO POVO', '#NULO#', '47142618191', 'FLAVIAJSM@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'CE', '-3', 'TAMBORIL', '05/10/1965', '53', '008146242011', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011945520186070000'], '70000616369': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616369', '36012', 'ANTONIO LOPES ANCHIETA JUNIOR', 'ANCHIETA JR', '#NULO#', '49724720306', 'BP.ANCHIETAJUNIOR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '19/10/1973', '45', '021430951503', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '142', 'PROFESSOR DE ENSINO SUPERIOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011954020186070000'], '70000616370': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616370', '36136', 'BENAIR MARIA DOMINGOS', 'BENA DOMINGOS', '#NULO#', '45481164191', 'BENADOMINGOS.OFICIAL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'TAGUATINGA', '21/02/1962', '56', '001825182062', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011962520186070000'], '70000616371': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616371', '36500', 'CELIO ALVES DE FREITAS', 'CELIO MARRU ', '#NULO#', '79399940187', 'CELIOMARRUA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '11/03/1972', '46', '010614952089', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011989220186070000'], '70000616372': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616372', '36017', 'DAVI LIMA SOUSA', 'TENENTE DAVI', '#NULO#', '35392959334', 'COMUNICACAO.PTCDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'MA', '-3', 'PEDREIRAS', '29/11/1968', '50', '097543820299', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012006220186070000'], '70000616373': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616373', '36000', 'EDUARDO WEYNE PEDROSA', 'EDUARDO PEDROSA', '#NULO#', '03113382165', 'COMUNICACAO.PTCDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '26/11/1989', '29', '020199722046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '2', 'ELEITO POR QP', 'N', 'S', '-1', '06012014720186070000'], '70000616374': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616374', '36147', 'ELISMAN SILVA OLIVEIRA', 'TALES RECANTO', '#NULO#', '78323436134', 'TALES_FENIX@HOTMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'GO', '-3', 'MIRACEMA NORTE', '11/12/1974', '44', '016763412062', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '403', 'COR TOR DE   VEIS  SEGUROS  T TULOS E VALORES', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06012023220186070000'], '70000616375': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616375', '36456', 'EURIPEDES VIANA SANTANA', 'LIPPE VIANA', '#NULO#', '57993793149', 'LIPPEVIANAVITORIA2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'JANUARIA', '20/04/1969', '49', '008167502089', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '171', 'JORNALISTA E REDATOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012031720186070000'], '70000616376': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616376', '36789', 'FABIO RODRIGUES RAMOS', 'BITO RAMOS', '#NULO#', '72361751100', 'BITORAMOSJSMF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAZL NDIA', '24/06/1981', '37', '017455732011', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012058420186070000'], '70000616377': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616377', '36222', 'FRANCISCO VICEMA MEDEIROS', 'VICEMAR MEDEIROS', '#NULO#', '64655407115', 'VICEMARMEDEIROS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '23/03/1973', '45', '009959692062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '171', 'JORNALISTA E REDATOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012066920186070000'], '70000616378': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616378', '36882', 'GERALDO BATISTA ALVES DE SOUSA', 'ST GERALDO ALVES', '#NULO#', '52476650153', 'ST.GERALDO.ALVES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ABAET ', '05/04/1972', '46', '009787482089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012075420186070000'], '70000616379': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616379', '36447', 'HAMSES GOMES DA SILVA', 'HAMSES GOMES', '#NULO#', '53947711115', 'HAMSES_GOMES@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '21/07/1971', '47', '007833012062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '157', 'T CNICO DE LABORAT RIO E RAIOS X', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012083920186070000'], '70000616380': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616380', '36036', 'IVAN JOS  DE ALMEIDA J NIOR', 'IVAN JOS ', '#NULO#', '72613483172', 'IVANJOSENOVO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '24/09/1981', '37', '014623912097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012092420186070000'], '70000616381': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616381', '36061', 'JEFFERSON DA SILVA ALVES', 'DJ JAMAIKA', '#NULO#', '45500215191', 'JAMAIKADJ@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'TAGUATINGA', '28/10/1967', '51', '003047942062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '164', 'M SICO', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06012100920186070000'], '70000616382': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616382', '36555', 'JOSE ANTONIO CRUZ GUIMARAES', 'TOM GUIMAR ES', '#NULO#', '23925841172', 'TOMGUIMARAES2010@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'MA', '-3', 'CAXIAS', '26/04/1962', '56', '006212342046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012127620186070000'], '70000616383': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616383', '36100', 'JOSE CARLOS SANTIAGO GUIMARAES', 'POLICIAL FEDERAL SANTIAGO', '#NULO#', '12001635168', 'SANTIAGOGUIMARAES@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO JANEIRO', '20/10/1956', '62', '009022272097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012136120186070000'], '70000616384': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616384', '36444', 'JULIANA FLORENCIO DOS SANTOS', 'JU FLOR', '#NULO#', '00536788189', 'JULIANAFSER@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'PLANALTINA', '08/03/1984', '34', '018302372089', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012153120186070000'], '70000616385': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616385', '36190', 'LUSIMAR TORRES ARRUDA', 'JAB ', '#NULO#', '50485334100', 'SIMPLESJABA1@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'CE', '-3', 'ITAPIPOCA', '13/05/1969', '49', '007781832003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012179820186070000'], '70000616386': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616386', '36123', 'MARIA CAROLINE FLEURY DE LIMA', 'CAROL LIMA', '#NULO#', '71728732115', 'AMIGOSCAROLLIMA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'AM', '-3', 'MANAUS', '24/07/1981', '37', '015795742089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012188320186070000'], '70000616387': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616387', '36180', 'MAYK ARA JO LOPES', 'MAYK MONTALV O', '#NULO#', '03903398144', 'MAYKMONTALVAO2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '04/12/1994', '24', '062915821074', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012205320186070000'], '70000616388': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616388', '36936', 'MIRIAN DUTRA DA SILVA', 'MIRIAN DUTRA', '#NULO#', '47769416191', 'DUTRA3000@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '01/04/1971', '47', '008262862011', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '537', 'MOTORISTA PARTICULAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012213820186070000'], '70000616389': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616389', '36373', 'PAULO HENRIQUE DE SOUSA', 'PH PAULO HENRIQUE', '#NULO#', '48059226568', 'PHSTUDIO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '22/07/1969', '49', '054071800515', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '531', 'MOTORISTA DE VE CULOS DE TRANSPORTE COLETIVO DE PASSAGEIROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012249020186070000'], '70000616390': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616390', '36055', 'PAULO THIAGO ALENCAR ANTUNES', 'PAULO THIAGO CAVEIRA', '#NULO#', '71272631168', 'PAULOETHIAGO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '25/01/1981', '37', '015809882097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012257520186070000'], '70000616391': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616391', '36333', 'SANDOVAL ALVES DE ALENCAR', 'SANDOVAL ALENCAR', '#NULO#', '22704744149', 'SANDOVALCAFEDEOURO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '26/04/1964', '54', '002675462038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012291520186070000'], '70000616392': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616392', '36999', 'SERGIO ZOGHBI CASTELO BRANCO', 'S RGIO ZOGHBI', '#NULO#', '71732136149', 'SERGIOZOGHBI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'RO', '-3', 'PORTO VELHO', '01/02/1986', '32', '015799142003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '142', 'PROFESSOR DE ENSINO SUPERIOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012309720186070000'], '70000616393': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616393', '36331', 'TEREZINHA MARIA DE JESUS SILVA', 'TEREZINHA SILVA', '#NULO#', '34252312191', 'TERESASILVA.BANDEIRANTE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'GO', '-3', 'RIAN POLIS', '14/12/1963', '55', '005969081058', '4', 'FEMININO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012326720186070000'], '70000616394': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616394', '36223', 'VALDINEY ARRUDA BEZERRA', 'VAV    LEGAL FRENTISTA', '#NULO#', '91608597172', 'VAVALEGAL2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '05/06/1982', '36', '016897742097', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '194', 'FRENTISTA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012335220186070000'], '70000616395': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616395', '36122', 'VALDIVINA PEREIRA DA CONCEI  O ALMEIDA', 'VAL SILVA RADIALISTA', '#NULO#', '00312417195', 'VAL-PM1@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'BARREIRAS', '30/05/1982', '36', '041493731074', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '166', 'LOCUTOR E COMENTARISTA DE R DIO E TELEVIS O E RADIALISTA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012343720186070000'], '70000616396': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616396', '36888', 'VANDA CL A RODRIGUES DO LAGO', 'VANDA LAGO', '#NULO#', '39816788187', 'VANDALAAGOO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'BOM JESUS', '08/10/1966', '52', '004327402038', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012352220186070000'], '70000616397': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '3', 'GOVERNADOR', '70000616397', '29', 'RENAN ROSA DE ARRUDA', 'RENAN ROSA', '#NULO#', '46262210172', 'CEE.DF.PCO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'CE', '-3', 'IGUATU', '30/09/1964', '54', '014851962020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '395', 'BANC RIO E ECONOMI RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014145320186070000'], '70000616398': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '4', 'VICE-GOVERNADOR', '70000616398', '29', 'GILSON VASCONCELOS DOBBIN', 'G LSON DOBBIN', '#NULO#', '26656388191', 'CEE.DF.PCO@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '22/02/1964', '54', '000353512054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06014101620186070000'], '70000616399': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000616399', '290', 'DANILO MATOSO MACEDO', 'DANILO MATOSO', '#NULO#', '00534055605', 'CEE.DF.PCO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '21/02/1974', '44', '104362460248', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '102', 'ARQUITETO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014059120186070000'], '70000616400': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000616400', '290', 'JOAQUIM BENEDITO DA SILVA FILHO', 'JOAQUIM BENEDITO', '#NULO#', '05515262115', 'CEE.DF.PCO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'MA', '-3', 'CAXIAS', '24/07/1951', '67', '001136492062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06014119820186070000'], '70000616401': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000616401', '2929', 'RICARDO DE SOUSA MACHADO', 'RICARDO MACHADO', '#NULO#', '22650253134', 'CEE.DF.PCO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '01/03/1961', '57', '007257592070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014153820186070000'], '70000616402': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000616402', '2939', 'NIRCEU WERNECK', 'NIRCEU WERNECK', '#NULO#', '70653879172', 'CEE.DF.PCO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '14/04/1980', '38', '014895052062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '102', 'ARQUITETO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014136820186070000'], '70000616403': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000616403', '290', 'ELIZ NGELA MIRIAM SILVA', 'MILLA', '#NULO#', '80978169115', 'CEE.DF.PCO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '13/02/1978', '40', '013819912070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '395', 'BANC RIO E ECONOMI RIO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06014067620186070000'], '70000616404': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000616404', '2949', 'FERNANDO KENGY TABA', 'KENGY', '#NULO#', '30522511805', 'CEE.DF.PCO2018@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'MG', '-3', 'TIMOTEO', '17/12/1981', '37', '298373040116', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '9 ', 'ESTUD TE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014084620186070000'], '70000616405': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000616405', '2959', 'LIA DE SOUSA AIRES', 'LIA AIRES', '#NULO#', '03472855380', 'CEE.DF.PCO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '26/02/1988', '30', '035866651597', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '931 ESTUDAN   BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014128320186070000'], '70000616406': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616406', '29029', 'EXPEDITO CARNEIRO DE MENDON A', 'EXPEDITO MENDON A', '#NULO#', '22062386168', 'CEE.DF.PCO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PIRAPORA', '22/11/1960', '58', '001371692003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '292', 'AGENTE ADMINISTRATIVO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014076120186070000'], '70000616407': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616407', '29129', 'CREUZENIR MAGALH ES DA COSTA GON ALVES', 'PETRA MAGALH ES', '#NULO#', '95477160187', 'CEE.DF.PCO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'MA', '-3', 'BOM JARDIM', '13/12/1975', '43', '017706232089', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014040920186070000'], '70000616408': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616408', '29229', 'FERNANDO MONTEIRO VARGUES', 'FERNANDO VARGUES', '#NULO#', '87096692134', 'CEE.DF.PCO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '31/01/1979', '39', '014203062054', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '126', 'ANALISTA DE SISTEMAS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014093120186070000'], '70000616409': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616409', '29329', 'ANT NIO VIEIRA MARQUES', 'ANT NIO MARQUES', '#NULO#', '03366058110', 'CEE.DF.PCO@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA ', '13/05/1989', '29', '020449912070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014032420186070000'], '70000616410': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000616410', '29429', 'TEREZINHA F TIMA SILVA', 'TEREZINHA DE F TIMA', '#NULO#', '11452960178', 'CEE.DF.PCO2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '29', 'PCO', 'PARTIDO DA CAUSA OPER RIA', '70000050437', 'PARTIDO ISOLADO', 'PCO', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ITAPECERICA', '16/12/1955', '63', '004327142046', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014162320186070000'], '70000617652': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000617652', '70003', 'TATIANA REHBEIN RODRIGUES', 'TATIANA REHBEIN', '#NULO#', '64074110920', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '10/01/1967', '51', '001823500671', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011867820186070000'], '70000617678': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000617678', '43420', 'CLAUDIO FERNANDO MARQUES DE OLIVEIRA', 'CLAUDIO PERIFERIA', '#NULO#', '72270691172', 'CANDIDATOSPVDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '05/11/1981', '37', '015185272038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '110', 'AGENTE POSTAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06011876320186070000'], '70000617679': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000617679', '43700', 'JOSE ADIBE DAMASCENO DA CRUZ', 'ADIBE MECANICO', '#NULO#', '60682418153', 'CANDIDATOSPVDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '43', 'PV', 'PARTIDO VERDE', '70000050198', 'SUSTENTABILIDADE E TRABALHO', 'PDT / PV', '1', 'BRASILEIRA NATA', 'MA', '-3', 'COD ', '11/09/1969', '49', '019332631570', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '541', 'MEC NICO DE MANUTEN  O', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06011884820186070000'], '70000618958': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618958', '1010', 'JULIO CESAR RIBEIRO', 'JULIO CESAR', '#NULO#', '15791563809', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O BERNARDO DO CAMPO', '24/02/1975', '43', '034006990906', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '2', 'ELEITO POR QP', 'N', 'S', '-1', '06012534320186070000'], '70000618959': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618959', '2300', 'EDUARDO MAIA DA SILVEIRA', 'EDUARDO CUSTO ZERO', '#NULO#', '71512934100', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '20/11/1984', '34', '036710432712', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012490620186070000'], '70000618960': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618960', '2377', 'GILDOVAN VIEIRA DA CONCEI  O', 'ARAJ  SEPETI GUARANI', '#NULO#', '00100507603', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'MG', '-3', 'S O ROM O', '08/01/1974', '45', '013606942089', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '05', 'IND GENA 403', ' RRETOR DE IM VEIS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012517320186070000'], '70000618961': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618961', '2323', 'LUCIANO SOARES LEIRO', 'DELEGADO FEDERAL LEIRO', '#NULO#', '55339670104', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '31/10/1970', '48', '007535132097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012542820186070000'], '70000618962': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618962', '2345', 'PAULA MORENO PARO BELMONTE', 'PAULA BELMONTE', '#NULO#', '57867100172', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'SP', '-3', 'S O PAULO', '23/06/1973', '45', '008455552046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06012578020186070000'], '70000618963': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618963', '1000', 'WILSON EURICO NOBRE DA SILVA', 'WILSON NOBRE', '#NULO#', '37372238153', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '13/03/1970', '48', '007621712003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '258', 'BOMBEIRO MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012612020186070000'], '70000618964': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618964', '7777', 'AUGUSTO SILVEIRA DE CARVALHO', 'AUGUSTO CARVALHO', '#NULO#', '06796478134', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PATOS DE MINAS', '27/07/1953', '65', '000533372089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '5', 'SUPLENTE', 'S', 'S', '-1', '06012465120186070000'], '70000618965': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618965', '5555', 'RENATO SANTANA DA SILVA', 'RENATO SANTANA', '#NULO#', '60209399104', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '55', 'PSD', 'PARTIDO SOCIAL DEMOCR TICO', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '17/02/1973', '45', '010295652089', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012586520186070000'], '70000618966': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618966', '2030', 'SUZANGELA MARIA ALEXANDRE COSTA', 'SUZANGELA LE O DE JUD ', '#NULO#', '60599588187', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '20/12/1975', '43', '012590592020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012603520186070000'], '70000618967': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618967', '2018', 'PATR CIA VAL RIA RODRIGUES DOS SANTOS', 'PATR CIA RODRIGUEZ', '#NULO#', '00024674613', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ITAJUB ', '10/07/1970', '48', '007544922089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06012569520186070000'], '70000618968': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618968', '2022', 'FRANCIMAR NAVA VILARINDO', 'FRANCIMAR', '#NULO#', '41353900304', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'MA', '-3', 'IMPERATRIZ', '15/08/1974', '44', '011186172089', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012508820186070000'], '70000618969': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618969', '1919', 'MARCOS PACCO RIBEIRO COELHO', 'PROFESSOR PACCO', '#NULO#', '40971996253', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '19', 'PODE', 'PODEMOS', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA - BRAS LIA', '12/05/1974', '44', '014219222003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '142', 'PROFESSOR DE ENSINO SUPERIOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012551320186070000'], '70000618970': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618970', '2017', 'JOSE RAIMUNDO LOPES DE SOUZA', 'JOSE LOPES', '#NULO#', '28940741153', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'MA', '-3', 'ITAPECURU MIRIM', '28/07/1962', '56', '004876382054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012525820186070000'], '70000618971': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618971', '2020', 'EDNILSON MIRA DOS SANTOS', 'MIRA DA SA DE', '#NULO#', '27570509153', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'AP', '-3', 'AMAP ', '23/07/1962', '56', '002650672038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012482120186070000'], '70000618972': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618972', '1005', 'SENIRA RODRIGUES RAMALHO', 'SENIRA RAMALHO', '#NULO#', '33991375168', 'BRUNO.BELEZA@NWADV.COM.BR', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'MG', '-3', 'S O FRANCISCO', '03/02/1967', '51', '005270362070', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '5', 'VI VO(A)', '03', 'PARDA', '403 CORRET  DE IM VEIS  SEGUROS  T TULOS E VALORES', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06012595020186070000'], '70000618973': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000618973', '1017', 'CLEMENTINA DE LAS MERCEDES CAMPOS RIVAS', 'PROFESSORA CLEMENTINA', '#NULO#', '57323160197', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '2', 'BRASILEIRA (NATURALIZADA)', 'ZZ', '-3', 'MOLINA/CHILE', '17/10/1959', '59', '022702842097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012473620186070000'], '70000620283': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620283', '40190', 'ANA PAULA DAMASCENO DE SOUZA', 'ANINHA', '#NULO#', '84926783134', 'CAP.APSILVA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'AN POLIS', '01/05/1976', '42', '011596922097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012664220186070000'], '70000620284': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620284', '40004', 'EDNA MARIA SAMPAIO', 'EDNA  VILA', '#NULO#', '81905440120', 'EDNAMARIASAMPAIO2014@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '23/10/1977', '41', '012542792020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012707920186070000'], '70000620285': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620285', '40200', 'ETEL N CIA OLIVEIRA MONTEIRO', 'PROFESSORA ETEL', '#NULO#', '67553508500', 'ENUCIA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'IMPERATRIZ', '01/04/1972', '46', '012809252003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012724920186070000'], '70000620286': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620286', '40777', 'FRANCISMAR MOREIRA DE FIGUEIREDO LIMA', 'PROFESSORA FRANCIS', '#NULO#', '78945216472', 'FRANCYSPRINCE@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'PB', '-3', 'CACHOEIRA DOS  NDIOS', '25/05/1974', '44', '019389531210', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012733420186070000'], '70000620287': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620287', '40105', 'MARLON ANDERSON COSTA', 'MARLON COSTA', '#NULO#', '72023163153', 'MARLLONCOSTA40@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '04/11/1981', '37', '017469132097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '172', 'PUBLICIT RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012871820186070000'], '70000620288': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620288', '40000', 'M NICA CAMPOS DA N BREGA', 'M NICA N BREGA', '#NULO#', '18438881149', 'MONICANOBREGADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'PE', '-3', 'RECIFE', '07/07/1957', '61', '000371262020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '136', 'COMUNIC LOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012880320186070000'], '70000620289': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620289', '40222', 'VALDINEIA CASTRO MIRANDA DE AMORIM', 'NEIA AMORIM', '#NULO#', '45509689153', 'NEIACASTROMIRANDA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '20/07/1968', '50', '283159170116', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012984720186070000'], '70000620290': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620290', '40040', 'RODRIGO MARQUES BATISTA', 'RODRIGO MARQUES', '#NULO#', '75691485687', 'RODRIGOMARQUESBATISTA17@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '17/06/1970', '48', '007529892097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '101', 'ENGENHEIRO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012924020186070000'], '70000620291': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620291', '40369', 'JOS  ROSALVO DE SOUSA', 'ROSALVO BRASILEIRO', '#NULO#', '16313887115', 'CEDELROSALVO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'CE', '-3', 'MAURITI', '20/04/1953', '65', '001794482054', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012802620186070000'], '70000620292': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620292', '40026', 'SUEIDE MIRANDA LEITE', 'SUEIDE DO ICEP', '#NULO#', '27081753191', 'DIVULGACAO009@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'BARRA DO CORDA', '16/08/1964', '54', '006396052046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '390', 'SECRET RIO E DATIL GRAFO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012967720186070000'], '70000620293': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620293', '40007', 'ANA PAULA BENETE CROZU ', 'PAULA BENETT', '#NULO#', '09835845751', 'PAULABENETT.LGBT@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'MIRA ', '07/07/1980', '38', '024682871406', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '134', 'ASSISTENTE SOCIAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012655720186070000'], '70000620294': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620294', '40888', 'RAISSA ALESSANDRA ROSSITER', 'RAISSA ROSSITER', '#NULO#', '19702906415', 'RAISSA.ROSSITER@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '09/08/1960', '58', '039614950868', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '133', 'SOCI LOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012907020186070000'], '70000620295': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620295', '40555', 'GENILDO ESTEVES LIMA', 'GENILDO VIGILANTE', '#NULO#', '50487337115', 'GENILDO.ESTEVESDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'NIQUEL NDIA', '17/12/1968', '50', '007964862020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012741920186070000'], '70000620296': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620296', '40404', 'HENRIQUE MORAES ZILLER', 'ZILLER', '#NULO#', '17917360172', 'HENRIQUE@ZILLER.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BELO HORIZONTE', '18/06/1959', '59', '000302552046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012750420186070000'], '70000620297': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620297', '40051', 'ISAIAS APARECIDO DA SILVA', 'ISAIAS', '#NULO#', '81436890187', '81111533@BOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '15/05/1977', '41', '015643892011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012777120186070000'], '70000620298': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620298', '40111', 'JOS  GOMES FERREIRA FILHO', 'JOS  GOMES', '#NULO#', '71824693168', 'JOSEGOMESREAL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '05/04/1982', '36', '015533522020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '2', 'ELEITO POR QP', 'N', 'S', '-1', '06012785620186070000'], '70000620299': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620299', '40010', 'JOS  HENRIQUE FRAN A CAMPOS', 'HENRIQUE FRAN A', '#NULO#', '66659639187', 'DPHENRIQUEFRANCA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '08/03/1975', '43', '011579942038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012794120186070000'], '70000620300': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620300', '40123', 'JUAREZ CARLOS DE LIMA OLIVEIRA', 'JUAREZ O', '#NULO#', '26562006104', 'DEPJUAREZAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'LUZI NIA', '12/08/1962', '56', '014419242062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '277', 'DEPUTADO', '0', '5', 'SUPLENTE', 'S', 'S', '-1', '06012829320186070000'], '70000620301': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620301', '40456', 'LUZIA DE LOURDES MOREIRA DE PAULA', 'LUZIA DE PAULA', '#NULO#', '18281125187', 'CONTATOLUZIADEPAULA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PATOS DE MINAS', '02/03/1955', '63', '005900982003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '277', 'DEPUTADO', '0', '5', 'SUPLENTE', 'S', 'S', '-1', '06012846320186070000'], '70000620302': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620302', '40140', 'MARIA JOS  FEITOSA DE ANDRADE', 'MARIA JOS  DO TOROR ', '#NULO#', '79254535915', 'MJFANDRADE@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'PR', '-3', 'CURITIBA', '23/09/1970', '48', '048043170663', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012863320186070000'], '70000620303': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620303', '40180', 'M RCIA DE ALENCAR ARA JO', 'M RCIA DE ALENCAR', '#NULO#', '43802222415', 'MARCIADEALENCAR.BR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'PE', '-3', 'TIMBA BA', '12/07/1965', '53', '002899650850', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '132', 'PSIC LOGO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012854820186070000'], '70000620304': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620304', '40300', 'IGOR DANIN TOKARSKI', 'IGOR TOKARSKI', '#NULO#', '00114628173', 'IGOR@TOKARSKI.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOI NIA', '18/05/1983', '35', '015459452046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012768620186070000'], '70000620305': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620305', '40540', 'JOS  SANTAR M BRITO FILHO', 'JOS  SANTAR M', '#NULO#', '18311423172', 'JSANTAREMBRITOFILHO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'BA', '-3', 'BARREIRAS', '21/01/1960', '58', '005379682070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '196', 'GAR OM', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012811120186070000'], '70000620306': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620306', '40333', 'RAIMUNDO ALVES PEREIRA', 'RAY', '#NULO#', '11595345191', 'RAIAP@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '10/12/1955', '63', '000229262011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012898520186070000'], '70000620307': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620307', '40405', 'RICHARD BARROS ROCHA', 'RICHARD BARROS', '#NULO#', '00644618159', 'RICHARDBARROSROCHA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'IMPERATRIZ', '24/03/1987', '31', '019580072003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '536', 'TAXISTA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012915520186070000'], '70000620308': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620308', '40303', 'CLEBSON PEREIRA CARVALHO', 'CLEBSON CARVALHO', '#NULO#', '25030817387', 'CLEBSON.CARVALHO40@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'SANTA IN S', '01/06/1965', '53', '027431251384', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '02', 'PRETA', '124', 'CONTADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012699420186070000'], '70000620309': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620309', '40400', 'RODRIGO OLIVEIRA DE CASTRO DIAS', 'RODRIGO DIAS', '#NULO#', '03620535108', 'RODRIGODIASBSB@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '28/12/1990', '28', '021142422046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '159', 'CIENTISTA POL TICO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012932520186070000'], '70000620310': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620310', '40193', 'ROOSEVELT VILELA PIRES', 'ROOSEVELT VILELA', '#NULO#', '64152103191', 'ROOSEVELTVILELA@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOI NIA', '12/11/1974', '44', '011206632020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '2', 'ELEITO POR QP', 'N', 'S', '-1', '06012941020186070000'], '70000620311': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620311', '40513', 'SIMONE NUNES DE SANTANA', 'SIMONE SANTANA', '#NULO#', '00657333123', 'SIMONEGERENCIA@ICLOUD.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'PARANO ', '12/12/1983', '35', '016638502062', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '931 ESTUDAN   BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012959220186070000'], '70000620312': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620312', '40321', 'THIAGO JARJOUR', 'THIAGO JARJOUR', '#NULO#', '00716498162', 'JARJOUR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '11/10/1983', '35', '017853892038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012976220186070000'], '70000620313': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620313', '40100', 'VIRGILIO DO REGO MONTEIRO NETO', 'VIRG LIO NETO', '#NULO#', '30600669149', 'VIRGILIONETODF@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '01/08/1963', '55', '001659722038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012993220186070000'], '70000620314': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620314', '40403', 'BERNARDO ANT NIO DE BARROS LIMA', 'BEBETO DA COMUNIDADE', '#NULO#', '57878242100', 'REDE.ENTIDADES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PIO IX', '20/05/1974', '44', '011430492046', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012672720186070000'], '70000620315': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620315', '40153', 'CELSO ANT NIO PEREIRA DA SILVA', 'PROFESSOR CELSO', '#NULO#', '34053638372', 'PEDROLANDIM.POL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'PEDREIRAS', '16/02/1968', '50', '014966792046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '230', 'PEDAGOGO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012681220186070000'], '70000620316': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620316', '40800', 'ALESSANDRO FABR CIO CLEMENTE PAIVA', 'ALESSANDRO PAIVA', '#NULO#', '64769798172', 'ALESSANDROPAIVA2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'FORMOSA', '24/01/1974', '44', '010956202046', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '910', 'SACERDOTE OU MEMBRO DE ORDEM OU SEITA RELIGIOSA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012638720186070000'], '70000620317': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620317', '40104', 'ALZIRA MARIA DOS PASSOS FOLHA', 'ALZIRA FOLHA', '#NULO#', '66430283372', 'ALZIRAFOLHA.PASSOS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '26/04/1981', '37', '027454821570', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012647220186070000'], '70000620318': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620318', '40444', 'J LIO C SAR DE OLIVEIRA SILVA', 'J LIO C SAR DELEGADO', '#NULO#', '41716116104', 'JCOS.BSB@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PARNA BA', '19/05/1968', '50', '010111592003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06012837820186070000'], '70000620319': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000620319', '40017', 'ENIVALDO MANOEL DE SOUZA', 'ST MANOEL SOUZA GAS ', '#NULO#', '31889808172', 'ENIVALDOMANOEL1964@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '40', 'PSB', 'PARTIDO SOCIALISTA BRASILEIRO', '70000050525', 'PARTIDO ISOLADO', 'PSB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'ANAP LIS', '17/02/1964', '54', '009717012038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06012716420186070000'], '70000621146': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621146', '17171', 'ERICH NEGRIS BEZERRA', 'ERICH', '#NULO#', '16862316877', 'ERICH.BEZERRA@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '11/05/1974', '44', '089818870337', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013123120186070000'], '70000621147': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621147', '17197', 'ALINE CABRAL COSTA ANDRADE', 'ALINE CABRAL', '#NULO#', '88681661191', 'ALINECCANDRADE@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '22/11/1980', '38', '014274912046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '232', 'POLICIAL CIVIL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013998420186070000'], '70000621148': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621148', '17123', 'ALEX RIBEIRO LEITE', 'ALEX RIBEIRO', '#NULO#', '71597077100', 'ALEXRLEITE@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '10/04/1981', '37', '015325402070', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013980220186070000'], '70000621149': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621149', '17000', 'REGINALDO PEREIRA GOVEIA', 'REGINALDO GOUVEIA', '#NULO#', '52843734304', 'REGINALDO.GOVEIA@YAHOO.COM.BR', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'MA', '-3', 'PRESIDENTE DUTRA', '28/04/1975', '43', '012129102003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013946220186070000'], '70000621150': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621150', '17135', 'SIMONE DE JESUS SOUZA', 'SIMONE DE JESUS', '#NULO#', '51637910100', 'SIMONE.JSDF@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'GO', '-3', 'ANAPLIS', '05/05/1970', '48', '007703412046', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '581', 'DONA DE CASA', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013374420186070000'], '70000621151': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621151', '17467', 'PAULO AUGUSTO CARDOSO CAVALCANTE', 'PAULINHO CARDOSO', '#NULO#', '88757447187', 'PAULOAUGUSTO010@HOTMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '19/01/1980', '38', '014362122003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '402', 'V DEDOR PRACIST  REPRESENTANTE  CAIXEIRO-VIAJANTE E ASSEMELHADOS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013261520186070000'], '70000621152': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621152', '17323', 'MATAGUAYOS ROMAN FRANCA QUARESMA', 'ROMAN DF', '#NULO#', '59203218220', 'MOVIMENTOEXIJO@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'AM', '-3', 'MANAUS', '24/07/1974', '44', '008647442356', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '292', 'AGENTE ADMINISTRATIVO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013244520186070000'], '70000621153': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621153', '17217', 'JORGE MARQUES DA CRUZ JUNIOR', 'JORGE MARQUES', '#NULO#', '03600763199', 'JORGEMARQUESPSL17@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '31/12/1992', '26', '021729412070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013175320186070000'], '70000621154': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621154', '17992', 'GEISA APARECIDA DA SILVA', 'GEISA SILVA', '#NULO#', '41735978191', 'GEISASILVA440@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ITUITUBA', '06/06/1963', '55', '000729682003', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '581', 'DONA DE CASA', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013149820186070000'], '70000621155': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621155', '17222', 'SAULO SALMEM CAD', 'DR SAULO', '#NULO#', '75529246672', 'SAULO.SALMEN@HOTMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'MG', '-3', 'UBERABA ', '01/08/1972', '46', '013184002089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '115', 'ODONT LOGO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013348920186070000'], '70000621156': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621156', '17234', 'LUCIA DE FATIMA FELIX DA SILVA', 'PROFESSORA LUCIA', '#NULO#', '25728709400', 'LUCIA_DE_FATIMA_FELIX@HOTMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'PB', '-3', 'TAVARES', '06/06/1960', '58', '001101312054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013219020186070000'], '70000621157': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621157', '17456', 'AUGUSTO CESAR DA SILVA FREIRE', 'PROF AUGUSTO FREIRE', '#NULO#', '26487055204', 'AUGUSTOCEF209@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'PA', '-3', 'BELEM', '14/08/1972', '46', '026181221333', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '144', 'DIRETOR DE ESTABELECIMENTO DE ENSINO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013062420186070000'], '70000621158': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621158', '17010', 'SILVANA CARVALHO JAVED', 'SILVANA JAVED', '#NULO#', '79544738134', 'SICARSAN1989@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIS', '08/11/1976', '42', '011804122020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013365920186070000'], '70000621159': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621159', '17190', 'IVAN SOARES PEREIRA', 'IVAN SOARES', '#NULO#', '39794768120', 'IVANSOARESPEREIRA@YAHOO.COM.BR', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '14/12/1966', '52', '005958802062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '233', 'POLICIAL MILITAR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013971720186070000'], '70000621160': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621160', '17444', 'TANIA MARQUES SILVA', 'TANIA MARQUES', '#NULO#', '32970986191', 'TANIA.SILVA@ITAMARATY.GOV.BR', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '21/07/1962', '56', '001493582020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06013382920186070000'], '70000621161': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621161', '17333', 'ALMACHIO REZENDE BARRETO DA ROCHA', 'ALMACHIO ROCHA', '#NULO#', '47139269149', 'AR@FOCOEMMELHORIA.COM.BR', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '09/04/1969', '49', '008212802054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013028420186070000'], '70000621162': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621162', '17777', 'AMILTON SILVA', 'AMILTON SILVA', '#NULO#', '18247113104', 'AMILTONGEMAC.SILVA@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'GO', '-3', 'RUBIATABA', '20/09/1959', '59', '003408192011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013036920186070000'], '70000621163': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621163', '17995', 'IVANA GUIMAR ES STOIMENOF DE SOUSA', 'IVANA GUIMAR ES', '#NULO#', '34408800104', 'OFICIAL.IVANAGUIMARAES@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'PLANALTINA', '26/09/1960', '58', '001608462003', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '581', 'DONA DE CASA', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06013937720186070000'], '70000621164': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621164', '17111', 'MATHEUS FELIPE LOPES FERREIRA', 'MATHEUS LOPES', '#NULO#', '05722376183', 'AGENDADOMATHEUS7@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '31/05/1996', '22', '024309462003', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013253020186070000'], '70000621165': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621165', '17180', 'RICHARDE BRAGA RIECHE', 'RICHARDE BRAGA', '#NULO#', '58476237120', 'RICHARDBRAGARIECHE@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'MA', '-3', 'SANTA IN S', '22/09/1975', '43', '012136312003', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014006920186070000'], '70000621166': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621166', '17017', 'SERGIO DE SOUZA PIMENTEL', 'SERGIO PIMENTEL', '#NULO#', '36134120715', 'PIMENTELSERGIO1000@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'PE', '-3', 'RECIFE', '26/11/1954', '64', '014675182089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013357420186070000'], '70000621167': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621167', '17999', 'SARAH AIDAR MARIANO REGO', 'SARAH AIDAR', '#NULO#', '35100567104', 'SAIDARLEGIS@HOTMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '26/03/1965', '53', '013288752003', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06013330720186070000'], '70000621168': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621168', '54001', 'ALINNE DE SOUZA MARQUES', 'ALINNE MARQUES', '#NULO#', '78775264234', 'ALINNESMARQUES@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'AM', '-3', 'MANAUS', '03/10/1983', '35', '022516202240', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013010220186070000'], '70000621169': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621169', '54180', 'ANDREIA CANDIDA DA SILVA BANDEIRA', 'ANDREIA BANDEIRA', '#NULO#', '86498320591', 'DEACANDIDA73@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'MG', '-3', 'JOAO PINHEIRO', '07/03/1973', '45', '076373750540', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013045420186070000'], '70000621170': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621170', '54540', 'ANTONIO ZITO MOUR O SOARES', 'ZITO MOUR O', '#NULO#', '12125377187', 'ZITTOSOARES@BOL.COM.BR', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'CE', '-3', 'CRATE S', '05/01/1956', '62', '005969392054', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '4 ', 'CORR OR DE IM VEIS  SEGUROS  T TULOS E VALORES', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013053920186070000'], '70000621171': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621171', '54017', 'CARLOS MARTINS DE SOUZA', 'CARLOS MARTINS', '#NULO#', '01468784854', 'MARTINS_AFRICARD@HOTMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'SP', '-3', 'CASA VERDE', '11/02/1959', '59', '140068870124', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06013070920186070000'], '70000621172': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621172', '54929', 'CLAIRTON MONTEIRO DOS SANTOS', 'CLAIRTON MANGA ROSA', '#NULO#', '50408020130', 'CLAIRTONMANGAROSA@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PIRI PIRI', '23/03/1972', '46', '009939902038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013089120186070000'], '70000621173': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621173', '54444', 'DEUSDETE SOARES BENEVIDES', 'DEUSDETE', '#NULO#', '21496846249', 'JOAOBEZERRA@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '27/03/1966', '52', '020075161325', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013097620186070000'], '70000621174': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621174', '54007', 'EDVAN FERREIRA DE SA', 'WOLVERINE', '#NULO#', '93613652153', 'WOLVERINELOGAN.MD@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'GO', '-3', 'ANAPOLIS', '08/09/1970', '48', '009048832097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013106120186070000'], '70000621175': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621175', '54051', 'EMILIANO CALDEIRA DA SILVA', 'NEG O DO PARANO ', '#NULO#', '15243494100', 'NEGAODOPARANOA2010@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SANTA RITA DE C SSIA', '10/09/1958', '60', '001717852054', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013114620186070000'], '70000621176': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621176', '54123', 'ERIVALDO ALVES PEREIRA', 'ERIVALDO ALVES', '#NULO#', '63580101153', 'ERIVALDOPPL@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/03/1973', '45', '008354432003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013131620186070000'], '70000621177': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621177', '54357', 'JAILSON FIRMINO DOS SANTOS', 'JAILSON SANTOS', '#NULO#', '62278819100', 'JAILSONSANTOS.SP@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '16/10/1975', '43', '015876972070', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013158320186070000'], '70000621178': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621178', '54777', 'JOAO HENRIQUE RIBEIRO MARTINS', 'JOAO HENRIQUE', '#NULO#', '02510646117', 'JOAO.HRM@HOTMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '01/07/1988', '30', '020341102054', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA 931', 'E UDANTE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013166820186070000'], '70000621179': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621179', '54789', 'JOSE BERNARDO DA SILVA', 'PASTOR BERNARDO', '#NULO#', '56891385415', 'PASTORBERNARDO22@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'PE', '-3', 'ITAMB ', '12/04/1957', '61', '015242812011', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '02', 'PRE ', '931', ' STUDANTE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013183820186070000'], '70000621180': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621180', '54190', 'JOS  DO CARMO DOS REIS', 'JOSE REIS', '#NULO#', '34325263187', 'JCREIS63@YAHOO.COM.BR', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '02/08/1963', '55', '004875552097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '921', 'MILITAR REFORMADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013192320186070000'], '70000621181': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621181', '54033', 'LAURIZZE CAROLINA GOMES LIMA', 'LAURIZZE', '#NULO#', '01249595126', 'LAURIZZE@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'MS', '-3', 'CAMPO GRANDE', '05/02/1985', '33', '027613521864', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '02', 'PRETA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013200820186070000'], '70000621182': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621182', '54541', 'LEONARDO LOUREN O BERTOLDO', 'LEOZ O', '#NULO#', '38670119153', 'LEOZAODISTRITAL@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '23/08/1973', '45', '010820472070', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06013954720186070000'], '70000621183': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621183', '54156', 'LUIS MARCOS DOS SANTOS LICA', 'LUIS FARMA', '#NULO#', '85604330159', 'LUISFARMA2012@HOTMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'MA', '-3', 'ANAJATUBA', '24/03/1974', '44', '013995342003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013227520186070000'], '70000621184': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621184', '54111', 'MARIO BLANCO NUNES NETO', 'MARIO BLANCO', '#NULO#', '11277165149', 'BLANCOMARIO.NETO@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'GO', '-3', 'BURITI ALEGRE', '11/04/1955', '63', '006714732003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013236020186070000'], '70000621185': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621185', '54113', 'RAIMUNDO RESENDE DO NASCIMENTO', 'PAI RESENDE', '#NULO#', '25950517687', 'REZENDENASCIMENTO158@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'MG', '-3', 'SANTOS DUMONT', '19/07/1957', '61', '012977972070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013279720186070000'], '70000621186': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621186', '54555', 'ROBERTA MONZINI SILVEIRA', 'ROBERTA MONZINI', '#NULO#', '87961148191', 'RMONZINI@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'SC', '-3', 'ARA ATUBA', '30/05/1977', '41', '033284711074', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013288220186070000'], '70000621187': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621187', '54321', 'ROBERTO RIBEIRO DE ALMEIDA', 'BETO RIBEIRO', '#NULO#', '56383649191', 'ROBERTORIBEIROALMEIDA@HOTMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '20/08/1973', '45', '028229271040', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA 931', 'E UDANTE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013296720186070000'], '70000621188': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621188', '54420', 'RODRIGO COSTA OLIVEIRA', 'RODRIGO MANDARIN', '#NULO#', '00762131101', 'ROD3SUL@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '15/04/1988', '30', '020190372097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013305220186070000'], '70000621189': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621189', '54054', 'RODRIGO DIEGO PEREIRA PASSOS TAVARES', 'RODRIGO PASSOS', '#NULO#', '72413549153', 'RODRIGOPASSOSPPL@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '03/09/1984', '34', '017612882089', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '537', 'MOTORISTA PARTICULAR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013313720186070000'], '70000621190': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621190', '54333', 'RONALDE SILVA LINS', 'RONALDE LINS', '#NULO#', '22457895120', 'RONALDE.LINS@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '07/07/1960', '58', '007060972011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013322220186070000'], '70000621191': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621191', '54002', 'TATIANA DA COSTA CORREA LEITE', 'TATIANA LEITE', '#NULO#', '17760320809', 'ELECOES2018PPLDF@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '21/04/1973', '45', '180360810175', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013391420186070000'], '70000621286': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621286', '23456', 'AGNALDO ROMEIRO DE MELO', 'AGNALDO ROMEIRO', '#NULO#', '35781645187', 'AGNALDOROMEIRO.MELO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'GAMA', '12/08/1967', '51', '007680592070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013418120186070000'], '70000621287': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621287', '23023', 'PEDRO IVO SANTANA BORGES DE LIMA', 'PEDRO IVO', '#NULO#', '03295368180', 'PEDROIVO.SBL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '15/03/1992', '26', '021224632038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013642720186070000'], '70000621288': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621288', '23222', 'ALDOVRANDO TELES TORRES', 'ALDOVRANDO TORRES', '#NULO#', '29286760159', 'ALDOVRANDO12@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'SE', '-3', 'ARACAJ ', '24/12/1961', '57', '000356992097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013426620186070000'], '70000621289': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621289', '23711', 'ANDR  LUIZ DE CARVALHO MARTINS', 'ANDR  MARTINS ', '#NULO#', '80425984168', 'ANDRELUIZCM10@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '06/10/1977', '41', '012508312046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013435120186070000'], '70000621290': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621290', '23000', 'CLAUDIO AARON RIBEIRO', 'PROFESSOR AARON', '#NULO#', '33904421115', 'PROFESSORCLAUDIOAARON@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '07/11/1966', '52', '167389110141', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013487320186070000'], '70000621291': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621291', '23001', 'ANTONIO CUST DIO NETO', 'NETO NOROESTE ', '#NULO#', '78000998300', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '28/04/1979', '39', '049327750752', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013452120186070000'], '70000621292': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621292', '23024', 'BERNARDO ISRAEL SANTANA REGO', 'BEB  SANTANA', '#NULO#', '15197522100', 'PPSDF@PPS.ORG.DF', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'MA', '-3', 'BREJO', '17/02/1956', '62', '002625392038', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013460620186070000'], '70000621293': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621293', '23333', 'DANIEL DE SOUSA OLIVEIRA', 'DANIEL RADAR', '#NULO#', '72593083115', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'SANTA MARIA', '07/01/1983', '35', '018620482054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '291', 'OCUPANTE DE CARGO EM COMISS O', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013495820186070000'], '70000621294': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621294', '23512', 'DANIEL TARCISIO DOS SANTOS', '  DANIEL E PRONTO', '#NULO#', '68948220187', 'PPSDF@PPS.ORG.DF', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '07/09/1977', '41', '014226012046', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '531', 'MOTORISTA DE VE CULOS DE TRANSPORTE COLETIVO DE PASSAGEIROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013504320186070000'], '70000621295': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621295', '23300', 'EPIT CIO FARIAS DE BRITTO J NIOR', 'EPIT CIO J NIOR', '#NULO#', '47078626320', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'RS', '-3', 'PORTO ALEGRE', '21/05/1973', '45', '011302092070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013521320186070000'], '70000621296': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621296', '23100', 'FABIANA ARANTES DE ARA JO MENDES', 'PEDIATRA FABIANA', '#NULO#', '04968133669', 'DRAFABIANADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BELO HORIZONTE', '15/06/1981', '37', '136371030256', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013539520186070000'], '70000621297': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621297', '23444', 'FERNANDO ANTONIO PEREIRA GOMIDE', 'FERNANDO GOMIDE', '#NULO#', '18631193100', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'MG', '-3', 'SANTA B RBARA', '10/03/1961', '57', '009088482020', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013548020186070000'], '70000621298': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621298', '23122', 'FRANCISCO EUQUILDES DE ARA JO', 'EUCLIDES PAPIROS', '#NULO#', '11276312172', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'CE', '-3', 'TIANGU ', '15/03/1954', '64', '000353302020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013963220186070000'], '70000621299': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621299', '23111', 'ISAIAS PAIVA RAMOS FILHO', 'ISAIAS FILHO', '#NULO#', '05508444149', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'MA', '-3', 'CAXIAS', '11/12/1951', '67', '002971182062', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013565020186070000'], '70000621300': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621300', '23123', 'JO O CARLOS MOREIRA CORR A', 'JO O CARLOS CORR A', '#NULO#', '79465811734', 'PPSDF@PPS.ORG.BR', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'PA', '-3', 'BEL M', '20/09/1963', '55', '000746612046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06013573520186070000'], '70000621301': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621301', '23423', 'DIEGO RAFAEL BARBOZA AMORIM', 'DIEGO AMORIM', '#NULO#', '02303137101', 'PPSDF@PPS.ORG.BR', '3', 'INAPTO', '14', 'INDEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '04/10/1986', '32', '019509342003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013512820186070000'], '70000621302': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621302', '23180', 'LUCIA DIVINA BARREIRA BESSA MARTINS', 'LUCIA BESSA', '#NULO#', '30512883149', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '27/08/1963', '55', '005032822020', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013582020186070000'], '70000621303': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621303', '23500', 'MANOEL MORAIS DE OLIVEIRA NETO ALEXANDRE', 'PROFESSOR MANOEL MORAIS', '#NULO#', '50656031387', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '28/11/1975', '43', '043311800760', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013590520186070000'], '70000621304': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621304', '23623', 'MARIANA DUARTE DA SILVA', 'MARIANA DUARTE', '#NULO#', '72322870110', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '06/09/1982', '36', '014624642089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013608720186070000'], '70000621305': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621305', '23465', 'OSVALDO RODRIGUES DOS SANTOS', 'OSVALDO RODRIGUES', '#NULO#', '33944970187', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'BA', '-3', 'FORMOSA DO RIO PRETO', '18/07/1965', '53', '000386252011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013634220186070000'], '70000621306': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621306', '23015', 'PEDRO JAKSON ABREU DA SILVA', 'PEDR O', '#NULO#', '22454853191', 'PPSDF@PPS.ORG.DF', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'BA', '-3', 'UAU ', '30/04/1959', '59', '002673542011', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013651220186070000'], '70000621307': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621307', '23777', 'RAFAEL VASCONCELLOS DE ARAUJO PEREIRA', 'RAFAEL VASCONCELLOS', '#NULO#', '71085670163', 'RAFAELVAPEREIRA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '27/01/1981', '37', '015232302011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013669420186070000'], '70000621308': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621308', '23200', 'YURI MAIA GUIMAR ES', 'YURI MAIA', '#NULO#', '00268084122', 'YURIMAIA15@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '10/08/1983', '35', '016570192070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '395', 'BANC RIO E ECONOMI RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013694920186070000'], '70000621309': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621309', '23321', 'ANDYARA BAGATINI DIEGUEZ BARREIRO', 'ANDYARA', '#NULO#', '97382230678', 'ADVOCACIAPREVIDENCIARIA.ADV@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PO O DE CALDAS', '18/01/1973', '45', '126361220230', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013443620186070000'], '70000621310': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621310', '23400', 'CHRISTIANE QUINTILIANO FERNANDES DE BRITO', 'CHRIS QUINTILIANO', '#NULO#', '04764771900', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'PR', '-3', 'LONDRINA', '25/08/1983', '35', '079381650604', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013478820186070000'], '70000621311': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621311', '23555', 'GIORDANA CARNEIRO DO VALE RODRIGUES', 'GIORDADA DO VALE', '#NULO#', '84121050100', 'GIORDANACARNEIRO@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOI NIA', '28/10/1977', '41', '038752371090', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06013556520186070000'], '70000621312': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621312', '23230', 'NERLY FRANCISCA DE LIMA', 'NERLY LIMA', '#NULO#', '09179541810', 'NERLYLIMAPD@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'MS', '-3', 'GARCIAS', '08/08/1967', '51', '014817111902', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013617220186070000'], '70000621313': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621313', '23007', 'NILO ARTHUR ERICSEN FERREIRA', 'NILO ARTHUR', '#NULO#', '66994276104', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '07/06/1974', '44', '011219932097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013625720186070000'], '70000621314': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621314', '23061', 'TATHIANA NOLETO MELO', 'TATHI NOLETO', '#NULO#', '81080093168', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '04/09/1978', '40', '013564042089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013677920186070000'], '70000621315': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000621315', '23345', 'VENERANDA VIEIRA MENDES', 'VEN ', '#NULO#', '22332294104', 'PPSDF@PPS.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'PR', '-3', 'RONDOM ', '15/05/1960', '58', '011383152011', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013686420186070000'], '70000621953': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000621953', '111', 'HELIO QUEIROZ DA SILVA', 'HELIO QUEIROZ', '#NULO#', '64555755120', 'HQBRASILIA@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050385', 'PRA FAZER A DIFEREN A', 'MDB / PP / AVANTE / PSL / PPL', '1', 'BRASILEIRA NATA', 'BA', '-3', 'IBIPEBA', '27/02/1974', '44', '010936362003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013711920186070000'], '70000621954': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000621954', '111', 'MARCOS ANTONIO DOMINGOS', 'MARCOS DOMINGOS', '#NULO#', '25606840120', 'DOMINGOSMARCOS0@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050385', 'PRA FAZER A DIFEREN A', 'MDB / PP / AVANTE / PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'TAGUATINGA', '24/04/1967', '51', '001863222038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '257', 'EMPRES RIO', '-1', '4', 'N O ELEITO', 'N', 'N', '-1', '06013755620186070000'], '70000621955': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000621955', '111', 'M RCIO ANTONIO DA SILVA', 'MARCINHO SILVA', '#NULO#', '21103224620', 'MARCINHOSILVA.15@HOTMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '15', 'MDB', 'MOVIMENTO DEMOCR TICO BRASILEIRO', '70000050385', 'PRA FAZER A DIFEREN A', 'MDB / PP / AVANTE / PSL / PPL', '1', 'BRASILEIRA NATA', 'MG', '-3', 'CAMPINA VERDE', '26/03/1956', '62', '009271682062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '5', 'VI VO(A)', '01', 'BRANCA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06013747120186070000'], '70000621956': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000621956', '544', 'JO O PEDRO FERRAZ DOS PASSOS', 'JO O PEDRO FERRAZ', '#NULO#', '26304635753', 'JPEDRO@FERRAZDOSPASSOS.ABV.BR', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050385', 'PRA FAZER A DIFEREN A', 'MDB / PP / AVANTE / PSL / PPL', '1', 'BRASILEIRA NATA', 'RS', '-3', 'TAPES', '05/06/1952', '66', '001004132011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013720420186070000'], '70000621957': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000621957', '544', 'JOSE ROBERTO RUTKOSKI', 'JOSE ROBERTO RUTKOSKI', '#NULO#', '23330171987', 'DIRETORIA@FIRSTCONSULTORIA.COM.BR', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050385', 'PRA FAZER A DIFEREN A', 'MDB / PP / AVANTE / PSL / PPL', '1', 'BRASILEIRA NATA', 'PR', '-3', 'CURITIBA', '12/09/1954', '64', '030878880680', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '-1', '4', 'N O ELEITO', 'N', 'N', '-1', '06013738620186070000'], '70000621958': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000621958', '544', 'TIAGO TARSIS ADALDO', 'TIAGO', '#NULO#', '01116461110', 'AVANTE.TRE.DF@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '70', 'AVANTE', 'AVANTE', '70000050385', 'PRA FAZER A DIFEREN A', 'MDB / PP / AVANTE / PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '22/09/1986', '32', '019724662070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06013764120186070000'], '70000622457': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622457', '9017', 'CHARLES DE MAGALHAES ARAUJO JUNIOR', 'CORONEL CHARLES MAGALHAES', '#NULO#', '37288105172', 'ALEX@DUARTEEGONTIJO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '20/10/1966', '52', '006984852011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013781120186070000'], '70000622458': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622458', '9033', 'MANOEL PEREIRA XAVIER', 'PASTOR MANOEL', '#NULO#', '25961489191', 'ALEX@DUARTEEGONTIJO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'MG', '-3', 'VAZANTE', '27/01/1963', '56', '005470282054', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013877020186070000'], '70000622459': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622459', '9090', 'HELIO JOSE DA SILVA LIMA', 'H LIO JOS ', '#NULO#', '18540104172', 'ALEX@DUARTEEGONTIJO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'GO', '-3', 'CORUMBA DE GOIAS', '09/03/1960', '58', '013423792070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '101', 'ENGENHEIRO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013816320186070000'], '70000622460': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622460', '9015', 'JOAQUIM DOMINGOS RORIZ NETO', 'JOAQUIM RORIZ', '#NULO#', '01074941160', 'ALEX@DUARTEEGONTIJO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '06/11/1991', '27', '021237852097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013841820186070000'], '70000622461': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622461', '9000', 'NEVITON PEREIRA JUNIOR', 'NEVITON SANGUE BOM', '#NULO#', '47175338104', 'ALEX@DUARTEEGONTIJO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '21/12/1970', '48', '010544772011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013902520186070000'], '70000622462': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622462', '9010', 'LINEUDA FERREIRA DE MELO', 'LINEUDA DA SUSTENTABILIDADE', '#NULO#', '46253491172', 'ALEX@DUARTEEGONTIJO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'PE', '-3', 'PASSIRA', '01/08/1956', '62', '023989322070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013868520186070000'], '70000622463': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622463', '9001', 'MARIA DE FATIMA BRITO VOGT', 'DRA. F TIMA', '#NULO#', '37190091149', 'ALEX@DUARTEEGONTIJO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'BA', '-3', 'ALAGOINHAS', '06/01/1961', '58', '000205682003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '111', 'M DICO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013885520186070000'], '70000622464': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622464', '9006', 'VANESSA CRISTINA CUSTODIA', 'VANESSA GUERRA', '#NULO#', '98854259187', 'ALEX@DUARTEEGONTIJO.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '25/12/1979', '39', '016241332097', '4', 'FEMININO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06013929220186070000'], '70000622465': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622465', '3340', 'CIRO JOS  DE FREITAS', 'CIRO FREITAS', '#NULO#', '30619890134', 'CIROJFREITAS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PAR  DE MINAS', '13/08/1965', '53', '001942062097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013799320186070000'], '70000622466': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622466', '3370', 'ISANIL FRANCISCO GUALBERTO', 'ISANIL', '#NULO#', '53917472104', 'ISANILDJ@GMAIL.COM', '3', 'INAPTO', '13', 'N O CONHECIMENTO DO PEDIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/04/1970', '48', '008002922046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06013824820186070000'], '70000622467': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622467', '3390', 'JOSE EDMAR DE CASTRO CORDEIRO', 'Z  EDMAR', '#NULO#', '03808190159', 'LOPESDEOLIVEIRAADV@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'GO', '-3', 'FORMOSA', '29/10/1951', '67', '002333382046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '5', 'VI VO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014015420186070000'], '70000622468': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622468', '3310', 'JO O BATISTA DE S  E S ', 'JO O S  S ', '#NULO#', '91895677300', 'JOAO2626@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'MA', '-3', 'S O JOAO DOS PATOS', '26/10/1978', '40', '033255771163', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013833320186070000'], '70000622469': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622469', '3333', 'MARIA DE FATIMA DAMASIO ROQUE', 'PASTORA FATIMA ROQUE', '#NULO#', '48384879168', 'FATIMAROQUE@GLOBO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '03/05/1962', '56', '002760692003', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '910', 'SACERDOTE OU MEMBRO DE ORDEM OU SEITA RELIGIOSA', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06013894020186070000'], '70000622470': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622470', '9099', 'TANIA ALVES VIANA PIRES', 'TANIA PIRES', '#NULO#', '70225672120', 'ELEICOESGERAISDF2018@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/06/1977', '41', '014102622054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '390', 'SECRET RIO E DATIL GRAFO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013911020186070000'], '70000622471': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622471', '3535', 'HAMILTON TEIXEIRA DOS SANTOS', 'TATU', '#NULO#', '79359744115', 'TATUHAMILTON@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '13/11/1977', '41', '011758632054', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013807820186070000'], '70000622472': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000622472', '3500', 'JOSE NOGUEIRA DOS SANTOS', 'JOSE NOGUEIRA', '#NULO#', '04286898172', 'JOSENOGUEIRAFEDERAL@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '35', 'PMB', 'PARTIDO DA MULHER BRASILEIRA', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'S O JO O DO MERITI', '09/10/1949', '69', '007187652038', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06013850320186070000'], '70000624319': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624319', '5441', 'DINAIR BARROS DOS SANTOS', 'DINAIR BARROS', '#NULO#', '28496558134', 'FLSFILHO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'MA', '-3', 'BARRA DO CORDA', '05/01/1962', '57', '001591262062', '4', 'FEMININO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014206020186070000'], '70000624320': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624320', '5411', 'EDUARDO ATILA DA SILVA', 'EDU ATILA', '#NULO#', '72482826187', 'DJEDUATILA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '01/07/1981', '37', '016456652038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014214520186070000'], '70000624321': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624321', '5422', 'FRANCISCA MARIA ROCHA SILVA', 'FRANCISCA ROCHA', '#NULO#', '11580305172', 'FRANCISCACAPAUTAS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PARNA BA', '17/09/1956', '62', '003501832038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '02', 'PRETA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014231520186070000'], '70000624322': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624322', '5464', 'VERONICA THEML FIALHO GOULART', 'VERONICA GOULART', '#NULO#', '85966673772', 'VERONICA.GOULART@OUTLOOK.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '07/10/1966', '52', '017498420329', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014318920186070000'], '70000624323': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624323', '5455', 'ETIENO DE SOUSA PEREIRA', 'ETIENO - O AGENTE DA SAUDE', '#NULO#', '00798730145', 'ETIENOSOUSA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/09/1985', '33', '018309762038', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014639420186070000'], '70000624324': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624324', '5400', 'VALDIR DE CASTRO MIRANDA', 'VALDIR MIRANDA', '#NULO#', '02992299200', 'VALDIR.MIRANDA@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'PA', '-3', 'BREVES', '18/06/1956', '62', '001704272038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014300720186070000'], '70000624325': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624325', '5412', 'HENRIQUE ANTONIO RODRIGUES DE OLIVEIRA', 'RICK MARANTZ', '#NULO#', '37698974391', 'RICK-MARANTZ@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PARNAIBA', '02/10/1968', '50', '021291171198', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014249720186070000'], '70000624326': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624326', '5499', 'FLAUZINO ANTUNES NETO', 'FLAUZINO ANTUNES', '#NULO#', '26558623846', 'FLAUZINOANTUNES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'SP', '-3', 'ITAPEVA', '06/07/1977', '41', '233377410175', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014223020186070000'], '70000624327': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624327', '5490', 'ISAAC ANANIAS DA SILVA', 'ISAAC SILVA', '#NULO#', '56140274168', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'GO', '-3', 'CERES', '31/03/1973', '45', '008984852097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014258220186070000'], '70000624328': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624328', '5493', 'JEFERSON MAXIMINO PINTO', 'JEFERSON MAXIMINO', '#NULO#', '47146176134', 'JEFMAXIMINO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '29/08/1972', '46', '010254722020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014266720186070000'], '70000624329': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624329', '5454', 'MARCO ANTONIO TOFETTI CAMPANELLA', 'CAMPANELLA', '#NULO#', '88332870844', 'MATCAMPANELLA@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'SP', '-3', 'BATATAIS', '09/04/1957', '61', '007243772046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '171', 'JORNALISTA E REDATOR', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06014283720186070000'], '70000624330': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624330', '5408', 'MARIA DO SOCORRO ALVES DA ROCHA', 'SOCORRO', '#NULO#', '04815645353', 'ELEICOES2018PPLDF@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'MA', '-3', 'SAO LUIS', '04/11/1947', '71', '010630542062', '4', 'FEMININO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '581', 'DONA DE CASA', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06014292220186070000'], '70000624331': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624331', '5413', 'JOAO DE AQUINO VIEIRA', 'JOAO SEM TERRA', '#NULO#', '37352075100', 'GEORGEMARANHAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '22/11/1961', '57', '004623952097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '601', 'AGRICULTOR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014275220186070000'], '70000624571': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '3', 'GOVERNADOR', '70000624571', '90', 'ELIANA MARIA PASSOS PEDROSA', 'ELIANA PEDROSA', '#NULO#', '11959088149', 'EMERENCIANOEPALOMO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050657', 'JUNTOS DE VOC ', 'PROS / PTB / PHS / PATRI / PMN / PTC / PMB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BICAS', '26/02/1953', '65', '000742282070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '104', 'QU MICO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014413620186070000'], '70000624572': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000624572', '333', 'EVERARDO ALVES RIBEIRO', 'JUIZ EVERARDO RIBEIRO', '#NULO#', '66226597887', 'EVERARDO@GLOBO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050657', 'JUNTOS DE VOC ', 'PROS / PTB / PHS / PATRI / PMN / PTC / PMB', '1', 'BRASILEIRA NATA', 'MG', '-3', 'UNAI', '24/07/1954', '64', '010821622070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '271', 'MAGISTRADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014430620186070000'], '70000624573': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '4', 'VICE-GOVERNADOR', '70000624573', '90', 'ALIRIO DE OLIVEIRA NETO', 'ALIRIO NETO', '#NULO#', '18447546187', 'ALIRP@ALIRIO.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050657', 'JUNTOS DE VOC ', 'PROS / PTB / PHS / PATRI / PMN / PTC / PMB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PIRIPIRI', '26/09/1959', '59', '006685532062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '03', 'PARDA', '131', 'ADVOGADO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06014396620186070000'], '70000624574': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000624574', '333', 'TAKANE KIYOTSUKA DO NASCIMENTO', 'TAKANE', '#NULO#', '29611610106', 'TAKANE@TAKANE.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050657', 'JUNTOS DE VOC ', 'PROS / PTB / PHS / PATRI / PMN / PTC / PMB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '01/08/1963', '55', '004505172046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '232', 'POLICIAL CIVIL', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06014448820186070000'], '70000624575': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000624575', '333', 'ELISEU KADESH ROSA ASSUNCAO', 'ELISEU KADESH', '#NULO#', '89734580191', 'KADESH@KADESH.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050657', 'JUNTOS DE VOC ', 'PROS / PTB / PHS / PATRI / PMN / PTC / PMB', '1', 'BRASILEIRA NATA', 'PI', '-3', 'ESPERANTINA', '14/02/1981', '37', '015266482062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '230', 'PEDAGOGO', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06015418820186070000'], '70000624576': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000624576', '144', 'WALISSON DO NASCIMENTO PERONICO', 'WALISSON NASCIMENTO', '#NULO#', '79386938120', 'WALISSONP1414@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050657', 'JUNTOS DE VOC ', 'PROS / PTB / PHS / PATRI / PMN / PTC / PMB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '14/06/1978', '40', '013542512062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06014457320186070000'], '70000624577': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000624577', '144', 'EURIPEDES GOMES DE MACEDO JUNIOR', 'EURIPEDES JUNIOR', '#NULO#', '65796365134', 'ELEICOESGERAISDF@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050657', 'JUNTOS DE VOC ', 'PROS / PTB / PHS / PATRI / PMN / PTC / PMB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '01/04/1975', '43', '012698852070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06014422120186070000'], '70000624578': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000624578', '144', 'CRISTIAN FERREIRA VIANA', 'CRISTIAN VIANA', '#NULO#', '64613798191', 'CRISTIANFVIANA@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050657', 'JUNTOS DE VOC ', 'PROS / PTB / PHS / PATRI / PMN / PTC / PMB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '04/06/1977', '41', '012963852020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '131', 'ADVOGADO', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06014405120186070000'], '70000624613': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624613', '1456', 'IZAIAS SOARES PEREIRA', 'TODI MORENO', '#NULO#', '64668665134', 'FALECOMTODIMORENO@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '15/06/1972', '46', '010116122054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014535020186070000'], '70000624614': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624614', '1414', 'JURACI PESSOA DE CARVALHO', 'JURACI TESOURA DE OURO', '#NULO#', '17220521391', 'KLEBERNSOUSA@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '12/12/1960', '58', '005412242020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014543520186070000'], '70000624615': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624615', '1400', 'MAURO ROGERIO GOMES PESSANHA', 'MAURO ROGERIO', '#NULO#', '00339195770', 'MOVIMENTOBRASILFUTURO@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '04/03/1970', '48', '016323061686', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014578720186070000'], '70000624616': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624616', '1444', 'MIGUEL LUCENA FILHO', 'MIGUEL LUCENA', '#NULO#', '45147256415', 'MIGUELLUCENA.FILHO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'PB', '-3', 'PRINCESA ISABEL', '05/03/1966', '52', '069612770531', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014587220186070000'], '70000624617': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624617', '5151', 'PAULO FERNANDO MELO DA COSTA', 'PAULO FERNANDO', '#NULO#', '27972380104', 'DF@PATRIOTA51.ORG.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '11/06/1967', '51', '000329042054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014604220186070000'], '70000624618': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624618', '3100', 'CHARLES ROBERTO DE LIMA', 'DR. CHARLES', '#NULO#', '11309776172', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'MG', '-3', 'MONTE CARMELO', '21/08/1955', '63', '001324292020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '111', 'M DICO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014474320186070000'], '70000624619': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624619', '3131', 'FL VIO WERNECK MENEGUELLI', 'FL VIO WERNECK', '#NULO#', '03953461699', 'AGENDAFLAVIOWERNECK@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'MG', '-3', 'JUIZ DE FORA', '09/04/1976', '42', '112165910256', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014509520186070000'], '70000624620': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624620', '3199', 'MARIA DA CONSOLA  O FERREIRA DA PONTE LIMA', 'BISPA CONSOLA  O', '#NULO#', '32716265100', 'MISSIONARIACONSOLA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'CE', '-3', 'SOBRAL', '12/10/1963', '55', '004932832089', '4', 'FEMININO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '910', 'SACERDOTE OU MEMBRO DE ORDEM OU SEITA RELIGIOSA', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014560520186070000'], '70000624621': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624621', '3636', 'ELIOMAR RODRIGUES DE SOUZA', 'SARGENTO ELIOMAR RODRIGUES', '#NULO#', '53868242104', 'COMUNICACAO.PTCDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '31/01/1971', '48', '008315322097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014482820186070000'], '70000624622': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624622', '3600', 'GEORGIOS STAIKOS TZEMOS', 'GEORGIOS', '#NULO#', '41062787153', 'GREGOTZEMOS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '25/06/1967', '51', '000379912038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014518020186070000'], '70000624623': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624623', '3663', 'GERARDO ALVES LIMA FILHO', 'PROFESSOR GERARDO', '#NULO#', '81714220559', 'GERARDOALVESLIMAFILHO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '24/08/1981', '37', '096286090515', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014526520186070000'], '70000624624': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624624', '3635', 'LURI SAEKI', 'LURI SAEKI', '#NULO#', '00608452874', 'LURISAEKI@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'SP', '-3', 'SANTA F  DO SUL', '16/06/1954', '64', '002011862070', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '04', 'AMARELA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014552020186070000'], '70000624625': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624625', '3617', 'NAIARA LOUREN O', 'NAIARA LOUREN O', '#NULO#', '55612903120', 'NAIARAPRODUTORA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '09/06/1971', '47', '007583752038', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014595720186070000'], '70000624626': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624626', '3677', 'SAMIA WALESKA PEREIRA BARBOSA DE CARVALHO', 'SAMIA WALESKA', '#NULO#', '32166745334', 'SAMIACARVALHO77@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '26/09/1966', '52', '023693910760', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015375120186070000'], '70000624627': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624627', '1421', 'FLAVIO CORREIA DE SOUSA', 'FLAVIO CORREIA', '#NULO#', '10256741115', 'FLAVIO_COR@HOTMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '15/08/1952', '66', '002274082062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '101', 'ENGENHEIRO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014491320186070000'], '70000624628': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000624628', '1490', 'SIMONE AZEVEDO DOS SANTOS NEVES', 'SIMONE AZEVEDO', '#NULO#', '84474866134', 'SIMONEEAZEVEDO@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '14', 'PTB', 'PARTIDO TRABALHISTA BRASILEIRO', '70000050659', 'RENOVAR DF', 'PTB / PHS / PTC / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '05/05/1976', '42', '012507082038', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014612720186070000'], '70000625515': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000625515', '456', 'IZALCI LUCAS FERREIRA', 'IZALCI', '#NULO#', '06801480197', 'EMERENCIANOEPALOMO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050689', 'CORAGEM E RESPEITO PELO POVO', 'PR / PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'ARAUJOS', '07/04/1956', '62', '006274332011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '1', 'ELEITO', 'N', 'S', '-1', '06014690420186070000'], '70000625516': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '3', 'GOVERNADOR', '70000625516', '25', 'JO O ALBERTO FRAGA SILVA', 'ALBERTO FRAGA', '#NULO#', '11939141168', 'DEPUTADOFRAGA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050689', 'CORAGEM E RESPEITO PELO POVO', 'PR / PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'SE', '-3', 'EST NCIA', '02/06/1956', '62', '007235102003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014708620186070000'], '70000625517': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '4', 'VICE-GOVERNADOR', '70000625517', '25', 'ALEXANDRE FERREIRA BISPO DE OLIVEIRA', 'ALEXANDRE BISPO', '#NULO#', '63612240153', 'ALEXANDREBISPODFMELHOR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050689', 'CORAGEM E RESPEITO PELO POVO', 'PR / PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '05/08/1974', '44', '014619182003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '121', 'ECONOMISTA', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06014656420186070000'], '70000625518': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000625518', '222', 'AMABILE APARECIDA PACIOS DE ANDRADE', 'PROFESSORA AM BILE', '#NULO#', '67011390863', 'AMABILE@COLEGIODROMOS.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050689', 'CORAGEM E RESPEITO PELO POVO', 'PR / PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'SP', '-3', 'DSO PSULO', '29/01/1955', '64', '001270862097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014664920186070000'], '70000625519': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000625519', '456', 'ANDRE FELIPE DE OLIVEIRA DA SILVA', 'ANDRE FILIPE', '#NULO#', '98735519720', 'AFAS2100@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050689', 'CORAGEM E RESPEITO PELO POVO', 'PR / PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '04/06/1968', '50', '070286080361', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '-1', '1', 'ELEITO', 'N', 'S', '-1', '06014673420186070000'], '70000625520': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000625520', '456', 'LUIS FELIPE BELMONTE DOS SANTOS', 'LUIS FELIPE BELMONTE', '#NULO#', '11552050149', 'LFBELMONTE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050689', 'CORAGEM E RESPEITO PELO POVO', 'PR / PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'RS', '-3', 'SANTA CRUZ DO SUL', '01/08/1953', '65', '000820882011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '-1', '1', 'ELEITO', 'N', 'S', '-1', '06014717120186070000'], '70000625521': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000625521', '222', 'FRANCISCO JOS  DE OLIVEIRA FERRAZ', 'FRANCISCO FERRAZ', '#NULO#', '08705470110', 'FRANCISCOFERRAZ@FERRAZ.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050689', 'CORAGEM E RESPEITO PELO POVO', 'PR / PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'PARNA BA', '19/12/1952', '66', '001179132062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06014681920186070000'], '70000625522': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000625522', '222', 'MARIA DE LOURDES WERNECK', 'LOURDINHA WERNECK', '#NULO#', '01068199687', 'MDELWERNECK@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050689', 'CORAGEM E RESPEITO PELO POVO', 'PR / PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'DIVIN POLIS', '31/12/1941', '77', '000309382097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06014725620186070000'], '70000625523': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625523', '4548', 'ANDR IA MOURA ZEMUNER', 'ANDR IA MOURA', '#NULO#', '95511946915', 'AZEMUNER@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'PR', '-3', 'ALTO PIQUIRI', '06/05/1974', '44', '014926991872', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06014742620186070000'], '70000625524': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625524', '4545', 'CLAUDIA AIRES BARBOSA RIBEIRO', 'CLAUDINHA DA SA DE', '#NULO#', '99866161153', 'CLAUDIAAIRES2011@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'TO', '-3', 'FORMOSO ARAGUAIA', '21/04/1982', '36', '042909951031', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '03', 'PARDA', '243', 'T CNICO DE ENFERMAGEM E ASSEMELHADOS (EXCETO ENFERMEIRO)', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06014751120186070000'], '70000625525': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625525', '4555', 'LEANDRO NARDY DE ALMEIDA', 'LEANDRO NARDY', '#NULO#', '02593461608', 'ALMEIDANARDY@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'MG', '-3', 'JUIZ DE FORA', '23/03/1975', '43', '099230010213', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06014820320186070000'], '70000625526': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625526', '4510', 'LEONARDO SILVA BORGES', 'SEU GABINETE', '#NULO#', '00873973151', 'LEOBWF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '13/02/1990', '28', '020195622011', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06014838520186070000'], '70000625527': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625527', '4515', 'PAULO ROBERTO RORIZ', 'PAULO RORIZ', '#NULO#', '16795733149', 'PAULORORIZ4515@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'GO', '-3', 'LUZI NIA', '20/08/1958', '60', '011714852097', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06014864020186070000'], '70000625528': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625528', '2200', 'FLAVIA CAROLINA PERES', 'FLAVIA ARRUDA', '#NULO#', '85773875187', 'EPADVOCACIA@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '21/01/1980', '39', '013330022003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '2', 'ELEITO POR QP', 'N', 'S', '-1', '06014777820186070000'], '70000625529': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625529', '2277', 'FRANCISCO LUCIO PEREIRA FILHO', 'FRANCISCO LUCIO', '#NULO#', '63573849172', 'FLUCIOPF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'SP', '-3', 'CAMPINAS', '01/09/1972', '46', '008453612062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06014786320186070000'], '70000625530': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625530', '2215', 'JUSTINO CARVALHO DA SILVA', 'JUSTINO CARVALHO', '#NULO#', '03385493153', 'JOTATIPO@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'PE', '-3', 'FLORESTA', '19/07/1940', '78', '000202302046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06014803320186070000'], '70000625531': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625531', '2222', 'LAERTE RODRIGUES DE BESSA', 'LAERTE BESSA', '#NULO#', '09511172115', 'LIARAGOMES.ADV@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIANIA', '01/05/1954', '64', '011375292097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '277', 'DEPUTADO', '0', '5', 'SUPLENTE', 'S', 'S', '-1', '06014811820186070000'], '70000625532': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625532', '2233', 'RAQUEL COSTA RIBEIRO', 'DRA. RAQUEL COSTA RIBEIRO', '#NULO#', '34404643187', 'CONTATO@RAQUELCOSTARIBEIRO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'MG', '-3', 'MONTE CARMELO', '15/07/1966', '52', '007835152097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06014872520186070000'], '70000625533': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625533', '2555', 'LUIS CLAUDIO FERNANDES MIRANDA', 'LUIS MIRANDA', '#NULO#', '90218647115', 'MIRANDA@GIFFSWORD.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '27/03/1980', '38', '014085462011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '3', 'ELEITO POR M DIA', 'N', 'S', '-1', '06014847020186070000'], '70000625534': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625534', '2500', 'VIRNA MARIA SMITH SOARES DUTRA', 'VIRNA SMITH', '#NULO#', '24521531172', 'VIRNASMITH@UOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '08/09/1970', '48', '007562672054', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06014881020186070000'], '70000625535': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625535', '2525', 'WELLINGTON CORSINO DO NASCIMENTO', 'CORONEL WELLINGTON', '#NULO#', '09471707404', 'WELLCORSIN@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'RN', '-3', 'NATAL', '08/12/1951', '67', '000569542020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '921', 'MILITAR REFORMADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06014899220186070000'], '70000625536': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625536', '4500', 'EDUARDO ANTONIO RODRIGUES', 'DUDA RODRIGUES', '#NULO#', '60638729149', 'EDUARDORODRIGUESCORRETOR@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '18/07/1973', '45', '014188572003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '4 ', 'CORR OR DE IM VEIS  SEGUROS  T TULOS E VALORES', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06014769320186070000'], '70000625537': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625537', '4550', 'MARCELO ALVES ENEAS DANTAS', 'MARCELO TIGRE', '#NULO#', '83881328491', 'MARCELOTIGRE.2@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'RN', '-3', 'NATAL', '05/02/1973', '45', '015071051678', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06014855520186070000'], '70000625538': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000625538', '4590', 'HERLAN INACIO DE MOURA', 'SARGENTO HERLAN', '#NULO#', '37282522120', 'HERLANINACIO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOI NIA', '28/04/1967', '51', '005235232054', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06014794820186070000'], '70000625595': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625595', '45352', 'M NICA DA SILVA ALVARES', 'M NICA ALVARES', '#NULO#', '70368562620', 'MONICASILVAALVARES@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BELO HORIZONTE', '01/12/1966', '52', '032226670256', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '132', 'PSIC LOGO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015184520186070000'], '70000625596': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625596', '45345', 'CLEISON MEDAS DUVAL', 'CLEISON DUVAL', '#NULO#', '55184740678', 'CLEISONMDUVAL@ICLOUD.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'CORONEL FABRICIANO', '03/09/1965', '53', '010901312003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '101', 'ENGENHEIRO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014950220186070000'], '70000625597': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625597', '45777', 'EDSON FERREIRA COSTA', 'IRM O GL RIA A DEUS', '#NULO#', '46253807315', 'IRMAOEDSON@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '30/11/1973', '45', '016222562038', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014976920186070000'], '70000625598': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625598', '45123', 'EROTIDES SOUZA DE ALMEIDA JUNIOR', 'JUNIOR ALMEIDA', '#NULO#', '55794220163', 'JRDF2011@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '29/12/1972', '46', '014840242038', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015383620186070000'], '70000625599': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625599', '45678', 'FLAVIO JOS  BARBOSA DE ALENCASTRO', 'FLAVIO ALENCASTRO', '#NULO#', '30986052191', 'FLAVIO1ALENCASTRO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PE', '-3', 'RECIFE', '26/01/1962', '56', '000301032054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014993920186070000'], '70000625600': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625600', '45233', 'L CIA MARIA DE OLIVEIRA F LIX', 'L CIA F LIX', '#NULO#', '15396860197', 'LMOF23AM@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'S O JO O DEL REI', '23/12/1958', '60', '000410762046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015115320186070000'], '70000625601': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625601', '45456', 'MARCO ANTONIO ELIAS DE ALMEIDA', 'DEPUTADO M E', '#NULO#', '85879193187', 'MARCBUGRE@BOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '04/09/1978', '40', '013672792070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015159020186070000'], '70000625602': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625602', '45555', 'DIEGO LUIZ DE SOUSA ARRUDA', 'DIEGO ARRUDA', '#NULO#', '87979977149', 'DIEGOARRUDABSB@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PB', '-3', 'JO O PESSOA', '03/10/1979', '39', '014287282054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014968420186070000'], '70000625603': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625603', '45000', 'ROBINSON NOGUEIRA BARROSO PAIS', 'PROFESSOR ROBINSON PAIS', '#NULO#', '80603440134', 'ROBINSON.PAIS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '19/01/1977', '41', '011395942003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015245220186070000'], '70000625604': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625604', '45045', 'NOEMI ALVES BARUZZI', 'NOEMI BARUZZI', '#NULO#', '16159730444', 'NOBARUZZI@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PB', '-3', 'JO O PESSOA', '27/02/1957', '61', '014751192046', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015201520186070000'], '70000625605': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625605', '45190', 'FRANCISCO DE ASSIS FERNANDES DOS SANTOS', 'ASSIS FERNANDES', '#NULO#', '38186560106', 'MENDESDJDIEGO2009@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'BARRA', '04/10/1968', '50', '009001282003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015002420186070000'], '70000625606': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625606', '45789', 'JOSE FERREIRA DE SOUSA FILHO', 'O FISCAL DE BRAS LIA', '#NULO#', '66584582353', 'FERREIRA.JFILHO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'VALEN A DO PIAU ', '27/01/1979', '39', '024575221546', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015071620186070000'], '70000625607': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625607', '45007', 'JAQUELINE CHAGAS DE OLIVEIRA', 'KELLYNHA ESTRUTURAL', '#NULO#', '00136710140', 'KELLYBEAUTY5.0@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '05/01/1983', '35', '017539672062', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015063120186070000'], '70000625608': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625608', '45222', 'MARISMAR REIS DA SILVA', 'MARA DE TODOS', '#NULO#', '22497439168', 'MARADETODOS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'MA', '-3', 'ALTO PARNAIBA', '06/05/1961', '57', '022730250574', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015176020186070000'], '70000625609': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625609', '45488', 'RICHARD DA SILVA BANHARA', 'RICHARD BANHARA', '#NULO#', '02269898109', 'RICHARDBANHARA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'S O RAIMUNDO NONATO', '08/07/1995', '23', '023918232038', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015228220186070000'], '70000625610': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625610', '45221', 'ELAYNE TIAGO DE QUEIROZ', 'ELAYNE TIAGO', '#NULO#', '56397780163', 'ELAYNETQ@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'TAGUATINGA', '06/06/1974', '44', '011277602020', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014985420186070000'], '70000625611': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625611', '45444', 'ANTONIO MONTEIRO DOS SANTOS', 'DR. ANTONIO MONTEIRO', '#NULO#', '05703565120', 'IIMPAZINSTITUTO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PARACATU', '29/05/1952', '66', '000200572836', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '132', 'PSIC LOGO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014933220186070000'], '70000625612': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625612', '45017', 'FREDERICO ROSSI DOS SANTOS', 'ROSSI', '#NULO#', '86211315104', 'ROSSIJONES5@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '09/04/1980', '38', '014081052097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015010920186070000'], '70000625613': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625613', '45888', 'RODRIGO GUSTAVO SCARPA', 'RODRIGO SCARPA', '#NULO#', '04282535121', 'RODRIGOGSCARPA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '03/02/1995', '23', '023341372089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '101', 'ENGENHEIRO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015253720186070000'], '70000625614': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625614', '45600', 'N GELA MARIA GON ALVES DOS SANTOS', 'N GELA MARIA', '#NULO#', '61089710100', 'NAGELAMARIAOFICIAL@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PR', '-3', 'CRUZEIRO DO OESTE', '24/07/1953', '65', '008890501414', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015193020186070000'], '70000625615': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625615', '27123', 'WESLEY MOURA E SILVA', 'WESLEY MOURA', '#NULO#', '70281416168', 'WESLEYLG@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '19/05/1980', '38', '016449122062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '124', 'CONTADOR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015366620186070000'], '70000625616': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625616', '25025', 'ADAO FRANCISCO ITACARAMBY', 'O PAPAI CHEGOU', '#NULO#', '06950618875', 'ADAOITACARAMBY@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'ANGICAL', '27/07/1964', '54', '069754380116', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '303', 'GERENTE', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014916220186070000'], '70000625617': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625617', '25525', 'ALINE DE CARVALHO MARTINS REIS', 'ALINE', '#NULO#', '02876096773', 'ALINEADV2017@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '02/01/1970', '48', '083695070396', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06014924720186070000'], '70000625618': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625618', '25100', 'AURINDO PEREIRA DA SILVA', 'AURINDO SILVA', '#NULO#', '48466832572', 'AURINDO.SILVA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'CORIBE', '07/05/1972', '46', '010410452070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06014941720186070000'], '70000625619': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625619', '25190', 'JOSE FRANCISCO DE LIMA NETO', 'LIMA NETO', '#NULO#', '29155193153', 'PR_JOSEFRANCISCO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'RN', '-3', 'S O MIGUEL', '04/01/1965', '53', '008334982062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '921', 'MILITAR REFORMADO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015400620186070000'], '70000625620': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625620', '25777', 'LUCIA ALVES DE SOUZA', 'LUCINHA DA SA DE', '#NULO#', '24020214115', 'EDVALDO.LUCIA.2012@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'GOVERNADOR VALADARES', '18/04/1962', '56', '003112162003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '113', 'ENFERMEIRO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015106820186070000'], '70000625621': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625621', '25013', 'MARCELO FREITAS FEITOSA', 'MARCELO X', '#NULO#', '42056691272', 'MARCELOFEITOSAUBER@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'RR', '-3', 'PORTO VELHO', '20/03/1972', '46', '005551962305', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '537', 'MOTORISTA PARTICULAR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015132320186070000'], '70000625622': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625622', '25555', 'MARCIO FERNANDES AZENHA DA SILVA', 'LORD AZENHA', '#NULO#', '71377557120', 'MARCIOAZENHAV8@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '03/04/1981', '37', '016486612070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015140820186070000'], '70000625623': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625623', '25125', 'MARIA DERMINDA DA SILVA PEREIRA', 'DED ', '#NULO#', '15319563191', 'DERMINDAPEREIRA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PATOS DE MINAS', '02/10/1954', '64', '006574012070', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015167520186070000'], '70000625624': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625624', '25123', 'ROMMEINE SANTOS DE ANDRADE', 'ROMMEINE', '#NULO#', '91784859168', 'ROMMEINE@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '03/06/1981', '37', '015937082097', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '397', 'RECEPCIONISTA', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015270720186070000'], '70000625625': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625625', '25001', 'SAMUEL LEANDRO DE OLIVEIRA NETO', 'SAMUEL LEANDRO', '#NULO#', '53971884172', 'SAMUELLEANDRO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '17/08/1972', '46', '008009412046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '258', 'BOMBEIRO MILITAR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015297420186070000'], '70000625626': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625626', '25825', 'SIMONE CASTELO BRANCO CAVALCANTI', 'SIMONE CASTELO BRANCO', '#NULO#', '64591166104', 'SIMONECBC2@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'SP', '-3', 'MOGI DAS CRUZES', '18/11/1973', '45', '011226942038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '514', 'ESTETICISTA', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015314420186070000'], '70000625627': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625627', '25252', 'UZIAS DOS SANTOS DE MATOS', 'UZIAS MATOS', '#NULO#', '00992413150', 'UZIAS.S.MATOS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'GO', '-3', 'ITAPURANGA', '27/12/1983', '35', '045665891031', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015322920186070000'], '70000625628': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625628', '25200', 'VALDEMAR SILVA DE SOUSA', 'DJAVAN', '#NULO#', '37958224168', 'DJAVANDF@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TERESINA', '02/12/1963', '55', '007042552089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '7', 'SEPARADO(A) JUDICIALMENTE', '03', 'PARDA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015331420186070000'], '70000625629': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625629', '25000', 'WALTER MARCELO DOS SANTOS', 'WALTER MARCELO', '#NULO#', '69906394153', 'WALTERNEGAO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '25', 'DEM', 'DEMOCRATAS', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '23/12/1978', '40', '014026112020', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015358120186070000'], '70000625630': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625630', '45100', 'RAAD MASSOUH JUNIOR', 'RAAD JR.', '#NULO#', '01986822125', 'RAADJUNIOR100@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '14/02/1997', '21', '024913232054', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '04', 'AMARELA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015219720186070000'], '70000625631': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625631', '45133', 'JOSE NETO FIGUEIREDO PARANAGUA', 'PASTOR FIGUEIREDO PARANAGU ', '#NULO#', '11731974191', 'FIGUEIREDOPARANAGUA@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'TO', '-3', 'ARAGUAINA', '07/12/1958', '60', '014020952054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '171', 'JORNALISTA E REDATOR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015089820186070000'], '70000625632': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625632', '45333', 'LUCIMARA SOARES FAGUNDES', 'LUCIMARA FAGUNDES', '#NULO#', '00606877118', 'LUCIMARAFAGUNDES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '16/09/1983', '35', '018186912020', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '163', 'CANTOR E COMPOSITOR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015123820186070000'], '70000625633': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625633', '45001', 'HELCIMAR EVANGELISTA DA SILVA', 'PROFESSORA HELCIMAR', '#NULO#', '95802371153', 'EVANGELISTAHELCIMAR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '12/10/1981', '37', '014873612038', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '265', 'PROFESSOR DE ENSINO FUNDAMENTAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015029120186070000'], '70000625634': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625634', '45015', 'SAULO COSTA DE JESUS', 'SAULO COSTA', '#NULO#', '00868470155', 'SAUCJ86@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'SAMAMBAIA NORTE', '04/08/1986', '32', '020178182020', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015305920186070000'], '70000625635': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625635', '27001', 'IRENE TEODORO MOREIRA DE MORAIS', 'IRENE', '#NULO#', '15090264104', 'IRENETEODORO10@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'SP', '-3', 'PONTAL', '05/04/1948', '70', '004110782011', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '113', 'ENFERMEIRO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015037620186070000'], '70000625636': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625636', '27777', 'IVAN CANDIDO DE MORAES', 'PROFESSOR IVAN MORAES', '#NULO#', '92902332068', 'DEUSNAOSECANSA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PR', '-3', 'COLORADO', '19/04/1975', '43', '057549430655', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015046120186070000'], '70000625637': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625637', '27789', 'IVANI APARECIDA BERNARDINA DA SILVA', 'IVANI FERREIRA', '#NULO#', '82284512100', 'IVANIABS577@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '29/09/1977', '41', '010862112003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015054620186070000'], '70000625638': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625638', '27277', 'KALEBE CARLOS PIMENTEL DE OLIVEIRA', 'KALEBE', '#NULO#', '04840162107', 'KALEBE.CARLOS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '25/01/1997', '21', '024449522003', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015098320186070000'], '70000625639': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625639', '27444', 'ROBERT JOSE MIRANDA LIMA', 'PROFESSOR ROBERT', '#NULO#', '11699388172', 'ROBERT27444@BOL.COM.BR', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TEREZINA', '23/03/1958', '60', '004073522054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '266', 'PROFESSOR DE ENSINO M DIO', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06015236720186070000'], '70000625640': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625640', '27234', 'ROGERIO VIEIRA DA SILVA', 'ROGERIO VIEIRA', '#NULO#', '58399895172', 'DCELEICOES2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '26/06/1973', '45', '010687192003', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '394', 'AUXILIAR DE ESCRIT RIO E ASSEMELHADOS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015262220186070000'], '70000625641': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625641', '27127', 'RONALDO PEREIRA DE ARAUJO', 'RONALDO', '#NULO#', '86898000187', 'RONALDOHEYME@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'ANGICAL', '14/08/1977', '41', '033581651074', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015288920186070000'], '70000625642': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000625642', '27888', 'VINICIUS AVELINO SAMPAIO OLIVEIRA', 'VINICIUS', '#NULO#', '60564466115', 'VINICIUSASO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '21/01/1972', '46', '030220831015', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015349620186070000'], '70000627341': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627341', '2727', 'VIRGILIO MACEDO DE SOUZA', 'PROFESSOR VIRGILIO', '#NULO#', '17626340400', 'VMACEDO@BOL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'PB', '-3', 'JO O PESSOA', '29/09/1954', '64', '013014092097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015609420186070000'], '70000627342': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627342', '2700', 'CARLOS ALBERTO NUNES DA CUNHA', 'CARL O', '#NULO#', '45965005768', 'CARLOSNUNES.CORRETOR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '12/07/1955', '63', '014344392046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '403', 'COR TOR DE   VEIS  SEGUROS  T TULOS E VALORES', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015488020186070000'], '70000627343': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627343', '2799', 'FRANCISCO JOAO PINTO DA SILVA', 'JO O TERRA', '#NULO#', '24097055372', 'SJOAOTERRA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'VALEN A', '28/06/1965', '53', '004250411597', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '292', 'AGENTE ADMINISTRATIVO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015505020186070000'], '70000627344': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627344', '2756', 'MAICON CARVALHO COSTA', 'MAICON CARVALHO', '#NULO#', '00833943111', 'MAICON.WDN@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '19/05/1986', '32', '019286702089', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '537', 'MOTORISTA PARTICULAR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015557220186070000'], '70000627345': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627345', '2712', 'GILSON FERREIRA DE LIMA', 'GILSON FERREIRA', '#NULO#', '35875224134', 'GILSON_JUIZ@HOTMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILISA', '27/09/1969', '49', '039714421007', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '531', 'MOTORISTA DE VE CULOS DE TRANSPORTE COLETIVO DE PASSAGEIROS', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06015513520186070000'], '70000627346': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627346', '2710', 'JOSIVALDO FEITOSA DA SILVA', 'JOSIVALDO FEITOSA', '#NULO#', '37393251434', 'JOSIVALDOFEITOSA.SILVA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'PB', '-3', 'MONTEIRO', '03/04/1965', '53', '003368212011', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015530520186070000'], '70000627347': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627347', '2740', 'RODGER ROBERTO ALVES DE SOUSA', 'RODGER DO GRUPO DE EMPREGOS', '#NULO#', '95839860115', 'RODGERSOUSA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '17/03/1982', '36', '017960022097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '403', 'CORRE R DE IM EIS  SEGUROS  T TULOS E VALORES', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015591220186070000'], '70000627348': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627348', '2792', 'JOEL OLIVEIRA AMARAL', 'AMARAL', '#NULO#', '29920140791', 'JAMARAL0752@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '07/01/1952', '67', '016021172070', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '921', 'MILITAR REFORMADO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015522020186070000'], '70000627349': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627349', '2706', 'FLAVIO PIKANA LEMOS', 'FLAVIO PIKANA', '#NULO#', '78897912834', 'SOMELF34@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'RS', '-3', 'PORTO ALEGRE', '29/05/1956', '62', '000540972089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '295', 'MEMBRO DAS FOR AS ARMADAS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015496520186070000'], '70000627350': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627350', '2728', 'NILSON DA SILVA PIRES', 'NILSON PIRES', '#NULO#', '11887702172', 'NILSONPIRES@HOTMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'GO', '-3', 'CRISTALINA', '29/07/1957', '61', '007210862089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '124', 'CONTADOR', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06015582720186070000'], '70000627351': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627351', '2772', 'FELLIPE PASSOS DOS SANTOS', 'FELLIPE PASSOS', '#NULO#', '04994720126', 'JUSCELIA14@YAHOO.COPM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'TO', '-3', 'BRASILIA', '01/04/1996', '22', '024010542054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06016068320186070000'], '70000627352': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627352', '2789', 'MARIA DENISE LINS PERCIANO', 'DENISE', '#NULO#', '44330227134', 'DENISE.PERCIANO@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '14/01/1968', '51', '001867562038', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015565720186070000'], '70000627353': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627353', '2714', 'JUSCELIA LUISA DE OLIVEIRA', 'JUSCELIA', '#NULO#', '41811550134', 'JUSCELIA14@YAHOO.COM.BR', '3', 'INAPTO', '14', 'INDEFERIDO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'RIO POMBA', '14/04/1964', '54', '010925612097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015548720186070000'], '70000627354': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000627354', '2711', 'MARIA DO SOCORRO SILVA', 'SOCORRO', '#NULO#', '34299360397', 'SECREATARIABRASILIA@DEMOCRACIACRISTA.ORG.BR', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'TEREZINA', '06/04/1967', '51', '009775152038', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06015574220186070000'], '70000627426': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627426', '20333', 'ANTONIO JOSE LEMOS LACERDA', 'BAIANO TEM', '#NULO#', '11972572172', 'DEPUTADOTOTADF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'S O GON ALO DOS CAMPOS', '11/01/1954', '64', '006947121031', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '02', 'PRETA', '402', 'V DEDOR PRACIST  REPRESENTANTE  CAIXEIRO-VIAJANTE E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015634920186070000'], '70000627427': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627427', '20555', 'BELAISIO DE QUEIROZ SANTOS', 'BELLO PIL O DE OURO', '#NULO#', '75391031591', 'BELLOQUEIROZ@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'ACUDINA', '14/05/1975', '43', '071011380523', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '411', 'VENDEDOR DE COM RCIO VAREJISTA E ATACADISTA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016059820186070000'], '70000627428': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627428', '20190', 'CHRISTIANA INOCENCIO', 'CHRISTIANA INOCENCIO', '#NULO#', '58524347104', 'CHRISVOLEI38@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '18/11/1971', '47', '010349492097', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015643420186070000'], '70000627429': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627429', '20070', 'CIVALDO MARQUES REBOU AS', 'CIVALDO REBOU AS', '#NULO#', '17967830130', 'CIVALDOREBOUCAS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SANTANA', '07/03/1960', '58', '005457952054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015651920186070000'], '70000627430': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627430', '20123', 'DANIEL DE CASTRO SOUSA', 'PASTOR DANIEL DE CASTRO', '#NULO#', '37342649104', 'DANIELCASTRO11@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'CE', '-3', 'ITAPIPOCA', '23/10/1967', '51', '000998472089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015660420186070000'], '70000627431': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627431', '20200', 'DANIEL RIBEIRO LEMOS', 'DANIEL LEMOS', '#NULO#', '00108074625', 'DANIELRLEMOS20@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'BOTELHOS', '13/03/1978', '40', '111089520221', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015678620186070000'], '70000627432': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627432', '20747', 'EDENUDES DE CASSIA SOARES DA CUNHA', 'EDENUDES DE CASSIA', '#NULO#', '24814814100', 'EDENUDES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'GRAO-MOGOL', '07/01/1960', '58', '002787742011', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '5', 'VI VO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015687120186070000'], '70000627433': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627433', '20456', 'EDGARD ROGERIO DE SIQUEIRA VASCONCELOS', 'PROFESSOR EDGARD', '#NULO#', '64568466172', 'PROFESSOREDGARD2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '10/01/1974', '44', '010612402089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015695620186070000'], '70000627434': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627434', '20222', 'EDSON RICARDO ISAIAS DO CARMO', 'RICARDO PATO', '#NULO#', '32721463187', 'RICARDOPATO11@HOTMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'UBERLANDIA', '21/10/1965', '53', '009103882003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06015704120186070000'], '70000627435': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627435', '20002', 'EDUARDO VON SOHSTEN CHAGAS', 'EDUARDO VON', '#NULO#', '31352359120', 'EDUARDOVON@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'PE', '-3', 'RECIFE', '12/06/1964', '54', '006989332003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '403', 'CORRE R DE IM EIS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015712620186070000'], '70000627436': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627436', '20144', 'EZEQUIAS PEREIRA DA SILVA', 'EZEQUIAS PEREIRA', '#NULO#', '35779462100', 'ZACALU@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/04/1969', '49', '007807562020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015721120186070000'], '70000627437': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627437', '20300', 'FERNANDO DA COSTA COELHO', 'FERNANDO SERVO', '#NULO#', '00925982180', 'F-COSTA-COELHO@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'SOBRADINHO', '30/12/1984', '34', '017434282097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015739320186070000'], '70000627438': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627438', '20777', 'GUSTAVO RENAN MIRANDA ALVES', 'GUSTAVO MIRANDA', '#NULO#', '72661500197', 'GUSTAVO@GIMOVEISDF.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '08/07/1982', '36', '018534682062', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '403', 'CORRETO DE IM  IS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015747820186070000'], '70000627439': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627439', '20015', 'HENRIQUE DO ESPIRITO SANTO PASSOS', 'HENRIQUE PASSOS', '#NULO#', '05924139182', 'CONTATO@HENRIQUEPASSOS.NET', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '12/10/1995', '23', '062457091082', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015756320186070000'], '70000627440': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627440', '20001', 'HENRIQUE NELSON DA CUNHA MESQUITA', 'HENRIQUE NELSON RODOVIARIO', '#NULO#', '55322964134', 'HENRIQUE338@GMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '21/11/1970', '48', '009723372046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06015764820186070000'], '70000627441': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627441', '20444', 'IANE MAIARA SILVA DE ASSIS', 'IANE', '#NULO#', '02189759102', 'IANEMAIARA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'GO', '-3', 'LUZIANIA', '06/02/1990', '28', '021065342097', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015773320186070000'], '70000627442': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627442', '20678', 'IARA FERNANDES DE OLIVEIRA', 'IARA', '#NULO#', '00438093321', 'IARA.FERNANDES10@HOTMAIL.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', '2894486', '11/09/1981', '37', '026510221570', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '254', 'VIGILANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015781820186070000'], '70000627443': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627443', '20800', 'IGOR BISPO DOS SANTOS', 'IGOR BISPO', '#NULO#', '71741542120', 'IGORMISSIONARIONOVO@HOTMAIL.COM', '3', 'INAPTO', '6', 'REN NCIA', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '09/05/1980', '38', '042582181007', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06015790320186070000'], '70000627444': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627444', '20000', 'IOLANDO ALMEIDA DE SOUZA', 'IOLANDO', '#NULO#', '49329367100', 'IOLANDOALMEIDA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '25/11/1969', '49', '010321082003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '921', 'MILITAR REFORMADO', '0', '2', 'ELEITO POR QP', 'N', 'S', '-1', '06015808520186070000'], '70000627445': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627445', '20567', 'JOAO PAULO SOARES EVANGELISTA', 'DR. JOAO PAULO ', '#NULO#', '89307399115', 'JPSOARES2000@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '10/05/1980', '38', '016022972011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015817020186070000'], '70000627446': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627446', '20150', 'JOCELIA GOMES DE ALBUQUERQUE', 'JOCELIA ALBURQUERQUE', '#NULO#', '35194464134', 'JOCELIALINS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '08/07/1963', '55', '013088342038', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '5', 'VI VO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015825520186070000'], '70000627447': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627447', '20018', 'JOEDIS GOMES DA SILVA', 'J  SILVA', '#NULO#', '76878970130', 'JOEDIS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'RN', '-3', 'PAT ', '14/05/1973', '45', '011562422003', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '512', 'CABELEIREIRO E BARBEIRO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015834020186070000'], '70000627448': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627448', '20900', 'JOSE AILTON FERREIRA DE OLIVEIRA', 'PROFESSOR AILTON', '#NULO#', '56707495453', 'AOLIVEIRA.OLIVEIRA@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'RN', '-3', 'ANGICOS', '20/04/1967', '51', '012161352070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '266', 'PROFESSOR DE ENSINO M DIO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06015842520186070000'], '70000627449': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627449', '20234', 'JOSE DE OLIVEIRA GUEDES', 'JOS  GUEDES', '#NULO#', '56481845149', 'JJ.GUEDES.7@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'CE', '-3', 'POTENGI', '25/09/1970', '48', '009902282070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '125', 'ADMINISTRADOR', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015851020186070000'], '70000627450': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627450', '20077', 'JULIO LEONARDO MOREIRA', 'JULIO LANCHONETE', '#NULO#', '63633019120', 'JULIOMOREIRA101@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/06/1974', '44', '012923772003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015869220186070000'], '70000627451': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627451', '20321', 'MARCIO VALERIO MENDON A TOMAZ', 'VAL RIO BANDA MARANATHA', '#NULO#', '38505037120', 'VALERIOBMARANATHA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '11/02/1971', '47', '009540972003', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '164', 'M SICO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015877720186070000'], '70000627452': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627452', '20789', 'MARCOS ANTONIO ALVES NOGUEIRA', 'MARCOS NOGUEIRA', '#NULO#', '65996550334', 'MARCOSNOG68@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'MA', '-3', 'LORETO', '29/10/1982', '36', '037792091112', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '402', 'VENDE R PRACISTA  R RESENTANTE  CAIXEIRO-VIAJANTE E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015886220186070000'], '70000627453': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627453', '20177', 'MARIA ADELIA SOARES CORREIA DOS SANTOS', 'MARIA ADELIA', '#NULO#', '20998210110', 'MADELIA30.CAIXA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'FRANCISCO S ', '23/11/1958', '60', '003115122070', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '403', 'COR TOR DE   VEIS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015894720186070000'], '70000627454': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627454', '20350', 'MARIA JAID  MARINHO DE OLIVEIRA', 'SGT JAID ', '#NULO#', '49323954187', 'MARIABONITA39L@HOTMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'AL', '-3', 'PENEDO', '18/10/1969', '49', '009791092046', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '233', 'POLICIAL MILITAR', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06015903220186070000'], '70000627455': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627455', '20218', 'MARIA TRINDADE BRAGA SOARES', 'PASTORA MARIA TRINDADE', '#NULO#', '15343162134', 'MARIATRINDADEDF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'TO', '-3', 'ARAGUAINA', '31/05/1953', '65', '005963382097', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015911720186070000'], '70000627456': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627456', '20020', 'MESAQUE DO NASCIMENTO BARBOSA', 'MESAQUE', '#NULO#', '56369581100', 'VELHOMESA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'CORRENTE', '10/10/1972', '46', '011284412020', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '402', 'VENDE R PRACISTA  R RESENTANTE  CAIXEIRO-VIAJANTE E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015920220186070000'], '70000627457': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627457', '20211', 'M NICA DE MENEZES DE ASSIS', 'MONICA D  AID ', '#NULO#', '81202032168', 'MONICADAIDE202011@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'MA', '-3', 'SANTA LUZIA', '12/03/1978', '40', '013000962097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015938420186070000'], '70000627458': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627458', '20999', 'NAIR QUEIROZ BLAIR', 'NAIR', '#NULO#', '34722262268', 'NAIRBLAIR2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'AM', '-3', 'MANAUS', '08/05/1971', '47', '011024892259', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015946920186070000'], '70000627459': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627459', '20600', 'NEVITON FERREIRA', 'NEVITON MONOVIM', '#NULO#', '39298990197', 'NEVITON-FERREIRA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '22/05/1968', '50', '035795311007', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015955420186070000'], '70000627460': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627460', '20111', 'PAULO DE SOUSA MOURA', 'PAULO MOURA', '#NULO#', '30166055115', 'PASTORPAULOMOURA@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'OEIRAS', '14/01/1965', '53', '005368932062', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015963920186070000'], '70000627461': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627461', '20100', 'PAULO ROBERTO MIRANDA TORRES', 'PAULO TORRES VIP', '#NULO#', '21443688134', 'PAULOTORRES312@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'CAMPO MAIOR', '13/04/1958', '60', '017205202046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015972420186070000'], '70000627462': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627462', '20500', 'PEDRO ALEGAR DA SILVA', 'PEDRO SILVA', '#NULO#', '45371881620', 'PEDROALEGAR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'SANTANA DO DESERTO', '15/03/1962', '56', '003005212062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '5', 'VI VO(A)', '03', 'PARDA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06015980920186070000'], '70000627463': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627463', '20120', 'PEDRO PAULO DE OLIVEIRA', 'PEPA', '#NULO#', '39020843591', 'PEPACONTATO2018@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'VARZEA DO PO O', '29/06/1967', '51', '008016632011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '297', 'SERVIDOR P BLICO ESTADUAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015999120186070000'], '70000627464': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627464', '20127', 'RODRIGO VIANA DE SOUSA', 'RODRIGO VIANA', '#NULO#', '01313197106', 'RODRIGO1639@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '13/06/1985', '33', '018476362089', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '395', 'BANC RIO E ECONOMI RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06016007620186070000'], '70000627465': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627465', '20220', 'TANIA ALVES COELHO', 'T NIA ALVES C ELHO', '#NULO#', '26316803168', 'DISTRITALTANIACOELHO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIANAPOLIS', '29/07/1965', '53', '002857522097', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '581', 'DONA DE CASA', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016016120186070000'], '70000627466': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627466', '20303', 'VANESSA VANONY LIMA COSTA', 'VANESSA VANONY', '#NULO#', '87336251153', 'WANONY@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'SP', '-3', 'EMBU', '02/07/1978', '40', '014338692062', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '581', 'DONA DE CASA', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06016024620186070000'], '70000627467': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627467', '20011', 'WALDEMIRO LIVINGSTON DE SOUZA', 'PEIXE', '#NULO#', '47782781604', 'PEIXE.SOUZA@YAHOO.COM.BR', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'CORINTO', '28/11/1966', '52', '069699260272', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '394', 'AUXILIAR DE ESCRIT RIO E ASSEMELHADOS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06016033120186070000'], '70000627468': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627468', '20007', 'WASHINGTON ARAPU  LIMA', 'BABY FACE', '#NULO#', '37598058172', 'BABYFACEVIVO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '04/09/1966', '52', '007806222011', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016041620186070000'], '70000627469': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627469', '20363', 'ANGELA CRISTINA DO NASCIMENTO AUGUSTO', 'ANGELA AUGUSTO', '#NULO#', '33976902187', 'NEGANGELACRISTINA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '22/09/1964', '54', '001398442003', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06015626420186070000'], '70000627794': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627794', '22188', 'MARIA EMILIA PAIVA SALAZAR', 'BA SALAZAR', '#NULO#', '31016456115', 'BAPSALAZAR@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIIA', '08/09/1962', '56', '003055612020', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016076820186070000'], '70000627796': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000627796', '22046', 'WINSTON ALVES DA COSTA DORTA', 'WINSTON COSTA', '#NULO#', '02904774173', 'FALECOMCOSTA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/10/1988', '30', '021663662011', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '531', 'MOTORISTA DE VE CULOS DE TRANSPORTE COLETIVO DE PASSAGEIROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016085320186070000'], '70000628275': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000628275', '6522', 'ALEXANDRE PEREIRA DE FREITAS', 'ALEXANDRE P/ O SERVI O SOCIAL', '#NULO#', '01207685690', 'ALEXANDREMASCATE@HOTMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '65', 'PC do B', 'PARTIDO COMUNISTA DO BRASIL', '70000050382', 'Bras lia de M os Limpas', 'PSB / PV / PC do B / PDT / REDE', '1', 'BRASILEIRA NATA', 'MG', '-3', 'SENADOR MOUR O', '13/03/1980', '38', '124449230299', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '4 ', 'VENDEDOR P CISTA  REPRESENTANTE  CAIXEIRO-VIAJANTE E ASSEMELHADOS', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06016110820186070000'], '70000628472': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000628472', '4516', 'WILMAN NEPOMUCENO DA SILVA', 'WILMAN NEPOMUCENO DA SILVA', '#NULO#', '06686613134', 'COM-EXW@HOTMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'GO', '-3', 'RIALMA', '06/02/1954', '64', '002297432046', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '-1', '-1', '#NULO#', 'N', 'N', '-1', '06016129020186070000'], '70000628562': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '5', 'SENADOR', '70000628562', '459', 'ROMILDA TEIXEIRA SHINTATE', 'ROMILDA TEIXEIRA', '#NULO#', '29132359802', '511@UOL.COM.BR', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050689', 'CORAGEM E RESPEITO PELO POVO', 'PR / PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'CURVELO', '22/05/1954', '64', '160436350141', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06016163020186070000'], '70000628563': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000628563', '450', 'JAIRO TEIXEIRA SOARES', 'JAIRO TEIXEIRA', '#NULO#', '63572443172', 'RODRIGUIM@HOTMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050689', 'CORAGEM E RESPEITO PELO POVO', 'PR / PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'CORINTO', '28/06/1965', '53', '001288052097', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '591', 'ALFAIATE E COSTUREIRO', '-1', '-1', '#NULO#', 'N', 'S', '-1', '06016171520186070000'], '70000628603': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000628603', '31310', 'ANA PAULA ALVES RIBEIRO', 'SGT PAULA', '#NULO#', '62078313149', 'PHSDF.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '02/01/1975', '43', '010993682011', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '233', 'POLICIAL MILITAR', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06016189720186070000'], '70000628604': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000628604', '31330', 'KALEY BLADIMIR NOBRE BONAN', 'KALEY BLADIMIR', '#NULO#', '51254824120', 'PHSDF.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '06/11/1968', '50', '007539342070', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '151', 'T CNICO C TABILIDADE  STAT STICA  ECONOMIA DOM STICA E ADMINISTRA  O', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016198220186070000'], '70000628605': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000628605', '31266', 'MARCUS VINICIUS SILVA PIAZZAROLLO', 'SGT MARCUS VINICIUS', '#NULO#', '23878576153', 'PHSDF31.NOTIFICACOESELEICAO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '31', 'PHS', 'PARTIDO HUMANISTA DA SOLIDARIEDADE', '70000050141', 'PARTIDO ISOLADO', 'PHS', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '26/11/1966', '52', '011102392003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '295', 'MEMBRO DAS FOR AS ARMADAS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016206720186070000'], '70000628725': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000628725', '22229', 'UDSON SOARES DE SOUSA ', 'UDSON SOARES ', '#NULO#', '09758291149', 'USSADVOGADO@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOIANESIA ', '19/01/1951', '67', '002476652070', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016232220186070000'], '70000628798': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000628798', '20040', 'ANDRE LUIS SILVA', 'ANDR  SILVA', '#NULO#', '02552644708', 'LSANDRE01@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'RJ', '-3', 'RIO DE JANEIRO', '18/09/1972', '46', '082202930310', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '296', 'SERVIDOR P BLICO FEDERAL', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06016267420186070000'], '70000628872': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000628872', '11118', 'SAMUEL DE JESUS MUNIZ', 'SAMUEL MUNIZ', '#NULO#', '76553361134', 'MUNIZSAMU@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '11', 'PP', 'PARTIDO PROGRESSISTA', '70000050051', 'PARTIDO ISOLADO', 'PP', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '30/05/1974', '44', '011235282046', '2', 'MASCULINO', '7', 'SUPERIOR INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '235', 'PROFESSOR E INSTRUTOR DE FORMA  O PROFISSIONAL', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016284420186070000'], '70000628916': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000628916', '22999', 'HUMBERTO JOSE CARDOSO ', 'HUMBERTO JOSE CARDOSO ', '#NULO#', '15437191120', 'HUMBERTOJCARDOSO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '22', 'PR', 'PARTIDO DA REP BLICA', '70000050315', 'PARTIDO ISOLADO', 'PR', '1', 'BRASILEIRA NATA', 'GO', '-3', 'ANAPOLIS ', '11/11/1957', '61', '006653902011', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06016292920186070000'], '70000629028': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629028', '20373', 'DIVINO AMARO DA SILVA', 'DIVINO DOS PANFLETOS', '#NULO#', '37347802172', 'ADV.EDENILSONMIRAEASSOCIADOS@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'MARA ROSA', '07/11/1968', '50', '008045082097', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016319620186070000'], '70000629034': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629034', '51312', 'ROMILDA CONRADO SOARES', 'DRA. ROMILDA', '#NULO#', '55238491115', 'RROMMY@LIVE.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '51', 'PATRI', 'PATRIOTA', '70000050335', 'RENOVA DF', 'PMB / PATRI', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '22/12/1970', '48', '009635922003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '131', 'ADVOGADO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06016328120186070000'], '70000629128': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000629128', '333', 'WESLIAN DO PERP TUO SOCORRO PELES RORIZ', 'WESLIAN RORIZ', '#NULO#', '26557401149', 'SECRETARIAPMN33@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050657', 'JUNTOS DE VOC ', 'PROS / PTB / PHS / PATRI / PMN / PTC / PMB', '1', 'BRASILEIRA NATA', 'GO', '-3', 'GOI NIA', '07/10/1942', '76', '010284162089', '4', 'FEMININO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '581', 'DONA DE CASA', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06016414320186070000'], '70000629138': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000629138', '333', 'TAKANE KIYOTSUKA DO NASCIMENTO', 'TAKANE KIYOTSUKA', '#NULO#', '29611610106', 'CLEYTONTREVIZAN@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050657', 'JUNTOS DE VOC ', 'PROS / PTB / PHS / PATRI / PMN / PTC / PMB', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '01/08/1963', '55', '004505172046', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '232', 'POLICIAL CIVIL', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06016422820186070000'], '70000629286': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629286', '33111', 'EDILENE FERREIRA SANTOS FERNANDES', 'GALEGA DO SHOPPING POPULAR', '#NULO#', '56460546134', 'PEREIRAEDFERNANDES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'MG', '-3', 'PANDEIROS', '10/07/1971', '47', '010153112003', '4', 'FEMININO', '7', 'SUPERIOR INCOMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06016483520186070000'], '70000629287': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000629287', '3322', 'LOURIVAL DE AZEVEDO RAMOS FILHO', 'LOURIVAL AZEVEDO', '#NULO#', '34415084168', 'ASSEHNC2014@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '33', 'PMN', 'PARTIDO DA MOBILIZA  O NACIONAL', '70000050599', 'RENOVAR DF 2', 'PROS / PMB / PMN', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '06/05/1965', '53', '000483682003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06016492020186070000'], '70000629420': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629420', '45208', 'RAIMUNDO NONATO DOS SANTOS', 'RAIMUNDO NONATO DOS SANTOS', '#NULO#', '15096530310', 'RAIMUNDONONATO62@HOTMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050692', 'TODOS PELO DF', 'PSDB / DEM / DC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'BARRAS', '05/08/1946', '72', '002614242038', '2', 'MASCULINO', '5', 'ENSINO M DIO INCOMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '0', '4', 'N O ELEITO', 'S', 'N', '-1', '06016518720186070000'], '70000629458': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000629458', '777', 'FERNANDO VITOR PASSOS', 'MAJOR FERNANDO PASSOS', '#NULO#', '69768765100', 'BRUNO.BELEZA@NWADV.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '77', 'SOLIDARIEDADE', 'SOLIDARIEDADE', '70000050368', 'UNIDOS PELO DF', 'PSD / PRB / PPS / SOLIDARIEDADE / PODE / PSC', '1', 'BRASILEIRA NATA', 'GO', '-3', 'JATA ', '15/09/1978', '40', '014052972003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '297', 'SERVIDOR P BLICO ESTADUAL', '-1', '4', 'N O ELEITO', 'N', 'S', '-1', '06016552720186070000'], '70000629549': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000629549', '2711', 'GILDETE SANTANA NETO', 'GILDETE', '#NULO#', '24501093153', 'GILDETESEN@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'SANTA BRIGIDA', '14/07/1957', '61', '003356182038', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06016682620186070000'], '70000629552': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629552', '70133', 'FRANCISCO CELIO RIBEIRO DE SANTANA', 'PR. C LIO SANTANA', '#NULO#', '39349144115', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'PB', '-3', 'DIAMANTE', '13/05/1970', '48', '009297262003', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016691120186070000'], '70000629595': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629595', '70026', 'NIVALDO DE OLIVEIRA', 'PROFESSOR NIVALDO', '#NULO#', '05490685115', 'AVANTE.TRE.DF@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '70', 'AVANTE', 'AVANTE', '70000050027', 'PARTIDO ISOLADO', 'AVANTE', '1', 'BRASILEIRA NATA', 'ES', '-3', 'CARIACICA', '26/07/1950', '68', '002769052003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '02', 'PRETA', '131', 'ADVOGADO', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016743320186070000'], '70000629596': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000629596', '2717', 'VERA LUCIA PEREIRA LIRA DE SOUZA', 'VERA LUCIA', '#NULO#', '11511133104', 'LIRACEDO@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'PARTIDO ISOLADO', '27', 'DC', 'DEMOCRACIA CRIST ', '70000050746', 'PARTIDO ISOLADO', 'DC', '1', 'BRASILEIRA NATA', 'BA', '-3', 'PAULO AFONSO', '11/11/1950', '68', '003897772003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '01', 'BRANCA', '922', 'SERVIDOR P BLICO CIVIL APOSENTADO', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06016751820186070000'], '70000629607': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000629607', '4500', 'ROMUALDO AMARO ALVES', 'ROMUALDO JOW', '#NULO#', '26567016191', 'RVAALVES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '45', 'PSDB', 'PARTIDO DA SOCIAL DEMOCRACIA BRASILEIRA', '70000050690', 'UNI O E FOR A', 'PSDB / PR / DEM', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '28/01/1966', '53', '002486672097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06016847720186070000'], '70000629622': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629622', '20990', 'GEISIMAR BORGES DE OLIVEIRA', 'GEISIMAR MORRO DA CRUZ', '#NULO#', '00916239365', 'GEISIMARBORGES@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'PI', '-3', 'ANTONIO ALMEIDA', '09/09/1985', '33', '031117571503', '2', 'MASCULINO', '3', 'ENSINO FUNDAMENTAL INCOMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '999', 'OUTROS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016908420186070000'], '70000629623': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629623', '20389', 'JULIMAR MORAES DA SILVA', 'JULIMAR PRODUTOR', '#NULO#', '49278266191', 'NEIDESANTOS820@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '20', 'PSC', 'PARTIDO SOCIAL CRIST O', '70000050755', 'PARTIDO ISOLADO', 'PSC', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '29/01/1974', '44', '011487542020', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06016890220186070000'], '70000629629': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629629', '17555', 'VANESSA MARIA LOPES GOUVEA', 'VANESSA GOUVEA', '#NULO#', '04750391140', 'VANESSAGOUVEANEGOCIOS@GMAIL.COM', '12', 'APTO', '16', 'DEFERIDO COM RECURSO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '05/04/1995', '23', '023893302038', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA 931', 'E UDANTE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06016916920186070000'], '70000629837': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629837', '44064', 'EVANDRO DE ARAUJO PAULA', 'EVANDRO ARAUJO', '#NULO#', '04873125111', 'EVANDRO.ARAJO846@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '44', 'PRP', 'PARTIDO REPUBLICANO PROGRESSISTA', '70000050394', 'BRAS LIA ACIMA DE TUDO', 'PRP / PRTB', '1', 'BRASILEIRA NATA', 'MA', '-3', 'PIRAPEMAS', '27/09/1993', '25', '022091902046', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA 931', 'E UDANTE  BOLSISTA  ESTAGI RIO E ASSEMELHADOS', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06020078220186070000'], '70000629898': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000629898', '5433', 'VIVIANE GOMES LIMA', 'VIVIANE GOMES', '#NULO#', '98771965149', 'VIVIANE.GL@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'MS', '-3', 'CAMPO GRANDE', '14/02/1984', '34', '017840771953', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '02', 'PRETA', '125', 'ADMINISTRADOR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06027335620186070000'], '70000629926': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '9', '1  SUPLENTE', '70000629926', '111', 'LUCAS KONTOYANIS', 'LUCAS KONTOYANIS', '#NULO#', '11386231134', 'REJANE84172744@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '70', 'AVANTE', 'AVANTE', '70000050385', 'PRA FAZER A DIFEREN A', 'MDB / PP / AVANTE / PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '06/06/1956', '62', '001620242003', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '131', 'ADVOGADO', '-1', '4', 'N O ELEITO', 'N', 'N', '-1', '06027457020186070000'], '70000629927': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '10', '2  SUPLENTE', '70000629927', '544', 'ANTONIO CARLOS CABRAL CARPINTERO', 'PROFESSOR CARPINTERO', '#NULO#', '03864421187', 'CARPIU@GMAIL.COM', '12', 'APTO', '4', 'INDEFERIDO COM RECURSO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050385', 'PRA FAZER A DIFEREN A', 'MDB / PP / AVANTE / PSL / PPL', '1', 'BRASILEIRA NATA', 'SP', '-3', 'MAR LIA', '02/10/1945', '73', '007500952054', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '03', 'PARDA', '923', 'APOSENTADO (EXCETO SERVIDOR P BLICO)', '-1', '4', 'N O ELEITO', 'N', 'N', '-1', '06027465520186070000'], '70000629982': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629982', '23223', 'MARIA TEREZA FERRAZ DA CRUZ ', 'MARIA TEREZA', '#NULO#', '87472236187', 'MARIATEREZAFERRAZ@YAHOO.COM.BR', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '23', 'PPS', 'PARTIDO POPULAR SOCIALISTA', '70000050552', 'PARTIDO ISOLADO', 'PPS', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRAS LIA', '29/12/1979', '39', '014660492003', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '125', 'ADMINISTRADOR', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06027941420186070000'], '70000629985': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000629985', '90789', 'JOSE MARCELO BARROSO GUIMARAES', 'MARCELO GUIMARAES', '#NULO#', '56126115104', 'MARCELOGUIMARAESDF@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '90', 'PROS', 'PARTIDO REPUBLICANO DA ORDEM SOCIAL', '70000050164', 'PARTIDO ISOLADO', 'PROS', '1', 'BRASILEIRA NATA', 'CE', '-3', 'FORTALEZA', '29/08/1971', '47', '008444742097', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '403', 'CORRETO DE IM  IS  SEGUROS  T TULOS E VALORES', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06027976620186070000'], '70000630009': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000630009', '5454', 'FERNANDO LUIS CAMPANELLA', 'CAMPANELLA', '#NULO#', '01328705170', 'CAMPANELLA.FERNANDO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'PARTIDO ISOLADO', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050649', 'PARTIDO ISOLADO', 'PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '14/08/1985', '33', '019634882097', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', '257', 'EMPRES RIO', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06027993620186070000'], '70000630015': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000630015', '10030', 'MAYKON ROBERTO DE SOUZA CORTEZ', 'MAYKON CORTEZ', '#NULO#', '60550805168', 'MAYKONCORTEZ30@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050230', 'COLIGA  O UNIDOS PELO DF 3', 'PRB / SOLIDARIEDADE', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '23/04/1976', '42', '023564772062', '2', 'MASCULINO', '6', 'ENSINO M DIO COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '169', 'COMERCIANTE', '0', '5', 'SUPLENTE', 'N', 'N', '-1', '06028010620186070000'], '70000630060': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000630060', '36600', 'UESLLEI PEREIRA DE ALMEIDA', 'UESLLEI ALMEIDA', '#NULO#', '98640712115', 'UESLLEIALMEIDA@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '36', 'PTC', 'PARTIDO TRABALHISTA CRIST O', '70000050436', 'mobilizar pra mudar', 'PMN / PTC', '1', 'BRASILEIRA NATA', 'GO', '-3', 'POSSE', '24/11/1983', '35', '017591052089', '2', 'MASCULINO', '8', 'SUPERIOR COMPLETO', '1', 'SOLTEIRO(A)', '01', 'BRANCA', ' 1', 'SUPERVISOR  INSPETOR E AGENTE DE COMPRAS E VENDAS', '0', '5', 'SUPLENTE', 'N', 'S', '-1', '06028037320186070000'], '70000630078': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000630078', '54456', 'ANTONIO BARBOSA PEREIRA', 'TONINHO COWBOY', '#NULO#', '69503362172', 'TONINHOPEREIRA533@GMAIL.COM', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'PI', '-3', 'JAIC S', '13/06/1975', '43', '014330922003', '2', 'MASCULINO', '4', 'ENSINO FUNDAMENTAL COMPLETO', '9', 'DIVORCIADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06028045820186070000'], '70000630081': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000630081', '54987', 'MARIA APARECIDA SANTANA', 'CIDINHA ROCHA', '#NULO#', '09759417120', 'LAUDECY_DJ@HOTMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '54', 'PPL', 'PARTIDO P TRIA LIVRE', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'SP', '-3', 'FRAN A', '02/01/1952', '66', '005810922020', '4', 'FEMININO', '6', 'ENSINO M DIO COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06028054320186070000'], '70000630082': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '8', 'DEPUTADO DISTRITAL', '70000630082', '17888', 'GISELE AVELINO DE FIGUEIREDO', 'GISELE ', '#NULO#', '48456373168', 'GISELEAVELINOFIGUEIREDO@GMAIL.COM', '12', 'APTO', '2', 'DEFERIDO', 'COLIGA  O', '17', 'PSL', 'PARTIDO SOCIAL LIBERAL', '70000050548', 'UMA NOVA ESPERAN A', 'PSL / PPL', '1', 'BRASILEIRA NATA', 'DF', '-3', 'BRASILIA', '09/11/1968', '50', '007412872089', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '9', 'DIVORCIADO(A)', '01', 'BRANCA', '233', 'POLICIAL MILITAR', '0', '4', 'N O ELEITO', 'N', 'S', '-1', '06028062820186070000'], '70000630086': ['27/10/2018', '18:06:43', '2018', '2', 'ELEI  O ORDIN RIA', '1', '297', 'Elei  es Gerais Estaduais 2018', '07/10/2018', 'ESTADUAL', 'DF', 'DF', 'DISTRITO FEDERAL', '6', 'DEPUTADO FEDERAL', '70000630086', '1005', 'K TIA TAVARES DE OLIVEIRA RIBEIRO MACHADO', 'K TIA TAVARES', '#NULO#', '02497813108', 'BRUNO.BELEZA@NWADV.COM.BR', '3', 'INAPTO', '14', 'INDEFERIDO', 'COLIGA  O', '10', 'PRB', 'PARTIDO REPUBLICANO BRASILEIRO', '70000050492', 'UNIDOS PELO DF 1', 'PRB / PODE / PPS / SOLIDARIEDADE / PSC / PSD', '1', 'BRASILEIRA NATA', 'MG', '-3', 'UNA ', '23/09/1987', '31', '052447791007', '4', 'FEMININO', '8', 'SUPERIOR COMPLETO', '3', 'CASADO(A)', '03', 'PARDA', '999', 'OUTROS', '0', '4', 'N O ELEITO', 'N', 'N', '-1', '06028158720186070000']})
\ No newline at end of file
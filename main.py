@@ -1,260 +1,2917 @@
 #%%
 import csv
+import glob
+import hashlib
+import math
 import heapq
+import json
+import multiprocessing
+import bisect
+import copy
+import os
+import pickle
+import re
+import struct
+import tempfile
+import zlib
 import sqlparse
 import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import partial
+from array import array
+from collections import OrderedDict, deque
+from itertools import chain, count, groupby, islice, repeat
 from typing import List
-from sortedcontainers import SortedDict
+import numpy as np
 from datetime import datetime
 from timeit import default_timer as timer
 
 
-with open('consulta_cand_2018/consulta_cand_2018_BR.csv',
-          encoding="latin-1") as csv_file:
-    csv_reader = csv.reader(csv_file, delimiter='\n')
-    csv_info = [row[0].replace('"', '').replace(",", " ").split(';')
-                for row in csv_reader]
-    csv_fields = csv_info.pop(0)
+BLOCK_SIZE = 4096
+WHERE_TERM = re.compile(
+    r"\s*([\w.]+)\s*(?:=\s*('[^']*'|\"[^\"]*\"|\S+?)|\s+in\s*\(([^)]*)\)?"
+    r"|\s+between\s+(\S+)\s+and\s+(\S+?))\s*(?:\band\b|;|$)",
+    re.IGNORECASE)
+LIMIT_CLAUSE = re.compile(
+    r"\s+limit\s+(\d+|\?)(?:\s+offset\s+(\d+|\?))?\s*$", re.IGNORECASE)
+ORDER_CLAUSE = re.compile(r"\s+order\s+by\s+(.+?)\s*$", re.IGNORECASE)
+GROUP_CLAUSE = re.compile(r"\s+group\s+by\s+(.+?)\s*$", re.IGNORECASE)
+AGGREGATE = re.compile(r"^(count|sum|avg|min|max)\((\*|[\w.]+)\)$", re.IGNORECASE)
+KEY_TOKEN = re.compile(r"'[^']*'|\"[^\"]*\"|\s+|[()]|[^\s'\"()]+|.")
+KEYWORDS = {"select", "from", "where", "and", "in", "between", "insert", "into",
+            "values", "delete", "order", "group", "by", "limit", "offset",
+            "asc", "desc", "join", "inner", "on", "as"}
+JOIN_CLAUSE = re.compile(
+    r"\bfrom\s+(\w+)(?:\s+(?:as\s+)?(?!(?:inner|join|where)\b)(\w+))?"
+    r"\s+(?:inner\s+)?join\s+(\w+)(?:\s+(?:as\s+)?(?!on\b)(\w+))?"
+    r"\s+on\s+([\w.]+)\s*=\s*([\w.]+)", re.IGNORECASE)
+
+
+#%%
+def csv_rows(filename: str):
+    # rows of one TSE file, header first; fields are ; separated and quoted,
+    # so names may hold commas and semicolons
+    with open(filename, mode="r", encoding="latin-1", newline="") as csv_file:
+        yield from csv.reader(csv_file, delimiter=";", quotechar='"')
+
+
+def file_digest(filename: str, digests: dict = {}) -> str:
+    # size, modification time and content hash of a file; the hash of a
+    # file left untouched is only computed once per process
+    info = os.stat(filename)
+    key = (os.path.abspath(filename), info.st_size, info.st_mtime_ns)
+    if key not in digests:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(filename, "rb") as f:
+            for block in iter(partial(f.read, 1 << 20), b""):
+                digest.update(block)
+        digests[key] = "{}:{}:{}".format(info.st_size, info.st_mtime_ns,
+                                         digest.hexdigest())
+    return digests[key]
+
+
+def fit_row(row: list, columns: int) -> list:
+    return (row + [""] * (columns - len(row)))[:columns]
+
+
+def where_rows(rows, columns: int, where: tuple = None):
+    # fitted rows, only those whose field `where[0]` equals `where[1]`
+    rows = (fit_row(x, columns) for x in rows)
+    if where is None:
+        return rows
+    return (x for x in rows if x[where[0]] == where[1])
+
+
+def column_widths(rows, columns: int) -> List[int]:
+    widths = [1] * columns
+    for row in rows:
+        for i, field in enumerate(row[:columns]):
+            if len(field) > widths[i]:
+                widths[i] = len(field)
+    return widths
+
+
+def csv_file_rows(filename: str, where: tuple = None) -> List[list]:
+    rows = csv_rows(filename)
+    columns = len(next(rows))
+    return list(where_rows(rows, columns, where))
+
+
+def csv_file_widths(filename: str, where: tuple = None) -> tuple:
+    rows = csv_rows(filename)
+    columns = len(next(rows))
+    count = [0]
+
+    def counted():
+        for row in where_rows(rows, columns, where):
+            count[0] += 1
+            yield row
+    widths = column_widths(counted(), columns)
+    return count[0], widths
+
+
+def csv_file_values(filename: str, index: int) -> set:
+    rows = csv_rows(filename)
+    columns = len(next(rows))
+    return {x[index] for x in where_rows(rows, columns)}
+
+
+class CSVSource(object):
+    # the records of one or more TSE files (a name, a glob pattern such as
+    # "consulta_cand_2018/consulta_cand_2018_*.csv" or a list of names). They
+    # are streamed each time the source is iterated; several files are
+    # parsed by a process pool and come back in file order, with no more
+    # than `processes` files held at once. `where` = (index, value) keeps
+    # only the rows holding `value` in that column
+    def __init__(self, filenames, processes: int = None, where: tuple = None,
+                 header: List[str] = None):
+        if isinstance(filenames, str):
+            filenames = sorted(glob.glob(filenames)) or [filenames]
+        self.filenames = list(filenames)
+        self.processes = min(processes or os.cpu_count() or 1,
+                             len(self.filenames))
+        self.header = header if header is not None \
+            else next(csv_rows(self.filenames[0]))
+        self.where = where
+        self.count = None
+        self.column_widths = None
+
+    def map(self, function):
+        if self.processes <= 1:
+            yield from map(function, self.filenames)
+            return
+        with multiprocessing.Pool(self.processes) as pool:
+            pending = deque()
+            for filename in self.filenames:
+                pending.append(pool.apply_async(function, (filename,)))
+                if len(pending) >= self.processes:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+
+    def __iter__(self):
+        if self.processes <= 1:
+            for filename in self.filenames:
+                rows = csv_rows(filename)
+                next(rows)
+                yield from where_rows(rows, len(self.header), self.where)
+            return
+        for rows in self.map(partial(csv_file_rows, where=self.where)):
+            yield from rows
+
+    def widths(self) -> List[int]:
+        # widest value of every column, in one parallel pass
+        if self.column_widths is None:
+            self.count = 0
+            self.column_widths = [1] * len(self.header)
+            for count, widths in self.map(
+                    partial(csv_file_widths, where=self.where)):
+                self.count += count
+                self.column_widths = [max(x) for x in
+                                      zip(self.column_widths, widths)]
+        return self.column_widths
+
+    def __len__(self) -> int:
+        self.widths()
+        return self.count
+
+    def fingerprint(self) -> str:
+        # changes as soon as one of the files does
+        digest = hashlib.blake2b(repr(self.where).encode("latin-1"),
+                                 digest_size=16)
+        for filename in self.filenames:
+            digest.update(file_digest(filename).encode("latin-1"))
+        return digest.hexdigest()
+
+    def partition(self, index: int) -> dict:
+        # a source per value of column `index`, each one reading only the
+        # files that hold the value
+        files = {}
+        values = self.map(partial(csv_file_values, index=index))
+        for filename, found in zip(self.filenames, values):
+            for value in found:
+                files.setdefault(value, []).append(filename)
+        return {x: CSVSource(y, self.processes, (index, x), self.header)
+                for x, y in files.items()}
 
 
 #%%
 class HeapRecord(list):
-    sort_parameters = []
+    # a record with its rid, its tombstone and its sort key, which is taken
+    # once from the fields named by `parameters`, typed by `key` when given
+    __slots__ = ("sort_key", "rid", "deleted")
 
-    def __init__(self, list_of_objs: list, parameters: List[int] = [0]):
-        self.sort_parameters = parameters
+    def __init__(self, list_of_objs: list, parameters: List[int] = [0],
+                 rid: int = None, key=None):
         super().__init__(list_of_objs)
+        self.rid = rid
+        self.deleted = False
+        self.sort_key = key(self) if key is not None else \
+            tuple(self[x] for x in parameters if x < len(self))
 
     def __lt__(self, value):
-        for field in self.sort_parameters:
-            if self[field] < value[field]:
-                return True
-            elif self[field] > value[field]:
-                return False
-        else:
-            return False
+        return self.sort_key < value.sort_key
 
     def __gt__(self, value):
-        for field in self.sort_parameters:
-            if self[field] < value[field]:
-                return False
-            elif self[field] > value[field]:
-                return True
-        else:
-            return False
+        return self.sort_key > value.sort_key
 
 
 class HeapTable(list):
-    sort_parameters = []
-
-    def __init__(self, list_of_objs: list, parameters: List[int] = [0]):
-        list_of_objs = [HeapRecord(x, parameters) for x in list_of_objs]
-        heapq.heapify(list_of_objs)
-        super().__init__(list_of_objs)
+    # a binary heap of (sort key, sequence, record) tuples, so heapq only
+    # compares native tuples; iterating it gives the records
+    def __init__(self, list_of_objs, parameters: List[int] = [0], key=None):
+        self.sort_parameters = parameters
+        self.key = key
+        self.sequence = count()
+        entries = [(x.sort_key, next(self.sequence), x)
+                   for x in map(self.record, list_of_objs)]
+        heapq.heapify(entries)
+        super().__init__(entries)
+
+    def record(self, value) -> HeapRecord:
+        if not isinstance(value, HeapRecord):
+            return HeapRecord(value, self.sort_parameters, key=self.key)
+        if self.key is not None:
+            value.sort_key = self.key(value)
+        return value
+
+    def __iter__(self):
+        return (x[2] for x in super().__iter__())
 
     def append(self, value):
-        return heapq.heappush(self, value)
+        value = self.record(value)
+        return heapq.heappush(self, (value.sort_key, next(self.sequence), value))
 
     def pop(self, index=-1):
         if index == 0:
-            return super().pop(0)
-        return heapq.heappop(self)
+            return super().pop(0)[2]
+        return heapq.heappop(self)[2]
+
+
+#%%
+class Descending(object):
+    # inverts the order of one part of a sort key
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class ExternalSort(object):
+    # sorts more rows than fit in memory: runs of about `memory` bytes are
+    # sorted and spilled to temporary files, then merged back as a stream,
+    # at most `fan_in` runs at a time. Rows are lists of strings
+    memory = 64 << 20
+    fan_in = 64
+    chunk = 1024
+
+    def __init__(self, memory: int = None, fan_in: int = None,
+                 directory: str = None):
+        if memory is not None:
+            self.memory = memory
+        if fan_in is not None:
+            self.fan_in = fan_in
+        self.directory = directory
+        self.runs = 0
+
+    def sort(self, rows, key, reverse: bool = False):
+        # nothing is spilled when every row fits in the budget
+        runs = []
+        run = []
+        size = 0
+        for row in rows:
+            run.append(row)
+            size += self.row_size(row)
+            if size >= self.memory:
+                run.sort(key=key, reverse=reverse)
+                runs.append(self.spill(run))
+                run = []
+                size = 0
+        run.sort(key=key, reverse=reverse)
+        if not runs:
+            yield from run
+            return
+        if run:
+            runs.append(self.spill(run))
+        run = None
+        while len(runs) > self.fan_in:
+            runs = [self.spill(self.merge(runs[i:i + self.fan_in], key, reverse))
+                    for i in range(0, len(runs), self.fan_in)]
+        yield from self.merge(runs, key, reverse)
+
+    def row_size(self, row) -> int:
+        # a rough size of a row of strings, object headers included
+        return 56 * len(row) + sum(len(x) for x in row if isinstance(x, str))
+
+    def spill(self, rows):
+        run = tempfile.TemporaryFile(dir=self.directory)
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == self.chunk:
+                pickle.dump(chunk, run, pickle.HIGHEST_PROTOCOL)
+                chunk = []
+        if chunk:
+            pickle.dump(chunk, run, pickle.HIGHEST_PROTOCOL)
+        run.seek(0)
+        self.runs += 1
+        return run
+
+    def read_run(self, run):
+        try:
+            while True:
+                yield from pickle.load(run)
+        except EOFError:
+            pass
+        finally:
+            run.close()
+
+    def merge(self, runs: list, key, reverse: bool = False):
+        return heapq.merge(*[self.read_run(x) for x in runs], key=key,
+                           reverse=reverse)
+
+    def partition(self, rows, part, parts: int) -> list:
+        # spills the rows to `parts` runs, row by row to run part(row)
+        runs = [tempfile.TemporaryFile(dir=self.directory)
+                for _ in range(parts)]
+        chunks = [[] for _ in range(parts)]
+        for row in rows:
+            index = part(row)
+            chunks[index].append(row)
+            if len(chunks[index]) == self.chunk:
+                pickle.dump(chunks[index], runs[index], pickle.HIGHEST_PROTOCOL)
+                chunks[index] = []
+        for run, chunk in zip(runs, chunks):
+            if chunk:
+                pickle.dump(chunk, run, pickle.HIGHEST_PROTOCOL)
+            run.seek(0)
+        self.runs += parts
+        return runs
+
+
+class HashAggregate(object):
+    # GROUP BY in one pass: a dictionary of running states while the groups
+    # fit in about `memory` bytes. The rows of groups that come after that
+    # are spilled to `fan_in` runs on a hash of their key, and each run is
+    # aggregated the same way once the pass is over
+    memory = 64 << 20
+    fan_in = 16
+    group_size = 512
+    depth = 4
+
+    def __init__(self, key, start, step, memory: int = None,
+                 directory: str = None):
+        self.key = key
+        self.start = start
+        self.step = step
+        if memory is not None:
+            self.memory = memory
+        self.sorter = ExternalSort(directory=directory)
+
+    def aggregate(self, rows, depth: int = 0):
+        # (key, state) of every group, in no particular order
+        groups = {}
+        runs = []
+        spilled = []
+        # a run that still holds too many groups after a few splits is
+        # aggregated in memory all the same
+        limit = max(1, self.memory // self.group_size) \
+            if depth < self.depth else None
+        for row in rows:
+            key = self.key(row)
+            state = groups.get(key)
+            if state is None:
+                if limit is not None and len(groups) >= limit:
+                    spilled.append(row)
+                    if len(spilled) == self.sorter.chunk:
+                        self.spill(runs, spilled, depth)
+                        spilled = []
+                    continue
+                state = groups[key] = self.start(key)
+            self.step(state, row)
+        yield from groups.items()
+        groups = None
+        if spilled:
+            self.spill(runs, spilled, depth)
+        for run in runs:
+            run.seek(0)
+            yield from self.aggregate(self.sorter.read_run(run), depth + 1)
+
+    def spill(self, runs: list, rows: list, depth: int):
+        if not runs:
+            runs.extend(tempfile.TemporaryFile(dir=self.sorter.directory)
+                        for _ in range(self.fan_in))
+            self.sorter.runs += self.fan_in
+        chunks = [[] for _ in runs]
+        for row in rows:
+            chunks[hash((depth, self.key(row))) % self.fan_in].append(row)
+        for run, chunk in zip(runs, chunks):
+            if chunk:
+                pickle.dump(chunk, run, pickle.HIGHEST_PROTOCOL)
+
+
+class Aggregates(object):
+    # the running COUNT, SUM, AVG, MIN and MAX of a group. `functions` are
+    # (name, column index) pairs, the index None for COUNT(*); `positions`
+    # maps a column index to its place in the rows and `typed` types fields
+    def __init__(self, functions: List[tuple], positions: dict, typed):
+        self.functions = functions
+        self.positions = positions
+        self.typed = typed
+
+    def start(self, key=None) -> list:
+        return [[0, 0] if name != "min" and name != "max" else [None, None]
+                for name, _ in self.functions]
+
+    def step(self, state: list, row: list):
+        for accumulator, (name, index) in zip(state, self.functions):
+            if index is None:
+                accumulator[0] += 1
+                continue
+            value = row[self.positions[index]]
+            if value is None:
+                continue
+            if name == "count":
+                # empty fields are not counted
+                if value.strip():
+                    accumulator[0] += 1
+            elif name == "sum" or name == "avg":
+                number = self.number(index, value)
+                if number is not None:
+                    accumulator[0] += number
+                    accumulator[1] += 1
+            else:
+                value = self.typed(index, value)
+                key = (0, value) if isinstance(value, int) else (1, value)
+                if accumulator[0] is None or (key < accumulator[0]
+                                              if name == "min"
+                                              else key > accumulator[0]):
+                    accumulator[0], accumulator[1] = key, value
+
+    def number(self, index: int, value: str):
+        # INTEGER fields as typed, other fields when they read as a number
+        value = self.typed(index, value)
+        if isinstance(value, int):
+            return value
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+    def finish(self, state: list) -> list:
+        results = []
+        for accumulator, (name, _) in zip(state, self.functions):
+            if name == "count":
+                results.append(accumulator[0])
+            elif name == "sum":
+                results.append(accumulator[0] if accumulator[1] else None)
+            elif name == "avg":
+                results.append(accumulator[0] / accumulator[1]
+                               if accumulator[1] else None)
+            else:
+                results.append(accumulator[1])
+        return results
+
+
+#%%
+class Frame(object):
+    __slots__ = ("key", "data", "pins", "dirty")
+
+    def __init__(self, key: tuple, data: bytearray):
+        self.key = key
+        self.data = data
+        self.pins = 0
+        self.dirty = False
+
+
+class LRUPolicy(object):
+    def __init__(self):
+        self.order = OrderedDict()
+
+    def access(self, key: tuple):
+        self.order[key] = True
+        self.order.move_to_end(key)
+
+    def remove(self, key: tuple):
+        self.order.pop(key, None)
+
+    def victim(self, evictable) -> tuple:
+        for key in self.order:
+            if evictable(key):
+                return key
+        return None
+
+
+class ClockPolicy(object):
+    def __init__(self):
+        self.keys = []
+        self.referenced = {}
+        self.hand = 0
+
+    def access(self, key: tuple):
+        if key not in self.referenced:
+            self.keys.append(key)
+        self.referenced[key] = True
+
+    def remove(self, key: tuple):
+        if key in self.referenced:
+            index = self.keys.index(key)
+            del self.keys[index]
+            del self.referenced[key]
+            if index < self.hand:
+                self.hand -= 1
+
+    def victim(self, evictable) -> tuple:
+        # second chance: a referenced frame is skipped once and cleared
+        for _ in range(2 * len(self.keys)):
+            if self.hand >= len(self.keys):
+                self.hand = 0
+            key = self.keys[self.hand]
+            if evictable(key):
+                if not self.referenced[key]:
+                    return key
+                self.referenced[key] = False
+            self.hand += 1
+        return None
+
+
+# the I/O counts of the statement running on each thread
+METER = threading.local()
+
+
+class BufferPool(object):
+    # fixed number of block-sized frames shared by every page file; pages are
+    # read on demand and dirty ones are written back when evicted or flushed.
+    # The latch lets several threads read through one pool
+    def __init__(self, frames: int = 256, policy=None):
+        self.frames = frames
+        self.policy = policy if policy is not None else LRUPolicy()
+        self.table = {}
+        self.latch = threading.RLock()
+        self.reset_stats()
+
+    counters = ("logical_reads", "logical_writes", "hits", "misses",
+                "reads", "writes", "bytes_read", "bytes_written", "seeks",
+                "evictions")
+
+    def reset_stats(self):
+        # logical reads and writes are page accesses through the pool, reads
+        # and writes are the blocks that actually went to or from the disk
+        for name in self.counters:
+            setattr(self, name, 0)
+
+    def counts(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.counters)
+
+    def stats(self) -> dict:
+        stats = {"frames": self.frames, "used": len(self.table)}
+        stats.update(zip(self.counters, self.counts()))
+        return stats
+
+    def add(self, **counts):
+        # counters go to the pool totals and to the meter of the statement
+        # running on this thread, whichever pools it goes through
+        meter = getattr(METER, "counts", None)
+        for name, value in counts.items():
+            setattr(self, name, getattr(self, name) + value)
+            if meter is not None:
+                meter[name] += value
+
+    @staticmethod
+    @contextmanager
+    def meter(counts: dict):
+        # the block accesses made on this thread inside the block are added
+        # to `counts`; meters nest, the inner one takes them
+        outer = getattr(METER, "counts", None)
+        METER.counts = counts
+        try:
+            yield counts
+        finally:
+            METER.counts = outer
+
+    def pin(self, page_file, page: int) -> Frame:
+        key = (page_file, page)
+        with self.latch:
+            frame = self.table.get(key)
+            if frame is None:
+                self.add(misses=1, logical_reads=1)
+                if len(self.table) >= self.frames:
+                    self.evict()
+                frame = Frame(key, bytearray(page_file.read_block(page)))
+                self.table[key] = frame
+            else:
+                self.add(hits=1, logical_reads=1)
+            frame.pins += 1
+            self.policy.access(key)
+        return frame
+
+    def unpin(self, frame: Frame, dirty: bool = False):
+        with self.latch:
+            frame.pins -= 1
+            if dirty:
+                self.add(logical_writes=1)
+                frame.dirty = True
+
+    def evict(self):
+        key = self.policy.victim(lambda x: not self.table[x].pins)
+        if key is None:
+            raise BufferError("all {} frames are pinned".format(self.frames))
+        self.write_back(self.table.pop(key))
+        self.policy.remove(key)
+        self.add(evictions=1)
+
+    def write_back(self, frame: Frame):
+        if frame.dirty:
+            frame.key[0].write_block(frame.key[1], frame.data)
+            frame.dirty = False
+
+    def flush(self, page_file=None):
+        with self.latch:
+            for key, frame in self.table.items():
+                if page_file is None or key[0] is page_file:
+                    self.write_back(frame)
+
+    def drop(self, page_file):
+        # forgets the frames of a file without writing them back
+        with self.latch:
+            for key in [x for x in self.table if x[0] is page_file]:
+                del self.table[key]
+                self.policy.remove(key)
 
 
 #%%
-class DBFile(object):
+class RecordFormat(object):
+    # fixed-length layout built from the widths declared in the schema header:
+    # one flag byte for the slot followed by every field padded to its width
+    FREE = 0
+    LIVE = 1
+
+    def __init__(self, header: List[str], schema_map: dict):
+        self.header = header
+        self.widths = [schema_map.get(x, 1) for x in header]
+        self.layout = struct.Struct(
+            "<B" + "".join("{}s".format(w) for w in self.widths))
+        self.size = self.layout.size
+
+    def pack(self, row: list, flag: int = LIVE) -> bytes:
+        fields = [str(x).encode("latin-1", "replace") if x is not None else b""
+                  for x in row[:len(self.widths)]]
+        fields += [b""] * (len(self.widths) - len(fields))
+        return self.layout.pack(flag, *fields)
+
+    def unpack(self, buffer, fields: set = None) -> tuple:
+        # only the `fields` given (all by default) are decoded, the others
+        # are None
+        values = self.layout.unpack(buffer)
+        if fields is None:
+            return values[0], [x.rstrip(b"\0").decode("latin-1")
+                               for x in values[1:]]
+        return values[0], [x.rstrip(b"\0").decode("latin-1")
+                           if i in fields else None
+                           for i, x in enumerate(values[1:])]
+
+
+class BlockFile(object):
+    # block reads and writes shared by the page, hash and tree files; the
+    # disk accesses, their bytes and the seeks are counted in the buffer pool
+    first_block = 0
+
+    def read_block(self, page: int) -> bytes:
+        self.seek((page + self.first_block) * self.block_size)
+        data = self.file.read(self.block_size)
+        self.pool.add(reads=1, bytes_read=len(data))
+        return data.ljust(self.block_size, b"\0")
+
+    def write_block(self, page: int, data: bytes):
+        self.seek((page + self.first_block) * self.block_size)
+        self.file.write(data)
+        self.pool.add(writes=1, bytes_written=len(data))
+
+    def seek(self, offset: int):
+        # only a jump away from where the last access ended is a seek
+        if self.file.tell() != offset:
+            self.pool.add(seeks=1)
+            self.file.seek(offset)
+
+
+class PageFile(BlockFile):
+    # block 0 holds the file header; records live in fixed-size slots of the
+    # following blocks, so record `rid` is always at the same offset
+    magic = b"CBDP"
+    header_struct = struct.Struct("<4sIII")
+    first_block = 1
+
+    def __init__(self, filename: str, record_format: RecordFormat,
+                 buffer_pool: BufferPool = None, block_size: int = BLOCK_SIZE,
+                 truncate: bool = False):
+        self.filename = filename
+        self.format = record_format
+        self.pool = buffer_pool if buffer_pool is not None else BufferPool()
+        self.block_size = block_size
+        self.per_page = block_size // record_format.size
+        if not self.per_page:
+            raise ValueError("record of {} bytes does not fit in a {} bytes "
+                             "block".format(record_format.size, block_size))
+        self.count = 0
+        if not truncate and os.path.exists(filename) \
+           and os.path.getsize(filename):
+            self.file = open(filename, mode="r+b")
+            magic, block_size, record_size, self.count = \
+                self.header_struct.unpack(
+                    self.file.read(self.header_struct.size))
+            if magic != self.magic or block_size != self.block_size \
+               or record_size != record_format.size:
+                self.file.close()
+                raise OSError(filename + " does not match the schema.")
+        else:
+            self.file = open(filename, mode="w+b")
+            self.write_header()
+
+    def write_header(self):
+        self.file.seek(0)
+        self.file.write(self.header_struct.pack(
+            self.magic, self.block_size, self.format.size, self.count)
+                        .ljust(self.block_size, b"\0"))
+
+    def locate(self, rid: int) -> tuple:
+        page, slot = divmod(rid, self.per_page)
+        return page, slot * self.format.size
+
+    def pages(self) -> int:
+        return -(-self.count // self.per_page)
+
+    def read_record(self, rid: int, fields: set = None) -> list:
+        if not 0 <= rid < self.count:
+            raise IndexError(rid)
+        page, offset = self.locate(rid)
+        frame = self.pool.pin(self, page)
+        flag, row = self.format.unpack(
+            frame.data[offset:offset + self.format.size], fields)
+        self.pool.unpin(frame)
+        return row if flag == RecordFormat.LIVE else None
+
+    def write_record(self, rid: int, row: list, flag: int = RecordFormat.LIVE):
+        if not 0 <= rid < self.count:
+            raise IndexError(rid)
+        page, offset = self.locate(rid)
+        frame = self.pool.pin(self, page)
+        frame.data[offset:offset + self.format.size] = \
+            self.format.pack(row, flag)
+        self.pool.unpin(frame, dirty=True)
+
+    def append_record(self, row: list) -> int:
+        self.count += 1
+        self.write_record(self.count - 1, row)
+        return self.count - 1
+
+    def write_all(self, rows) -> List[int]:
+        # dumps a whole table page by page, bypassing the buffer pool;
+        # returns the rid of every row
+        self.pool.drop(self)
+        self.file.seek(0)
+        self.file.truncate()
+        self.count = 0
+        rids = []
+        page = []
+        for row in rows:
+            page.append(self.format.pack(row))
+            rids.append(len(rids))
+            if len(page) == self.per_page:
+                self.write_block(self.count // self.per_page, b"".join(page))
+                self.count += len(page)
+                page = []
+        if page:
+            self.write_block(self.count // self.per_page, b"".join(page))
+            self.count += len(page)
+        self.write_header()
+        self.file.flush()
+        return rids
+
+    def scan(self, fields: set = None, pages: List[int] = None):
+        # `pages` limits the scan to those pages, in order
+        size = self.format.size
+        for page in range(self.pages()) if pages is None else pages:
+            frame = self.pool.pin(self, page)
+            first = page * self.per_page
+            rows = []
+            for slot in range(min(self.per_page, self.count - first)):
+                flag, row = self.format.unpack(
+                    frame.data[slot * size:(slot + 1) * size], fields)
+                if flag == RecordFormat.LIVE:
+                    rows.append((first + slot, row))
+            self.pool.unpin(frame)
+            yield from rows
+
+    def free_slots(self) -> List[int]:
+        # rids of the tombstoned slots, in order
+        size = self.format.size
+        free = []
+        for page in range(self.pages()):
+            frame = self.pool.pin(self, page)
+            first = page * self.per_page
+            free.extend(first + slot
+                        for slot in range(min(self.per_page, self.count - first))
+                        if frame.data[slot * size] == RecordFormat.FREE)
+            self.pool.unpin(frame)
+        return free
+
+    def flush(self):
+        self.pool.flush(self)
+        self.write_header()
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        self.pool.drop(self)
+        self.file.close()
+
+
+class HashFile(BlockFile):
+    # linear hashing: a bucket is a chain of fixed-size pages and buckets are
+    # split one at a time, round robin, whenever the file gets too full. The
+    # bucket directory (bucket -> first page) and the free overflow pages are
+    # kept in a small side file
+    magic = b"CBDH"
+    header_struct = struct.Struct("<4sIIIIIII")
+    page_struct = struct.Struct("<iH")
+    split_load = 0.8
+
+    def __init__(self, filename: str, record_format: RecordFormat, key,
+                 buffer_pool: BufferPool = None, block_size: int = BLOCK_SIZE,
+                 buckets: int = 1, truncate: bool = False):
+        self.filename = filename
+        self.directory_file = filename + ".dir"
+        self.format = record_format
+        self.key = key
+        self.pool = buffer_pool if buffer_pool is not None else BufferPool()
+        self.block_size = block_size
+        self.per_page = (block_size - self.page_struct.size) // record_format.size
+        if not self.per_page:
+            raise ValueError("record of {} bytes does not fit in a {} bytes "
+                             "block".format(record_format.size, block_size))
+        if not truncate and os.path.exists(filename) \
+           and os.path.getsize(filename):
+            self.file = open(filename, mode="r+b")
+            magic, block_size, record_size, self.initial, self.level, \
+                self.next, self.page_count, self.count = \
+                self.header_struct.unpack(
+                    self.file.read(self.header_struct.size))
+            if magic != self.magic or block_size != self.block_size \
+               or record_size != record_format.size:
+                self.file.close()
+                raise OSError(filename + " does not match the schema.")
+            with open(self.directory_file, mode="rb") as f:
+                sizes = array("I")
+                sizes.fromfile(f, 2)
+                self.directory = array("I")
+                self.directory.fromfile(f, sizes[0])
+                self.free = array("I")
+                self.free.fromfile(f, sizes[1])
+            self.directory_dirty = False
+        else:
+            self.file = open(filename, mode="w+b")
+            self.initial = max(1, buckets)
+            self.level = 0
+            self.next = 0
+            self.page_count = 0
+            self.count = 0
+            self.directory = array("I")
+            self.free = array("I")
+            for _ in range(self.initial):
+                self.directory.append(self.new_page())
+            self.flush()
+
+    def new_page(self) -> int:
+        # block 0 is the file header, so page numbers start at 1
+        if self.free:
+            page = self.free.pop()
+        else:
+            self.page_count += 1
+            page = self.page_count
+        frame = self.pool.pin(self, page)
+        self.page_struct.pack_into(frame.data, 0, -1, 0)
+        self.pool.unpin(frame, dirty=True)
+        self.directory_dirty = True
+        return page
+
+    def hash(self, key: str) -> int:
+        return zlib.crc32(key.encode("latin-1", "replace"))
+
+    def bucket_of(self, key: str) -> int:
+        h = self.hash(key)
+        bucket = h % (self.initial << self.level)
+        if bucket < self.next:
+            bucket = h % (self.initial << (self.level + 1))
+        return bucket
+
+    def chain(self, bucket: int) -> List[int]:
+        pages = []
+        page = self.directory[bucket]
+        while page != -1:
+            pages.append(page)
+            frame = self.pool.pin(self, page)
+            page = self.page_struct.unpack_from(frame.data)[0]
+            self.pool.unpin(frame)
+        return pages
+
+    def read_page(self, page: int, fields: set = None) -> List[list]:
+        size = self.format.size
+        frame = self.pool.pin(self, page)
+        used = self.page_struct.unpack_from(frame.data)[1]
+        start = self.page_struct.size
+        rows = [self.format.unpack(frame.data[start + i * size:
+                                              start + (i + 1) * size],
+                                   fields)[1]
+                for i in range(used)]
+        self.pool.unpin(frame)
+        return rows
+
+    def write_page(self, page: int, rows: List[list], next_page: int = None):
+        frame = self.pool.pin(self, page)
+        if next_page is None:
+            next_page = self.page_struct.unpack_from(frame.data)[0]
+        self.page_struct.pack_into(frame.data, 0, next_page, len(rows))
+        start = self.page_struct.size
+        frame.data[start:start + len(rows) * self.format.size] = \
+            b"".join(self.format.pack(x) for x in rows)
+        self.pool.unpin(frame, dirty=True)
+
+    def place(self, bucket: int, row: list):
+        pages = self.chain(bucket)
+        for page in pages:
+            rows = self.read_page(page)
+            if len(rows) < self.per_page:
+                return self.write_page(page, rows + [row])
+        overflow = self.new_page()
+        self.write_page(overflow, [row])
+        frame = self.pool.pin(self, pages[-1])
+        self.page_struct.pack_into(frame.data, 0, overflow,
+                                   self.page_struct.unpack_from(frame.data)[1])
+        self.pool.unpin(frame, dirty=True)
+
+    def insert(self, row: list):
+        self.place(self.bucket_of(self.key(row)), row)
+        self.count += 1
+        if self.count > self.split_load * self.per_page * len(self.directory):
+            self.split()
+
+    def split(self):
+        # moves the records of bucket `next` between it and its new image
+        bucket = self.next
+        pages = self.chain(bucket)
+        rows = [x for page in pages for x in self.read_page(page)]
+        self.write_page(pages[0], [], -1)
+        self.free.extend(reversed(pages[1:]))
+        self.directory.append(self.new_page())
+        self.next += 1
+        if self.next == self.initial << self.level:
+            self.level += 1
+            self.next = 0
+        for row in rows:
+            self.place(self.bucket_of(self.key(row)), row)
+
+    def find(self, predicate, buckets=None, fields: set = None) -> List[list]:
+        buckets = range(len(self.directory)) if buckets is None else buckets
+        return [x for bucket in buckets for page in self.chain(bucket)
+                for x in self.read_page(page, fields) if predicate(x)]
+
+    def remove(self, predicate, buckets=None) -> List[list]:
+        removed = []
+        buckets = range(len(self.directory)) if buckets is None else buckets
+        for bucket in buckets:
+            for page in self.chain(bucket):
+                rows = self.read_page(page)
+                kept = [x for x in rows if not predicate(x)]
+                if len(kept) != len(rows):
+                    self.write_page(page, kept)
+                    removed += [x for x in rows if predicate(x)]
+        self.count -= len(removed)
+        return removed
+
+    def scan(self, buckets=None, fields: set = None):
+        buckets = range(len(self.directory)) if buckets is None else buckets
+        for bucket in buckets:
+            for page in self.chain(bucket):
+                yield from self.read_page(page, fields)
+
+    def flush(self):
+        self.pool.flush(self)
+        self.file.seek(0)
+        self.file.write(self.header_struct.pack(
+            self.magic, self.block_size, self.format.size, self.initial,
+            self.level, self.next, self.page_count, self.count)
+                        .ljust(self.block_size, b"\0"))
+        self.file.flush()
+        if self.directory_dirty:
+            with open(self.directory_file, mode="wb") as f:
+                array("I", [len(self.directory), len(self.free)]).tofile(f)
+                self.directory.tofile(f)
+                self.free.tofile(f)
+            self.directory_dirty = False
+
+    def close(self):
+        self.flush()
+        self.pool.drop(self)
+        self.file.close()
+
+
+class BPlusTree(BlockFile):
+    # disk-backed B+-tree of (key, rid) entries with linked leaves. Keys are
+    # int64 for INTEGER columns or fixed-width strings otherwise; duplicates
+    # are allowed. Deletes leave underfull nodes behind instead of merging
+    magic = b"CBDB"
+    header_struct = struct.Struct("<4sIIiIQ8s")
+    node_struct = struct.Struct("<BHi")
+    fill = 0.9
+
+    def __init__(self, filename: str, key_width: int = 0,
+                 buffer_pool: BufferPool = None, block_size: int = BLOCK_SIZE,
+                 truncate: bool = False, value_format: str = "I"):
+        # values are record ids: "I" for slot numbers, "<n>s" for the
+        # fixed-width keys of a hash file
+        self.filename = filename
+        self.pool = buffer_pool if buffer_pool is not None else BufferPool()
+        self.block_size = block_size
+        if not truncate and os.path.exists(filename) \
+           and os.path.getsize(filename):
+            self.file = open(filename, mode="r+b")
+            magic, block_size, key_width, self.root, self.page_count, \
+                self.count, value_format = self.header_struct.unpack(
+                    self.file.read(self.header_struct.size))
+            value_format = value_format.rstrip(b"\0").decode()
+            if magic != self.magic or block_size != self.block_size:
+                self.file.close()
+                raise OSError(filename + " is not a B+-tree file.")
+        else:
+            self.file = open(filename, mode="w+b")
+            self.root = -1
+            self.page_count = 0
+            self.count = 0
+        self.key_width = key_width
+        self.value_format = value_format
+        self.key_struct = struct.Struct("<q" if not key_width
+                                        else "<{}s".format(key_width))
+        # leaves hold (key, rid) entries, internal nodes (key, child page)
+        self.entry_struct = struct.Struct(self.key_struct.format + value_format)
+        self.child_struct = struct.Struct(self.key_struct.format + "I")
+        self.capacity = (block_size - self.node_struct.size - 4) \
+            // max(self.entry_struct.size, self.child_struct.size)
+        if self.root == -1:
+            self.root = self.new_page()
+            self.write_node(self.root, True, [], [], -1)
+            self.flush()
+
+    def new_page(self) -> int:
+        self.page_count += 1
+        return self.page_count
+
+    def encode(self, key):
+        return key if not self.key_width \
+            else str(key).encode("latin-1", "replace")
+
+    def decode(self, key):
+        return key if not self.key_width else key.rstrip(b"\0").decode("latin-1")
+
+    def read_node(self, page: int) -> tuple:
+        # leaf: (True, keys, rids, next leaf)
+        # internal: (False, keys, children, -1) with len(children) == n + 1
+        frame = self.pool.pin(self, page)
+        leaf, n, next_leaf = self.node_struct.unpack_from(frame.data)
+        offset = self.node_struct.size
+        if leaf:
+            entries = [self.entry_struct.unpack_from(
+                frame.data, offset + i * self.entry_struct.size)
+                       for i in range(n)]
+            keys = [self.decode(x[0]) for x in entries]
+            values = [x[1] for x in entries]
+        else:
+            first = struct.unpack_from("<I", frame.data, offset)[0]
+            entries = [self.child_struct.unpack_from(
+                frame.data, offset + 4 + i * self.child_struct.size)
+                       for i in range(n)]
+            keys = [self.decode(x[0]) for x in entries]
+            values = [first] + [x[1] for x in entries]
+        self.pool.unpin(frame)
+        return bool(leaf), keys, values, next_leaf
+
+    def write_node(self, page: int, leaf: bool, keys: list, values: list,
+                   next_leaf: int = -1):
+        parts = [self.node_struct.pack(leaf, len(keys), next_leaf)]
+        pairs = zip(keys, values)
+        entry = self.entry_struct
+        if not leaf:
+            parts.append(struct.pack("<I", values[0]))
+            pairs = zip(keys, values[1:])
+            entry = self.child_struct
+        parts += [entry.pack(self.encode(k), v) for k, v in pairs]
+        frame = self.pool.pin(self, page)
+        data = b"".join(parts)
+        frame.data[:len(data)] = data
+        self.pool.unpin(frame, dirty=True)
+
+    def bulk_load(self, entries):
+        # builds the tree bottom-up from (key, rid) pairs sorted by key
+        self.pool.drop(self)
+        self.file.seek(0)
+        self.file.truncate()
+        self.page_count = 0
+        self.count = 0
+        per_node = max(1, int(self.capacity * self.fill))
+        level = []
+        keys, rids = [], []
+        previous = None
+        for key, rid in entries:
+            keys.append(key)
+            rids.append(rid)
+            if len(keys) == per_node:
+                previous = self.bulk_leaf(level, previous, keys, rids)
+                keys, rids = [], []
+        if keys or not level:
+            self.bulk_leaf(level, previous, keys, rids)
+        while len(level) > 1:
+            upper = []
+            for i in range(0, len(level), per_node + 1):
+                group = level[i:i + per_node + 1]
+                page = self.new_page()
+                self.write_node(page, False, [x[0] for x in group[1:]],
+                                [x[1] for x in group])
+                upper.append((group[0][0], page))
+            level = upper
+        self.root = level[0][1]
+        self.flush()
+
+    def bulk_leaf(self, level: list, previous: tuple, keys: list, rids: list):
+        page = self.new_page()
+        self.write_node(page, True, keys, rids, -1)
+        if previous is not None:
+            # links the previous leaf now that its successor exists
+            self.write_node(previous[0], True, previous[1], previous[2], page)
+        level.append((keys[0] if keys else None, page))
+        self.count += len(keys)
+        return page, keys, rids
+
+    def leaf_for(self, key) -> tuple:
+        # leftmost leaf that may hold `key`, and the path of internal nodes
+        path = []
+        page = self.root
+        leaf, keys, values, next_leaf = self.read_node(page)
+        while not leaf:
+            index = bisect.bisect_left(keys, key)
+            path.append((page, index))
+            page = values[index]
+            leaf, keys, values, next_leaf = self.read_node(page)
+        return page, path
+
+    def range(self, low=None, high=None):
+        # yields (key, rid) with low <= key <= high in key order
+        if low is None:
+            page = self.root
+            leaf, keys, values, next_leaf = self.read_node(page)
+            while not leaf:
+                page = values[0]
+                leaf, keys, values, next_leaf = self.read_node(page)
+        else:
+            page = self.leaf_for(low)[0]
+        while page != -1:
+            leaf, keys, values, next_leaf = self.read_node(page)
+            start = 0 if low is None else bisect.bisect_left(keys, low)
+            for key, rid in zip(keys[start:], values[start:]):
+                if high is not None and key > high:
+                    return
+                yield key, rid
+            page = next_leaf
+
+    def search(self, key) -> List[int]:
+        return [rid for _, rid in self.range(key, key)]
+
+    def insert(self, key, rid: int):
+        page = self.root
+        path = []
+        leaf, keys, values, next_leaf = self.read_node(page)
+        while not leaf:
+            index = bisect.bisect_right(keys, key)
+            path.append((page, index))
+            page = values[index]
+            leaf, keys, values, next_leaf = self.read_node(page)
+        index = bisect.bisect_right(keys, key)
+        keys.insert(index, key)
+        values.insert(index, rid)
+        self.count += 1
+        if len(keys) <= self.capacity:
+            return self.write_node(page, True, keys, values, next_leaf)
+
+        middle = len(keys) // 2
+        right = self.new_page()
+        self.write_node(right, True, keys[middle:], values[middle:], next_leaf)
+        self.write_node(page, True, keys[:middle], values[:middle], right)
+        separator = keys[middle]
+        while path:
+            # the new node goes right after the child that was split, which
+            # with duplicate keys is not always where bisect would put it
+            parent, index = path.pop()
+            leaf, keys, values, _ = self.read_node(parent)
+            keys.insert(index, separator)
+            values.insert(index + 1, right)
+            if len(keys) <= self.capacity:
+                return self.write_node(parent, False, keys, values)
+            middle = len(keys) // 2
+            right = self.new_page()
+            self.write_node(right, False, keys[middle + 1:], values[middle + 1:])
+            self.write_node(parent, False, keys[:middle], values[:middle + 1])
+            separator = keys[middle]
+        root = self.new_page()
+        self.write_node(root, False, [separator], [self.root, right])
+        self.root = root
+
+    def delete(self, key, rid: int = None) -> int:
+        removed = 0
+        page = self.leaf_for(key)[0]
+        while page != -1:
+            leaf, keys, values, next_leaf = self.read_node(page)
+            kept = [(k, v) for k, v in zip(keys, values)
+                    if not (k == key and (rid is None or v == rid))]
+            if len(kept) != len(keys):
+                removed += len(keys) - len(kept)
+                self.write_node(page, True, [x[0] for x in kept],
+                                [x[1] for x in kept], next_leaf)
+            if keys and keys[-1] > key:
+                break
+            page = next_leaf
+        self.count -= removed
+        return removed
+
+    def flush(self):
+        self.pool.flush(self)
+        self.file.seek(0)
+        self.file.write(self.header_struct.pack(
+            self.magic, self.block_size, self.key_width, self.root,
+            self.page_count, self.count, self.value_format.encode())
+                        .ljust(self.block_size, b"\0"))
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        self.pool.drop(self)
+        self.file.close()
+
+
+class BloomFilter(object):
+    # bit array sized for `capacity` keys at the false positive rate `error`;
+    # the bits of a key come from one blake2b digest split in two (double
+    # hashing), so filters of one size can share the digest of a key
+    __slots__ = ("size", "hashes", "error", "bits")
+
+    def __init__(self, capacity: int, error: float = 0.01):
+        capacity = max(capacity, 1)
+        self.error = error
+        self.size = max(64, int(-capacity * math.log(error) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(-(-self.size // 8))
+
+    @staticmethod
+    def digest(key) -> tuple:
+        digest = hashlib.blake2b(str(key).encode("latin-1", "replace"),
+                                 digest_size=16).digest()
+        return (int.from_bytes(digest[:8], "little"),
+                int.from_bytes(digest[8:], "little") | 1)
+
+    def positions(self, digest: tuple):
+        first, second = digest
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, digest: tuple):
+        for x in self.positions(digest):
+            self.bits[x >> 3] |= 1 << (x & 7)
+
+    def holds(self, positions: List[int]) -> bool:
+        bits = self.bits
+        return all(bits[x >> 3] & (1 << (x & 7)) for x in positions)
+
+    def __contains__(self, key) -> bool:
+        return self.holds(self.positions(self.digest(key)))
+
+
+#%%
+class WriteAheadLog(object):
+    # append-only log of the inserts and deletes made since the last
+    # compaction; every entry is (op, length, crc32) and a latin-1 payload
+    header_struct = struct.Struct("<4sQ")
+    entry_struct = struct.Struct("<BII")
+    INSERT, DELETE, UNDO = 1, 2, 3
+    SEPARATOR = "\x1f"
+
+    def __init__(self, filename: str, durability: str = "commit"):
+        # durability: "always" syncs every entry, "commit" every statement
+        # or batch, "none" leaves it to the operating system
+        assert durability in ("always", "commit", "none")
+        self.filename = filename
+        self.durability = durability
+        if not os.path.exists(filename):
+            self.create(1)
+        self.file = open(filename, "r+b")
+        magic, self.generation = self.header_struct.unpack(
+            self.file.read(self.header_struct.size))
+        assert magic == b"CBDL", filename + " is not a log file"
+        self.file.seek(0, 2)
+
+    def create(self, generation: int):
+        # the new log replaces the old one in a single rename
+        with open(self.filename + ".tmp", "wb") as f:
+            f.write(self.header_struct.pack(b"CBDL", generation))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(self.filename + ".tmp", self.filename)
+
+    def reset(self, generation: int):
+        self.file.close()
+        self.create(generation)
+        self.file = open(self.filename, "r+b")
+        self.generation = generation
+        self.file.seek(0, 2)
+
+    def read(self) -> List[tuple]:
+        # a torn or corrupt entry ends the log, it and anything after it is
+        # cut off
+        entries = []
+        offset = self.header_struct.size
+        self.file.seek(offset)
+        while True:
+            head = self.file.read(self.entry_struct.size)
+            if len(head) < self.entry_struct.size:
+                break
+            op, length, crc = self.entry_struct.unpack(head)
+            payload = self.file.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break
+            entries.append((op, payload.decode("latin-1")))
+            offset = self.file.tell()
+        self.file.seek(offset)
+        self.file.truncate()
+        return entries
+
+    def append(self, op: int, text: str):
+        payload = text.encode("latin-1", "replace")
+        self.file.write(self.entry_struct.pack(op, len(payload),
+                                               zlib.crc32(payload)) + payload)
+        if self.durability == "always":
+            self.sync()
+
+    def sync(self):
+        self.file.flush()
+        if self.durability != "none":
+            os.fsync(self.file.fileno())
+
+    def size(self) -> int:
+        return self.file.tell()
+
+    def close(self):
+        self.sync()
+        self.file.close()
+
+
+class Parameter(object):
+    # a `?` placeholder, bound by position when the statement runs
+    __slots__ = ("position",)
+
+    def __init__(self, position: int):
+        self.position = position
+
+
+class Plan(object):
+    # a compiled statement: the columns it returns (and their indexes, None
+    # for all), its WHERE terms as (index, op, value), the row it inserts, a
+    # predicate over records and the ORDER BY (index, descending) pairs,
+    # LIMIT and OFFSET of a select. The indexes of a join select are into
+    # the joined row, `join` holds the two tables. A GROUP BY select has
+    # `group` = (grouped indexes, [(function or None, index)] per column)
+    # and its ORDER BY indexes are into the columns it returns
+    def __init__(self, kind: str, columns: List[str] = None,
+                 terms: List[tuple] = (), row: list = None,
+                 indexes: List[int] = None, limit=None, offset=0,
+                 order: List[tuple] = None, join: "JoinedTables" = None,
+                 group: tuple = None):
+        self.kind = kind
+        self.columns = columns
+        self.indexes = indexes
+        self.order = order
+        self.join = join
+        self.group = group
+        self.terms = list(terms)
+        self.row = row
+        self.limit = limit
+        self.offset = offset
+        self.parameters = 0
+        self.predicate = None
+
+    def stop(self) -> int:
+        return self.offset + self.limit if self.limit is not None else None
+
+    def unlimited(self) -> "Plan":
+        plan = copy.copy(self)
+        plan.limit = None
+        plan.offset = 0
+        return plan
+
+    def prepare(self, db: "DBFile"):
+        # numbers the placeholders in the order they appear in the statement
+        def mark(value):
+            if value == "?":
+                self.parameters += 1
+                return Parameter(self.parameters - 1)
+            return value
+
+        self.terms = [(index, op, tuple(mark(x) for x in value)
+                       if op != "=" else mark(value))
+                      for index, op, value in self.terms]
+        if self.row is not None:
+            self.row = [mark(x) for x in self.row]
+        self.limit = mark(self.limit)
+        self.offset = mark(self.offset)
+        if not self.parameters:
+            self.predicate = db.predicate(self.terms)
+
+    def bind(self, db: "DBFile", params: tuple) -> "Plan":
+        if len(params) != self.parameters:
+            raise ValueError("statement takes {} parameters, {} given"
+                             .format(self.parameters, len(params)))
+
+        def value_of(index, value):
+            if isinstance(value, Parameter):
+                return db.typed(index, str(params[value.position]))
+            return value
+
+        plan = Plan(self.kind, self.columns, indexes=self.indexes,
+                    order=self.order, join=self.join, group=self.group)
+        plan.limit, plan.offset = [
+            int(params[x.position]) if isinstance(x, Parameter) else x
+            for x in (self.limit, self.offset)]
+        plan.terms = [(index, op, tuple(value_of(index, x) for x in value)
+                       if op != "=" else value_of(index, value))
+                      for index, op, value in self.terms]
+        if self.row is not None:
+            plan.row = [str(params[x.position]) if isinstance(x, Parameter)
+                        else x for x in self.row]
+        plan.predicate = db.predicate(plan.terms)
+        return plan
+
+
+class Cursor(object):
+    # the rows of a select, produced only as they are fetched
+    arraysize = 100
+
+    def __init__(self, rows, columns: List[str]):
+        self.rows = iter(rows)
+        self.columns = columns
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.rows)
+
+    def fetchone(self):
+        return next(self.rows, None)
+
+    def fetchmany(self, size: int = None) -> list:
+        return list(islice(self.rows, size or self.arraysize))
+
+    def fetchall(self) -> list:
+        return list(self.rows)
+
+    def close(self):
+        # rows left unfetched are dropped; a metered select records its
+        # statistics here
+        rows, self.rows = self.rows, iter(())
+        if hasattr(rows, "close"):
+            rows.close()
+
+
+class PlanCache(OrderedDict):
+    def __init__(self, size: int):
+        self.size = size
+        self.latch = threading.Lock()
+        super().__init__()
+
+    def get(self, key: str) -> Plan:
+        with self.latch:
+            plan = super().get(key)
+            if plan is not None:
+                self.move_to_end(key)
+        return plan
+
+    def put(self, key: str, plan: Plan):
+        with self.latch:
+            self[key] = plan
+            self.move_to_end(key)
+            if len(self) > self.size:
+                self.popitem(last=False)
+
+
+#%%
+class QueryTerms(object):
+    # WHERE, ORDER BY and GROUP BY clauses turned into terms, and terms into
+    # row tests and sort keys; shared by the tables and their joins, which
+    # provide `header`, `column_index` and `typed`
+    def tokens(self, statement) -> List[str]:
+        return [str(x) for x in statement if not x.is_whitespace]
+
+    def where_terms(self, statement) -> List[tuple]:
+        # "a=1 and b in (1,2) and c between 1 and 2" -> [(index, op, value)];
+        # the terms have to make up the whole clause, anything else (other
+        # operators, or) is refused rather than dropped
+        for token in self.tokens(statement):
+            if token.lower().startswith("where"):
+                text = token[len("where"):]
+                terms, end = [], 0
+                for found in WHERE_TERM.finditer(text):
+                    if found.start() != end:
+                        break
+                    terms.append(self.where_term(*found.groups()))
+                    end = found.end()
+                if not terms or text[end:].strip() \
+                        or re.search(r"\band\s*;?\s*$", text, re.IGNORECASE):
+                    raise ValueError("unsupported where clause: "
+                                     + (text[end:].strip() or text.strip()))
+                return terms
+        return []
+
+    def where_term(self, column, equals, in_list, low, high) -> tuple:
+        index = self.column_index(column)
+        if in_list:
+            return index, "in", tuple(self.typed(index, x)
+                                      for x in in_list.split(","))
+        if low:
+            return index, "between", (self.typed(index, low),
+                                      self.typed(index, high))
+        return index, "=", self.typed(index, equals)
+
+    def field_key(self, index: int, row: list) -> tuple:
+        # INTEGER fields sort numerically, ahead of malformed ones
+        value = self.typed(index, row[index]) if index < len(row) else ""
+        return (0, value) if isinstance(value, int) else (1, value)
+
+    def order_terms(self, clause: str) -> List[tuple]:
+        # "COLUMN [ASC|DESC], ..." -> [(index, descending)]
+        order = []
+        for item in clause.split(","):
+            words = item.split()
+            if not words or len(words) > 2 or (
+                    len(words) == 2 and words[1].lower() not in ("asc", "desc")):
+                raise ValueError("bad ORDER BY term: " + item.strip())
+            order.append((self.column_index(words[0]),
+                          len(words) == 2 and words[1].lower() == "desc"))
+        return order
+
+    def order_key(self, order: List[tuple]):
+        def key(row):
+            return tuple(Descending(self.field_key(index, row)) if descending
+                         else self.field_key(index, row)
+                         for index, descending in order)
+        return key
+
+    def group_terms(self, columns: List[str], clause: str) -> tuple:
+        # "SG_UF,COUNT(*)" grouped by "SG_UF" -> ([index], [(None, index),
+        # ("count", None)]); None stands for the * of COUNT(*)
+        group = [self.column_index(x.strip()) for x in clause.split(",")
+                 if x.strip()]
+        outputs = []
+        for column in columns:
+            found = AGGREGATE.match(column)
+            if found is None:
+                if self.column_index(column) not in group:
+                    raise ValueError(column + " is neither grouped nor "
+                                     "aggregated")
+                outputs.append((None, self.column_index(column)))
+            elif found.group(2) == "*":
+                if found.group(1).lower() != "count":
+                    raise ValueError("only COUNT takes *")
+                outputs.append(("count", None))
+            else:
+                outputs.append((found.group(1).lower(),
+                                self.column_index(found.group(2))))
+        return group, outputs
+
+    def predicate(self, terms: List[tuple]):
+        tests = [self.term_test(*x) for x in terms]
+        return lambda record: all(test(record) for test in tests)
+
+    def term_test(self, index: int, op: str, value):
+        test = self.value_test(op, value)
+        return lambda record: test(
+            self.typed(index, record[index]) if index < len(record) else "")
+
+    def value_test(self, op: str, value):
+        if op == "in":
+            value = set(value)
+
+        def test(field) -> bool:
+            try:
+                if op == "=":
+                    return field == value
+                if op == "in":
+                    return field in value
+                return value[0] <= field <= value[1]
+            except TypeError: # malformed field in an INTEGER column
+                return False
+        return test
+
+
+class DBFile(QueryTerms):
     data = None
     header = None
     schema_map = {}
+    schema_types = {}
+    buffer_pool = BufferPool()
+    indexes = {}
+    index_columns = []
+    bloom_columns = {}
+    bloom_error = 0.01
+    blooms = None
+    page_blooms = {}
+    id_format = "I"
+    plans = None
+    plan_cache_size = 256
+    batch_depth = 0
+    pending = []
+    log = None
+    log_rows = []
+    log_deleted = set()
+    checkpoint = 0
+    compact_size = 1 << 20
+    compact_interval = None
+    compactor = None
+    compact_due = False
+    sort_memory = ExternalSort.memory
+    scan_processes = 1
+    scan_pages = 256
+    lock = None
+    trace = None
+    last_stats = None
+    totals = None
+    fingerprint = None
+    attached = None
     struct = ""
     schema = ""
     record_file = ""
 
     def __init__(self, schema_file: str):
+        self.schema_file = schema_file
+        self.lock = threading.RLock()
+        self.schema_map = {}
+        self.schema_types = {}
+        self.indexes = {}
+        self.index_columns = []
+        self.bloom_columns = {}
+        self.blooms = None
+        # the fingerprint is only recorded once the record files are written
+        fingerprint, self.fingerprint = self.fingerprint, None
+        now = datetime.now().strftime("%Y%m%d%H%M%S")
         try:
-            schema_str = ""
-            now = datetime.now().strftime("%Y%m%d%H%M%S")
             f = open(file=schema_file, mode="r", encoding="latin-1")
             file_content = f.readlines()
+            f.close()
             if not file_content:
                 raise OSError(schema_file + " was empty.")
 
-            schema_str += "".join(
-                file_content[:2]
-                + ["Modification date: {}".format(now) + "\n"]
-                + [file_content[-1]])
-            f.close()
-
-            for x in file_content[-1].replace("Schema: ",
-                                              "").replace(")", "").split(";"):
-                if x:
-                    self.schema_map[x.split(":")[0]] = int(x.split(":")[1].split("(")[1])
+            self.schema_head = file_content[:2]
+            self.load_schema(file_content[-1])
+            self.load_indexes(file_content)
+            self.load_checkpoint(file_content)
         except OSError:
-            schema_str = "File structure: {}\n" \
-            "Creation date: {}\n" \
-            "Modification date: {}\n" \
-            "Schema: {}".format(self.struct, now, now, self.schema)
+            self.schema_head = ["File structure: {}\n".format(self.struct),
+                                "Creation date: {}\n".format(now)]
         finally:
-            f = open(file=schema_file, mode="w", encoding="latin-1")
-            f.write(schema_str)
-            f.close()
-
-
+            self.fit_schema()
+            self.write_schema()
+
+        self.write_to_file()
+        if os.path.exists(self.log_filename()):
+            # the table was rebuilt, what the log holds no longer applies
+            os.remove(self.log_filename())
+        if fingerprint is not None:
+            self.fingerprint = fingerprint
+            self.write_schema()
+
+    def name_files(self, record_file: str = None):
+        # a table kept under another name than the engine's own record file;
+        # the files that go with it are named after it
+        if record_file is not None:
+            self.record_file = record_file
+
+    def source(self, filename, processes: int = None) -> CSVSource:
+        if isinstance(filename, CSVSource):
+            return filename
+        return CSVSource(filename, processes)
+
+    def write_schema(self):
+        now = datetime.now().strftime("%Y%m%d%H%M%S")
+        f = open(file=self.schema_file, mode="w", encoding="latin-1")
+        f.write("".join(self.schema_head
+                        + ["Modification date: {}".format(now) + "\n"]
+                        + self.schema_lines()
+                        + [self.schema_line()]))
+        f.close()
+
+    def schema_lines(self) -> List[str]:
+        indexes = ["Indexes: {}\n".format(";".join(self.index_columns))] \
+            if self.index_columns else []
+        indexes += [self.bloom_line()] if self.bloom_columns else []
+        checkpoint = ["Checkpoint: {}\n".format(self.checkpoint)] \
+            if self.checkpoint else []
+        source = ["Source: {}\n".format(self.fingerprint)] \
+            if self.fingerprint else []
+        return indexes + checkpoint + source
+
+    def read_schema(self, schema_file: str):
+        # used when a table is reopened from its record file
+        self.schema_file = schema_file
+        self.lock = threading.RLock()
+        self.schema_map = {}
+        self.schema_types = {}
+        self.indexes = {}
+        self.blooms = None
+        with open(file=schema_file, mode="r", encoding="latin-1") as f:
+            file_content = f.readlines()
+        self.schema_head = file_content[:2]
+        self.header = self.load_schema(file_content[-1])
+        self.schema = ":{}({});".join(self.header)
+        self.load_indexes(file_content)
+        self.load_checkpoint(file_content)
+        self.fingerprint = self.load_source(file_content)
+        for name in self.index_columns:
+            self.indexes[self.header.index(name)] = BPlusTree(
+                self.index_filename(name), self.index_width(name),
+                self.buffer_pool, value_format=self.id_format)
+
+    def load_indexes(self, file_content: List[str]):
+        self.index_columns = []
+        self.bloom_columns = {}
+        for line in file_content:
+            if line.startswith("Indexes: "):
+                self.index_columns = [x for x in line[len("Indexes: "):]
+                                      .strip().split(";") if x]
+            if line.startswith("Bloom filters: "):
+                # COLUMN:ERROR pairs
+                self.bloom_columns = {
+                    x.split(":")[0]: float(x.split(":")[1])
+                    for x in line[len("Bloom filters: "):].strip().split(";")
+                    if x}
+
+    def bloom_line(self) -> str:
+        return "Bloom filters: {}\n".format(";".join(
+            "{}:{}".format(x, y) for x, y in self.bloom_columns.items()))
+
+    def load_checkpoint(self, file_content: List[str]):
+        # generation of the last log folded into the record file
+        self.checkpoint = 0
+        for line in file_content:
+            if line.startswith("Checkpoint: "):
+                self.checkpoint = int(line[len("Checkpoint: "):])
+
+    def load_source(self, file_content: List[str]) -> str:
+        # fingerprint of the csv files the record files were built from
+        for line in file_content:
+            if line.startswith("Source: "):
+                return line[len("Source: "):].strip()
+        return None
+
+    def reuse(self, schema_file: str, **options) -> bool:
+        # a table built before from the same csv files, and not changed
+        # since, is reopened from its record files instead of parsing the
+        # csv files again; otherwise the new fingerprint is kept for the
+        # schema file the load writes
+        fingerprint = "{}:{}:{}".format(
+            self.struct, ",".join(str(x) for x in options.get("parameters", ())),
+            self.data.fingerprint())
         try:
-            f = open(file=self.record_file, mode="w", encoding="latin-1")
-            for x in self.data:
-                f.write(";".join(x) + "\n")
-            f.close()
+            with open(schema_file, mode="r", encoding="latin-1") as f:
+                stored = self.load_source(f.readlines())
         except OSError:
-            pass
+            stored = None
+        if stored != fingerprint or not os.path.exists(self.record_file):
+            self.fingerprint = fingerprint
+            return False
+        self.data = None
+        self.reopen(schema_file, record_file=self.record_file, **options)
+        return True
 
+    @classmethod
+    def open(cls, schema_file: str, **options):
+        # reloads a table from its record files instead of the source csv;
+        # the options are those of the engine's reopen()
+        self = cls.__new__(cls)
+        self.reopen(schema_file, **options)
+        return self
 
-    def select(self, statement):
+    def reopen(self, schema_file: str, **options):
         raise NotImplementedError
+
+    def modified(self):
+        # the table no longer holds just what its csv files did
+        if self.fingerprint is not None:
+            self.fingerprint = None
+            self.write_schema()
+
+    def load_schema(self, line: str) -> List[str]:
+        names = []
+        for x in line.replace("Schema: ", "").replace(")", "").strip().split(";"):
+            if x and "(" in x:
+                names.append(x.split(":")[0])
+                self.schema_map[names[-1]] = int(x.split(":")[1].split("(")[1])
+                self.schema_types[names[-1]] = x.split(":")[1].split("(")[0]
+        return names
+
+    def fit_schema(self, rows=None) -> bool:
+        # widens the declared sizes the data does not fit in, so fixed-length
+        # records never truncate a field; tells whether anything changed
+        changed = False
+        rows = self.data if rows is None else rows
+        widths = rows.widths() if isinstance(rows, CSVSource) \
+            else column_widths(rows, len(self.header))
+        for i, name in enumerate(self.header):
+            if widths[i] > self.schema_map.get(name, 0):
+                self.schema_map[name] = widths[i]
+                changed = True
+            self.schema_types.setdefault(name, "VARCHAR")
+        return changed
+
+    def schema_line(self) -> str:
+        return "Schema: " + "".join(
+            "{}:{}({});".format(x, self.schema_types[x], self.schema_map[x])
+            for x in self.header)
+
+    def select(self, plan: "Plan") -> Cursor:
+        if plan.group is not None:
+            return self.aggregate(plan)
+        if plan.join is not None:
+            return plan.join.select(plan)
+        # only the projected, the tested and the ordering fields are decoded
+        fields = None
+        if plan.indexes is not None:
+            fields = set(plan.indexes) | {x[0] for x in plan.terms} \
+                | {x[0] for x in plan.order or ()}
+        if plan.order:
+            # every match goes through the sort before LIMIT and OFFSET
+            rows = self.sorter().sort(
+                (list(x) for x in self.matches(plan.unlimited(), fields)),
+                self.order_key(plan.order))
+            rows = islice(rows, plan.offset, plan.stop())
+        else:
+            rows = self.matches(plan, fields)
+        # rows go out as tuples, never as the table's own records
+        if plan.indexes is not None:
+            rows = (tuple(x[i] for i in plan.indexes) for x in rows)
+        else:
+            rows = (tuple(x) for x in rows)
+        return Cursor(rows, plan.columns)
+
+    def aggregate(self, plan: "Plan") -> Cursor:
+        # GROUP BY and aggregates, from the engine's own structures when it
+        # can answer the plan with them, else hashed in one pass over the
+        # matching rows
+        groups = self.grouped(plan) if plan.join is None else None
+        if groups is None:
+            groups = self.hash_groups(plan)
+        rows = self.group_rows(plan, groups)
+        if plan.order:
+            rows = self.sorter().sort(rows, self.output_key(plan.order))
+        return Cursor(islice(rows, plan.offset, plan.stop()), plan.columns)
+
+    def hash_groups(self, plan: "Plan"):
+        # only the grouped and aggregated fields are kept, and spilled
+        table = plan.join or self
+        group, outputs = plan.group
+        fields = sorted(set(group) | {x[1] for x in outputs
+                                      if x[0] and x[1] is not None})
+        positions = {x: n for n, x in enumerate(fields)}
+        scan = plan.unlimited()
+        scan.order = None
+        rows = ([x[i] for i in fields] for x in table.matches(
+            scan, set(fields) | {x[0] for x in plan.terms}))
+        aggregates = Aggregates([x for x in outputs if x[0]], positions,
+                                table.typed)
+        groups = HashAggregate(
+            lambda row: tuple(table.typed(i, row[positions[i]]) for i in group),
+            aggregates.start, aggregates.step, self.sort_memory,
+            self.sorter().directory)
+        return ((key, aggregates.finish(state))
+                for key, state in groups.aggregate(rows))
+
+    def grouped(self, plan: "Plan"):
+        # COUNT(*) over the whole table grouped by a text column with a
+        # secondary index counts the entries of the index; None when the
+        # plan can not be answered that way
+        group, outputs = plan.group
+        if plan.terms or self.log is not None or len(group) != 1 \
+           or group[0] not in self.indexes \
+           or not self.indexes[group[0]].key_width \
+           or any(x != ("count", None) for x in outputs if x[0]):
+            return None
+        functions = sum(1 for x in outputs if x[0])
+        return (((key,), [sum(1 for _ in entries)] * functions)
+                for key, entries in groupby(self.indexes[group[0]].range(),
+                                            key=lambda x: x[0]))
+
+    def group_rows(self, plan: "Plan", groups):
+        # (key, aggregates) pairs as rows in the order of the columns; an
+        # aggregate without GROUP BY has a row even when nothing matched
+        group, outputs = plan.group
+        found = False
+        for key, results in groups:
+            found = True
+            values = dict(zip(group, key))
+            results = iter(results)
+            yield tuple(next(results) if name else values[index]
+                        for name, index in outputs)
+        if not found and not group:
+            yield tuple(0 if name == "count" else None for name, _ in outputs)
+
+    def output_key(self, order: List[tuple]):
+        # numbers ahead of text, empty aggregates last
+        def value_key(value):
+            if value is None:
+                return (2, 0)
+            return (1, value) if isinstance(value, str) else (0, value)
+
+        def key(row):
+            return tuple(Descending(value_key(row[index])) if descending
+                         else value_key(row[index])
+                         for index, descending in order)
+        return key
+
+    def matches(self, plan: "Plan", fields: set = None):
+        # the records that satisfy the plan, from its offset up to its limit;
+        # the scan stops as soon as the limit is reached
+        rows = None
+        if self.scan_processes > 1 and self.candidate_ids(plan.terms) is None:
+            rows = self.parallel_scan(plan, fields)
+        if rows is None:
+            rows = (x for x in self.records(plan.terms, fields)
+                    if plan.predicate(x))
+        return islice(rows, plan.offset, plan.stop())
+
+    def scan_tasks(self, terms: List[tuple]) -> list:
+        # (table, page range) pairs a parallel scan splits the table into,
+        # None when the engine can not be scanned that way
+        return None
+
+    def page_tasks(self, page_file: PageFile, terms: List[tuple]) -> list:
+        # the workers read the file itself, so it is flushed first
+        page_file.flush()
+        pages = page_file.pages()
+        return [(self, (page_file.filename, self.header, self.schema_map,
+                        self.schema_types, terms, page_file.first_block,
+                        page_file.block_size, page_file.per_page,
+                        page_file.count, x, min(x + self.scan_pages, pages)))
+                for x in range(0, pages, self.scan_pages)]
+
+    def parallel_scan(self, plan: "Plan", fields: set = None):
+        # splits a full scan into page ranges that `scan_processes` workers
+        # test; each range comes back as the raw matching records and their
+        # rids, in order
+        tasks = self.scan_tasks(plan.terms)
+        if tasks is None or len(tasks) < 2:
+            return None
+        return self.parallel_rows(tasks, plan, fields)
+
+    def parallel_rows(self, tasks: list, plan: "Plan", fields: set = None):
+        tables = []
+        processes = min(self.scan_processes, len(tasks))
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.imap(scan_page_range, [x[1] for x in tasks])
+            for (table, _), (rids, data, blocks) in zip(tasks, results):
+                self.buffer_pool.reads += blocks
+                self.buffer_pool.bytes_read += blocks * table.page_file.block_size
+                self.buffer_pool.seeks += 1
+                if table not in tables:
+                    tables.append(table)
+                yield from table.scanned(array("I", rids), data, fields)
+        for table in tables:
+            if table.log is not None:
+                yield from (x for x in list(table.log_rows)
+                            if plan.predicate(x))
+
+    def scanned(self, rids: array, data: bytes, fields: set = None):
+        size = self.page_file.format.size
+        for i, rid in enumerate(rids):
+            record = HeapRecord(self.page_file.format.unpack(
+                data[i * size:(i + 1) * size], fields)[1], self.parameters, rid)
+            if self.log is None or self.log_key(record) not in self.log_deleted:
+                yield record
     
-    def insert(self, statement):
+    def insert(self, plan: "Plan"):
+        return self.insert_rows([list(plan.row)])
+
+    def insert_rows(self, rows: List[list]):
         raise NotImplementedError
+
+    def insert_many(self, rows: List[list], columns: List[str] = None):
+        # rows are value lists in `columns` order (every column by default);
+        # they are applied together and the files are flushed once
+        columns = [x.strip().upper() for x in columns] if columns else []
+        with self.batch():
+            self.pending.extend(self.new_row(columns, [str(x) for x in row])
+                                for row in rows)
+        return True
+
+    def executemany(self, statement: str, params_seq: List[tuple]):
+        # runs one compiled statement once per parameter tuple in a batch
+        plan = self.compile(statement)
+        if plan is None:
+            return False
+        with self.batch():
+            return all([self.parse(statement, x) for x in params_seq])
+
+    @contextmanager
+    def batch(self):
+        # inserts inside the block are collected and applied together, and
+        # every write stays in the buffer pool until the outermost batch ends
+        if not self.batch_depth:
+            self.pending = []
+        self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.batch_depth -= 1
+            if not self.batch_depth:
+                self.insert_pending()
+                self.flush()
+
+    def insert_pending(self):
+        # statements that read or delete must see the rows inserted before
+        # them in the batch
+        if self.pending:
+            rows, self.pending = self.pending, []
+            self.modified()
+            if self.log is not None:
+                return self.log_rows_inserted(rows)
+            self.insert_rows(rows)
+
+    def flush(self):
+        if not self.batch_depth:
+            self.flush_files()
+
+    def flush_files(self):
+        for file in self.files() + list(self.indexes.values()):
+            file.flush()
+        if self.log is not None:
+            self.log.sync()
+
+    def files(self) -> list:
+        return []
+
+    def close(self):
+        # folds the log in and lets go of the files of the table
+        with self.lock:
+            self.close_log()
+            for file in self.files() + list(self.indexes.values()):
+                file.close()
     
-    def delete(self, statement):
+    def delete(self, plan: "Plan"):
         raise NotImplementedError
     
-    def parse(self, statement):
-        ops = sqlparse.parse(statement)[0].tokens
-        if str(ops[0]).lower() == "select":
-            return self.select(ops[1:])
-        if str(ops[0]).lower() == "insert":
-            return self.insert(ops[1:])
-        if str(ops[0]).lower() == "delete":
-            return self.delete(ops[1:])
-        
+    def parse(self, statement: str, params: tuple = ()):
+        # `params` fills the `?` placeholders of the statement, in order
+        start = timer()
+        timings = {}
+        plan = self.compile(statement, timings)
+        if plan is None:
+            return self.unplanned(statement, params)
+        if plan.parameters:
+            plan = plan.bind(plan.join or self, params)
+        parsed = timings.get("parse", 0.0)
+        record = {"statement": statement.strip(), "kind": plan.kind,
+                  "parse": parsed, "plan": timer() - start - parsed,
+                  "execute": 0.0, "rows": 0}
+        # the I/O is metered on the statement's own thread, so statements
+        # running at the same time and other tables' pools are kept apart
+        counts = dict.fromkeys(BufferPool.counters, 0)
+        with self.lock, BufferPool.meter(counts):
+            start = timer()
+            result = self.execute(plan)
+            record["execute"] = timer() - start
+        if isinstance(result, Cursor):
+            result.rows = self.measured(record, result.rows, counts)
+        else:
+            self.account(record, counts)
+        return result
+
+    def unplanned(self, statement: str, params: tuple = ()):
+        # statements the engine cannot compile
         return False
 
+    def execute(self, plan: "Plan"):
+        if plan.kind == "insert" and self.batch_depth:
+            self.pending.append(list(plan.row))
+            return True
+        self.insert_pending()
+        if plan.kind != "select":
+            self.modified()
+        if self.log is not None and plan.kind != "select":
+            return self.log_plan(plan)
+        return getattr(self, plan.kind)(plan)
+
+    def measured(self, record: dict, rows, counts: dict):
+        # a select runs while its cursor is fetched, so its time and I/O are
+        # added up until the last row has been produced or the cursor is
+        # closed or collected
+        try:
+            while True:
+                start = timer()
+                try:
+                    with BufferPool.meter(counts):
+                        row = next(rows)
+                except StopIteration:
+                    record["execute"] += timer() - start
+                    return
+                record["execute"] += timer() - start
+                record["rows"] += 1
+                yield row
+        finally:
+            self.account(record, counts)
+
+    def account(self, record: dict, counts: dict):
+        # the block accesses of a statement are what its meter counted; they
+        # are added to the per-kind totals and sent to the trace
+        record.update(counts)
+        with self.lock:
+            if self.totals is None:
+                self.totals = {}
+            total = self.totals.setdefault(record["kind"], dict.fromkeys(
+                ("count", "parse", "plan", "execute", "rows")
+                + BufferPool.counters, 0))
+            total["count"] += 1
+            for name in total:
+                if name != "count":
+                    total[name] += record[name]
+            self.last_stats = record
+        if self.trace is not None:
+            self.trace(record)
+
+    def stats(self) -> dict:
+        # totals per statement kind plus the buffer pool counters
+        with self.lock:
+            statements = {x: dict(y) for x, y in (self.totals or {}).items()}
+        return {"statements": statements,
+                "buffer_pool": self.buffer_pool.stats()}
+
+    def reset_stats(self):
+        with self.lock:
+            self.totals = {}
+            self.last_stats = None
+            self.buffer_pool.reset_stats()
+
+    def set_trace(self, trace):
+        # `trace` is called with the record of every finished statement:
+        # its text, kind, parse, plan and execute seconds, rows and I/O
+        self.trace = trace
+
+    def compile(self, statement: str, timings: dict = None) -> "Plan":
+        # statements are tokenized once; the plan is kept in a bounded LRU
+        # cache keyed by the normalized statement text, which is also what
+        # gets parsed
+        key = self.plan_key(statement)
+        if self.plans is None:
+            self.plans = PlanCache(self.plan_cache_size)
+        plan = self.plans.get(key)
+        if plan is not None:
+            return plan
+
+        start = timer()
+        kind = key.split(None, 1)[0].lower() if key else ""
+        if kind == "insert":
+            # the values are split from the raw text, nothing to tokenize
+            values = self.insert_values(key)
+            if timings is not None:
+                timings["parse"] = timer() - start
+            plan = Plan(kind, row=self.new_row(*values))
+        elif kind in ("select", "delete"):
+            text = key
+            limit = order = group = join = None
+            if kind == "select":
+                limit = LIMIT_CLAUSE.search(text)
+                text = text[:limit.start()] if limit else text
+                order = ORDER_CLAUSE.search(text)
+                text = text[:order.start()] if order else text
+                group = GROUP_CLAUSE.search(text)
+                text = text[:group.start()] if group else text
+                join = JOIN_CLAUSE.search(text)
+            ops = sqlparse.parse(text)[0].tokens
+            if timings is not None:
+                timings["parse"] = timer() - start
+            # the columns of a join are looked up in both tables
+            table = self.joined(join) if join else self
+            columns = [x.strip().upper()
+                       for x in self.tokens(ops[1:])[0].split(",")]
+            plan = Plan(kind, columns=columns, terms=table.where_terms(ops[1:]))
+            if kind == "select":
+                plan.join = table if join else None
+                columns = ["".join(x.split()) for x in columns]
+                if group or any(AGGREGATE.match(x) for x in columns):
+                    plan.columns = columns
+                    plan.group = table.group_terms(
+                        columns, group.group(1) if group else "")
+                elif columns[0] == "*":
+                    plan.columns = list(table.header)
+                else:
+                    plan.indexes = [table.column_index(x) for x in columns]
+                if order and plan.group:
+                    plan.order = self.output_order(order.group(1), columns)
+                elif order:
+                    plan.order = table.order_terms(order.group(1))
+                if limit:
+                    plan.limit = int(limit.group(1)) \
+                        if limit.group(1) != "?" else "?"
+                    plan.offset = int(limit.group(2)) \
+                        if limit.group(2) not in ("?", None) \
+                        else limit.group(2) or 0
+        else:
+            return None
+        plan.prepare(plan.join or self)
+        if kind != "insert" or plan.parameters:
+            # literal inserts are rarely repeated, they would only push
+            # the other plans out of the cache
+            self.plans.put(key, plan)
+        return plan
+
+    def log_filename(self) -> str:
+        return self.record_file + ".log"
+
+    def open_log(self, durability: str = "commit", compact_size: int = 1 << 20,
+                 compact_interval: float = None) -> bool:
+        # from here on inserts and deletes are appended to the log and kept
+        # in memory on top of the record file, until compact() folds them in;
+        # whatever an earlier run left in the log is replayed first
+        with self.lock:
+            self.log = WriteAheadLog(self.log_filename(), durability)
+            self.compact_size = compact_size
+            self.compact_interval = compact_interval
+            self.log_rows, self.log_deleted = [], set()
+            if self.log.generation <= self.checkpoint:
+                # folded in by a compaction that stopped before resetting it
+                self.log.reset(self.checkpoint + 1)
+            for op, text in self.log.read():
+                if op == WriteAheadLog.INSERT:
+                    self.log_insert(text.split(WriteAheadLog.SEPARATOR))
+                elif op == WriteAheadLog.DELETE:
+                    self.log_deleted.add(text)
+                elif text.split(WriteAheadLog.SEPARATOR) in self.log_rows:
+                    self.log_rows.remove(text.split(WriteAheadLog.SEPARATOR))
+        self.schedule_compaction()
+        return True
+
+    def recover(self):
+        # a table reopened with a log left behind picks its changes up
+        if os.path.exists(self.log_filename()):
+            self.open_log()
+
+    def close_log(self) -> bool:
+        with self.lock:
+            if self.log is None:
+                return False
+            if self.compactor is not None:
+                self.compactor.cancel()
+            self.compact()
+            self.log.close()
+            self.log = None
+            if not self.batch_depth:
+                # everything was folded in, the table goes back to direct writes
+                os.remove(self.log_filename())
+        return True
+
+    def log_key(self, record: list) -> str:
+        # what identifies a record of the record file in a delete entry
+        return str(record.rid)
+
+    def log_insert(self, row: list):
+        self.log_rows.append(row)
+
+    def log_rows_inserted(self, rows: List[list]):
+        for row in rows:
+            self.log.append(WriteAheadLog.INSERT,
+                            WriteAheadLog.SEPARATOR.join(row))
+            self.log_insert(row)
+        return self.log_written()
+
+    def log_plan(self, plan: "Plan"):
+        if plan.kind == "insert":
+            return self.log_rows_inserted([list(plan.row)])
+        logged = {id(x) for x in self.log_rows}
+        for record in [x for x in self.records(plan.terms)
+                       if plan.predicate(x)]:
+            if id(record) in logged:
+                self.log.append(WriteAheadLog.UNDO,
+                                WriteAheadLog.SEPARATOR.join(record))
+                self.log_rows.remove(record)
+            else:
+                self.log.append(WriteAheadLog.DELETE, self.log_key(record))
+                self.log_deleted.add(self.log_key(record))
+        return self.log_written()
+
+    def log_written(self):
+        self.flush()
+        if self.compact_due or self.log.size() > self.compact_size:
+            # folded in on the writer's own path: a server holds the table's
+            # write lock here, so no select of it is reading the log
+            self.compact()
+        return True
+
+    def schedule_compaction(self):
+        if self.compact_interval:
+            self.compactor = threading.Timer(self.compact_interval,
+                                             self.compaction_due)
+            self.compactor.daemon = True
+            self.compactor.start()
+
+    def compaction_due(self):
+        # the timer only marks the log, the next write folds it in
+        if self.log is not None:
+            self.compact_due = True
+            self.schedule_compaction()
+
+    def compact(self) -> bool:
+        # folds the log into the record file, records its generation as the
+        # checkpoint and starts an empty log with the next one
+        with self.lock:
+            if self.log is None or self.batch_depth:
+                return False
+            log, self.log = self.log, None
+            try:
+                if self.log_deleted:
+                    deleted = self.log_deleted
+                    plan = Plan("delete")
+                    plan.predicate = lambda x: self.log_key(x) in deleted
+                    self.delete(plan)
+                if self.log_rows:
+                    self.insert_rows(self.log_rows)
+                self.flush_files()
+                self.checkpoint = log.generation
+                self.write_schema()
+                log.reset(log.generation + 1)
+                self.log_rows, self.log_deleted = [], set()
+                self.compact_due = False
+            finally:
+                self.log = log
+        return True
+
     def write_to_file(self):
         raise NotImplementedError
 
+    def plan_key(self, statement: str) -> str:
+        # blanks collapsed and keywords in lower case, outside quotes and
+        # parentheses only: what is inside them may be a value, and so is a
+        # keyword right after =
+        tokens = []
+        depth = 0
+        for token in KEY_TOKEN.findall(statement.strip().rstrip(";").strip()):
+            if token == "(":
+                depth += 1
+            elif token == ")":
+                depth = max(depth - 1, 0)
+            elif not depth:
+                if token.isspace():
+                    token = " "
+                elif token.lower() in KEYWORDS and \
+                        not (tokens and tokens[-1 - (tokens[-1] == " ")]
+                             .endswith("=")):
+                    token = token.lower()
+            tokens.append(token)
+        return "".join(tokens)
+
+    def insert_values(self, statement) -> tuple:
+        # "insert into <table> [(columns)] values (values)"
+        text = "".join(str(x) for x in statement).strip().rstrip(";").strip()
+        split = text.lower().index("values")
+        head, tail = text[:split], text[split + len("values"):].strip()
+        columns = []
+        if "(" in head:
+            columns = [x.strip().upper() for x in
+                       head[head.index("(") + 1:head.rindex(")")].split(",")]
+        if tail.startswith("(") and tail.endswith(")"):
+            tail = tail[1:-1]
+        return columns, [x.strip() for x in tail.split(",")]
+
+    def new_row(self, columns: List[str], values: List[str]) -> List[str]:
+        if not columns:
+            return (values + [""] * len(self.header))[:len(self.header)]
+        assert len(columns) == len(values)
+        new_record = [""] * len(self.header)
+        for column, value in zip(columns, values):
+            new_record[self.header.index(column)] = value
+        return new_record
+
+    def records(self, terms: List[tuple] = (), fields: set = None):
+        # records that may satisfy `terms`: only the ones the primary access
+        # path and the secondary indexes agree on, or a full scan; `fields`
+        # limits what gets decoded
+        ids = self.candidate_ids(terms)
+        records = self.scan(terms, fields) if ids is None \
+            else self.fetch(sorted(ids), fields)
+        if self.log is not None:
+            # the log hides what it deleted and adds what it inserted
+            return chain((x for x in records
+                          if self.log_key(x) not in self.log_deleted),
+                         list(self.log_rows))
+        return records
+
+    def scan(self, terms: List[tuple] = (), fields: set = None):
+        return iter(self.data)
+
+    def fetch(self, ids: list, fields: set = None):
+        raise NotImplementedError
+
+    def primary_ids(self, terms: List[tuple]) -> set:
+        return None
+
+    def record_id(self, record: list):
+        return record.rid
+
+    def candidate_ids(self, terms: List[tuple]) -> set:
+        terms = self.bloom_terms(terms)
+        if terms is None:
+            return set()
+        ids = self.primary_ids(terms)
+        for index, op, value in terms:
+            if index in self.indexes:
+                found = self.tree_ids(self.indexes[index], op, value)
+                if found is not None:
+                    ids = found if ids is None else ids & found
+        return ids
+
+    def tree_ids(self, tree: BPlusTree, op: str, value) -> set:
+        if op == "=":
+            bounds = [(value, value)]
+        elif op == "in":
+            bounds = [(x, x) for x in value]
+        else:
+            bounds = [value]
+        integer = tree.key_width == 0
+        if not all(isinstance(x, int) == integer for pair in bounds for x in pair):
+            return None
+        return {rid for low, high in bounds for _, rid in tree.range(low, high)}
+
+    def index_filename(self, name: str) -> str:
+        return "{}.{}.idx".format(self.record_file, name)
+
+    def index_width(self, name: str) -> int:
+        # 0 means an int64 key, as BPlusTree expects
+        if self.schema_types.get(name) == "INTEGER":
+            return 0
+        return self.schema_map[name]
+
+    def index_key(self, index: int, record: list):
+        # None when the field can not be indexed (missing or malformed)
+        if index >= len(record):
+            return None
+        key = self.typed(index, record[index])
+        if self.index_width(self.header[index]) == 0 and not isinstance(key, int):
+            return None
+        return key
+
+    def create_index(self, column: str) -> bool:
+        # secondary B+-tree from the values of `column` to record ids; it is
+        # kept up to date by insert and delete and listed in the schema file
+        name = column.strip().upper()
+        index = self.header.index(name)
+        if index in self.indexes:
+            self.indexes[index].close()
+        tree = BPlusTree(self.index_filename(name), self.index_width(name),
+                         self.buffer_pool, truncate=True,
+                         value_format=self.id_format)
+        entries = ((self.index_key(index, x), self.record_id(x))
+                   for x in self.scan())
+        tree.bulk_load(sorted(x for x in entries
+                              if x[0] is not None and x[1] is not None))
+        self.indexes[index] = tree
+        if name not in self.index_columns:
+            self.index_columns.append(name)
+            self.write_schema()
+        return True
+
+    def build_indexes(self):
+        for name in self.index_columns:
+            self.create_index(name)
+        self.build_bloom_filters()
+
+    def index_record(self, record: list):
+        for index, tree in self.indexes.items():
+            key, rid = self.index_key(index, record), self.record_id(record)
+            if key is not None and rid is not None:
+                tree.insert(key, rid)
+        if self.blooms:
+            self.bloom_record(record)
+
+    def create_bloom_filter(self, column: str, error: float = None) -> bool:
+        # Bloom filter over the values of `column`: = and in values that are
+        # not in the table are ruled out without reading its records. It is
+        # listed in the schema file with its false positive rate
+        name = column.strip().upper()
+        self.header.index(name)
+        self.bloom_columns = dict(self.bloom_columns)
+        self.bloom_columns[name] = error or self.bloom_error
+        self.write_schema()
+        self.build_bloom_filters()
+        return True
+
+    def bloom_file(self) -> PageFile:
+        # the record file the engine scans page by page, if any; each of its
+        # pages gets a filter of its own
+        return None
+
+    def build_bloom_filters(self):
+        # the filters live in memory only: they are built with the record
+        # file, and on first use after a reopen; inserts add to them, deletes
+        # leave them be until the next rebuild. A table filter is sized for
+        # twice the rows so inserts keep its rate until then. They are only
+        # published once filled, a concurrent select never sees them half
+        # built
+        blooms, page_blooms = {}, {}
+        page_file = self.bloom_file()
+        for name, error in self.bloom_columns.items():
+            index = self.header.index(name)
+            blooms[index] = BloomFilter(2 * self.row_count(), error)
+            if page_file is not None:
+                page_blooms[index] = [BloomFilter(page_file.per_page, error)
+                                      for _ in range(page_file.pages())]
+        if blooms:
+            for record in self.scan(fields=set(blooms)):
+                self.bloom_record(record, blooms, page_blooms)
+        self.blooms, self.page_blooms = blooms, page_blooms
+
+    def bloom_record(self, record: list, blooms: dict = None,
+                     page_blooms: dict = None):
+        blooms = self.blooms if blooms is None else blooms
+        page_blooms = self.page_blooms if page_blooms is None else page_blooms
+        page_file = self.bloom_file()
+        for index, bloom in blooms.items():
+            digest = BloomFilter.digest(
+                self.typed(index, record[index]) if index < len(record) else "")
+            bloom.add(digest)
+            if index in page_blooms:
+                pages = page_blooms[index]
+                page = page_file.locate(self.record_id(record))[0]
+                while len(pages) <= page:
+                    pages.append(BloomFilter(page_file.per_page, bloom.error))
+                pages[page].add(digest)
+
+    def bloom_terms(self, terms: List[tuple]) -> List[tuple]:
+        # = and in values the filters rule out are dropped from the terms;
+        # None when a term has none left, nothing can match then
+        if not self.bloom_columns or not terms:
+            return terms
+        if self.blooms is None:
+            self.build_bloom_filters()
+        narrowed = []
+        for index, op, value in terms:
+            if index in self.blooms and op in ("=", "in"):
+                values = [x for x in ((value,) if op == "=" else value)
+                          if x in self.blooms[index]]
+                if not values:
+                    return None
+                value = value if op == "=" else tuple(values)
+            narrowed.append((index, op, value))
+        return narrowed
+
+    def bloom_pages(self, terms: List[tuple]) -> List[int]:
+        # the pages whose filters may hold the = and in values of the terms,
+        # None for all of them
+        if not self.bloom_columns or not terms:
+            return None
+        if self.blooms is None:
+            self.build_bloom_filters()
+        found = None
+        for index, op, value in terms:
+            if index in self.page_blooms and op in ("=", "in"):
+                filters = self.page_blooms[index]
+                if not filters:
+                    return []
+                # filters of one column share their size and positions
+                positions = [filters[0].positions(BloomFilter.digest(x))
+                             for x in ((value,) if op == "=" else value)]
+                pages = {page for page, bloom in enumerate(filters)
+                         if any(bloom.holds(x) for x in positions)}
+                found = pages if found is None else found & pages
+        return None if found is None else sorted(found)
+
+    def unindex_record(self, record: list):
+        for index, tree in self.indexes.items():
+            key, rid = self.index_key(index, record), self.record_id(record)
+            if key is not None and rid is not None:
+                tree.delete(key, rid)
+
+    def column_index(self, name: str) -> int:
+        return self.header.index(name.upper())
+
+    def attach(self, name: str, table: "DBFile"):
+        # makes `table` joinable under `name`; plans naming it are dropped
+        self.attached = dict(self.attached or {}, **{name.lower(): table})
+        self.plans = None
+
+    def joined(self, found) -> "JoinedTables":
+        # a JOIN_CLAUSE match: this table, joined with an attached one
+        name, alias, other, other_alias, first, second = found.groups()
+        if other.lower() not in (self.attached or {}):
+            raise KeyError("no table " + other)
+        return JoinedTables(self, self.attached[other.lower()],
+                            [name, alias], [other, other_alias], (first, second))
+
+    def row_count(self) -> int:
+        return sum(1 for _ in self.scan())
+
+    def estimate(self, terms: List[tuple] = ()) -> int:
+        # rows a select with `terms` reads: what the indexes narrow it down
+        # to, else the whole table
+        ids = self.candidate_ids(terms)
+        return len(ids) if ids is not None else \
+            self.row_count() + len(self.log_rows)
+
+    def row_width(self) -> int:
+        # bytes a row takes in memory, counted the way ExternalSort does
+        return 56 * len(self.header) + sum(self.schema_map.get(x, 0)
+                                           for x in self.header)
+
+    def sort_key(self, row: list) -> tuple:
+        return tuple(self.field_key(x, row) for x in self.parameters)
+
+    def output_order(self, clause: str, columns: List[str]) -> List[tuple]:
+        # ORDER BY of a GROUP BY select: the columns it returns, as written
+        order = []
+        for item in clause.split(","):
+            words = item.rsplit(None, 1)
+            if len(words) == 2 and words[1].lower() not in ("asc", "desc"):
+                words = [item]
+            name = "".join(words[0].split()).upper()
+            if name not in columns:
+                raise ValueError("bad ORDER BY term: " + item.strip())
+            order.append((columns.index(name),
+                          len(words) == 2 and words[1].lower() == "desc"))
+        return order
+
+    def sorter(self) -> ExternalSort:
+        return ExternalSort(self.sort_memory,
+                            directory=os.path.dirname(
+                                os.path.abspath(self.record_file)))
+
+    def typed(self, index: int, value: str):
+        value = value.strip().strip("'\"")
+        if self.schema_types.get(self.header[index]) == "INTEGER":
+            try:
+                return int(value)
+            except ValueError:
+                pass
+        return value
+
     def get_column(self, fieldname: str) -> List[str]:
         try:
             index = self.header.index(fieldname.strip())
-            column = [x[index] for x in self.data]
+            column = [x[index] for x in self.records()]
         except IndexError: # not needed to check performance
             column = [[]]
         finally:
             return column
 
 
+def scan_page_range(task: tuple) -> tuple:
+    # runs in a worker: tests the live records of a page range of a record
+    # file and sends back the rids and the packed bytes of the matches
+    filename, header, schema_map, schema_types, terms, first_block, \
+        block_size, per_page, count, start, stop = task
+    record_format = RecordFormat(header, schema_map)
+    table = DBFile.__new__(DBFile)
+    table.header = header
+    table.schema_types = schema_types
+    predicate = table.predicate(terms)
+    fields = {x[0] for x in terms}
+    size = record_format.size
+    rids = array("I")
+    matches = []
+    with open(filename, mode="rb") as f:
+        f.seek((start + first_block) * block_size)
+        for page in range(start, stop):
+            block = f.read(block_size)
+            first = page * per_page
+            for slot in range(min(per_page, count - first)):
+                record = block[slot * size:(slot + 1) * size]
+                flag, row = record_format.unpack(record, fields)
+                if flag == RecordFormat.LIVE and predicate(row):
+                    rids.append(first + slot)
+                    matches.append(record)
+    return rids.tobytes(), b"".join(matches), stop - start
+
+
 class HeapDBFile(DBFile):
     struct = "Heap"
-    record_file = "heapfile.csv"
+    record_file = "heapfile.dat"
+    page_file = None
+    resident = True
+    free_rids = None
+    vacuum_ratio = 0.5
 
     def __init__(self, filename: str, schema_file: str,
-                 parameters: List[int] = [15]):
-        with open(filename, mode="r", encoding="latin-1") as csv_file:
-            csv_reader = csv.reader(csv_file, delimiter=',')
-            self.data = HeapTable([HeapRecord([row[0].replace('"', '').split(';')
-                                   for row in csv_reader])], parameters)[0]
-            self.header = self.data.pop(0)
-            self.schema = ":{}({});".join(self.header)
-
-            super().__init__(schema_file)
-
-    def select(self, statement):
-        columns = str(statement[1]).split(",")
-        tables = str( (statement[2:] + [None])[0] )
-        where = (str( (statement[3:] + [None])[0] ).lower()
-                 .replace("where ", "").replace(";", "").replace("'", "")
-                 .strip()).split(" and ")
-        
-        # "where" is not accepting in-place exchanges
-        where_args = {}
-        for w in where:
-            if "=" in w:
-                aux = w.split("=")
-                where_args[aux[0]] = aux[1]
-            elif "in" in w:
-                aux = w.split(" in (")
-                where_args[aux[0]] = aux[1].replace(")", "").split(",")
-            elif "between" in w:
-                aux = w.split(" between (")
-                where_args[aux[0]] = aux[1].replace(")", "").split(",")
-            
-        if columns[0] == '*':
-            temp = zip(*[self.get_column(x) for x in self.header])
-            res = []
-            for t in temp:
-                for key, value in where_args.items():
-                    index = self.header.index(key)
-                    if len(value) == 1: # regular = comparison
-                        if t[index] == value:
-                            res += t
-                    else: # in (GROUP) or BETWEEN (GROUP)
-                        if t[index] in value:
-                            res += t
-            return res
+                 parameters: List[int] = [15], buffer_pool: BufferPool = None,
+                 resident: bool = True, processes: int = None,
+                 record_file: str = None):
+        self.name_files(record_file)
+        # a table that is not resident is only kept in its record file and
+        # every scan pages it in through the buffer pool; its rows are
+        # streamed from the csv files straight into the record file
+        self.parameters = parameters
+        if buffer_pool is not None:
+            self.buffer_pool = buffer_pool
+        self.resident = resident
+        self.data = self.source(filename, processes)
+        if self.reuse(schema_file, parameters=parameters,
+                      buffer_pool=buffer_pool, resident=resident):
+            return
+        self.header = self.data.header
+        if resident:
+            self.data = [HeapRecord(x, parameters) for x in self.shared(self.data)]
+        self.schema = ":{}({});".join(self.header)
+
+        super().__init__(schema_file)
+        if resident:
+            # the sort keys are typed once the schema is known
+            self.data = HeapTable(self.data, parameters, self.sort_key)
+            self.write_snapshot()
         else:
-            return zip(*[self.get_column(x.upper()) for x in columns])
-
-    def insert(self, statement):
-        tables = str(statement[1])
-        columns = str(statement[2]).upper().strip().replace("(", "").replace(")", "").split(",")
-        values = str(statement[4]).upper().strip().replace("(", "").replace(")", "").split(",")
+            self.data = None
+
+    def reopen(self, schema_file: str, parameters: List[int] = [15],
+               buffer_pool: BufferPool = None, resident: bool = True,
+               record_file: str = None):
+        self.name_files(record_file)
+        self.parameters = parameters
+        if buffer_pool is not None:
+            self.buffer_pool = buffer_pool
+        self.read_schema(schema_file)
+        self.page_file = PageFile(self.record_file,
+                                  RecordFormat(self.header, self.schema_map),
+                                  self.buffer_pool)
+        self.free_rids = self.page_file.free_slots()
+        rows = self.read_snapshot() if resident else None
+        if rows is not None:
+            self.data = HeapTable((HeapRecord(x, parameters, rid)
+                                   for rid, x in rows), parameters,
+                                  self.sort_key)
+        elif resident:
+            self.data = HeapTable(self.shared(self.scan()), parameters,
+                                  self.sort_key)
+        else:
+            self.resident = False
+        self.recover()
+
+    def snapshot_file(self) -> str:
+        return os.path.splitext(self.record_file)[0] + ".snap"
+
+    def write_snapshot(self):
+        # the decoded records of a table fresh from its csv files, so a later
+        # open does not decode the record file field by field. The snapshot
+        # is json, not a pickle, so reading one runs no code; its first line
+        # is the fingerprint of the csv files it was taken from
+        with open(self.snapshot_file(), "w", encoding="utf-8") as f:
+            f.write(json.dumps(self.fingerprint) + "\n")
+            f.write(json.dumps([(x.rid, list(x)) for x in self.data]))
+
+    def read_snapshot(self) -> list:
+        # (rid, row) pairs. A snapshot is only valid while the schema file
+        # still names its fingerprint, i.e. while the record file holds just
+        # what those csv files did; the rows are not parsed otherwise
+        if self.fingerprint is None:
+            return None
+        try:
+            with open(self.snapshot_file(), encoding="utf-8") as f:
+                if json.loads(f.readline()) != self.fingerprint:
+                    return None
+                rows = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        # equal fields become one string object again
+        return list(zip((x[0] for x in rows), self.shared(x[1] for x in rows)))
+
+    def modified(self):
+        if self.fingerprint is not None and os.path.exists(self.snapshot_file()):
+            os.remove(self.snapshot_file())
+        super().modified()
+
+    def shared(self, rows):
+        # most columns repeat a handful of values; a dictionary per column
+        # makes equal fields of resident records one string object
+        dictionaries = [{} for _ in self.header]
+        for row in rows:
+            if isinstance(row, HeapRecord):
+                row[:] = [x.setdefault(y, y) for x, y in zip(dictionaries, row)]
+                yield row
+            else:
+                yield [x.setdefault(y, y) for x, y in zip(dictionaries, row)]
+
+    def scan(self, terms: List[tuple] = (), fields: set = None):
+        # while a table that is not resident is being built, data is still
+        # the csv source and the rows come back from the record file
+        if self.resident and self.data is not None:
+            return (x for x in self.data if not x.deleted)
+        return (HeapRecord(row, self.parameters, rid) for rid, row
+                in self.page_file.scan(fields, self.bloom_pages(terms)))
+
+    def fetch(self, ids: list, fields: set = None):
+        for rid in ids:
+            row = self.page_file.read_record(rid, fields)
+            if row is not None:
+                yield HeapRecord(row, self.parameters, rid)
+
+    def files(self) -> list:
+        return [self.page_file]
+
+    def bloom_file(self) -> PageFile:
+        # a resident table is scanned in memory
+        return None if self.resident else self.page_file
+
+    def row_count(self) -> int:
+        # the slots of the record file less the tombstoned ones; the resident
+        # table keeps its dead records until vacuum too
+        return self.page_file.count - len(self.free_rids)
+
+    def scan_tasks(self, terms: List[tuple]) -> list:
+        return self.page_tasks(self.page_file, terms)
+
+    def insert_rows(self, rows: List[list]):
+        records = [HeapRecord(x, self.parameters) for x in rows]
+        if self.resident:
+            for record in records:
+                self.data.append(record)
+        if self.fit_schema(records):
+            # the record layout changed, every slot has to move
+            rows = list(self.scan())
+            if not self.resident:
+                rows.extend(records)
+            self.write_schema()
+            self.page_file.close()
+            self.page_file = None
+            return self.write_to_file(rows)
+        try:
+            # tombstoned slots are reused first, then new ones are appended;
+            # the rest of the file is untouched
+            for record in records:
+                if self.free_rids:
+                    record.rid = heapq.heappop(self.free_rids)
+                    self.page_file.write_record(record.rid, record)
+                else:
+                    record.rid = self.page_file.append_record(record)
+                self.index_record(record)
+            self.flush()
+        except OSError:
+            return False
+        return True
 
-        assert len(columns) == len(values)
-        new_record = [None] * len(self.header)
-        for column in range(len(self.header)):
-            if column in columns:
-                i = self.header.index(column)
-                j = columns.index(column)
-                new_record[i] = values[j]
-        
-        self.data.append(HeapRecord(new_record, self.data.sort_parameters))
-        return self.write_to_file()
-
-    def delete(self, statement):
-        tables = str(statement[1])
-        columns = str(statement[1]).split(",")
-        where = str(statement[2]).split(" and ")
-        # where = str( (statement[2:] + [None])[0] ).split(" and ")
-
-        # if columns[0] == '*':
-        #     return zip(*[self.get_column(x) for x in self.header])
-        # else:
-        #     return zip(*[self.get_column(x.upper()) for x in columns])
-
-                # "where" is not accepting in-place exchanges
-        where_args = {}
-        for w in where:
-            if "=" in w:
-                aux = w.split("=")
-                where_args[aux[0]] = aux[1]
-            elif "in" in w:
-                aux = w.split(" in (")
-                where_args[aux[0]] = aux[1].replace(")", "").split(",")
-            elif "between" in w:
-                aux = w.split(" between (")
-                where_args[aux[0]] = aux[1].replace(")", "").split(",")
-
-        for row in self.data[:]:
-            for key, value in where_args.items():
-                index = self.header.index(key)
-                if len(value) == 1: # regular = comparison
-                    if t[index] == value:
-                        self.data.remove(row)
-                else: # in (GROUP) or BETWEEN (GROUP)
-                    if t[index] in value:
-                        self.data.remove(row)
-
-        return self.write_to_file()
+    def delete(self, plan: "Plan"):
+        # the slots only get their tombstone set; vacuum() reclaims them
+        rids = set()
+        for record in [x for x in self.records(plan.terms) if plan.predicate(x)]:
+            self.page_file.write_record(record.rid, record, RecordFormat.FREE)
+            self.unindex_record(record)
+            heapq.heappush(self.free_rids, record.rid)
+            rids.add(record.rid)
+        if self.resident and rids:
+            # one pass over the table; a reused slot shares its rid with
+            # the dead record, which is already marked
+            for record in self.data:
+                if record.rid in rids and not record.deleted:
+                    record.deleted = True
+        self.flush()
+        if len(self.free_rids) > self.vacuum_ratio * self.page_file.count:
+            return self.vacuum()
+        return True
 
+    def vacuum(self):
+        # packs the live records at the front of a new file, which renumbers
+        # them, rebuilds the indexes and re-heapifies the resident table
+        if self.log is not None:
+            self.compact()
+        return self.write_to_file(list(self.scan()))
 
-    def write_to_file(self):
+    def write_to_file(self, rows=None):
+        rows = self.data if rows is None else rows
         try:
-            f = open(file=self.record_file, mode="w", encoding="latin-1")
-            for x in self.data:
-                try:
-                    f.write(";".join(x) + "\n")
-                except:
-                    continue
-            f.close()
+            if self.page_file is None:
+                self.page_file = PageFile(
+                    self.record_file,
+                    RecordFormat(self.header, self.schema_map),
+                    self.buffer_pool, truncate=True)
+            rids = self.page_file.write_all(rows)
+            if self.resident:
+                for record, rid in zip(rows, rids):
+                    record.rid = rid
+                if rows is not self.data:
+                    self.data = HeapTable(rows, self.parameters,
+                                          self.sort_key)
+            self.free_rids = []
+            self.build_indexes()
             return True
         except OSError:
             return False
@@ -262,506 +2919,1438 @@ class HeapDBFile(DBFile):
 
 class OrderedDBFile(DBFile):
     struct = "Ordered"
-    record_file = "ordfile.csv"
+    record_file = "ordfile.dat"
+    index_file = "ordfile.idx"
+    page_file = None
+    tree = None
+    # tombstoned slots and records appended out of key order since the file
+    # was last written; past this share of the file a vacuum rewrites it
+    free_count = 0
+    appended = 0
+    vacuum_ratio = 0.5
 
     def __init__(self, filename: str, schema_file: str,
-                 parameters: List[int] = [15]):
-        self.conn = sqlite3.connect(filename[:-3] + "db")
-        cursor = self.conn.cursor()
+                 parameters: List[int] = [15], buffer_pool: BufferPool = None,
+                 processes: int = None,
+                 record_file: str = None):
+        self.name_files(record_file)
+        self.parameters = parameters
+        if buffer_pool is not None:
+            self.buffer_pool = buffer_pool
         
-        with open(filename, mode="r", encoding="latin-1") as csv_file:
-            csv_reader = csv.reader(csv_file, delimiter=',')
-            self.data = [row[0].replace('"', '').split(';')[:58] for row in csv_reader]
-            self.header = self.data.pop(0)
-
+        self.data = self.source(filename, processes)
+        if self.reuse(schema_file, parameters=parameters,
+                      buffer_pool=buffer_pool):
+            return
+        self.header = self.data.header
+        self.schema = ":{}({});".join(self.header)
+
+        super().__init__(schema_file)
+        # the column types are known once the schema is read and fitted; the
+        # mirror of an earlier table is started over like the record file
+        if os.path.exists(self.sqlite_file()):
+            os.remove(self.sqlite_file())
+        self.connect()
+        self.load_sqlite(self.data)
+        # from here on the records only live in the ordered file and its index
+        self.data = None
+
+    def reopen(self, schema_file: str, parameters: List[int] = [15],
+               buffer_pool: BufferPool = None, record_file: str = None):
+        self.name_files(record_file)
+        self.parameters = parameters
+        if buffer_pool is not None:
+            self.buffer_pool = buffer_pool
+        self.read_schema(schema_file)
+        self.page_file = PageFile(self.record_file,
+                                  RecordFormat(self.header, self.schema_map),
+                                  self.buffer_pool)
+        self.tree = BPlusTree(self.index_file, self.key_width(),
+                              self.buffer_pool)
+        self.free_count = len(self.page_file.free_slots())
+        self.check_mirror()
+        self.recover()
+
+    def name_files(self, record_file: str = None):
+        super().name_files(record_file)
+        if record_file is not None:
+            self.index_file = os.path.splitext(record_file)[0] + ".idx"
+
+    def key_width(self) -> int:
+        return self.index_width(self.header[self.parameters[0]])
+
+    def key(self, row: list):
+        return self.index_key(self.parameters[0], row)
+
+    def sqlite_file(self) -> str:
+        # the sqlite mirror sits next to the table files, so globs and lists
+        # of csv files get one database too
+        return os.path.splitext(self.record_file)[0] + ".db"
+
+    def connect(self):
+        # the server runs statements on a thread pool, the connection is
+        # shared by those threads; sqlite keeps the prepared statements
+        self.conn = sqlite3.connect(self.sqlite_file(), check_same_thread=False,
+                                    cached_statements=256)
+        self.cursor = self.conn.cursor()
+        # the mirror is rebuilt from the record file whenever it is found out
+        # of step, so its commits are not synced
+        self.cursor.execute("PRAGMA journal_mode=MEMORY")
+        self.cursor.execute("PRAGMA synchronous=OFF")
+        # the statements that keep the mirror in step with the record file;
+        # a deleted record takes one mirror row with the same fields along
+        self.insert_sql = "INSERT INTO candidates VALUES ({})".format(
+            ", ".join("?" * len(self.header)))
+        self.delete_sql = "DELETE FROM candidates WHERE rowid IN " \
+            "(SELECT rowid FROM candidates WHERE {} LIMIT 1)".format(
+                " AND ".join('"{}" IS ?'.format(x) for x in self.header))
+
+    def mirror_row(self, row: list) -> list:
+        return (list(row) + [None] * len(self.header))[:len(self.header)]
+
+    def load_sqlite(self, rows):
+        # one transaction with a single prepared insert fed by the row
+        # stream; journaling is off while loading and the indexes are built
+        # once the rows are in
+        types = ["INTEGER" if self.schema_types.get(x) == "INTEGER" else "TEXT"
+                 for x in self.header]
+        columns = ", ".join('"{}" {}'.format(x, t)
+                            for x, t in zip(self.header, types))
+        cursor = self.cursor
+        cursor.execute("PRAGMA journal_mode=OFF")
+        cursor.execute("DROP TABLE IF EXISTS candidates")
+        cursor.execute("CREATE TABLE candidates ({})".format(columns))
+        cursor.execute("BEGIN")
+        cursor.executemany(self.insert_sql, (self.mirror_row(x) for x in rows))
+        for name in [self.header[self.parameters[0]]] + self.index_columns:
+            cursor.execute('CREATE INDEX IF NOT EXISTS "candidates_{0}" '
+                           'ON candidates ("{0}")'.format(name))
+        self.conn.commit()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+
+    def check_mirror(self):
+        # a mirror that is out of step with the record file, as one can be
+        # after a crash, or no database at all is loaded again
+        try:
+            self.connect()
+            count = self.conn.execute(
+                "SELECT count(*) FROM candidates").fetchone()[0]
+        except sqlite3.DatabaseError:
+            self.conn.close()
+            os.remove(self.sqlite_file())
+            self.connect()
+            count = None
+        if count != self.row_count():
+            self.load_sqlite(x for x in self.scan())
+
+    def compile(self, statement: str, timings: dict = None) -> "Plan":
+        # selects the planner refuses are left to the mirror, which only
+        # holds what the record file does while no log is open
+        try:
+            return super().compile(statement, timings)
+        except ValueError:
+            kind = self.plan_key(statement).split(None, 1)[:1]
+            if self.log is None and [x.lower() for x in kind] == ["select"]:
+                return None
+            raise
+
+    def unplanned(self, statement: str, params: tuple = ()):
+        # only reads go to the mirror, a change there would not reach the
+        # record file; each call gets its own sqlite cursor and the lock
+        # keeps it off the writers' transaction
+        if statement.split(None, 1)[0].lower() != "select":
+            raise ValueError("unsupported statement: " + statement.strip())
+        with self.lock:
             try:
-                cursor.execute("CREATE TABLE candidates " + str(tuple(self.header)))
-            except:
-                pass
-            
-            for x in self.data:
-                try:
-                    cursor.executemany('insert into candidates values (' + '?,'*(len(self.header)-1) + '?)', x)
-                except:
-                    continue
-            self.conn.commit()
-
-            self.schema = ":{}({});".join(self.header)
-
+                cursor = self.conn.execute(statement, params)
+                rows = cursor.fetchall()
+            except sqlite3.Error as error:
+                raise ValueError(str(error)) from error
+        return Cursor(rows, [x[0] for x in cursor.description])
+
+    def primary_ids(self, terms: List[tuple]) -> set:
+        # = , in and between on the ordering key go through the B+-tree
+        for index, op, value in terms:
+            if index == self.parameters[0]:
+                ids = self.tree_ids(self.tree, op, value)
+                if ids is not None:
+                    return ids
+        return None
+
+    def scan(self, terms: List[tuple] = (), fields: set = None):
+        return (HeapRecord(row, self.parameters, rid) for rid, row
+                in self.page_file.scan(fields, self.bloom_pages(terms)))
+
+    def fetch(self, ids: list, fields: set = None):
+        for rid in ids:
+            row = self.page_file.read_record(rid, fields)
+            if row is not None:
+                yield HeapRecord(row, self.parameters, rid)
+
+    def files(self) -> list:
+        return [self.page_file, self.tree]
+
+    def bloom_file(self) -> PageFile:
+        return self.page_file
+
+    def row_count(self) -> int:
+        # the tombstoned slots stay in the file until vacuum
+        return self.page_file.count - self.free_count
+
+    def close(self):
+        super().close()
+        self.conn.close()
+
+    def scan_tasks(self, terms: List[tuple]) -> list:
+        return self.page_tasks(self.page_file, terms)
+
+    def insert_rows(self, rows: List[list]):
+        self.cursor.executemany(self.insert_sql,
+                                (self.mirror_row(x) for x in rows))
+        self.conn.commit()
+        if self.fit_schema(rows):
+            # the record layout changed, the file has to be rebuilt
+            self.data = list(self.scan()) + rows
+            self.write_schema()
+            self.page_file.close()
+            self.page_file = None
+            self.write_to_file()
+            self.data = None
+            return True
 
-    def parse(self, statement):
-        cursor = self.conn.cursor()
-        cursor.execute(statement)
-        
+        # new records go to the end of the file, the index keeps them in order
+        for row in rows:
+            record = HeapRecord(row, self.parameters,
+                                self.page_file.append_record(row))
+            if self.key(record) is not None:
+                self.tree.insert(self.key(record), record.rid)
+            self.index_record(record)
+        self.appended += len(rows)
+        self.flush()
+        if self.vacuum_due():
+            return self.vacuum()
         return True
 
-    def select(self, statement):
-        columns = str(statement[1]).split(",")
-        tables = str( (statement[2:] + [None])[0] )
-        where = (str( (statement[3:] + [None])[0] ).lower()
-                 .replace("where ", "").replace(";", "").replace("'", "")
-                 .strip()).split(" and ")
-        
-        # "where" is not accepting in-place exchanges
-        where_args = {}
-        for w in where:
-            if "=" in w:
-                aux = w.split("=")
-                where_args[aux[0]] = aux[1]
-            elif "in" in w:
-                aux = w.split(" in (")
-                where_args[aux[0]] = aux[1].replace(")", "").split(",")
-            elif "between" in w:
-                aux = w.split(" between (")
-                where_args[aux[0]] = aux[1].replace(")", "").split(",")
-            
-        if columns[0] == '*':
-            temp = zip(*[self.get_column(x) for x in self.header])
-            res = []
-            for t in temp:
-                for key, value in where_args.items():
-                    index = self.header.index(key)
-                    if len(value) == 1: # regular = comparison
-                        if t[index] == value:
-                            res += t
-                    else: # in (GROUP) or BETWEEN (GROUP)
-                        if t[index] in value:
-                            res += t
-            return res
-        else:
-            return zip(*[self.get_column(x.upper()) for x in columns])
-
-    def insert(self, statement):
-        tables = str(statement[1])
-        columns = str(statement[2]).upper().strip().replace("(", "").replace(")", "").split(",")
-        values = str(statement[4]).upper().strip().replace("(", "").replace(")", "").split(",")
+    def delete(self, plan: "Plan"):
+        records = [x for x in self.records(plan.terms) if plan.predicate(x)]
+        for record in records:
+            self.page_file.write_record(record.rid, record, RecordFormat.FREE)
+            if self.key(record) is not None:
+                self.tree.delete(self.key(record), record.rid)
+            self.unindex_record(record)
+        self.cursor.executemany(self.delete_sql,
+                                (self.mirror_row(x) for x in records))
+        self.conn.commit()
+        self.free_count += len(records)
+        self.flush()
+        if self.vacuum_due():
+            return self.vacuum()
+        return True
 
-        assert len(columns) == len(values)
-        new_record = [None] * len(self.header)
-        for column in range(len(self.header)):
-            if column in columns:
-                i = self.header.index(column)
-                j = columns.index(column)
-                new_record[i] = values[j]
-        
-        self.data.append(HeapRecord(new_record, self.data.sort_parameters))
-        return self.write_to_file()
-
-    def delete(self, statement):
-        tables = str(statement[1])
-        columns = str(statement[1]).split(",")
-        where = str(statement[2]).split(" and ")
-        # where = str( (statement[2:] + [None])[0] ).split(" and ")
-
-        # if columns[0] == '*':
-        #     return zip(*[self.get_column(x) for x in self.header])
-        # else:
-        #     return zip(*[self.get_column(x.upper()) for x in columns])
-
-                # "where" is not accepting in-place exchanges
-        where_args = {}
-        for w in where:
-            if "=" in w:
-                aux = w.split("=")
-                where_args[aux[0]] = aux[1]
-            elif "in" in w:
-                aux = w.split(" in (")
-                where_args[aux[0]] = aux[1].replace(")", "").split(",")
-            elif "between" in w:
-                aux = w.split(" between (")
-                where_args[aux[0]] = aux[1].replace(")", "").split(",")
-
-        for row in self.data[:]:
-            for key, value in where_args.items():
-                index = self.header.index(key)
-                if len(value) == 1: # regular = comparison
-                    if t[index] == value:
-                        self.data.remove(row)  
-                else: # in (GROUP) or BETWEEN (GROUP)
-                    if t[index] in value:
-                        self.data.remove(row)
-
-        return self.write_to_file()
+    def vacuum_due(self) -> bool:
+        return self.free_count + self.appended > \
+            self.vacuum_ratio * self.page_file.count
 
+    def vacuum(self):
+        # rewrites the live records in key order, which drops the tombstones,
+        # puts the appended records back in place and rebuilds the indexes
+        if self.log is not None:
+            self.compact()
+        self.data = list(self.scan())
+        try:
+            return self.write_to_file()
+        finally:
+            self.data = None
 
     def write_to_file(self):
+        # the rows are streamed through the external sort into the record
+        # file and the primary index is then bulk loaded from the file
         try:
-            f = open(file=self.record_file, mode="w", encoding="latin-1")
-            for x in self.data:
-                try:
-                    f.write(";".join(x) + "\n")
-                except:
-                    continue
-            f.close()
+            rows = self.sorter().sort(
+                (list(x) for x in self.data), self.sort_key)
+            if self.page_file is None:
+                self.page_file = PageFile(
+                    self.record_file,
+                    RecordFormat(self.header, self.schema_map),
+                    self.buffer_pool, truncate=True)
+            if self.tree is not None:
+                self.tree.close()
+            self.tree = BPlusTree(self.index_file, self.key_width(),
+                                  self.buffer_pool, truncate=True)
+            self.page_file.write_all(rows)
+            # the file is in key order, so the keys come out sorted
+            entries = ((self.key(x), rid) for rid, x in
+                       self.page_file.scan({self.parameters[0]}))
+            self.tree.bulk_load(x for x in entries if x[0] is not None)
+            self.free_count = self.appended = 0
+            self.build_indexes()
             return True
         except OSError:
             return False
 
 
+class HashDBFile(DBFile):
+    struct = "Hash"
+    record_file = "hashfile.dat"
+    hash_file = None
 
-class HashRecord(SortedDict):
-    sort_parameters = []
-
-    def __init__(self, list_of_objs: list, parameters: List[int] = [0]):
-        self.sort_parameters = parameters
+    def __init__(self, filename: str, schema_file: str,
+                 parameters: List[int] = [15], buffer_pool: BufferPool = None,
+                 processes: int = None,
+                 record_file: str = None):
+        assert len(parameters) == 1 # hashing supports only one key
+        self.name_files(record_file)
+
+        if buffer_pool is not None:
+            self.buffer_pool = buffer_pool
+        self.data = self.source(filename, processes)
+        if self.reuse(schema_file, parameters=parameters,
+                      buffer_pool=buffer_pool):
+            return
+        self.header = self.data.header
+
+        self.index_field = self.header[parameters[0]]
+        self.index_number = parameters[0]
+        self.schema = ":{}({});".join(self.header)
+
+        super().__init__(schema_file)
+        # from here on the records only live in the hash file
+        self.data = None
+
+    def reopen(self, schema_file: str, parameters: List[int] = [15],
+               buffer_pool: BufferPool = None, record_file: str = None):
+        self.name_files(record_file)
+        if buffer_pool is not None:
+            self.buffer_pool = buffer_pool
+        # the indexes opened with the schema point to keys of this column
+        self.index_number = parameters[0]
+        self.read_schema(schema_file)
+        self.index_field = self.header[parameters[0]]
+        self.hash_file = HashFile(self.record_file,
+                                  RecordFormat(self.header, self.schema_map),
+                                  self.key, self.buffer_pool)
+        self.recover()
+
+    def key(self, row: list) -> str:
+        return str(self.typed(self.index_number, row[self.index_number]))
+
+    def log_key(self, record: list) -> str:
+        return self.key(record)
+
+    def log_insert(self, row: list):
+        # the new row replaces the stored and the logged ones with its key
+        key = self.key(row)
+        self.log_deleted.add(key)
+        self.log_rows = [x for x in self.log_rows if self.key(x) != key]
+        self.log_rows.append(row)
+
+    def record_id(self, record: list):
+        # records move when buckets split, so secondary indexes point to
+        # keys; every record has one, whatever the type of the key column
+        return self.encode_id(self.key(record))
+
+    @property
+    def id_format(self) -> str:
+        return "{}s".format(self.id_width())
+
+    def id_width(self) -> int:
+        return self.schema_map[self.header[self.index_number]]
+
+    def encode_id(self, key: str) -> bytes:
+        # the key padded the way the B+-tree gives its values back
+        return key.encode("latin-1").ljust(self.id_width(), b"\0")
+
+    def decode_id(self, rid: bytes) -> str:
+        return rid.rstrip(b"\0").decode("latin-1")
+
+    def primary_ids(self, terms: List[tuple]) -> set:
+        for index, op, value in terms:
+            if index == self.index_number and op in ("=", "in"):
+                return {self.encode_id(str(x))
+                        for x in ((value,) if op == "=" else value)}
+        return None
+
+    def buckets(self, ids: set):
+        if ids is None:
+            return None
+        return sorted({self.hash_file.bucket_of(self.decode_id(x))
+                       for x in ids})
+
+    def scan(self, terms: List[tuple] = (), fields: set = None):
+        # the key is always decoded, the log looks records up by it
+        if fields is not None:
+            fields = fields | {self.index_number}
+        return self.hash_file.scan(fields=fields)
+
+    def fetch(self, ids: list, fields: set = None):
+        keys = {self.decode_id(x) for x in ids}
+        if fields is not None:
+            fields = fields | {self.index_number}
+        return iter(self.hash_file.find(lambda x: self.key(x) in keys,
+                                        self.buckets(ids), fields))
+
+    def files(self) -> list:
+        return [self.hash_file]
+
+    def row_count(self) -> int:
+        return self.hash_file.count
+
+    def insert_rows(self, rows: List[list]):
+        if self.fit_schema(rows):
+            # the record layout changed, the file has to be rebuilt; later
+            # rows replace earlier ones with the same key
+            self.data = list(self.scan()) + rows
+            self.write_schema()
+            self.hash_file.close()
+            self.hash_file = None
+            self.write_to_file()
+            self.data = None
+            return True
 
-        super().__init__(list_of_objs)
+        # same key replaces the old record, as the dict organization did
+        for row in rows:
+            key = self.key(row)
+            for record in self.hash_file.remove(
+                    lambda x: self.key(x) == key,
+                    [self.hash_file.bucket_of(key)]):
+                self.unindex_record(record)
+            self.hash_file.insert(row)
+            self.index_record(row)
+        self.flush()
+        return True
 
-    def __lt__(self, value):
-        for field in self.sort_parameters:
-            if self[field] < value[field]:
-                return True
-            elif self[field] > value[field]:
-                return False
-        else:
-            return False
+    def delete(self, plan: "Plan"):
+        for record in self.hash_file.remove(
+                plan.predicate, self.buckets(self.candidate_ids(plan.terms))):
+            self.unindex_record(record)
+        self.flush()
+        return True
 
-    def __gt__(self, value):
-        for field in self.sort_parameters:
-            if self[field] < value[field]:
-                return False
-            elif self[field] > value[field]:
-                return True
-        else:
+    def write_to_file(self):
+        try:
+            if self.hash_file is not None:
+                self.hash_file.close()
+            record_format = RecordFormat(self.header, self.schema_map)
+            per_page = (BLOCK_SIZE - HashFile.page_struct.size) // record_format.size
+            self.hash_file = HashFile(
+                self.record_file, record_format, self.key, self.buffer_pool,
+                buckets=int(len(self.data) / (HashFile.split_load * per_page)),
+                truncate=True)
+            for row in {self.key(x): x for x in self.data}.values():
+                self.hash_file.insert(row)
+            self.hash_file.flush()
+            self.build_indexes()
+            return True
+        except OSError:
             return False
 
 
-class HashDBFile(DBFile):
-    struct = "Hash"
-    record_file = "hashfile.py"
-
-    def __init__(self, filename: str, schema_file: str,
-                 parameters: List[int] = [15]):
-        assert len(parameters) == 1 # SortedDict supports only one index
-
-        self.data = SortedDict()
-        with open(filename, mode="r", encoding="latin-1") as csv_file:
-            csv_reader = csv.reader(csv_file, delimiter=',')
-            temp = [row[0].replace('"', '').split(';')[:58] for row in csv_reader]
-            self.header = temp.pop(0)
 
-            self.index_field = self.header[parameters[0]]
-            self.index_number = parameters[0]
-            for row in temp:
-                self.data[row[parameters[0]]] = row
+#%%
+class ColumnStore(object):
+    # the fields of a table column by column: the text of every field as
+    # fixed-width latin-1 bytes, the typed text where it differs (stripped of
+    # blanks and quotes), and for INTEGER columns the int64 value of every
+    # field with a mask of the fields that are valid int64 numbers.
+    # Text columns that repeat a few values keep a dictionary of the values
+    # instead, and a uint16 code per field. All of it is saved to a single
+    # .npz file
+    max_codes = 1 << 16
+    dictionary_ratio = 4
+
+    def __init__(self, filename: str, integer: List[bool],
+                 buffer_pool: BufferPool = None):
+        # the store is not paged, the pool only counts its loads and saves
+        self.filename = filename
+        self.integer = integer
+        self.pool = buffer_pool if buffer_pool is not None else BufferPool()
+        self.text = [np.zeros(0, "S1") for _ in integer]
+        self.keys = [None] * len(integer)
+        self.codes = [None] * len(integer)
+        self.dictionary = [None] * len(integer)
+        self.dictionary_keys = [None] * len(integer)
+        self.lookup = [None] * len(integer)
+        self.numbers = [np.zeros(0, np.int64) if x else None for x in integer]
+        self.valid = [np.zeros(0, bool) if x else None for x in integer]
+        self.live = np.zeros(0, bool)
+        self.dirty = True
+        # rows appended or killed since the last save
+        self.unsaved = 0
+
+    @classmethod
+    def load(cls, filename: str, integer: List[bool],
+             buffer_pool: BufferPool = None) -> "ColumnStore":
+        self = cls(filename, integer, buffer_pool)
+        self.count_io(os.path.getsize(filename))
+        with np.load(filename) as arrays:
+            self.live = arrays["live"]
+            for i in range(len(integer)):
+                for name in ("text", "keys", "codes", "dictionary",
+                             "dictionary_keys", "numbers", "valid"):
+                    if "{}{}".format(name, i) in arrays:
+                        getattr(self, name)[i] = arrays["{}{}".format(name, i)]
+                if self.codes[i] is not None:
+                    self.text[i] = None
+                    self.lookup[i] = {x: code for code, x in
+                                      enumerate(self.dictionary[i].tolist())}
+        self.dirty = False
+        return self
+
+    def __len__(self) -> int:
+        return len(self.live)
+
+    def encode(self, values: List[bytes]) -> bytes:
+        return np.array(values, dtype="S")
+
+    def append(self, rows: List[list]) -> int:
+        # returns the position of the first new row
+        first = len(self)
+        columns = list(zip(*rows)) or [()] * len(self.integer)
+        for i, values in enumerate(columns):
+            text = [x.encode("latin-1", "replace") for x in values]
+            if not first and not self.integer[i] and \
+               len(set(text)) * self.dictionary_ratio <= len(text):
+                # low cardinality, known from the first rows loaded
+                self.codes[i] = np.zeros(0, np.uint16)
+                self.dictionary[i] = np.zeros(0, "S1")
+                self.lookup[i] = {}
+                self.text[i] = None
+            if self.codes[i] is not None and not self.append_codes(i, text):
+                self.drop_dictionary(i)
+            if self.codes[i] is None:
+                keys = [x.strip().strip("'\"") for x in values]
+                if self.keys[i] is not None or keys != list(values):
+                    old = self.keys[i] if self.keys[i] is not None \
+                        else self.text[i]
+                    self.keys[i] = np.concatenate([old, self.encode(
+                        [x.encode("latin-1", "replace") for x in keys])])
+                self.text[i] = np.concatenate([self.text[i], self.encode(text)])
+            if self.integer[i]:
+                numbers, valid = self.parse_numbers(
+                    [x.strip().strip("'\"") for x in values])
+                self.numbers[i] = np.concatenate([self.numbers[i], numbers])
+                self.valid[i] = np.concatenate([self.valid[i], valid])
+        self.live = np.concatenate([self.live, np.ones(len(rows), bool)])
+        self.dirty = True
+        self.unsaved += len(rows)
+        return first
+
+    def append_codes(self, i: int, text: List[bytes]) -> bool:
+        # False when the dictionary would outgrow the codes
+        lookup = self.lookup[i]
+        new = [x for x in dict.fromkeys(text) if x not in lookup]
+        if len(lookup) + len(new) > self.max_codes:
+            return False
+        if new:
+            for x in new:
+                lookup[x] = len(lookup)
+            self.dictionary[i] = np.concatenate([self.dictionary[i],
+                                                 self.encode(new)])
+            keys = [x.decode("latin-1").strip().strip("'\"") for x in new]
+            if self.dictionary_keys[i] is not None or \
+               keys != [x.decode("latin-1") for x in new]:
+                old = self.dictionary_keys[i] \
+                    if self.dictionary_keys[i] is not None \
+                    else self.dictionary[i][:-len(new)]
+                self.dictionary_keys[i] = np.concatenate([old, self.encode(
+                    [x.encode("latin-1", "replace") for x in keys])])
+        self.codes[i] = np.concatenate([self.codes[i], np.array(
+            [lookup[x] for x in text], dtype=np.uint16)])
+        return True
 
+    def drop_dictionary(self, i: int):
+        self.text[i] = self.dictionary[i][self.codes[i]]
+        if self.dictionary_keys[i] is not None:
+            self.keys[i] = self.dictionary_keys[i][self.codes[i]]
+        self.codes[i] = self.dictionary[i] = None
+        self.dictionary_keys[i] = self.lookup[i] = None
+
+    def parse_numbers(self, values: List[str]) -> tuple:
+        numbers = np.zeros(len(values), np.int64)
+        valid = np.zeros(len(values), bool)
+        for i, value in enumerate(values):
             try:
-                f = open(file=self.record_file, mode="w", encoding="latin-1")
-                f.write("data=" + str(self.data))
-                f.close()
-            except OSError:
+                numbers[i] = int(value)
+                valid[i] = True
+            except (ValueError, OverflowError):
                 pass
+        return numbers, valid
+
+    def kill(self, ids: List[int]):
+        self.live[ids] = False
+        self.dirty = True
+        self.unsaved += len(ids)
+
+    def compact(self):
+        keep = self.live
+        for name in ("text", "keys", "codes", "numbers", "valid"):
+            setattr(self, name, [x[keep] if x is not None else None
+                                 for x in getattr(self, name)])
+        self.live = self.live[keep]
+        self.dirty = True
+
+    def string_mask(self, i: int, test):
+        # `test` maps an array of typed text to a mask; a dictionary column
+        # tests each value once and maps the result through the codes
+        if self.codes[i] is None:
+            return test(self.keys[i] if self.keys[i] is not None
+                        else self.text[i])
+        keys = self.dictionary_keys[i] if self.dictionary_keys[i] is not None \
+            else self.dictionary[i]
+        return test(keys)[self.codes[i]]
+
+    def field(self, i: int, row: int) -> str:
+        if self.codes[i] is not None:
+            return self.dictionary[i][self.codes[i][row]].decode("latin-1")
+        return self.text[i][row].decode("latin-1")
+
+    def column(self, i: int, ids) -> List[str]:
+        if self.codes[i] is not None:
+            values = [x.decode("latin-1") for x in self.dictionary[i].tolist()]
+            return [values[x] for x in self.codes[i][ids].tolist()]
+        return [x.decode("latin-1") for x in self.text[i][ids].tolist()]
+
+    def rows(self, ids, fields: set = None) -> List[list]:
+        # fields not in `fields` are None
+        columns = [self.column(i, ids) if fields is None or i in fields
+                   else repeat(None) for i in range(len(self.integer))]
+        return [list(x) for x in zip(*columns)]
+
+    def flush(self):
+        if not self.dirty:
+            return
+        arrays = {"live": self.live}
+        for i in range(len(self.integer)):
+            for name in ("text", "keys", "codes", "dictionary",
+                         "dictionary_keys", "numbers", "valid"):
+                if getattr(self, name)[i] is not None:
+                    arrays["{}{}".format(name, i)] = getattr(self, name)[i]
+        with open(self.filename, "wb") as f:
+            np.savez(f, **arrays)
+            self.count_io(f.tell(), write=True)
+        self.dirty = False
+        self.unsaved = 0
+
+    def close(self):
+        self.flush()
+
+    def count_io(self, size: int, write: bool = False):
+        # a whole-file load or save is one seek and a run of blocks
+        blocks = -(-size // BLOCK_SIZE)
+        if write:
+            self.pool.add(writes=blocks, bytes_written=size, seeks=1)
+        else:
+            self.pool.add(reads=blocks, bytes_read=size, seeks=1)
 
-            self.schema = ":{}({});".join(self.header)
 
-    def select(self, statement):
-        columns = str(statement[1]).split(",")
-        tables = str( (statement[2:] + [None])[0] )
-        where = (str( (statement[7:] + [None])[0] ).lower()
-                 .replace("where ", "").replace(";", "").replace("'", "")
-                 .strip()).split(" and ")
-        
-        # "where" is not accepting in-place exchanges
-        where_args = {}
-        counter = 0
-        for w in where:
-            if "=" in w:
-                aux = w.split("=")
-                where_args[aux[0].strip()] = aux[1]
-            elif "in" in w:
-                aux = w.split(" in (")
-                where_args[aux[counter].strip()] = aux[1].replace(")", "").split(",")
-            elif "between" in w:
-                aux = w.split(" between ")
-                where_args[aux[0].strip()] = [aux[1], where[1]] 
-                break
+class ColumnDBFile(DBFile):
+    # columnar organization: = , in and between are evaluated as NumPy masks
+    # over whole columns; only the fields that are not int64 numbers in an
+    # INTEGER column are tested one by one
+    struct = "Column"
+    record_file = "colfile.npz"
+    store = None
+    save_ratio = 0.125
 
-                # if where_args.get(aux[0], False):
-                #     where_args[aux[0]] += aux[1].replace(")", "").split(",")
-                # else:
-                #     where_args[aux[0]] = aux[1].replace(")", "").split(",")
-            counter += 1
-            
-        if columns[0] == '*':
-            keys = self.data.keys()
-            temp = self.data.values()
-            res = []
-            for row, record in self.data.items():
-                for key, value in where_args.items():
-                    if key.lower() == self.index_field.lower():
-                        if len(value) == 1 and row == value: # regular = comparison
-                            res += [record]
-                        elif len(value) == 2: # between comparison
-                            if where_args[key][0] <= row <= where_args[key][1]:
-                                res += [record]
-                        elif len(value) > 2:
-                            if row in where_args[key]:
-                                res += [record]
-                    else:
-                        index = self.header.index(key.upper())
-                        if len(value) == 1 and record[index] == value.upper(): # regular = comparison
-                            res += [record]
-                        elif len(value) == 2: # between comparison
-                            if where_args[key][0].upper() <= record[index] <= where_args[key][1].upper():
-                                res += [record]
-                        elif len(value) > 2:
-                            if record[index].lower() in where_args[key]:
-                                res += [record]
-            # raise Exception
-            return res
+    def __init__(self, filename: str, schema_file: str,
+                 parameters: List[int] = [15], buffer_pool: BufferPool = None,
+                 processes: int = None,
+                 record_file: str = None):
+        self.name_files(record_file)
+        self.parameters = parameters
+        if buffer_pool is not None:
+            self.buffer_pool = buffer_pool
+        self.data = self.source(filename, processes)
+        if self.reuse(schema_file, parameters=parameters,
+                      buffer_pool=buffer_pool):
+            return
+        self.header = self.data.header
+        self.schema = ":{}({});".join(self.header)
+
+        super().__init__(schema_file)
+        self.data = None
+
+    def reopen(self, schema_file: str, parameters: List[int] = [15],
+               buffer_pool: BufferPool = None, record_file: str = None):
+        self.name_files(record_file)
+        self.parameters = parameters
+        if buffer_pool is not None:
+            self.buffer_pool = buffer_pool
+        self.read_schema(schema_file)
+        self.store = ColumnStore.load(self.record_file, self.integer(),
+                                      self.buffer_pool)
+        self.recover()
+
+    def integer(self) -> List[bool]:
+        return [self.schema_types.get(x) == "INTEGER" for x in self.header]
+
+    def files(self) -> list:
+        return [self.store]
+
+    def flush(self):
+        # the store is saved whole. With a log open, which can replay what
+        # the store has not saved, the save waits until the rows changed
+        # since the last one reach `save_ratio` of the table; compaction,
+        # vacuum and close save the rest. Without a log every statement
+        # saves it, batch() is the way to group writes then
+        if self.batch_depth:
+            return
+        if self.log is None or \
+                self.store.unsaved >= self.save_ratio * len(self.store):
+            self.flush_files()
         else:
-            return zip(*[self.get_column(x.upper()) for x in columns])
-
-    def insert(self, statement):
-        tables = str(statement[5])
-        columns = str(statement[2]).upper().strip().replace("(", "").replace(")", "").split(",")
-        temp = ""
-        for i in range(7, len(statement)-1):
-            temp += statement[i].normalized
-        values = temp.upper().strip().replace("(", "").replace(")", "").split(",")
-
-        assert len(columns) == len(values) or columns == [""]
-        # new_record = [None] * len(self.header)
-        # for value in range(len(self.header)):
-        #     i = self.header.index(column)
-        #     j = columns.index(column)
-        #     new_record[i] = values[j]
-        
-        self.data[values[self.index_number]] = values
-        # raise Exception
-        return self.write_to_file()
-
-    def delete(self, statement):
-        tables = str(statement[1])
-        columns = str(statement[1]).split(",")
-        where = (str(statement[5]).lower()
-                 .replace("where ", "").replace(";", "").replace("'", "")
-                 .strip()).split(" and ")
-
-        # "where" is not accepting in-place exchanges
-        counter = 0
-        where_args = {}
-        for w in where:
-            if "=" in w:
-                aux = w.split("=")
-                where_args[aux[0].strip()] = aux[1]
-            elif "in" in w:
-                aux = w.split(" in (")
-                where_args[aux[counter].strip()] = aux[1].replace(")", "").split(",")
-            elif "between" in w:
-                aux = w.split(" between ")
-                where_args[aux[0].strip()] = [aux[1], where[1]] 
-                break
-            counter += 1
-
-        #####
-        # raise Exception
-        if columns[0]:
-            keys = self.data.keys()
-            temp = self.data.values()
-            # res = []
-            for row, record in self.data.items():
-                for key, value in where_args.items():
-                    if key.lower() == self.index_field.lower():
-                        if len(value) == 1 and row == value: # regular = comparison
-                            del self.data[row]
-                        elif len(value) == 2: # between comparison
-                            if where_args[key][0] <= row <= where_args[key][1]:
-                                del self.data[row]
-                        elif len(value) > 2:
-                            if row in where_args[key]:
-                                del self.data[row]
-                    else:
-                        index = self.header.index(key.upper())
-                        if len(value) == 1 and record[index] == value.upper(): # regular = comparison
-                            del self.data[row]
-                        elif len(value) == 2: # between comparison
-                            if where_args[key][0].upper() <= record[index] <= where_args[key][1].upper():
-                                del self.data[row]
-                        elif len(value) > 2:
-                            if record[index].lower() in where_args[key]:
-                                del self.data[row]
-        # raise Exception
-        # temp2 = self.data.items()
-        # for row in temp2:
-        #     for key, value in where_args.items():
-        #         index = self.header.index(key)
-        #         if len(value) == 1: # regular = comparison
-        #             if t[index] == value:
-        #                 self.data.remove(row)  
-        #         else: # in (GROUP) or BETWEEN (GROUP)
-        #             if t[index] in value:
-        #                 self.data.remove(row)
-
-        return self.write_to_file()
+            self.log.sync()
+
+    def row_count(self) -> int:
+        # killed rows keep their place in the arrays until vacuum
+        return int(self.store.live.sum())
+
+    def mask(self, terms: List[tuple]):
+        mask = self.store.live.copy()
+        for term in terms:
+            mask &= self.term_mask(*term)
+        return mask
+
+    def term_mask(self, index: int, op: str, value):
+        store = self.store
+        if store.numbers[index] is None:
+            encoded = [x.encode("latin-1", "replace")
+                       for x in (value if op != "=" else (value,))]
+            if op == "=":
+                return store.string_mask(index, lambda x: x == encoded[0])
+            if op == "in":
+                return store.string_mask(index, lambda x: np.isin(x, encoded))
+            return store.string_mask(
+                index, lambda x: (x >= encoded[0]) & (x <= encoded[1]))
+
+        numbers, valid = store.numbers[index], store.valid[index]
+        low, high = np.iinfo(np.int64).min, np.iinfo(np.int64).max
+        if op == "between":
+            if all(isinstance(x, int) for x in value) \
+               and value[0] <= high and value[1] >= low:
+                mask = valid & (numbers >= max(value[0], low)) \
+                    & (numbers <= min(value[1], high))
+            else:
+                mask = np.zeros(len(store), bool)
+        else:
+            mask = valid & np.isin(numbers, [
+                x for x in (value if op == "in" else (value,))
+                if isinstance(x, int) and low <= x <= high])
+        # fields that did not parse as int64 keep the row by row semantics
+        test = self.value_test(op, value)
+        for i in np.flatnonzero(~valid).tolist():
+            mask[i] = test(self.typed(index, store.field(index, i)))
+        return mask
+
+    def primary_ids(self, terms: List[tuple]) -> set:
+        if not terms:
+            return None
+        return set(np.flatnonzero(self.mask(terms)).tolist())
+
+    def grouped(self, plan: "Plan"):
+        # groups of dictionary coded columns are found, counted and summed
+        # with NumPy over the codes of the matching rows; the aggregates of
+        # an INTEGER column come from its int64 values when they all parse
+        store = self.store
+        group, outputs = plan.group
+        functions = [x for x in outputs if x[0]]
+        if self.log is not None or \
+           not all(store.codes[i] is not None for i in group):
+            return None
+        ids = np.flatnonzero(self.mask(plan.terms))
+        for name, index in functions:
+            if index is not None and (store.numbers[index] is None
+                                      or not store.valid[index][ids].all()):
+                return None
+        # codes of one typed value are one group
+        codes, keys, size = [], [], 1
+        for i in group:
+            values = store.dictionary_keys[i] \
+                if store.dictionary_keys[i] is not None else store.dictionary[i]
+            unique, typed = np.unique(values, return_inverse=True)
+            codes.append(typed.reshape(-1)[store.codes[i][ids]])
+            keys.append(unique)
+            size *= len(unique)
+        if size >= 1 << 62:
+            return None
+        combined = np.ravel_multi_index(codes, [len(x) for x in keys]) \
+            if group else np.zeros(len(ids), np.int64)
+        groups, inverse = np.unique(combined, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        counts = np.bincount(inverse, minlength=len(groups))
+        results = []
+        for name, index in functions:
+            if name == "count":
+                results.append(counts.tolist())
+                continue
+            values = store.numbers[index][ids]
+            if name == "sum" or name == "avg":
+                totals = np.zeros(len(groups), np.int64)
+                np.add.at(totals, inverse, values)
+                results.append(totals.tolist() if name == "sum"
+                               else (totals / counts).tolist())
+            else:
+                limits = np.iinfo(np.int64)
+                extremes = np.full(len(groups), limits.max if name == "min"
+                                   else limits.min, np.int64)
+                (np.minimum if name == "min" else np.maximum).at(
+                    extremes, inverse, values)
+                results.append(extremes.tolist())
+        columns = [[x.decode("latin-1") for x in key[code].tolist()]
+                   for key, code in zip(keys, np.unravel_index(
+                       groups, [len(x) for x in keys]))] if group else []
+        return ((tuple(x[n] for x in columns), [x[n] for x in results])
+                for n in range(len(groups)))
+
+    def matches(self, plan: "Plan", fields: set = None):
+        if self.log is not None:
+            return super().matches(plan, fields)
+        if self.bloom_terms(plan.terms) is None:
+            return iter(())
+        # the mask is exact, the matching rows need no further test
+        ids = np.flatnonzero(self.mask(plan.terms))
+        return self.fetch(ids[plan.offset:plan.stop()], fields)
+
+    def scan(self, terms: List[tuple] = (), fields: set = None):
+        return self.fetch(np.flatnonzero(self.store.live), fields)
+
+    def fetch(self, ids: list, fields: set = None):
+        # decoded a block of rows at a time, so a cursor that stops early
+        # does not pay for the rest
+        ids = np.asarray(ids, dtype=np.int64)
+        ids = ids[self.store.live[ids]]
+        for start in range(0, len(ids), 4096):
+            block = ids[start:start + 4096]
+            yield from (HeapRecord(row, self.parameters, rid) for row, rid
+                        in zip(self.store.rows(block, fields), block.tolist()))
+
+    def get_column(self, fieldname: str) -> List[str]:
+        try:
+            index = self.header.index(fieldname.strip())
+            column = self.store.column(index, self.store.live)
+        except (IndexError, ValueError):
+            column = [[]]
+        finally:
+            return column
+
+    def insert_rows(self, rows: List[list]):
+        widened = self.fit_schema(rows)
+        if widened:
+            # the arrays widen by themselves; the schema is rewritten and the
+            # secondary indexes are rebuilt below with the wider keys
+            self.write_schema()
+        rows = [fit_row(x, len(self.header)) for x in rows]
+        first = self.store.append(rows)
+        if widened:
+            self.build_indexes()
+        else:
+            for rid, row in enumerate(rows, first):
+                self.index_record(HeapRecord(row, self.parameters, rid))
+        self.flush()
+        return True
+
+    def delete(self, plan: "Plan"):
+        records = [x for x in self.records(plan.terms) if plan.predicate(x)]
+        self.store.kill([x.rid for x in records])
+        for record in records:
+            self.unindex_record(record)
+        self.flush()
+        return True
 
+    def vacuum(self):
+        # drops the deleted rows, which renumbers the rest
+        if self.log is not None:
+            self.compact()
+        self.store.compact()
+        self.store.flush()
+        self.build_indexes()
+        return True
 
     def write_to_file(self):
         try:
-            f = open(file=self.record_file, mode="w", encoding="latin-1")
-            for x in self.data:
-                try:
-                    f.write(";".join(x) + "\n")
-                except:
-                    continue
-            f.close()
+            self.store = ColumnStore(self.record_file, self.integer(),
+                                     self.buffer_pool)
+            rows = []
+            for row in self.data:
+                rows.append(row)
+                if len(rows) == 65536:
+                    self.store.append(rows)
+                    rows = []
+            self.store.append(rows)
+            self.store.flush()
+            self.build_indexes()
             return True
         except OSError:
             return False
 
 
+#%%
+def engine_named(struct: str) -> type:
+    engines = list(DBFile.__subclasses__())
+    while engines:
+        engine = engines.pop(0)
+        if engine.struct == struct:
+            return engine
+        engines.extend(engine.__subclasses__())
+    raise ValueError("no engine stores " + struct + " tables")
+
+
+class PartitionedDBFile(DBFile):
+    # a table split on the values of one column, SG_UF by default. Every
+    # partition is a table of `engine` with its own record, index and schema
+    # files, named after the value, and is only opened once a statement
+    # needs it: = , in and between on the column skip the other partitions.
+    # The schema file of the whole table lists the partitions
+    struct = "Partitioned"
+
+    def __init__(self, filename, schema_file: str, engine: type = HeapDBFile,
+                 column: str = "SG_UF", processes: int = None, **options):
+        # `options` (parameters, buffer_pool, resident) go to the partitions;
+        # the declared types and indexes of an existing schema file too
+        source = self.source(filename, processes)
+        self.setup(schema_file, engine, source.header,
+                   source.header.index(column.strip().upper()), options)
+        if os.path.exists(schema_file) and os.path.getsize(schema_file):
+            with open(schema_file, mode="r", encoding="latin-1") as f:
+                file_content = f.readlines()
+            self.load_schema(file_content[-1])
+            self.load_indexes(file_content)
+        self.declared = all(x in self.schema_map for x in self.header)
+        for value, rows in sorted(source.partition(self.column).items()):
+            self.build(value, rows)
+        self.write_schema()
+
+    @classmethod
+    def open(cls, schema_file: str, **options):
+        self = cls.__new__(cls)
+        with open(schema_file, mode="r", encoding="latin-1") as f:
+            file_content = f.readlines()
+        catalog = dict(x.rstrip("\n").split(": ", 1) for x in file_content
+                       if x.startswith("Partition"))
+        self.setup(schema_file, engine_named(catalog["Partition engine"]),
+                   [], 0, options)
+        self.header = self.load_schema(file_content[-1])
+        self.column = self.header.index(catalog["Partition column"])
+        self.load_indexes(file_content)
+        self.schema_head = file_content[:2]
+        self.declared = True
+        self.values = [x for x in catalog["Partitions"].split(";") if x]
+        return self
+
+    def setup(self, schema_file: str, engine: type, header: List[str],
+              column: int, options: dict):
+        self.schema_file = schema_file
+        self.lock = threading.RLock()
+        self.engine = engine
+        self.header = header
+        self.column = column
+        self.options = options
+        if options.get("buffer_pool") is not None:
+            self.buffer_pool = options["buffer_pool"]
+        self.schema_map = {}
+        self.schema_types = {}
+        self.indexes = {}
+        self.index_columns = []
+        self.bloom_columns = {}
+        self.schema_head = [
+            "File structure: {}\n".format(self.struct),
+            "Creation date: {}\n".format(
+                datetime.now().strftime("%Y%m%d%H%M%S"))]
+        self.declared = False
+        self.values = []
+        self.tables = {}
+        self.log_options = None
+
+    def schema_lines(self) -> List[str]:
+        return super().schema_lines() + [
+            "Partition engine: {}\n".format(self.engine.struct),
+            "Partition column: {}\n".format(self.header[self.column]),
+            "Partitions: {}\n".format(";".join(self.values))]
+
+    def partition_name(self, filename: str, value: str) -> str:
+        # "heapfile.dat" -> "heapfile.DF.dat"; the value is %-escaped
+        base, extension = os.path.splitext(filename)
+        value = re.sub(r"[^\w-]", lambda x: "%{:02X}".format(ord(x.group())),
+                       value) or "%"
+        return "{}.{}{}".format(base, value, extension)
+
+    def partition_files(self, value: str) -> tuple:
+        return (self.partition_name(self.engine.record_file, value),
+                self.partition_name(self.schema_file, value))
+
+    def build(self, value: str, rows: CSVSource):
+        # (re)loads one partition
+        if value in self.tables:
+            self.tables.pop(value).close()
+        record_file, schema_file = self.partition_files(value)
+        if self.declared and not os.path.exists(schema_file):
+            self.seed_schema(schema_file)
+        table = self.engine(rows, schema_file, record_file=record_file,
+                            **self.options)
+        for name in self.header:
+            self.schema_map[name] = max(self.schema_map.get(name, 0),
+                                        table.schema_map[name])
+            self.schema_types.setdefault(name, table.schema_types[name])
+        if value not in self.values:
+            self.values.append(value)
+            self.values.sort()
+        self.tables[value] = table
+        self.open_partition_log(table)
+        return table
+
+    def seed_schema(self, schema_file: str):
+        # a new partition starts from the declared types, sizes and indexes
+        indexes = ["Indexes: {}\n".format(";".join(self.index_columns))] \
+            if self.index_columns else []
+        indexes += [self.bloom_line()] if self.bloom_columns else []
+        with open(schema_file, mode="w", encoding="latin-1") as f:
+            f.write("".join(["File structure: {}\n".format(self.engine.struct),
+                             self.schema_head[1]]
+                            + indexes + [self.schema_line()]))
+
+    def partition(self, value: str) -> DBFile:
+        table = self.tables.get(value)
+        if table is None:
+            record_file, schema_file = self.partition_files(value)
+            table = self.engine.open(schema_file, record_file=record_file,
+                                     **self.options)
+            self.tables[value] = table
+            self.open_partition_log(table)
+        return table
+
+    def reload(self, value: str, filename=None, processes: int = None) -> DBFile:
+        # rebuilds one partition from the rows of `value` in the csv files,
+        # or reopens it from its own files when no csv is given
+        if filename is None:
+            if value in self.tables:
+                self.tables.pop(value).close()
+            return self.partition(value)
+        table = self.build(value, CSVSource(filename, processes,
+                                            (self.column, value)))
+        self.write_schema()
+        return table
+
+    def release(self, value: str = None):
+        # closes one partition, or every open one
+        for x in [value] if value is not None else list(self.tables):
+            if x in self.tables:
+                self.tables.pop(x).close()
+
+    def prune(self, terms: List[tuple]) -> List[str]:
+        values = self.values
+        for index, op, value in terms:
+            if index == self.column:
+                test = self.value_test(op, value)
+                values = [x for x in values if test(self.typed(index, x))]
+        return values
+
+    def scan(self, terms: List[tuple] = (), fields: set = None):
+        return chain.from_iterable(self.partition(x).records(terms, fields)
+                                   for x in self.prune(terms))
+
+    def scan_tasks(self, terms: List[tuple]) -> list:
+        # the page ranges of every partition left after pruning, as long as
+        # none of them has an index that narrows the scan down
+        tasks = []
+        for value in self.prune(terms):
+            table = self.partition(value)
+            found = table.scan_tasks(terms) \
+                if table.candidate_ids(terms) is None else None
+            if found is None:
+                return None
+            tasks.extend(found)
+        return tasks
+
+    def insert_rows(self, rows: List[list]):
+        groups = {}
+        for row in rows:
+            value = str(self.typed(self.column, row[self.column]))
+            groups.setdefault(value, []).append(row)
+        for value, group in groups.items():
+            if value not in self.values:
+                # a new value gets its own, empty to begin with, partition
+                self.build(value, CSVSource([], header=self.header))
+                self.write_schema()
+            self.partition(value).insert_many(group)
+        return True
+
+    def delete(self, plan: "Plan"):
+        return all([self.partition(x).execute(plan)
+                    for x in self.prune(plan.terms)])
+
+    def files(self) -> list:
+        return list(self.tables.values())
+
+    def row_count(self) -> int:
+        return sum(self.partition(x).row_count() for x in self.values)
+
+    def estimate(self, terms: List[tuple] = ()) -> int:
+        return sum(self.partition(x).estimate(terms) for x in self.prune(terms))
+
+    def close(self):
+        self.release()
+
+    def create_index(self, column: str) -> bool:
+        column = column.strip().upper()
+        if not all([self.partition(x).create_index(column)
+                    for x in self.values]):
+            return False
+        if column not in self.index_columns:
+            self.index_columns.append(column)
+            self.write_schema()
+        return True
+
+    def create_bloom_filter(self, column: str, error: float = None) -> bool:
+        column = column.strip().upper()
+        error = error or self.bloom_error
+        if not all([self.partition(x).create_bloom_filter(column, error)
+                    for x in self.values]):
+            return False
+        self.bloom_columns = dict(self.bloom_columns)
+        self.bloom_columns[column] = error
+        self.write_schema()
+        return True
+
+    def build_bloom_filters(self):
+        # the partitions keep the filters
+        self.blooms, self.page_blooms = {}, {}
 
-## HEAP TESTBED
-# load heap and write to file
-# new_heap = HeapDBFile("consulta_cand_2018/consulta_cand_2018_DF.csv", "HeapHEAD.txt")
+    def open_log(self, durability: str = "commit", compact_size: int = 1 << 20,
+                 compact_interval: float = None) -> bool:
+        # every partition keeps its own log
+        self.log_options = (durability, compact_size, compact_interval)
+        for table in self.tables.values():
+            self.open_partition_log(table)
+        return True
 
-# SELECT statements
-# new_heap.parse("select * from candidates where SQ_CANDIDATO=280000622172")
+    def open_partition_log(self, table: DBFile):
+        if self.log_options is not None and table.log is None:
+            table.open_log(*self.log_options)
 
-# new_heap.parse("select * from candidates where SQ_CANDIDATO in (280000624082,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808")
+    def close_log(self) -> bool:
+        self.log_options = None
+        for table in self.tables.values():
+            table.close_log()
+        return True
 
-# new_heap.parse("select * from candidates where SQ_CANDIDATO between 280000600000 and 280000700000")
+    def write_to_file(self):
+        return True
 
-# new_heap.parse("select * from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
+
+#%%
+class JoinedTables(QueryTerms):
+    # the two tables of an inner equi-join seen as one: the header is the
+    # left one's followed by the right one's, a column may be qualified by
+    # its table's name or alias and unqualified ones are looked up on the
+    # left first. Each table only hands over the rows its own WHERE terms
+    # keep; they are then joined with a hash table when the smaller input
+    # fits `sort_memory`, by partitioning both to disk first (grace hash
+    # join) when one pass brings it under, and else by merging both inputs
+    # sorted on the join key
+    def __init__(self, left: DBFile, right: DBFile, left_names: List[str],
+                 right_names: List[str], on: tuple):
+        self.tables = (left, right)
+        self.names = ({x.upper() for x in left_names if x},
+                      {x.upper() for x in right_names if x})
+        self.width = len(left.header)
+        self.header = left.header + right.header
+        first, second = self.column_index(on[0]), self.column_index(on[1])
+        if (first < self.width) == (second < self.width) and "." not in on[1]:
+            # "on NR_PARTIDO = NR_PARTIDO" compares the two tables
+            second = self.column_index(on[1], first < self.width)
+        first, second = sorted((first, second))
+        if first >= self.width or second < self.width:
+            raise ValueError("the join has to compare a column of each table")
+        self.keys = (first, second - self.width)
+
+    def column_index(self, name: str, right: bool = False) -> int:
+        name = name.upper()
+        if "." in name:
+            table, name = name.split(".", 1)
+            if table in self.names[0]:
+                return self.tables[0].column_index(name)
+            if table in self.names[1]:
+                return self.width + self.tables[1].column_index(name)
+            raise KeyError("no table " + table)
+        if not right and name in self.tables[0].header:
+            return self.tables[0].column_index(name)
+        return self.width + self.tables[1].column_index(name)
+
+    def typed(self, index: int, value: str):
+        if index < self.width:
+            return self.tables[0].typed(index, value)
+        return self.tables[1].typed(index - self.width, value)
+
+    def sorter(self) -> ExternalSort:
+        return self.tables[0].sorter()
+
+    def matches(self, plan: Plan, fields: set = None):
+        # the joined rows; a join on the ORDER BY key comes out in its order
+        sides = ([x for x in plan.terms if x[0] < self.width],
+                 [(x[0] - self.width,) + x[1:] for x in plan.terms
+                  if x[0] >= self.width])
+        rows = getattr(self, self.strategy(sides, plan.order) + "_join")(*sides)
+        return islice(rows, plan.offset, plan.stop())
+
+    def select(self, plan: Plan) -> Cursor:
+        if plan.order and not self.key_order(plan.order):
+            rows = self.sorter().sort(self.matches(plan.unlimited()),
+                                      self.order_key(plan.order))
+            rows = islice(rows, plan.offset, plan.stop())
+        else:
+            rows = self.matches(plan)
+        # rows go out as tuples, never as the table's own records
+        if plan.indexes is not None:
+            rows = (tuple(x[i] for i in plan.indexes) for x in rows)
+        else:
+            rows = (tuple(x) for x in rows)
+        return Cursor(rows, plan.columns)
+
+    def sizes(self, sides: tuple) -> List[int]:
+        return [table.estimate(terms) * table.row_width()
+                for table, terms in zip(self.tables, sides)]
+
+    def key_order(self, order: List[tuple]) -> bool:
+        # ORDER BY the join key is what a merge join produces anyway
+        return order in ([(self.keys[0], False)],
+                         [(self.width + self.keys[1], False)])
+
+    def strategy(self, sides: tuple, order: List[tuple] = None) -> str:
+        memory = self.tables[0].sort_memory
+        smaller = min(self.sizes(sides))
+        if order and self.key_order(order):
+            return "merge"
+        if smaller <= memory:
+            return "hash"
+        if smaller <= memory * ExternalSort.fan_in:
+            return "grace"
+        return "merge"
+
+    def rows(self, side: int, terms: List[tuple]):
+        table = self.tables[side]
+        plan = Plan("select", terms=terms)
+        plan.predicate = table.predicate(terms)
+        return (list(x) for x in table.matches(plan))
+
+    def key(self, side: int):
+        return partial(self.tables[side].field_key, self.keys[side])
+
+    def hash_join(self, left_terms: List[tuple], right_terms: List[tuple]):
+        # the smaller input is the one held in memory
+        sizes = self.sizes((left_terms, right_terms))
+        build = 0 if sizes[0] <= sizes[1] else 1
+        terms = (left_terms, right_terms)
+        return self.hashed(build, self.rows(build, terms[build]),
+                           self.rows(1 - build, terms[1 - build]))
+
+    def hashed(self, build: int, build_rows, probe_rows):
+        table = {}
+        key = self.key(build)
+        for row in build_rows:
+            table.setdefault(key(row), []).append(row)
+        key = self.key(1 - build)
+        for row in probe_rows:
+            for other in table.get(key(row), ()):
+                yield other + row if build == 0 else row + other
+
+    def grace_join(self, left_terms: List[tuple], right_terms: List[tuple]):
+        # both inputs are split on a hash of the key into files small enough
+        # to join in memory, pair by pair
+        sizes = self.sizes((left_terms, right_terms))
+        build = 0 if sizes[0] <= sizes[1] else 1
+        parts = min(ExternalSort.fan_in,
+                    -(-sizes[build] // self.tables[0].sort_memory) + 1)
+        sorter = self.sorter()
+        runs = [sorter.partition(self.rows(x, terms),
+                                 lambda row, key=self.key(x): hash(key(row)) % parts,
+                                 parts)
+                for x, terms in enumerate((left_terms, right_terms))]
+        for pair in zip(*runs):
+            pair = [sorter.read_run(x) for x in pair]
+            yield from self.hashed(build, pair[build], pair[1 - build])
+
+    def ordered(self, side: int, terms: List[tuple]):
+        # the input sorted on its join key; a resident heap kept in join
+        # key order already has the sort keys of its records
+        table = self.tables[side]
+        if not terms and table.log is None \
+           and isinstance(table.data, HeapTable) \
+           and list(table.parameters) == [self.keys[side]]:
+            return (list(x[2]) for x in sorted(list.__iter__(table.data))
+                    if not x[2].deleted)
+        return table.sorter().sort(self.rows(side, terms), self.key(side))
+
+    def merge_join(self, left_terms: List[tuple], right_terms: List[tuple]):
+        left_key, right_key = self.key(0), self.key(1)
+        right = self.ordered(1, right_terms)
+        other = next(right, None)
+        group, group_key = [], None
+        for row in self.ordered(0, left_terms):
+            key = left_key(row)
+            if key != group_key:
+                # the right rows of the next key
+                group, group_key = [], key
+                while other is not None and right_key(other) < key:
+                    other = next(right, None)
+                while other is not None and right_key(other) == key:
+                    group.append(other)
+                    other = next(right, None)
+            for match in group:
+                yield row + match
+
+
+if __name__ == "__main__":
+    ## HEAP TESTBED
+    # load heap and write to file
+    # new_heap = HeapDBFile("consulta_cand_2018/consulta_cand_2018_DF.csv", "HeapHEAD.txt")
+
+    # SELECT statements
+    # new_heap.parse("select * from candidates where SQ_CANDIDATO=280000622172")
+
+    # new_heap.parse("select * from candidates where SQ_CANDIDATO in (280000624082,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808")
+
+    # new_heap.parse("select * from candidates where SQ_CANDIDATO between 280000600000 and 280000700000")
+
+    # new_heap.parse("select * from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
 
 
-# # INSERT statements
-# with open("insert1.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_heap.parse(statement)
+    # # INSERT statements
+    # with open("insert1.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_heap.parse(statement)
 
-# with open("insert10.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_heap.parse(statement)
+    # with open("insert10.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_heap.parse(statement)
 
-# with open("insert10.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_heap.parse(statement)
+    # with open("insert10.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_heap.parse(statement)
 
-# with open("insert10.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_heap.parse(statement)
+    # with open("insert10.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_heap.parse(statement)
 
-# with open("insertall.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_heap.parse(statement)
+    # with open("insertall.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_heap.parse(statement)
 
 
-# # DELETE statements
-# new_heap.parse("delete from candidates where SQ_CANDIDATO=280000622172")
+    # # DELETE statements
+    # new_heap.parse("delete from candidates where SQ_CANDIDATO=280000622172")
 
-# new_heap.parse("delete from candidates where SQ_CANDIDATO in (280000624082,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)")
+    # new_heap.parse("delete from candidates where SQ_CANDIDATO in (280000624082,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)")
 
-# new_heap.parse("delete from candidates where SQ_CANDIDATO between 280000600000 and 280000700000")
+    # new_heap.parse("delete from candidates where SQ_CANDIDATO between 280000600000 and 280000700000")
 
-# new_heap.parse("delete from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
+    # new_heap.parse("delete from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
 
 
 
-## ORDERED TESTBED
-# new_ord = OrderedDBFile("consulta_cand_2018/consulta_cand_2018_DF.csv", "HeapHEAD.txt")
+    ## ORDERED TESTBED
+    # new_ord = OrderedDBFile("consulta_cand_2018/consulta_cand_2018_DF.csv", "HeapHEAD.txt")
 
-# SELECT statements
-# new_ord.parse("select * from candidates where SQ_CANDIDATO=280000622172")
+    # SELECT statements
+    # new_ord.parse("select * from candidates where SQ_CANDIDATO=280000622172")
 
-# new_ord.parse("select * from candidates where SQ_CANDIDATO in (280000624082,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)")
+    # new_ord.parse("select * from candidates where SQ_CANDIDATO in (280000624082,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)")
 
-# new_ord.parse("select * from candidates where SQ_CANDIDATO between 280000600000 and 280000700000")
+    # new_ord.parse("select * from candidates where SQ_CANDIDATO between 280000600000 and 280000700000")
 
-# new_ord.parse("select * from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
+    # new_ord.parse("select * from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
 
 
-# # INSERT statements
-# with open("insert1.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_ord.parse(statement)
+    # # INSERT statements
+    # with open("insert1.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_ord.parse(statement)
 
-# with open("insert10.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_ord.parse(statement)
+    # with open("insert10.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_ord.parse(statement)
 
-# with open("insert10.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_ord.parse(statement)
+    # with open("insert10.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_ord.parse(statement)
 
-# with open("insert10.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_ord.parse(statement)
+    # with open("insert10.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_ord.parse(statement)
 
-# with open("insertall.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_ord.parse(statement)
+    # with open("insertall.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_ord.parse(statement)
 
 
-# # DELETE statements
-# new_ord.parse("delete from candidates where SQ_CANDIDATO=280000622172")
+    # # DELETE statements
+    # new_ord.parse("delete from candidates where SQ_CANDIDATO=280000622172")
 
-# new_ord.parse("delete from candidates where SQ_CANDIDATO in (280000624082,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)")
+    # new_ord.parse("delete from candidates where SQ_CANDIDATO in (280000624082,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)")
 
-# new_ord.parse("delete from candidates where SQ_CANDIDATO between 280000600000 and 280000700000")
+    # new_ord.parse("delete from candidates where SQ_CANDIDATO between 280000600000 and 280000700000")
 
-# new_ord.parse("delete from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
+    # new_ord.parse("delete from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
 
 
-## HASH TESTBED
-new_hash = HashDBFile("consulta_cand_2018/consulta_cand_2018_DF.csv", "HeapHEAD.txt")
+    ## HASH TESTBED
+    new_hash = HashDBFile("consulta_cand_2018/consulta_cand_2018_DF.csv", "HeapHEAD.txt")
 
-# SELECT statements
-# new_hash.parse("select * from candidates where SQ_CANDIDATO=70000607614")
+    # SELECT statements
+    # new_hash.parse("select * from candidates where SQ_CANDIDATO=70000607614")
 
-# new_hash.parse("select * from candidates where SQ_CANDIDATO in (70000607614,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)")
+    # new_hash.parse("select * from candidates where SQ_CANDIDATO in (70000607614,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)")
 
-# new_hash.parse("select * from candidates where SQ_CANDIDATO between 70000607610 and 70000607614")
+    # new_hash.parse("select * from candidates where SQ_CANDIDATO between 70000607610 and 70000607614")
 
-# new_hash.parse("select * from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
+    # new_hash.parse("select * from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
 
 
-# INSERT statements
-# with open("insert1.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_hash.parse(statement)
+    # INSERT statements
+    # with open("insert1.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_hash.parse(statement)
 
-# with open("insert10.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_hash.parse(statement)
+    # with open("insert10.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_hash.parse(statement)
 
-# with open("insert10.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_hash.parse(statement)
+    # with open("insert10.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_hash.parse(statement)
 
-# with open("insert10.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     new_hash.parse(statement)
+    # with open("insert10.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     new_hash.parse(statement)
 
-# with open("insertall.txt") as f:
-#     sql = f.readlines()
-# for statement in sql:
-#     try:
-#         new_hash.parse(statement)
-#     except:
-#         pass
+    # with open("insertall.txt") as f:
+    #     sql = f.readlines()
+    # for statement in sql:
+    #     try:
+    #         new_hash.parse(statement)
+    #     except:
+    #         pass
 
 
-# # DELETE statements
-# new_hash.parse("delete from candidates where SQ_CANDIDATO=70000607614")
+    # # DELETE statements
+    # new_hash.parse("delete from candidates where SQ_CANDIDATO=70000607614")
 
-# new_hash.parse("delete from candidates where SQ_CANDIDATO in (70000607614,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)")
+    # new_hash.parse("delete from candidates where SQ_CANDIDATO in (70000607614,280000624083,280000624085,280000624086,280000625869,280000625870,280000629807,280000629807,280000629808,280000629808)")
 
-# new_hash.parse("delete from candidates where SQ_CANDIDATO between 70000607610 and 70000607614")
+    # new_hash.parse("delete from candidates where SQ_CANDIDATO between 70000607610 and 70000607614")
 
-new_hash.parse("delete from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
+    new_hash.parse("delete from candidates where NM_PARTIDO=PODEMOS and DS_ESTADO_CIVIL=CASADO(A)")
 
@@ -0,0 +1,187 @@
+#%%
+import argparse
+import asyncio
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+
+import main
+
+TABLE_NAME = re.compile(r"\b(?:from|into)\s+(\w+)", re.IGNORECASE)
+JOINED_NAME = re.compile(r"\bjoin\s+(\w+)", re.IGNORECASE)
+
+
+class ReadWriteLock(object):
+    # any number of readers or a single writer; a waiting writer keeps new
+    # readers out, so a stream of selects can not starve the DML
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.readers = 0
+        self.writer = False
+        self.writers_waiting = 0
+
+    @contextmanager
+    def reading(self):
+        with self.condition:
+            while self.writer or self.writers_waiting:
+                self.condition.wait()
+            self.readers += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.readers -= 1
+                if not self.readers:
+                    self.condition.notify_all()
+
+    @contextmanager
+    def writing(self):
+        with self.condition:
+            self.writers_waiting += 1
+            while self.writer or self.readers:
+                self.condition.wait()
+            self.writers_waiting -= 1
+            self.writer = True
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.writer = False
+                self.condition.notify_all()
+
+
+class QueryServer(object):
+    # keeps its tables loaded and runs the statements of every connection on
+    # a thread pool; selects of a table share its lock, inserts and deletes
+    # take it alone. Requests and responses are json objects, one per line:
+    # {"id", "statement", "params", "table"} -> {"id", "columns", "rows"} for
+    # a select, {"id", "result"} otherwise and {"id", "error"} on failure
+    def __init__(self, tables: dict, workers: int = None):
+        self.tables = tables
+        self.locks = {x: ReadWriteLock() for x in tables}
+        # every table can be joined with every other one
+        for db in tables.values():
+            for name, other in tables.items():
+                db.attach(name, other)
+        self.default = next(iter(tables))
+        self.executor = ThreadPoolExecutor(workers)
+
+    def table_of(self, request: dict) -> str:
+        # the table named in the request, else the one after FROM or INTO
+        # when it is served, else the first table
+        name = request.get("table")
+        if name is None:
+            found = TABLE_NAME.search(request["statement"])
+            name = found.group(1) if found and found.group(1) in self.tables \
+                else self.default
+        if name not in self.tables:
+            raise KeyError("no table " + name)
+        return name
+
+    def execute(self, request: dict) -> dict:
+        name = self.table_of(request)
+        db = self.tables[name]
+        statement = request["statement"]
+        params = tuple(request.get("params", ()))
+        kind = statement.split(None, 1)[0].lower() if statement.strip() else ""
+        if kind == "select":
+            # a join reads the joined tables too, their locks are taken in
+            # name order
+            names = sorted({name} | {x for x in JOINED_NAME.findall(statement)
+                                     if x in self.tables})
+            with ExitStack() as stack:
+                for x in names:
+                    stack.enter_context(self.locks[x].reading())
+                cursor = db.parse(statement, params)
+                if not cursor:
+                    return {"result": cursor}
+                return {"columns": cursor.columns,
+                        "rows": [list(x) for x in cursor]}
+        with self.locks[name].writing():
+            return {"result": db.parse(statement, params)}
+
+    async def handle(self, reader, writer):
+        loop = asyncio.get_event_loop()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            request = {}
+            try:
+                request = json.loads(line.decode("latin-1"))
+                response = await loop.run_in_executor(
+                    self.executor, self.execute, request)
+            except Exception as error:
+                response = {"error": "{}: {}".format(type(error).__name__,
+                                                     error)}
+            response["id"] = request.get("id") \
+                if isinstance(request, dict) else None
+            writer.write(json.dumps(response).encode("latin-1") + b"\n")
+            await writer.drain()
+        writer.close()
+
+    def serve(self, host: str = "localhost", port: int = 7410,
+              path: str = None):
+        # runs until interrupted; plain event loop calls, which python 3.6
+        # has too
+        loop = asyncio.get_event_loop()
+        if path is not None:
+            start = asyncio.start_unix_server(self.handle, path)
+        else:
+            start = asyncio.start_server(self.handle, host, port)
+        server = loop.run_until_complete(start)
+        try:
+            loop.run_forever()
+        finally:
+            server.close()
+            loop.run_until_complete(server.wait_closed())
+
+    def close(self):
+        self.executor.shutdown()
+        for name, db in self.tables.items():
+            with self.locks[name].writing():
+                db.close()
+
+
+def load_table(spec: str, processes: int = None):
+    # NAME=ENGINE:SCHEMA_FILE[:CSV]; without a csv the table is reopened
+    # from the files a previous load left behind. The record files are
+    # named after the table, so tables of one engine do not collide
+    name, rest = spec.split("=", 1)
+    engine, schema_file, source = (rest.split(":", 2) + [None])[:3]
+    engine = main.engine_named(engine.capitalize())
+    files = {}
+    if engine is not main.PartitionedDBFile:
+        files["record_file"] = "{}.{}".format(name, engine.record_file)
+    if source is None:
+        return name, engine.open(schema_file, **files)
+    return name, engine(source, schema_file, processes=processes, **files)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Serve statements against tables loaded once.")
+    parser.add_argument("--table", action="append", required=True,
+                        help="NAME=ENGINE:SCHEMA_FILE[:CSV], can be repeated")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=7410)
+    parser.add_argument("--unix", default=None,
+                        help="listen on this unix socket instead of tcp")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--processes", type=int, default=None,
+                        help="processes used to parse the csv files")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    server = QueryServer(dict(load_table(x, args.processes)
+                              for x in args.table), args.workers)
+    try:
+        server.serve(args.host, args.port, args.unix)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
@@ -0,0 +1,134 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import main
+
+SOURCE = os.path.join(ROOT, "consulta_cand_2018", "consulta_cand_2018_DF.csv")
+ENGINES = {"heap": main.HeapDBFile, "ordered": main.OrderedDBFile,
+           "hash": main.HashDBFile, "column": main.ColumnDBFile}
+PODEMOS = "select * from candidates where NM_PARTIDO=PODEMOS"
+
+
+@pytest.fixture
+def schema(tmp_path, monkeypatch):
+    # every table writes its files next to the schema, in a fresh directory
+    monkeypatch.chdir(tmp_path)
+    shutil.copy(os.path.join(ROOT, "HeapHEAD.txt"), "HeapHEAD.txt")
+    return "HeapHEAD.txt"
+
+
+def count(db, statement: str = "select * from candidates") -> int:
+    return len(db.parse(statement).fetchall())
+
+
+def crash(engine: str, script: str):
+    # runs `script` on a fresh table in another process, which then dies
+    # without closing anything; what it prints comes back
+    code = "\n".join([
+        "import os, sys", "sys.path.insert(0, {!r})".format(ROOT),
+        "import main",
+        "db = main.{}({!r}, 'HeapHEAD.txt')".format(
+            ENGINES[engine].__name__, SOURCE),
+        script, "os._exit(0)"])
+    return subprocess.run([sys.executable, "-c", code], check=True,
+                          capture_output=True, text=True).stdout.split()
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+@pytest.mark.parametrize("statement", [
+    "delete from candidates where NR_IDADE_DATA_POSSE > 50",
+    "delete from candidates where SG_UF<>DF",
+    "delete from candidates where SG_UF=DF or SG_UF=SP",
+    "delete from candidates where SG_UF=DF and"])
+def test_unsupported_where_is_refused(schema, engine, statement):
+    # a condition the parser can not read must not turn into no condition
+    db = ENGINES[engine](SOURCE, schema, buffer_pool=main.BufferPool(64))
+    rows = db.row_count()
+    with pytest.raises(ValueError):
+        db.parse(statement)
+    assert db.row_count() == rows
+
+
+@pytest.mark.parametrize("engine", ["heap", "hash", "column"])
+def test_unsupported_select_is_refused(schema, engine):
+    db = ENGINES[engine](SOURCE, schema, buffer_pool=main.BufferPool(64))
+    with pytest.raises(ValueError):
+        db.parse("select * from candidates where SG_UF=DF or SG_UF=SP")
+
+
+def test_ordered_select_goes_to_the_mirror(schema):
+    db = main.OrderedDBFile(SOURCE, schema, buffer_pool=main.BufferPool(64))
+    like = "select NM_CANDIDATO from candidates where NM_PARTIDO like 'PODE%'"
+    assert count(db, like) == count(db, PODEMOS) == 26
+    db.parse("delete from candidates where NM_PARTIDO=PODEMOS")
+    assert count(db, like) == 0
+    # the mirror lags behind a log until it is compacted
+    db.open_log()
+    with pytest.raises(ValueError):
+        db.parse(like)
+    db.close_log()
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_log_is_replayed_after_a_crash(schema, engine):
+    expected = crash(engine, "\n".join([
+        "db.open_log(durability='commit')",
+        "for statement in open({!r}):".format(
+            os.path.join(ROOT, "insert10.txt")),
+        "    db.parse(statement)",
+        "db.parse('delete from candidates where NM_PARTIDO=PODEMOS')",
+        "print(len(db.parse('select * from candidates').fetchall()))"]))
+    db = ENGINES[engine].open(schema, buffer_pool=main.BufferPool(64))
+    assert db.log is not None
+    assert [str(count(db))] == expected
+    assert count(db, PODEMOS) == 0
+    db.close_log()
+    db = ENGINES[engine].open(schema, buffer_pool=main.BufferPool(64))
+    assert db.log is None
+    assert [str(count(db))] == expected
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_changes_survive_a_crash_without_a_log(schema, engine):
+    expected = crash(engine, "\n".join([
+        "db.parse('delete from candidates where NM_PARTIDO=PODEMOS')",
+        "for statement in open({!r}):".format(
+            os.path.join(ROOT, "insert10.txt")),
+        "    db.parse(statement)",
+        "print(len(db.parse('select * from candidates').fetchall()))"]))
+    db = ENGINES[engine].open(schema, buffer_pool=main.BufferPool(64))
+    assert [str(count(db))] == expected
+    assert db.row_count() == count(db)
+    assert count(db, PODEMOS) == 0
+
+
+@pytest.mark.parametrize("engine, parameters", [
+    ("heap", [15]), ("ordered", [15]), ("hash", [15]), ("hash", [17]),
+    ("column", [15])])
+def test_indexes_find_every_row(schema, engine, parameters):
+    # an index answers like a scan, whatever the table is keyed by
+    queries = [PODEMOS,
+               "select * from candidates where DS_CARGO in (SENADOR,GOVERNADOR)",
+               "select * from candidates where NM_PARTIDO=PODEMOS and "
+               "SQ_CANDIDATO between 70000600000 and 70000620000"]
+    db = ENGINES[engine](SOURCE, schema, parameters=parameters,
+                         buffer_pool=main.BufferPool(64))
+    scanned = [count(db, x) for x in queries]
+    for column in ("NM_PARTIDO", "DS_CARGO", "SQ_CANDIDATO"):
+        db.create_index(column)
+    assert [count(db, x) for x in queries] == scanned
+    db.close()
+    db = ENGINES[engine].open(schema, parameters=parameters,
+                              buffer_pool=main.BufferPool(64))
+    assert sorted(db.index_columns) == ["DS_CARGO", "NM_PARTIDO",
+                                        "SQ_CANDIDATO"]
+    assert [count(db, x) for x in queries] == scanned
+    db.parse("delete from candidates where NM_PARTIDO=PODEMOS")
+    assert count(db, PODEMOS) == 0